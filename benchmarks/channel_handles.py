@@ -0,0 +1,120 @@
+"""Measure the per-call saving of reading and writing channels through ChannelHandles.
+
+get_channel_value and set_channel_value build a new request, including the channel
+name, for every call.  A ChannelHandle builds its requests once.  This times building
+the requests on their own, and whole calls to the fake server, both ways.
+
+Usage: python channel_handles.py [number of calls]
+"""
+
+import sys
+import time
+
+from flexlogger.automation import ChannelSpecificationDocument
+from flexlogger.automation._stub_registry import StubRegistry
+from flexlogger.automation.proto import (
+    ChannelSpecificationDocument_pb2,
+    FlexLoggerApplication_pb2,
+    FlexLoggerApplication_pb2_grpc,
+    Project_pb2,
+    Project_pb2_grpc,
+)
+from flexlogger.automation.proto.Identifiers_pb2 import ElementIdentifier
+from flexlogger.automation.testing import FakeChannel, FakeFlexLoggerServer
+from grpc import Channel, insecure_channel
+
+_INPUT_NAME = "Module 1/Analog input channel with a long descriptive name 1"
+_OUTPUT_NAME = "Module 2/Analog output channel with a long descriptive name 1"
+
+
+def _open_channel_specification(channel: Channel) -> ElementIdentifier:
+    """Open a project on the fake server and get its channel specification's identifier."""
+    application_stub = FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub(channel)
+    project = application_stub.OpenProject(
+        FlexLoggerApplication_pb2.OpenProjectRequest(project_path="Benchmark.flxproj")
+    ).project
+    project_stub = Project_pb2_grpc.ProjectStub(channel)
+    return project_stub.OpenChannelSpecificationDocument(
+        Project_pb2.OpenChannelSpecificationDocumentRequest(project=project)
+    ).document_identifier
+
+
+def _time_per_call(function, calls: int) -> float:
+    for _ in range(min(calls, 100)):
+        function()
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls
+
+
+def _report(name: str, by_name: float, by_handle: float) -> None:
+    print(
+        "%-22s %8.2f us/call by name, %8.2f us/call with a handle, %6.2f us/call saved"
+        % (name, by_name * 1e6, by_handle * 1e6, (by_name - by_handle) * 1e6)
+    )
+
+
+def _time_request_building(calls: int) -> None:
+    identifier = ElementIdentifier(element_id="Channel Specification")
+    prebuilt_read = ChannelSpecificationDocument_pb2.GetDoubleChannelValueRequest(
+        document_identifier=identifier, channel_name=_INPUT_NAME
+    )
+    prebuilt_write = ChannelSpecificationDocument_pb2.SetDoubleChannelValueRequest(
+        document_identifier=identifier, channel_name=_OUTPUT_NAME
+    )
+
+    def update_prebuilt_write() -> None:
+        prebuilt_write.channel_value = 1.0
+
+    _report(
+        "read request",
+        _time_per_call(
+            lambda: ChannelSpecificationDocument_pb2.GetDoubleChannelValueRequest(
+                document_identifier=identifier, channel_name=_INPUT_NAME
+            ).SerializeToString(),
+            calls,
+        ),
+        _time_per_call(prebuilt_read.SerializeToString, calls),
+    )
+    _report(
+        "write request",
+        _time_per_call(
+            lambda: ChannelSpecificationDocument_pb2.SetDoubleChannelValueRequest(
+                document_identifier=identifier, channel_name=_OUTPUT_NAME, channel_value=1.0
+            ).SerializeToString(),
+            calls,
+        ),
+        _time_per_call(
+            lambda: (update_prebuilt_write(), prebuilt_write.SerializeToString()), calls
+        ),
+    )
+
+
+def main(calls: int) -> int:
+    _time_request_building(calls)
+    channels = [FakeChannel(_INPUT_NAME, 1.0), FakeChannel(_OUTPUT_NAME, is_output=True)]
+    with FakeFlexLoggerServer(channels) as server:
+        with insecure_channel("localhost:%d" % server.port) as channel:
+            document = ChannelSpecificationDocument(
+                StubRegistry(channel), lambda: None, _open_channel_specification(channel)
+            )
+            input_handle = document.get_channel_handle(_INPUT_NAME)
+            output_handle = document.get_channel_handle(_OUTPUT_NAME)
+            _report(
+                "read call",
+                _time_per_call(lambda: document.get_channel_value(_INPUT_NAME), calls),
+                _time_per_call(input_handle.read, calls),
+            )
+            _report(
+                "write call",
+                _time_per_call(lambda: document.set_channel_value(_OUTPUT_NAME, 1.0), calls),
+                _time_per_call(lambda: output_handle.write(1.0), calls),
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv
+    calls_arg = int(argv[1]) if len(argv) > 1 else 5000
+    sys.exit(main(calls_arg))
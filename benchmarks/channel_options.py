@@ -0,0 +1,60 @@
+"""Compare bulk read throughput with different gRPC channel options.
+
+Each configuration connects an Application with the given ChannelOptions and times
+get_channel_values and get_channel_names for a project with many channels.
+
+Usage: python channel_options.py [number of channels] [number of sweeps]
+"""
+import sys
+import time
+
+from flexlogger.automation import Application, ChannelOptions
+from flexlogger.automation.testing import FakeFlexLoggerServer
+
+
+_CONFIGURATIONS = [
+    ("default", None),
+    ("64 KiB window", ChannelOptions(initial_window_size=64 * 1024)),
+    ("4 MiB window", ChannelOptions(initial_window_size=4 * 1024 * 1024)),
+    ("gzip", ChannelOptions(gzip_compression=True)),
+    ("keepalive", ChannelOptions(keepalive_time=30, keepalive_permit_without_calls=True)),
+]
+
+
+def _time_sweeps(sweep, sweeps: int) -> float:
+    sweep()
+    start = time.perf_counter()
+    for _ in range(sweeps):
+        sweep()
+    return (time.perf_counter() - start) / sweeps
+
+
+def main(channel_count: int, sweeps: int) -> int:
+    channel_names = ["Module %d/Channel %d" % (i // 32, i) for i in range(channel_count)]
+    print("Channels per sweep: %d" % channel_count)
+    print("%-16s %22s %22s" % ("Options", "get_channel_values", "get_channel_names"))
+    with FakeFlexLoggerServer(channel_names) as server:
+        for name, options in _CONFIGURATIONS:
+            with Application(server_port=server.port, channel_options=options) as app:
+                project = app.open_project("Benchmark.flxproj")
+                document = project.open_channel_specification_document()
+                values = _time_sweeps(lambda: document.get_channel_values(channel_names), sweeps)
+                names = _time_sweeps(document.get_channel_names, sweeps)
+            print(
+                "%-16s %9.2f ms %8.0f ch/s %9.2f ms %8.0f ch/s"
+                % (
+                    name,
+                    values * 1000,
+                    channel_count / values,
+                    names * 1000,
+                    channel_count / names,
+                )
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv
+    channel_count_arg = int(argv[1]) if len(argv) > 1 else 5000
+    sweeps_arg = int(argv[2]) if len(argv) > 2 else 20
+    sys.exit(main(channel_count_arg, sweeps_arg))
@@ -0,0 +1,79 @@
+"""Compare reading channels one at a time with reading them in bulk.
+
+The bulk reads are timed both as ChannelDataPoint lists and as ChannelSnapshots.
+
+Usage: python channel_values.py [number of channels] [number of sweeps]
+"""
+
+import sys
+import time
+
+from flexlogger.automation import ChannelSpecificationDocument
+from flexlogger.automation._stub_registry import StubRegistry
+from flexlogger.automation.proto import (
+    FlexLoggerApplication_pb2,
+    FlexLoggerApplication_pb2_grpc,
+    Project_pb2,
+    Project_pb2_grpc,
+)
+from flexlogger.automation.proto.Identifiers_pb2 import ElementIdentifier
+from flexlogger.automation.testing import FakeFlexLoggerServer
+from grpc import Channel, insecure_channel
+
+
+def _open_channel_specification(channel: Channel) -> ElementIdentifier:
+    """Open a project on the fake server and get its channel specification's identifier."""
+    application_stub = FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub(channel)
+    project = application_stub.OpenProject(
+        FlexLoggerApplication_pb2.OpenProjectRequest(project_path="Benchmark.flxproj")
+    ).project
+    project_stub = Project_pb2_grpc.ProjectStub(channel)
+    return project_stub.OpenChannelSpecificationDocument(
+        Project_pb2.OpenChannelSpecificationDocumentRequest(project=project)
+    ).document_identifier
+
+
+def _time_sweeps(sweep, sweeps: int) -> float:
+    sweep()
+    start = time.perf_counter()
+    for _ in range(sweeps):
+        sweep()
+    return (time.perf_counter() - start) / sweeps
+
+
+def main(channel_count: int, sweeps: int) -> int:
+    channel_names = ["Channel %d" % i for i in range(channel_count)]
+    with FakeFlexLoggerServer(channel_names) as server:
+        with insecure_channel("localhost:%d" % server.port) as channel:
+            document = ChannelSpecificationDocument(
+                StubRegistry(channel), lambda: None, _open_channel_specification(channel)
+            )
+
+            def per_channel_sweep() -> None:
+                for channel_name in channel_names:
+                    document.get_channel_value(channel_name)
+
+            def bulk_sweep() -> None:
+                document.get_channel_values(channel_names)
+
+            def snapshot_sweep() -> None:
+                document.get_channel_snapshot(channel_names)
+
+            per_channel = _time_sweeps(per_channel_sweep, sweeps)
+            bulk = _time_sweeps(bulk_sweep, sweeps)
+            snapshot = _time_sweeps(snapshot_sweep, sweeps)
+
+    print("Channels per sweep:       %d" % channel_count)
+    print("get_channel_value loop:   %8.2f ms/sweep" % (per_channel * 1000))
+    print("get_channel_values:       %8.2f ms/sweep" % (bulk * 1000))
+    print("get_channel_snapshot:     %8.2f ms/sweep" % (snapshot * 1000))
+    print("Speedup (values):         %8.1fx" % (per_channel / bulk))
+    print("Speedup (snapshot):       %8.1fx" % (per_channel / snapshot))
+    return 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv
+    channel_count_arg = int(argv[1]) if len(argv) > 1 else 400
+    sweeps_arg = int(argv[2]) if len(argv) > 2 else 20
+    sys.exit(main(channel_count_arg, sweeps_arg))
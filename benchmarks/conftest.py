@@ -0,0 +1,106 @@
+"""Fixtures and reporting for the pytest-benchmark suite in test_client_benchmarks.py."""
+
+import math
+from typing import Any, Iterator, List, NamedTuple
+
+import pytest
+from flexlogger.automation import (
+    Application,
+    ChannelSpecificationDocument,
+    LoggingSpecificationDocument,
+    Project,
+)
+from flexlogger.automation.testing import FakeChannel, FakeFlexLoggerServer, SineWaveform
+
+_INPUT_CHANNEL_NAMES = ["Input %d" % i for i in range(100)]
+_OUTPUT_CHANNEL_NAMES = ["Output %d" % i for i in range(20)]
+
+_LatencyResult = NamedTuple(
+    "_LatencyResult", [("name", str), ("p50", float), ("p99", float), ("calls_per_second", float)]
+)
+
+# The results of every benchmark that ran
+_latency_results = []  # type: List[_LatencyResult]
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Get a percentile with linear interpolation between the closest ranks."""
+    position = (len(sorted_values) - 1) * percent / 100.0
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    fraction = position - lower
+    return sorted_values[lower] * (1 - fraction) + sorted_values[upper] * fraction
+
+
+@pytest.fixture(scope="session")
+def server() -> Iterator[FakeFlexLoggerServer]:
+    channels = [
+        FakeChannel(name, SineWaveform(frequency=0.1 + i / 100.0))
+        for i, name in enumerate(_INPUT_CHANNEL_NAMES)
+    ] + [FakeChannel(name, 0.0, is_output=True) for name in _OUTPUT_CHANNEL_NAMES]
+    with FakeFlexLoggerServer(channels) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def input_channel_names() -> List[str]:
+    return list(_INPUT_CHANNEL_NAMES)
+
+
+@pytest.fixture(scope="session")
+def output_channel_names() -> List[str]:
+    return list(_OUTPUT_CHANNEL_NAMES)
+
+
+@pytest.fixture(scope="session")
+def app(server: FakeFlexLoggerServer) -> Iterator[Application]:
+    with Application(server_port=server.port) as app:
+        yield app
+
+
+@pytest.fixture(scope="session")
+def project(app: Application) -> Project:
+    return app.open_project("Benchmark.flxproj")
+
+
+@pytest.fixture(scope="class")
+def channels(project: Project) -> ChannelSpecificationDocument:
+    return project.open_channel_specification_document()
+
+
+@pytest.fixture(scope="class")
+def logging_specification(project: Project) -> LoggingSpecificationDocument:
+    logging_specification = project.open_logging_specification_document()
+    logging_specification.set_test_property("Operator", "Benchmark")
+    return logging_specification
+
+
+@pytest.fixture(autouse=True)
+def latency_percentiles(benchmark: Any, request: Any) -> Iterator[None]:
+    """Add p50 and p99 latencies and calls per second to each benchmark's JSON results."""
+    yield
+    stats = benchmark.stats
+    if stats is None or len(stats.stats.data) == 0:
+        return
+    data = sorted(stats.stats.data)
+    p50 = _percentile(data, 50)
+    p99 = _percentile(data, 99)
+    calls_per_second = 1.0 / stats.stats.mean
+    benchmark.extra_info.setdefault("p50", p50)
+    benchmark.extra_info.setdefault("p99", p99)
+    benchmark.extra_info.setdefault("calls_per_second", calls_per_second)
+    _latency_results.append(_LatencyResult(request.node.name, p50, p99, calls_per_second))
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    if len(_latency_results) == 0:
+        return
+    terminalreporter.section("latency percentiles")
+    name_width = max(len(name) for name, _, _, _ in _latency_results)
+    terminalreporter.write_line(
+        "%-*s %12s %12s %14s" % (name_width, "Name", "p50 (us)", "p99 (us)", "calls/s")
+    )
+    for name, p50, p99, calls_per_second in _latency_results:
+        terminalreporter.write_line(
+            "%-*s %12.1f %12.1f %14.1f" % (name_width, name, p50 * 1e6, p99 * 1e6, calls_per_second)
+        )
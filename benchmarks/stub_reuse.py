@@ -0,0 +1,92 @@
+"""Measure the per-call overhead saved by reusing gRPC stubs.
+
+Every call used to create a new service stub.  This compares that with getting
+the stub from the shared StubRegistry, for get_channel_value and TestSession.state.
+
+Usage: python stub_reuse.py [number of calls]
+"""
+
+import sys
+import time
+
+from flexlogger.automation import ChannelSpecificationDocument, TestSession
+from flexlogger.automation._stub_registry import StubRegistry
+from flexlogger.automation.proto import (
+    ChannelSpecificationDocument_pb2_grpc,
+    FlexLoggerApplication_pb2,
+    FlexLoggerApplication_pb2_grpc,
+    Project_pb2,
+    Project_pb2_grpc,
+    TestSession_pb2_grpc,
+)
+from flexlogger.automation.proto.Identifiers_pb2 import ElementIdentifier
+from flexlogger.automation.testing import FakeFlexLoggerServer
+from grpc import Channel, insecure_channel
+
+
+class _NewStubPerCallRegistry(StubRegistry):
+    """Creates a new stub on every request, like the client used to."""
+
+    def get(self, stub_class):  # type: ignore
+        return stub_class(self.channel)
+
+
+def _open_channel_specification(channel: Channel) -> ElementIdentifier:
+    """Open a project on the fake server and get its channel specification's identifier."""
+    application_stub = FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub(channel)
+    project = application_stub.OpenProject(
+        FlexLoggerApplication_pb2.OpenProjectRequest(project_path="Benchmark.flxproj")
+    ).project
+    project_stub = Project_pb2_grpc.ProjectStub(channel)
+    return project_stub.OpenChannelSpecificationDocument(
+        Project_pb2.OpenChannelSpecificationDocumentRequest(project=project)
+    ).document_identifier
+
+
+def _time_per_call(function, calls: int) -> float:
+    for _ in range(min(calls, 100)):
+        function()
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls
+
+
+def _report(name: str, new_stub: float, shared_stub: float) -> None:
+    print(
+        "%-22s %8.1f us/call with a new stub, %8.1f us/call with a shared stub, "
+        "%6.1f us/call saved"
+        % (name, new_stub * 1e6, shared_stub * 1e6, (new_stub - shared_stub) * 1e6)
+    )
+
+
+def main(calls: int) -> int:
+    with FakeFlexLoggerServer(["Channel 1"]) as server:
+        with insecure_channel("localhost:%d" % server.port) as channel:
+            for stub_class in (
+                ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub,
+                TestSession_pb2_grpc.TestSessionStub,
+            ):
+                construction = _time_per_call(lambda: stub_class(channel), calls)
+                print("%-22s %8.1f us to create" % (stub_class.__name__, construction * 1e6))
+
+            document_identifier = _open_channel_specification(channel)
+            timings = {}
+            for registry_class in (_NewStubPerCallRegistry, StubRegistry):
+                stubs = registry_class(channel)
+                document = ChannelSpecificationDocument(stubs, lambda: None, document_identifier)
+                test_session = TestSession(stubs, lambda: None)
+                timings[registry_class] = (
+                    _time_per_call(lambda: document.get_channel_value("Channel 1"), calls),
+                    _time_per_call(lambda: test_session.state, calls),
+                )
+
+    _report("get_channel_value", timings[_NewStubPerCallRegistry][0], timings[StubRegistry][0])
+    _report("TestSession.state", timings[_NewStubPerCallRegistry][1], timings[StubRegistry][1])
+    return 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv
+    calls_arg = int(argv[1]) if len(argv) > 1 else 5000
+    sys.exit(main(calls_arg))
@@ -0,0 +1,286 @@
+"""Latency and throughput baselines for the public client methods.
+
+Every benchmark runs against the in-process fake server with no added latency, so the
+results measure the client and gRPC overhead.  Run with ``--benchmark-json`` or
+``--benchmark-autosave`` to save results that can be compared between runs (see
+README.rst).
+"""
+
+import datetime
+import threading
+from typing import Any, List
+
+import pytest
+from flexlogger.automation import (
+    Application,
+    DataRateLevel,
+    EventType,
+    LogFileType,
+    Project,
+    TestProperty,
+    ValueChangeCondition,
+    ValueChangeType,
+    WriteBatcher,
+)
+from flexlogger.automation.testing import FakeFlexLoggerServer
+
+TestProperty.__test__ = False  # type: ignore
+
+_EVENTS_PER_ROUND = 1000
+
+
+def _value_change_condition(channel_name: str) -> ValueChangeCondition:
+    condition = ValueChangeCondition()
+    condition.channel_name = channel_name
+    condition.value_change_type = ValueChangeType.RISE_ABOVE_VALUE
+    condition.threshold = 1.0
+    condition.time = 2.0
+    return condition
+
+
+class TestApplicationBenchmarks:
+    def test_get_version(self, benchmark: Any, app: Application) -> None:
+        benchmark(app.get_version)
+
+    def test_get_active_project(self, benchmark: Any, app: Application, project: Project) -> None:
+        benchmark(app.get_active_project)
+
+
+class TestProjectBenchmarks:
+    def test_open_channel_specification_document(self, benchmark: Any, project: Project) -> None:
+        benchmark(project.open_channel_specification_document)
+
+    def test_open_channel_specification_document_uncached(
+        self, benchmark: Any, project: Project
+    ) -> None:
+        benchmark(project.open_channel_specification_document, use_cache=False)
+
+    def test_open_logging_specification_document(self, benchmark: Any, project: Project) -> None:
+        benchmark(project.open_logging_specification_document)
+
+    def test_open_screen_document(self, benchmark: Any, project: Project) -> None:
+        benchmark(project.open_screen_document, "Screen")
+
+    def test_open_test_specification_document(self, benchmark: Any, project: Project) -> None:
+        benchmark(project.open_test_specification_document)
+
+    def test_project_file_path(self, benchmark: Any, project: Project) -> None:
+        benchmark(lambda: project.project_file_path)
+
+    def test_save(self, benchmark: Any, project: Project) -> None:
+        benchmark(project.save)
+
+
+class TestTestSessionBenchmarks:
+    def test_state(self, benchmark: Any, project: Project) -> None:
+        benchmark(lambda: project.test_session.state)
+
+    def test_elapsed_test_time(self, benchmark: Any, project: Project) -> None:
+        benchmark(lambda: project.test_session.elapsed_test_time)
+
+    def test_start_stop(self, benchmark: Any, project: Project) -> None:
+        test_session = project.test_session
+
+        def start_stop() -> None:
+            test_session.start()
+            test_session.stop()
+
+        benchmark(start_stop)
+
+    def test_pause_resume(self, benchmark: Any, project: Project) -> None:
+        test_session = project.test_session
+        test_session.start()
+
+        def pause_resume() -> None:
+            test_session.pause()
+            test_session.resume()
+
+        try:
+            benchmark(pause_resume)
+        finally:
+            test_session.stop()
+
+    def test_add_note(self, benchmark: Any, project: Project) -> None:
+        benchmark(project.test_session.add_note, "Benchmark note")
+
+
+class TestChannelSpecificationBenchmarks:
+    def test_get_channel_names(self, benchmark: Any, channels: Any) -> None:
+        benchmark(channels.get_channel_names)
+
+    def test_get_filtered_channel_names(self, benchmark: Any, channels: Any) -> None:
+        benchmark(channels.get_filtered_channel_names, input_channels=False)
+
+    def test_get_channel_value(
+        self, benchmark: Any, channels: Any, input_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.get_channel_value, input_channel_names[0])
+
+    def test_get_channel_values(
+        self, benchmark: Any, channels: Any, input_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.get_channel_values, input_channel_names)
+
+    def test_get_channel_snapshot(
+        self, benchmark: Any, channels: Any, input_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.get_channel_snapshot, input_channel_names)
+
+    def test_set_channel_value(
+        self, benchmark: Any, channels: Any, output_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.set_channel_value, output_channel_names[0], 1.0)
+
+    def test_set_channel_values(
+        self, benchmark: Any, channels: Any, output_channel_names: List[str]
+    ) -> None:
+        values = {channel_name: 1.0 for channel_name in output_channel_names}
+        benchmark(channels.set_channel_values, values)
+
+    def test_channel_handle_read(
+        self, benchmark: Any, channels: Any, input_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.get_channel_handle(input_channel_names[0]).read)
+
+    def test_channel_handle_write(
+        self, benchmark: Any, channels: Any, output_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.get_channel_handle(output_channel_names[0]).write, 1.0)
+
+    def test_write_batcher_tick(
+        self, benchmark: Any, channels: Any, output_channel_names: List[str]
+    ) -> None:
+        batcher = WriteBatcher(channels)
+
+        def tick() -> None:
+            for channel_name in output_channel_names:
+                batcher.write(channel_name, 1.0)
+            batcher.flush()
+
+        benchmark(tick)
+
+    def test_is_channel_enabled(
+        self, benchmark: Any, channels: Any, input_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.is_channel_enabled, input_channel_names[0])
+
+    def test_set_channel_enabled(
+        self, benchmark: Any, channels: Any, input_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.set_channel_enabled, input_channel_names[0], True)
+
+    def test_is_channel_logging_enabled(
+        self, benchmark: Any, channels: Any, input_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.is_channel_logging_enabled, input_channel_names[0])
+
+    def test_set_channel_logging_enabled(
+        self, benchmark: Any, channels: Any, input_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.set_channel_logging_enabled, input_channel_names[0], True)
+
+    def test_get_data_rate(self, benchmark: Any, channels: Any) -> None:
+        benchmark(channels.get_data_rate, DataRateLevel.FAST)
+
+    def test_set_data_rate(self, benchmark: Any, channels: Any) -> None:
+        benchmark(channels.set_data_rate, DataRateLevel.FAST, 1000.0)
+
+    def test_get_data_rate_level(
+        self, benchmark: Any, channels: Any, input_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.get_data_rate_level, input_channel_names[0])
+
+    def test_set_data_rate_level(
+        self, benchmark: Any, channels: Any, input_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.set_data_rate_level, input_channel_names[0], DataRateLevel.SLOW)
+
+    def test_get_actual_data_rate(
+        self, benchmark: Any, channels: Any, input_channel_names: List[str]
+    ) -> None:
+        benchmark(channels.get_actual_data_rate, input_channel_names[0])
+
+
+# Each logging specification method, with the arguments to call it with
+_LOGGING_SPECIFICATION_CALLS = [
+    ("get_log_file_base_path", ()),
+    ("set_log_file_base_path", ("C:\\Logs",)),
+    ("get_resolved_log_file_base_path", ()),
+    ("get_log_file_name", ()),
+    ("set_log_file_name", ("Benchmark",)),
+    ("get_resolved_log_file_name", ()),
+    ("get_log_file_description", ()),
+    ("set_log_file_description", ("Benchmark run",)),
+    ("get_log_files", (LogFileType.TDMS,)),
+    ("remove_log_files", ()),
+    ("get_test_properties", ()),
+    ("set_test_properties", ([TestProperty("Operator", "Benchmark", False)],)),
+    ("get_test_property", ("Operator",)),
+    ("set_test_property", ("Operator", "Benchmark")),
+    ("get_start_trigger_settings", ()),
+    ("get_stop_trigger_settings", ()),
+    ("set_start_trigger_settings_to_test_start", ()),
+    ("set_start_trigger_settings_to_value_change", (_value_change_condition("Input 0"),)),
+    (
+        "set_start_trigger_settings_to_absolute_time",
+        (datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc),),
+    ),
+    ("set_stop_trigger_settings_to_test_stop", ()),
+    ("set_stop_trigger_settings_to_value_change", (_value_change_condition("Input 0"),)),
+    ("set_stop_trigger_settings_to_duration", (datetime.timedelta(minutes=5),)),
+    ("is_retriggering_enabled", ()),
+    ("set_retriggering", (False,)),
+]
+
+
+class TestLoggingSpecificationBenchmarks:
+    @pytest.mark.parametrize(  # type: ignore
+        "method_name,arguments",
+        _LOGGING_SPECIFICATION_CALLS,
+        ids=[method_name for method_name, _ in _LOGGING_SPECIFICATION_CALLS],
+    )
+    def test_method(
+        self, benchmark: Any, logging_specification: Any, method_name: str, arguments: tuple
+    ) -> None:
+        benchmark(getattr(logging_specification, method_name), *arguments)
+
+    def test_remove_test_property(self, benchmark: Any, logging_specification: Any) -> None:
+        def setup() -> Any:
+            logging_specification.set_test_property("Temporary", "1")
+            return ("Temporary",), {}
+
+        benchmark.pedantic(logging_specification.remove_test_property, setup=setup, rounds=200)
+
+
+class TestEventBenchmarks:
+    def test_event_throughput(
+        self, benchmark: Any, app: Application, server: FakeFlexLoggerServer
+    ) -> None:
+        """Time how long it takes to receive a burst of events through a callback."""
+        received_count = [0]
+        all_received = threading.Event()
+
+        def on_event(application: Any, event_type: Any, payload: Any) -> None:
+            received_count[0] += 1
+            if received_count[0] == _EVENTS_PER_ROUND:
+                all_received.set()
+
+        def send_events() -> None:
+            received_count[0] = 0
+            all_received.clear()
+            for _ in range(_EVENTS_PER_ROUND):
+                server.send_event(EventType.CUSTOM, "Benchmark")
+            if not all_received.wait(30):
+                raise RuntimeError("Timed out waiting for events")
+
+        event_handler = app.event_handler
+        event_handler.register_event_callback(on_event, [EventType.CUSTOM])
+        try:
+            benchmark.pedantic(send_events, rounds=10, warmup_rounds=1)
+        finally:
+            event_handler.unregister_from_events()
+        benchmark.extra_info["events_per_round"] = _EVENTS_PER_ROUND
+        if benchmark.stats is not None:
+            benchmark.extra_info["events_per_second"] = (
+                _EVENTS_PER_ROUND / benchmark.stats.stats.median
+            )
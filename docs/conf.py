@@ -44,13 +44,23 @@ exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
 
 nitpicky = True
 nitpick_ignore = [
+    ("py:class", "asyncio.events.AbstractEventLoop"),
     ("py:class", "datetime.datetime"),
     ("py:class", "datetime.timedelta"),
+    ("py:class", "numpy.ndarray"),
     ("py:class", "pathlib.Path"),
+    ("py:class", "threading.Thread"),
     ("py:data", "typing.Any"),
+    ("py:data", "typing.Awaitable"),
+    ("py:data", "typing.Callable"),
+    ("py:data", "typing.Dict"),
     ("py:data", "typing.Iterable"),
+    ("py:data", "typing.Iterator"),
     ("py:data", "typing.List"),
+    ("py:data", "typing.Mapping"),
     ("py:data", "typing.Optional"),
+    ("py:data", "typing.Sequence"),
+    ("py:data", "typing.Tuple"),
     ("py:data", "typing.Union"),
 ]
 
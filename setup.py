@@ -92,6 +92,7 @@ setup(
         "typing-extensions",
         "grpcio",
         "grpcio-tools",
+        "numpy",
         "psutil",
         # This package only works correctly on Windows,
         # but add this specifier to allow installing it on
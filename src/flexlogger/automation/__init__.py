@@ -1,5 +1,9 @@
 # flake8: noqa
 from ._application import Application
+from ._channel_options import ChannelOptions
+from ._timeout_policy import TimeoutPolicy
+from ._retry_policy import RetryPolicy
+from ._reconnect_policy import ReconnectPolicy
 from ._project import Project
 from ._test_session import TestSession
 from ._test_session_state import TestSessionState
@@ -9,7 +13,17 @@ from ._log_file_type import LogFileType
 from ._screen_document import ScreenDocument
 from ._test_specification_document import TestSpecificationDocument
 from ._flexlogger_error import FlexLoggerError
+from ._flexlogger_error import FlexLoggerTimeoutError
 from ._channel_data_point import ChannelDataPoint
+from ._channel_handle import ChannelHandle
+from ._channel_snapshot import ChannelSnapshot
+from ._channel_poller import ChannelPoller
+from ._channel_catalog import ChannelCatalog
+from ._channel_value_cache import ChannelValueCache
+from ._write_batcher import WriteBatcher
+from ._deadband_type import DeadbandType
+from ._channel_change_monitor import ChannelChangeMonitor
+from ._channel_change_stream import ChannelChangeStream
 from ._test_property import TestProperty
 from ._data_rate_level import DataRateLevel
 from ._event_payloads import EventPayload
@@ -18,6 +32,14 @@ from ._event_payloads import FilePayload
 from . import _event_names as EventNames
 from ._event_type import EventType
 from ._events import FlexLoggerEventHandler
+from ._event_stream import EventStream
+from ._overflow_policy import OverflowPolicy
+from ._event_recorder import EventRecorder
+from ._event_replayer import EventReplayer
+from ._dispatch_mode import DispatchMode
+from ._subscriber_metrics import SubscriberMetrics
+from ._rpc_metrics import RpcMethodMetrics
+from ._prometheus import export_prometheus_metrics
 from ._severity_level import SeverityLevel
 from ._start_trigger_condition import StartTriggerCondition
 from ._stop_trigger_condition import StopTriggerCondition
@@ -5,23 +5,35 @@ import re
 import struct
 import subprocess
 import sys
+import threading
 import time
 import uuid
 from datetime import timedelta
 from pathlib import Path
 from socket import SOCK_STREAM
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 # Do not import anything from win32api here (instead, import them in the
 # methods they're needed in). Linux machines need to be able to import our
 # module so buildthedocs will be able to use automodule correctly to generate
 # our API Reference documentation.
 import psutil  # type: ignore
-from grpc import insecure_channel, RpcError, StatusCode
+from grpc import Channel, insecure_channel, intercept_channel, RpcError, StatusCode
 
+from ._channel_options import ChannelOptions
 from ._events import FlexLoggerEventHandler
-from ._flexlogger_error import FlexLoggerError
+from ._flexlogger_error import _to_flexlogger_error, FlexLoggerError
+from ._metrics_interceptor import _MetricsInterceptor
 from ._project import Project
+from ._reconnect_policy import ReconnectPolicy
+from ._reconnecting_channel import _ReconnectingChannel
+from ._retry_interceptor import _RetryInterceptor
+from ._retry_policy import RetryPolicy
+from ._rpc_metrics import _RpcMetricsCollector, RpcMethodMetrics
+from ._session_tracker import _SessionTracker
+from ._stub_registry import StubRegistry
+from ._timeout_interceptor import _TimeoutInterceptor
+from ._timeout_policy import TimeoutPolicy
 from .proto import (
     Application_pb2,  # type: ignore
     Application_pb2_grpc,  # type: ignore
@@ -39,18 +51,53 @@ _APP_CLOSE_TIMEOUT = 60
 class Application:
     """Represents the FlexLogger application."""
 
-    def __init__(self, server_port: int = None) -> None:
+    def __init__(
+        self,
+        server_port: int = None,
+        collect_metrics: bool = False,
+        channel_options: ChannelOptions = None,
+        timeout_policy: TimeoutPolicy = None,
+        retry_policy: RetryPolicy = None,
+        reconnect_policy: ReconnectPolicy = None,
+    ) -> None:
         """Connect to an already running instance of FlexLogger.
 
         Args:
             server_port: The port that the automation server is listening to.  Omit this
                 argument or pass None to detect the port of a running FlexLogger automatically.
+            collect_metrics: Whether to record the count, errors and latency of every call
+                to FlexLogger.  See :meth:`metrics`.
+                Defaults to False.
+            channel_options: Settings for the gRPC channel, such as keepalive and message
+                size limits.
+                Defaults to None, meaning gRPC's defaults are used.
+            timeout_policy: The default timeouts for calls to FlexLogger.  Methods that take
+                a ``timeout`` argument can override them for a single call.
+                Defaults to None, meaning calls wait indefinitely unless they are given a
+                timeout.
+            retry_policy: How to retry calls that only read from FlexLogger when they fail
+                with a transient error, such as the connection being briefly unavailable.
+                Defaults to None, meaning calls are not retried.
+            reconnect_policy: How to reconnect to FlexLogger if it restarts, so that this
+                object and the projects and documents opened from it keep working.
+                Defaults to None, meaning they stop working if FlexLogger closes.
 
         Raises:
             FlexLoggerError: if connecting fails.
         """
         Application._raise_if_unsupported_platform()
         self._server_port = server_port if server_port is not None else self._detect_server_port()
+        self._channel_options = channel_options
+        self._timeout_policy = timeout_policy
+        self._retry_policy = retry_policy
+        self._metrics = _RpcMetricsCollector() if collect_metrics else None
+        self._reconnect_policy = reconnect_policy
+        self._session_tracker = _SessionTracker() if reconnect_policy is not None else None
+        # Only look for a new port when reconnecting if this one was detected.
+        self._detect_port_on_reconnect = server_port is None
+        self._recovery_lock = threading.Lock()
+        self._disconnecting = False
+        self._reconnecting_channel = None  # type: Optional[_ReconnectingChannel]
         self._connect()
         self._launched = False
         self._event_handler = None
@@ -71,7 +118,7 @@ class Application:
         if self._event_handler is not None:
             return self._event_handler
 
-        self._event_handler = FlexLoggerEventHandler(self._channel,
+        self._event_handler = FlexLoggerEventHandler(self._stubs,
                                                      self._client_id,
                                                      self,
                                                      self._raise_exception_if_closed)
@@ -82,8 +129,34 @@ class Application:
         """The port that the automation server is listening to."""
         return self._server_port
 
+    def metrics(self) -> Dict[str, RpcMethodMetrics]:
+        """Get statistics about the calls this application has made to FlexLogger.
+
+        Statistics are only collected if the application was created with
+        ``collect_metrics=True``.  They include the calls made by every object created from
+        this application, and are still available after disconnecting.  Use
+        :func:`.export_prometheus_metrics` to export them to Prometheus.
+
+        Returns:
+            A dictionary from the name of each gRPC method that has been called to its
+            statistics.  This is empty if statistics are not being collected.
+        """
+        if self._metrics is None:
+            return {}
+        return self._metrics.snapshot()
+
     @classmethod
-    def launch(cls, *, timeout: float = 40, path: Union[str, Path] = None) -> "Application":
+    def launch(
+        cls,
+        *,
+        timeout: float = 40,
+        path: Union[str, Path] = None,
+        collect_metrics: bool = False,
+        channel_options: ChannelOptions = None,
+        timeout_policy: TimeoutPolicy = None,
+        retry_policy: RetryPolicy = None,
+        reconnect_policy: ReconnectPolicy = None
+    ) -> "Application":
         """Launch a new instance of FlexLogger.
 
         Note that if this method is used to initialize a "with" statement, when
@@ -96,6 +169,22 @@ class Application:
                 Defaults to 40.
             path: The path to the FlexLogger executable to launch.
                 Defaults to None, meaning the latest installed version will be launched.
+            collect_metrics: Whether to record the count, errors and latency of every call
+                to FlexLogger.  See :meth:`metrics`.
+                Defaults to False.
+            channel_options: Settings for the gRPC channel, such as keepalive and message
+                size limits.
+                Defaults to None, meaning gRPC's defaults are used.
+            timeout_policy: The default timeouts for calls to FlexLogger.  Methods that take
+                a ``timeout`` argument can override them for a single call.
+                Defaults to None, meaning calls wait indefinitely unless they are given a
+                timeout.
+            retry_policy: How to retry calls that only read from FlexLogger when they fail
+                with a transient error, such as the connection being briefly unavailable.
+                Defaults to None, meaning calls are not retried.
+            reconnect_policy: How to reconnect to FlexLogger if it restarts, so that this
+                object and the projects and documents opened from it keep working.
+                Defaults to None, meaning they stop working if FlexLogger closes.
 
         Returns:
             The created Application object
@@ -107,8 +196,16 @@ class Application:
         if isinstance(path, str):
             path = Path(path)
         server_port = Application._launch_flexlogger(timeout_in_seconds=timeout, path=path)
-        application = Application(server_port=server_port)
+        application = Application(
+            server_port=server_port,
+            collect_metrics=collect_metrics,
+            channel_options=channel_options,
+            timeout_policy=timeout_policy,
+            retry_policy=retry_policy,
+            reconnect_policy=reconnect_policy,
+        )
         application._launched = True
+        application._detect_port_on_reconnect = True
         return application
 
     def close(self) -> None:
@@ -134,37 +231,106 @@ class Application:
         if self._server_port <= 0:
             raise ValueError("Tried to connect to invalid port number %d" % self._server_port)
         try:
-            self._channel = insecure_channel("localhost:%d" % self._server_port)
-            try:
-                stub = FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub(self._channel)
-                stub.Initialize(FlexLoggerApplication_pb2.InitializeRequest(client_type=AutomationClientType_pb2.CLIENT_TYPE_PYTHON))
-            except RpcError as error:
-                # Ignore UNIMPLEMENTED exceptions. Older FLexLogger does not support the Initialize message.
-                if error.code() != StatusCode.UNIMPLEMENTED:
-                    raise
+            self._channel = self._create_grpc_channel(self._server_port)
+            if self._reconnect_policy is not None:
+                self._reconnecting_channel = _ReconnectingChannel(
+                    self._channel, self._recover, self._session_tracker.update_request
+                )
+                self._channel = self._reconnecting_channel
+            # Each interceptor sees calls before the ones added earlier, so a timeout from
+            # the policy covers every retry of a call, and metrics record each call once.
+            if self._retry_policy is not None:
+                self._channel = intercept_channel(
+                    self._channel, _RetryInterceptor(self._retry_policy, self._metrics)
+                )
+            if self._timeout_policy is not None:
+                self._channel = intercept_channel(
+                    self._channel, _TimeoutInterceptor(self._timeout_policy)
+                )
+            if self._metrics is not None:
+                self._channel = intercept_channel(
+                    self._channel, _MetricsInterceptor(self._metrics)
+                )
+            self._stubs = StubRegistry(self._channel)
+            self._initialize(self._stubs)
         except RpcError as error:
-            raise FlexLoggerError(
+            raise _to_flexlogger_error(
                 'Failed to connect to FlexLogger. Ensure the "Automation server" preference is '
-                "enabled in the application. "
+                "enabled in the application. ",
+                error,
             ) from error
 
+    def _create_grpc_channel(self, server_port: int) -> Channel:
+        if self._channel_options is None:
+            return insecure_channel("localhost:%d" % server_port)
+        return insecure_channel(
+            "localhost:%d" % server_port,
+            options=self._channel_options._to_grpc_options(),
+            compression=self._channel_options._grpc_compression(),
+        )
+
+    @staticmethod
+    def _initialize(stubs: StubRegistry, timeout: float = None) -> None:
+        try:
+            stub = stubs.get(FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub)
+            stub.Initialize(
+                FlexLoggerApplication_pb2.InitializeRequest(
+                    client_type=AutomationClientType_pb2.CLIENT_TYPE_PYTHON
+                ),
+                timeout=timeout,
+            )
+        except RpcError as error:
+            # Ignore UNIMPLEMENTED exceptions. Older FLexLogger does not support the Initialize message.
+            if error.code() != StatusCode.UNIMPLEMENTED:
+                raise
+
+    def _recover(self, failed_generation: int) -> bool:
+        """Reconnect to FlexLogger after a call failed because it was unavailable.
+
+        Args:
+            failed_generation: The generation of the reconnecting channel the call failed on.
+
+        Returns:
+            Whether the application is connected again.  This is True without reconnecting
+            if another thread already reconnected since the call failed.
+        """
+        policy = self._reconnect_policy
+        with self._recovery_lock:
+            if self._disconnecting or self._reconnecting_channel is None:
+                return False
+            if self._reconnecting_channel.generation != failed_generation:
+                return True
+            deadline = time.monotonic() + policy.max_recovery_time
+            while True:
+                server_port = self._server_port
+                if self._detect_port_on_reconnect:
+                    try:
+                        server_port = self._detect_server_port()
+                    except (ImportError, OSError, RuntimeError):
+                        pass
+                channel = self._create_grpc_channel(server_port)
+                try:
+                    stubs = StubRegistry(channel)
+                    timeout = max(deadline - time.monotonic(), policy.retry_interval)
+                    self._initialize(stubs, timeout=timeout)
+                    self._session_tracker.rehydrate(stubs, timeout=timeout)
+                    break
+                except RpcError:
+                    channel.close()
+                    if self._disconnecting or time.monotonic() + policy.retry_interval > deadline:
+                        return False
+                    time.sleep(policy.retry_interval)
+            self._server_port = server_port
+            self._reconnecting_channel._replace_channel(channel).close()
+            return True
+
     def _disconnect(self, exit_application: bool) -> None:
+        self._disconnecting = True
         if self._channel is not None:
-            stub = Application_pb2_grpc.ApplicationStub(self._channel)
+            stub = self._stubs.get(Application_pb2_grpc.ApplicationStub)
             pid_to_wait_for = None
             if exit_application:
-                # Find the application that's using this port
-                pid_candidates = set(
-                    x.pid
-                    for x in psutil.net_connections()
-                    if x.type == SOCK_STREAM
-                    and x.laddr[1] == self._server_port
-                    and x.pid != os.getpid()
-                )
-                for pid in pid_candidates:
-                    if psutil.Process(pid).name().lower() == _FLEXLOGGER_EXE_NAME.lower():
-                        pid_to_wait_for = pid
-                        break
+                pid_to_wait_for = Application._find_flexlogger_pid(self._server_port)
             try:
                 if exit_application:
                     # If there is an active project, close it so closing the
@@ -182,35 +348,31 @@ class Application:
                     while time.time() < timeout_end_time and process_still_running:
                         # Only wait for 200 ms at a time so we can still be responsive to Ctrl-C
                         time.sleep(0.2)
-                        try:
-                            # This will raise an exception if the process doesn't exist.
-                            # But it's also possible the PID has been reused, so see if
-                            # the name is the same.
-                            process_still_running = (
-                                psutil.Process(pid_to_wait_for).name().lower()
-                                == _FLEXLOGGER_EXE_NAME.lower()
-                            )
-                        except psutil.Error:
-                            process_still_running = False
+                        process_still_running = Application._is_flexlogger_process(
+                            pid_to_wait_for
+                        )
             except (RpcError, ValueError, AttributeError) as rpc_error:
                 self._raise_exception_if_closed()
-                raise FlexLoggerError("Failed to disconnect") from rpc_error
+                raise _to_flexlogger_error("Failed to disconnect", rpc_error) from rpc_error
             finally:
                 self._channel.close()
                 self._channel = None
+                self._stubs.close()
                 self._event_handler = None
 
     def _raise_exception_if_closed(self) -> None:
         if self._channel is None:
             raise FlexLoggerError("Application has already been disconnected") from None
 
-    def open_project(self, path: Union[str, Path], timeout: int = -1) -> Project:
+    def open_project(self, path: Union[str, Path], timeout: float = None) -> Project:
         """Open a project.
 
         Args:
             path: The path to the project you want to open.
             timeout: The timeout in seconds.
-                     If the value is negative, it will be ignored and the call will wait indefinitely.
+                     If the value is None or negative, the project timeout of the application's
+                     :class:`.TimeoutPolicy` is used, and if there is no timeout policy the call
+                     will wait indefinitely.
 
         Returns:
             The opened project.
@@ -218,32 +380,36 @@ class Application:
         Raises:
             FlexLoggerError: if opening the project fails or the timeout is reached.
         """
+        if timeout is not None and timeout < 0:
+            timeout = None
         try:
-            stub = FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub(self._channel)
-            if timeout < 0:
-                response = stub.OpenProject(
-                    FlexLoggerApplication_pb2.OpenProjectRequest(project_path=str(path)))
-            else:
-                response = stub.OpenProject(
-                    FlexLoggerApplication_pb2.OpenProjectRequest(project_path=str(path)), timeout=timeout)
+            stub = self._stubs.get(FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub)
+            response = stub.OpenProject(
+                FlexLoggerApplication_pb2.OpenProjectRequest(project_path=str(path)),
+                timeout=timeout,
+            )
 
             # FlexLogger can hang if you open and then immediately close a project,
             # this seems sufficient to prevent that.
             time.sleep(1.0)
-            return Project(self._channel, self._raise_exception_if_closed, response.project)
+            return self._create_project(response.project, str(path))
         # For most methods, catching ValueError is sufficient to detect whether the Application
         # has been closed, and avoids race conditions where another thread closes the Application
         # in the middle of the first thread's call.
         #
-        # This method passes self._channel directly to a stub, and this raises an AttributeError
-        # if self._channel is None, so catch this as well.
-        except (RpcError, ValueError, AttributeError) as rpc_error:
+        # Once the Application has been disconnected, self._stubs raises a FlexLoggerError
+        # when asked for a stub.
+        except (RpcError, ValueError) as rpc_error:
             self._raise_exception_if_closed()
-            raise FlexLoggerError("Failed to open project") from rpc_error
+            raise _to_flexlogger_error("Failed to open project", rpc_error) from rpc_error
 
-    def get_active_project(self) -> Optional[Project]:
+    def get_active_project(self, timeout: float = None) -> Optional[Project]:
         """Gets the currently active (open) project.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             The active project, or None if a project is not currently open.
 
@@ -251,25 +417,43 @@ class Application:
             FlexLoggerError: if getting the active project fails.
         """
         try:
-            stub = FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub(self._channel)
-            response = stub.GetActiveProject(FlexLoggerApplication_pb2.GetActiveProjectRequest())
+            stub = self._stubs.get(FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub)
+            response = stub.GetActiveProject(
+                FlexLoggerApplication_pb2.GetActiveProjectRequest(), timeout=timeout
+            )
             if response.active_project_available:
-                return Project(self._channel, self._raise_exception_if_closed, response.project)
+                return self._create_project(response.project)
             else:
                 return None
         # For most methods, catching ValueError is sufficient to detect whether the Application
         # has been closed, and avoids race conditions where another thread closes the Application
         # in the middle of the first thread's call.
         #
-        # This method passes self._channel directly to a stub, and this raises an AttributeError
-        # if self._channel is None, so catch this as well.
-        except (RpcError, ValueError, AttributeError) as rpc_error:
+        # Once the Application has been disconnected, self._stubs raises a FlexLoggerError
+        # when asked for a stub.
+        except (RpcError, ValueError) as rpc_error:
             self._raise_exception_if_closed()
-            raise FlexLoggerError("Failed to get the active project") from rpc_error
+            raise _to_flexlogger_error("Failed to get the active project", rpc_error) from rpc_error
 
-    def get_version(self) -> (str, str):
+    def _create_project(self, identifier: Any, path: str = None) -> Project:
+        project = Project(
+            self._stubs, self._raise_exception_if_closed, identifier, self._session_tracker
+        )
+        if self._session_tracker is not None:
+            if path is None:
+                project_file_path = project.project_file_path
+                path = str(project_file_path) if project_file_path is not None else None
+            if path is not None:
+                self._session_tracker.add_project(project, path)
+        return project
+
+    def get_version(self, timeout: float = None) -> (str, str):
         """Gets the FlexLogger server version.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             A tuple containing the FlexLogger versions (internal version and user visible version).
 
@@ -277,18 +461,18 @@ class Application:
             FlexLoggerError: if getting the version fails.
         """
         try:
-            stub = FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub(self._channel)
-            response = stub.GetVersion(empty_pb2.Empty())
+            stub = self._stubs.get(FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub)
+            response = stub.GetVersion(empty_pb2.Empty(), timeout=timeout)
             return response.version, response.version_string
         # For most methods, catching ValueError is sufficient to detect whether the Application
         # has been closed, and avoids race conditions where another thread closes the Application
         # in the middle of the first thread's call.
         #
-        # This method passes self._channel directly to a stub, and this raises an AttributeError
-        # if self._channel is None, so catch this as well.
-        except (RpcError, ValueError, AttributeError) as rpc_error:
+        # Once the Application has been disconnected, self._stubs raises a FlexLoggerError
+        # when asked for a stub.
+        except (RpcError, ValueError) as rpc_error:
             self._raise_exception_if_closed()
-            raise FlexLoggerError("Failed to get version") from rpc_error
+            raise _to_flexlogger_error("Failed to get version", rpc_error) from rpc_error
 
     @classmethod
     def _launch_flexlogger(cls, timeout_in_seconds: float, path: Optional[Path] = None) -> int:
@@ -340,9 +524,10 @@ class Application:
         program_data_path = Path(shell.SHGetFolderPath(0, shellcon.CSIDL_COMMON_APPDATA, 0, 0))
         return program_data_path / _FLEXLOGGER_PORT_FILE_PATH
 
-    def _detect_server_port(self) -> int:
+    @classmethod
+    def _detect_server_port(cls) -> int:
         """Detect the server_port of a running FlexLogger."""
-        port_file_path = Application._get_server_port_file_path()
+        port_file_path = cls._get_server_port_file_path()
         if not port_file_path.exists():
             raise RuntimeError(
                 "No running FlexLogger detected.  If FlexLogger is running, this might mean the "
@@ -356,6 +541,29 @@ class Application:
         except Exception as ex:
             raise RuntimeError("Failed to read automation port from running FlexLogger.") from ex
 
+    @classmethod
+    def _find_flexlogger_pid(cls, server_port: int) -> Optional[int]:
+        """Find the FlexLogger process that is using the given port."""
+        pid_candidates = set(
+            x.pid
+            for x in psutil.net_connections()
+            if x.type == SOCK_STREAM and x.laddr[1] == server_port and x.pid != os.getpid()
+        )
+        for pid in pid_candidates:
+            if cls._is_flexlogger_process(pid):
+                return pid
+        return None
+
+    @classmethod
+    def _is_flexlogger_process(cls, pid: int) -> bool:
+        try:
+            # This will raise an exception if the process doesn't exist.
+            # But it's also possible the PID has been reused, so see if
+            # the name is the same.
+            return psutil.Process(pid).name().lower() == _FLEXLOGGER_EXE_NAME.lower()
+        except psutil.Error:
+            return False
+
     @classmethod
     def _get_latest_installed_flexlogger_path(cls) -> Optional[Path]:
         import winreg  # type: ignore
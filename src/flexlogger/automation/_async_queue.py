@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Deque, Generic, Optional, TypeVar
+
+from ._overflow_policy import OverflowPolicy
+
+_T = TypeVar("_T")
+
+
+class _QueueClosed(Exception):
+    """Raised by :meth:`_ThreadSafeAsyncQueue.get` once the queue is closed and empty."""
+
+
+class _ThreadSafeAsyncQueue(Generic[_T]):
+    """A bounded queue that is filled from any thread and emptied by an asyncio task.
+
+    The bound is enforced when items are put, on the producer's thread, so the drop
+    policies hold no matter how far behind the event loop is.  With
+    :attr:`.OverflowPolicy.BLOCK`, :meth:`put` waits on the producer's thread until the
+    consumer makes room, so it must not be called from the event loop's own thread.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        max_size: int,
+        overflow_policy: OverflowPolicy,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than zero")
+        if not isinstance(overflow_policy, OverflowPolicy):
+            raise ValueError("overflow_policy must be an OverflowPolicy")
+        self._loop = loop
+        self.max_size = max_size
+        self.overflow_policy = overflow_policy
+        self._items = deque()  # type: Deque[_T]
+        self._not_full = threading.Condition(threading.Lock())
+        self._waiter = None  # type: Optional[asyncio.Future]
+        self._closed = False
+        self._error = None  # type: Optional[BaseException]
+        self.put_count = 0
+        self.get_count = 0
+        self.dropped_count = 0
+        self.blocked_count = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, item: _T) -> bool:
+        """Add an item, applying the overflow policy if the queue is full.
+
+        Returns:
+            False if the item was discarded (because the queue is full and the policy is
+            :attr:`.OverflowPolicy.DROP_NEWEST`, or because the queue is closed),
+            otherwise True.
+        """
+        with self._not_full:
+            if self._closed:
+                return False
+            self.put_count += 1
+            if len(self._items) >= self.max_size:
+                if self.overflow_policy is OverflowPolicy.DROP_NEWEST:
+                    self.dropped_count += 1
+                    return False
+                if self.overflow_policy is OverflowPolicy.DROP_OLDEST:
+                    self._items.popleft()
+                    self.dropped_count += 1
+                else:
+                    self.blocked_count += 1
+                    while len(self._items) >= self.max_size and not self._closed:
+                        self._not_full.wait()
+                    if self._closed:
+                        return False
+            self._items.append(item)
+            self._wake_consumer()
+        return True
+
+    async def get(self) -> _T:
+        """Remove and return the oldest item, waiting for one if the queue is empty.
+
+        Raises:
+            _QueueClosed: if the queue was closed without an error and is empty.
+            BaseException: the error the queue was closed with, once it is empty.
+        """
+        while True:
+            with self._not_full:
+                if len(self._items) > 0:
+                    item = self._items.popleft()
+                    self.get_count += 1
+                    self._not_full.notify()
+                    return item
+                if self._closed:
+                    if self._error is not None:
+                        raise self._error
+                    raise _QueueClosed()
+                waiter = self._loop.create_future()
+                self._waiter = waiter
+            await waiter
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        """Stop accepting items.
+
+        Items already in the queue can still be read.  After that, :meth:`get` raises
+        ``error``, or :class:`_QueueClosed` if no error was given.  Closing a queue that
+        is already closed has no effect.
+        """
+        with self._not_full:
+            if self._closed:
+                return
+            self._closed = True
+            self._error = error
+            self._not_full.notify_all()
+            self._wake_consumer()
+
+    def _wake_consumer(self) -> None:
+        # Called with the lock held.
+        waiter = self._waiter
+        if waiter is None:
+            return
+        self._waiter = None
+        try:
+            self._loop.call_soon_threadsafe(_set_result_if_pending, waiter)
+        except RuntimeError:
+            # The event loop has been closed, so nobody is waiting any more.
+            pass
+
+
+def _set_result_if_pending(future: "asyncio.Future[Any]") -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,188 @@
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from ._channel_specification_document import ChannelSpecificationDocument
+from ._data_rate_level import DataRateLevel
+
+
+class ChannelCatalog:
+    """Caches the channels of a channel specification document and their settings.
+
+    Classifying channels one call at a time, for instance with
+    :meth:`.ChannelSpecificationDocument.is_channel_enabled`, costs a round trip to
+    FlexLogger for every channel.  The catalog gets the input, output and configured
+    channels with one request each (see
+    :meth:`.ChannelSpecificationDocument.get_filtered_channel_names`), and asks for each
+    channel's settings only the first time they are needed::
+
+        catalog = ChannelCatalog(channel_specification)
+        for channel_name in catalog.output_channel_names:
+            if catalog.is_channel_enabled(channel_name):
+                ...
+
+    The catalog does not see changes made through the document or in FlexLogger.  Call
+    :meth:`refresh` after making changes, or set ``max_age`` to refresh information
+    automatically once it is older than that.
+    """
+
+    def __init__(
+        self, channel_specification: ChannelSpecificationDocument, max_age: float = None
+    ) -> None:
+        """Create a new ChannelCatalog.
+
+        Args:
+            channel_specification: The document to get the channels from.
+            max_age: The time, in seconds, after which cached information is fetched
+                again the next time it is used.  Defaults to None, meaning information is
+                kept until :meth:`refresh` is called.
+
+        Raises:
+            ValueError: if max_age is not positive.
+        """
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age must be positive")
+        self._channel_specification = channel_specification
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        # The cached values and when they were fetched, keyed by the kind of information
+        # and the channel name, which is empty for channel lists
+        self._entries = {}  # type: Dict[Tuple[str, str], Tuple[float, Any]]
+        # Sets of channel names for fast lookups, and the names they were built from
+        self._name_sets = {}  # type: Dict[str, Tuple[Tuple[str, ...], FrozenSet[str]]]
+
+    @property
+    def max_age(self) -> Optional[float]:
+        """The time, in seconds, after which cached information is fetched again."""
+        return self._max_age
+
+    @property
+    def channel_names(self) -> Tuple[str, ...]:
+        """The names of all the channels in the document."""
+        return self._get_names("all", self._channel_specification.get_channel_names)
+
+    @property
+    def input_channel_names(self) -> Tuple[str, ...]:
+        """The names of the input channels in the document."""
+        return self._get_names(
+            "input",
+            lambda: self._channel_specification.get_filtered_channel_names(output_channels=False),
+        )
+
+    @property
+    def output_channel_names(self) -> Tuple[str, ...]:
+        """The names of the output channels in the document."""
+        return self._get_names(
+            "output",
+            lambda: self._channel_specification.get_filtered_channel_names(input_channels=False),
+        )
+
+    @property
+    def configured_channel_names(self) -> Tuple[str, ...]:
+        """The names of the configured channels in the document."""
+        return self._get_names(
+            "configured",
+            lambda: self._channel_specification.get_filtered_channel_names(configured_only=True),
+        )
+
+    def is_input_channel(self, channel_name: str) -> bool:
+        """Get whether the specified channel is an input channel."""
+        return channel_name in self._get_name_set("input", self.input_channel_names)
+
+    def is_output_channel(self, channel_name: str) -> bool:
+        """Get whether the specified channel is an output channel."""
+        return channel_name in self._get_name_set("output", self.output_channel_names)
+
+    def is_channel_enabled(self, channel_name: str) -> bool:
+        """Get the enabled state of the specified channel.
+
+        Args:
+            channel_name: The name of the channel.
+
+        Raises:
+            FlexLoggerError: if the state is not cached and getting it fails.
+        """
+        return self._get(
+            ("enabled", channel_name),
+            lambda: self._channel_specification.is_channel_enabled(channel_name),
+        )
+
+    def is_channel_logging_enabled(self, channel_name: str) -> bool:
+        """Get the logging state of the specified channel.
+
+        Args:
+            channel_name: The name of the channel.
+
+        Raises:
+            FlexLoggerError: if the state is not cached and getting it fails.
+        """
+        return self._get(
+            ("logging_enabled", channel_name),
+            lambda: self._channel_specification.is_channel_logging_enabled(channel_name),
+        )
+
+    def get_data_rate_level(self, channel_name: str) -> DataRateLevel:
+        """Get the data rate level of the specified channel.
+
+        Args:
+            channel_name: The name of the channel.
+
+        Raises:
+            FlexLoggerError: if the level is not cached and getting it fails.
+        """
+        return self._get(
+            ("data_rate_level", channel_name),
+            lambda: self._channel_specification.get_data_rate_level(channel_name),
+        )
+
+    def get_actual_data_rate(self, channel_name: str) -> float:
+        """Get the actual data rate, in Hertz, of the specified channel.
+
+        Args:
+            channel_name: The name of the channel.
+
+        Raises:
+            FlexLoggerError: if the rate is not cached and getting it fails.
+        """
+        return self._get(
+            ("actual_data_rate", channel_name),
+            lambda: self._channel_specification.get_actual_data_rate(channel_name),
+        )
+
+    def refresh(self, channel_names: Iterable[str] = None) -> None:
+        """Forget cached information, so it is fetched again the next time it is used.
+
+        Args:
+            channel_names: The channels whose settings to forget.  Defaults to None,
+                meaning everything is forgotten, including the lists of channels.
+        """
+        with self._lock:
+            if channel_names is None:
+                self._entries.clear()
+                return
+            names = set(channel_names)
+            for key in [key for key in self._entries if key[1] in names]:
+                del self._entries[key]
+
+    def _get(self, key: Tuple[str, str], fetch: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and (self._max_age is None or now - entry[0] < self._max_age):
+            return entry[1]
+        # Fetch without holding the lock so that other threads can use cached values.
+        value = fetch()
+        with self._lock:
+            self._entries[key] = (now, value)
+        return value
+
+    def _get_names(self, kind: str, fetch: Callable[[], Iterable[str]]) -> Tuple[str, ...]:
+        return self._get((kind, ""), lambda: tuple(fetch()))
+
+    def _get_name_set(self, kind: str, names: Tuple[str, ...]) -> FrozenSet[str]:
+        # Sets are rebuilt when the names they were built from are fetched again.
+        name_set = self._name_sets.get(kind)
+        if name_set is None or name_set[0] is not names:
+            name_set = (names, frozenset(names))
+            self._name_sets[kind] = name_set
+        return name_set[1]
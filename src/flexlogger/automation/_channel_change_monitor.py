@@ -0,0 +1,367 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np  # type: ignore
+
+from ._channel_change_stream import ChannelChangeStream
+from ._channel_data_point import ChannelDataPoint
+from ._channel_specification_document import ChannelSpecificationDocument
+from ._deadband_type import DeadbandType
+from ._flexlogger_error import FlexLoggerError
+from ._overflow_policy import OverflowPolicy
+
+
+def _find_reports(
+    values: np.ndarray,
+    last_values: np.ndarray,
+    absolute_deadbands: np.ndarray,
+    deadband_fractions: np.ndarray,
+    elapsed: np.ndarray,
+    min_intervals: np.ndarray,
+    max_intervals: np.ndarray,
+) -> np.ndarray:
+    """Decide which channels to report, for every channel at once.
+
+    A channel is reported if its value moved by more than its deadband since it was last
+    reported and at least its minimum interval has passed, or if its maximum interval has
+    passed.  A deadband is the sum of an absolute part and a fraction of the magnitude of
+    the last reported value; one of the two is zero.
+
+    >>> _find_reports(
+    ...     values=np.array([1.4, 1.6, 110.0, 5.0, 5.0]),
+    ...     last_values=np.array([1.0, 1.0, 100.0, 5.0, np.nan]),
+    ...     absolute_deadbands=np.array([0.5, 0.5, 0.0, 0.0, 0.0]),
+    ...     deadband_fractions=np.array([0.0, 0.0, 0.05, 0.0, 0.0]),
+    ...     elapsed=np.array([1.0, 1.0, 1.0, 2.0, np.inf]),
+    ...     min_intervals=np.zeros(5),
+    ...     max_intervals=np.array([np.inf, np.inf, np.inf, 2.0, np.inf]),
+    ... )
+    array([False,  True,  True,  True,  True])
+    """
+    thresholds = absolute_deadbands + deadband_fractions * np.abs(last_values)
+    with np.errstate(invalid="ignore"):
+        changed = np.abs(values - last_values) > thresholds
+    # A value becoming or stopping being NaN is always a change.
+    changed |= np.isnan(values) != np.isnan(last_values)
+    return (changed & (elapsed >= min_intervals)) | (elapsed >= max_intervals)
+
+
+class _MonitoredChannel:
+    """The settings of one channel of a :class:`.ChannelChangeMonitor`."""
+
+    __slots__ = (
+        "absolute_deadband",
+        "deadband_fraction",
+        "min_interval",
+        "max_interval",
+        "callback",
+    )
+
+    def __init__(
+        self,
+        absolute_deadband: float,
+        deadband_fraction: float,
+        min_interval: float,
+        max_interval: float,
+        callback: Optional[Callable[[ChannelDataPoint], None]],
+    ) -> None:
+        self.absolute_deadband = absolute_deadband
+        self.deadband_fraction = deadband_fraction
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.callback = callback
+
+
+class ChannelChangeMonitor:
+    """Reports channel values only when they change significantly.
+
+    On a background thread, the monitor reads all of its channels at a fixed rate with a
+    single request (see :meth:`.ChannelSpecificationDocument.get_channel_snapshot`), and
+    compares every value with the last one it reported for that channel.  A value is
+    reported when it moved by more than the channel's deadband and the channel's minimum
+    interval has passed since its last report, or when the channel's maximum interval has
+    passed, even if the value did not change.  The first value of each channel is always
+    reported.
+
+    Reported values are passed to the channel's callback, if it has one, and to every
+    stream returned by :meth:`changes`::
+
+        monitor = ChannelChangeMonitor(channel_specification, poll_rate=20)
+        monitor.add_channel("Temperature", deadband=0.5, callback=print)
+        monitor.add_channel("Pressure", deadband=2, deadband_type=DeadbandType.PERCENT)
+        with monitor:
+            time.sleep(60)
+    """
+
+    def __init__(
+        self, channel_specification: ChannelSpecificationDocument, poll_rate: float
+    ) -> None:
+        """Create a new ChannelChangeMonitor.
+
+        Args:
+            channel_specification: The document to read the channels from.
+            poll_rate: The rate, in Hertz, at which to read the channels.
+
+        Raises:
+            ValueError: if poll_rate is not positive.
+        """
+        if poll_rate <= 0:
+            raise ValueError("poll_rate must be greater than zero")
+        self._channel_specification = channel_specification
+        self._period = 1.0 / poll_rate
+        self._lock = threading.Lock()
+        self._channels = OrderedDict()  # type: OrderedDict[str, _MonitoredChannel]
+        self._streams = []  # type: List[ChannelChangeStream]
+        # The state of each channel, in the order of _channel_names.  The arrays are
+        # rebuilt when channels are added or removed.
+        self._channel_names = ()  # type: Tuple[str, ...]
+        self._absolute_deadbands = np.zeros(0)
+        self._deadband_fractions = np.zeros(0)
+        self._min_intervals = np.zeros(0)
+        self._max_intervals = np.zeros(0)
+        self._last_values = np.zeros(0)
+        self._last_report_times = np.zeros(0)
+        self._poll_count = 0
+        self._report_count = 0
+        self._callback_error_count = 0
+        self._last_error = None  # type: Optional[FlexLoggerError]
+        self._stop_event = threading.Event()
+        self._thread = None  # type: Optional[threading.Thread]
+
+    def __enter__(self) -> "ChannelChangeMonitor":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def channel_names(self) -> Tuple[str, ...]:
+        """The names of the channels being monitored."""
+        return self._channel_names
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the monitor is currently reading channels."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def poll_count(self) -> int:
+        """The number of times the channels have been read."""
+        return self._poll_count
+
+    @property
+    def report_count(self) -> int:
+        """The number of values that have been reported."""
+        return self._report_count
+
+    @property
+    def callback_error_count(self) -> int:
+        """The number of times a callback raised an exception."""
+        return self._callback_error_count
+
+    @property
+    def last_error(self) -> Optional[FlexLoggerError]:
+        """The error raised by the most recent failed read, or None if no read has failed."""
+        return self._last_error
+
+    def add_channel(
+        self,
+        channel_name: str,
+        deadband: float = 0.0,
+        deadband_type: DeadbandType = DeadbandType.ABSOLUTE,
+        min_interval: float = 0.0,
+        max_interval: float = None,
+        callback: Callable[[ChannelDataPoint], None] = None,
+    ) -> None:
+        """Start monitoring a channel, or change the settings of a monitored channel.
+
+        Args:
+            channel_name: The name of the channel.
+            deadband: How far the value must move from the last reported value to be
+                reported.  Defaults to 0, meaning every change is reported.
+            deadband_type: Whether the deadband is in the channel's units or a percentage
+                of the last reported value.  Defaults to :attr:`.DeadbandType.ABSOLUTE`.
+            min_interval: The shortest time, in seconds, between reports of the channel.
+                Changes within this time of the last report are held back until it has
+                passed.  Defaults to 0.
+            max_interval: The longest time, in seconds, between reports of the channel.
+                The value is reported when this time has passed, even if it did not
+                change.  Defaults to None, meaning values are only reported when they
+                change.
+            callback: A function to call with each reported value, as a
+                :class:`.ChannelDataPoint`.  It is called on the monitor's thread.
+
+        Raises:
+            ValueError: if the settings are invalid.
+        """
+        if not isinstance(deadband_type, DeadbandType):
+            raise ValueError("deadband_type must be a DeadbandType")
+        if deadband < 0:
+            raise ValueError("deadband must not be negative")
+        if min_interval < 0:
+            raise ValueError("min_interval must not be negative")
+        if max_interval is not None and (max_interval <= 0 or max_interval < min_interval):
+            raise ValueError("max_interval must be positive and at least min_interval")
+        channel = _MonitoredChannel(
+            deadband if deadband_type is DeadbandType.ABSOLUTE else 0.0,
+            deadband / 100.0 if deadband_type is DeadbandType.PERCENT else 0.0,
+            min_interval,
+            max_interval if max_interval is not None else np.inf,
+            callback,
+        )
+        with self._lock:
+            self._channels[channel_name] = channel
+            self._update_channel_state()
+
+    def remove_channel(self, channel_name: str) -> None:
+        """Stop monitoring a channel.
+
+        Raises:
+            KeyError: if the channel is not being monitored.
+        """
+        with self._lock:
+            del self._channels[channel_name]
+            self._update_channel_state()
+
+    def changes(
+        self,
+        max_queue_size: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> ChannelChangeStream:
+        """Get an asynchronous iterator over the reported values of every channel.
+
+        This must be called from a coroutine::
+
+            async with monitor.changes() as changes:
+                async for data_point in changes:
+                    print(data_point.name, data_point.value)
+
+        Args:
+            max_queue_size: The maximum number of values to hold until they are read.
+            overflow_policy: What to do with new values when the queue is full.
+                Defaults to :attr:`.OverflowPolicy.DROP_OLDEST`, so a slow consumer does
+                not delay the monitor.
+
+        Raises:
+            ValueError: if max_queue_size is not positive.
+        """
+        stream = ChannelChangeStream(
+            self, max_queue_size, overflow_policy, asyncio.get_event_loop()
+        )
+        with self._lock:
+            self._streams.append(stream)
+        return stream
+
+    def start(self) -> None:
+        """Start reading channels on a background thread.
+
+        Calling this method while the monitor is already running has no effect.
+        """
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._poll, name="FlexLogger ChannelChangeMonitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop reading channels and wait for the background thread to exit.
+
+        The streams returned by :meth:`changes` end once their queued values are read.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            streams = self._streams
+            self._streams = []
+        for stream in streams:
+            stream._close()
+
+    def _remove_stream(self, stream: ChannelChangeStream) -> None:
+        with self._lock:
+            if stream in self._streams:
+                self._streams.remove(stream)
+
+    def _update_channel_state(self) -> None:
+        # Called with the lock held.  Channels that are still monitored keep their last
+        # reported value and time.
+        previous_positions = {name: i for i, name in enumerate(self._channel_names)}
+        channel_names = tuple(self._channels)
+        channels = list(self._channels.values())
+        last_values = np.full(len(channel_names), np.nan)
+        last_report_times = np.full(len(channel_names), -np.inf)
+        for position, channel_name in enumerate(channel_names):
+            previous_position = previous_positions.get(channel_name)
+            if previous_position is not None:
+                last_values[position] = self._last_values[previous_position]
+                last_report_times[position] = self._last_report_times[previous_position]
+        self._absolute_deadbands = np.array([c.absolute_deadband for c in channels], dtype=float)
+        self._deadband_fractions = np.array([c.deadband_fraction for c in channels], dtype=float)
+        self._min_intervals = np.array([c.min_interval for c in channels], dtype=float)
+        self._max_intervals = np.array([c.max_interval for c in channels], dtype=float)
+        self._last_values = last_values
+        self._last_report_times = last_report_times
+        self._channel_names = channel_names
+
+    def _poll(self) -> None:
+        next_poll_time = time.monotonic()
+        while not self._stop_event.is_set():
+            self._poll_once()
+            next_poll_time += self._period
+            now = time.monotonic()
+            if now > next_poll_time:
+                # Skip the polls we missed rather than trying to catch up.
+                next_poll_time += ((now - next_poll_time) // self._period + 1) * self._period
+            self._stop_event.wait(next_poll_time - now)
+
+    def _poll_once(self) -> None:
+        channel_names = self._channel_names
+        if len(channel_names) == 0:
+            return
+        try:
+            snapshot = self._channel_specification.get_channel_snapshot(channel_names)
+        except FlexLoggerError as error:
+            self._last_error = error
+            return
+        now = time.monotonic()
+        values = snapshot.values
+        with self._lock:
+            self._poll_count += 1
+            if self._channel_names is not channel_names:
+                # Channels were added or removed during the read.
+                return
+            reported = np.flatnonzero(
+                _find_reports(
+                    values,
+                    self._last_values,
+                    self._absolute_deadbands,
+                    self._deadband_fractions,
+                    now - self._last_report_times,
+                    self._min_intervals,
+                    self._max_intervals,
+                )
+            )
+            if len(reported) == 0:
+                return
+            self._last_values[reported] = values[reported]
+            self._last_report_times[reported] = now
+            self._report_count += len(reported)
+            callbacks = [self._channels[channel_names[i]].callback for i in reported]
+            streams = list(self._streams)
+        for position, callback in zip(reported, callbacks):
+            data_point = snapshot[int(position)]
+            if callback is not None:
+                try:
+                    callback(data_point)
+                except Exception:
+                    # Keep reporting; the failure shows up in callback_error_count.
+                    self._callback_error_count += 1
+            for stream in streams:
+                stream._put(data_point)
@@ -0,0 +1,90 @@
+import asyncio
+from typing import Any, Optional, TYPE_CHECKING
+
+from ._async_queue import _QueueClosed, _ThreadSafeAsyncQueue
+from ._channel_data_point import ChannelDataPoint
+from ._overflow_policy import OverflowPolicy
+
+if TYPE_CHECKING:
+    from ._channel_change_monitor import ChannelChangeMonitor  # noqa: F401
+
+
+class ChannelChangeStream:
+    """An asynchronous iterator over the changes reported by a :class:`.ChannelChangeMonitor`.
+
+    Do not create this class directly; instead, use the return value of
+    :meth:`.ChannelChangeMonitor.changes`.
+
+    Changes are reported on the monitor's thread and put in a bounded queue, which is
+    emptied by iterating over the stream with ``async for``.  When the queue is full,
+    the stream's :class:`.OverflowPolicy` decides whether to wait for the consumer or to
+    discard a change.  The iteration ends when the monitor stops, or after leaving the
+    ``async with`` block or calling :meth:`aclose`.
+    """
+
+    def __init__(
+        self,
+        monitor: "ChannelChangeMonitor",
+        max_queue_size: int,
+        overflow_policy: OverflowPolicy,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self._monitor = monitor
+        self._queue = _ThreadSafeAsyncQueue(
+            loop, max_queue_size, overflow_policy
+        )  # type: _ThreadSafeAsyncQueue[ChannelDataPoint]
+
+    def __aiter__(self) -> "ChannelChangeStream":
+        return self
+
+    async def __anext__(self) -> ChannelDataPoint:
+        try:
+            return await self._queue.get()
+        except _QueueClosed:
+            raise StopAsyncIteration from None
+
+    async def __aenter__(self) -> "ChannelChangeStream":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    @property
+    def max_queue_size(self) -> int:
+        """The maximum number of changes that can wait in the queue."""
+        return self._queue.max_size
+
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        """What happens to new changes when the queue is full."""
+        return self._queue.overflow_policy
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of changes waiting in the queue."""
+        return len(self._queue)
+
+    @property
+    def delivered_count(self) -> int:
+        """The number of changes returned by the iterator."""
+        return self._queue.get_count
+
+    @property
+    def dropped_count(self) -> int:
+        """The number of changes discarded because the queue was full."""
+        return self._queue.dropped_count
+
+    async def aclose(self) -> None:
+        """Stop receiving changes.
+
+        Changes that are already in the queue can still be read, after which the
+        iteration ends.
+        """
+        self._close()
+        self._monitor._remove_stream(self)
+
+    def _put(self, data_point: ChannelDataPoint) -> None:
+        self._queue.put(data_point)
+
+    def _close(self, error: Optional[BaseException] = None) -> None:
+        self._queue.close(error)
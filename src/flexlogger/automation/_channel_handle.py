@@ -0,0 +1,132 @@
+import threading
+from datetime import timezone
+from typing import Any, Optional, TYPE_CHECKING
+
+from grpc import RpcError
+
+from ._channel_data_point import ChannelDataPoint
+from ._flexlogger_error import _to_flexlogger_error
+from .proto import (
+    ChannelSpecificationDocument_pb2,
+    ChannelSpecificationDocument_pb2_grpc,
+)
+
+if TYPE_CHECKING:
+    from ._channel_specification_document import ChannelSpecificationDocument  # noqa: F401
+
+
+class ChannelHandle:
+    """A channel in a channel specification document, for reading and writing it often.
+
+    Do not create this class directly; instead, use the return value of
+    :meth:`.ChannelSpecificationDocument.get_channel_handle`.
+
+    :meth:`read` and :meth:`write` do the same as
+    :meth:`.ChannelSpecificationDocument.get_channel_value` and
+    :meth:`.ChannelSpecificationDocument.set_channel_value`, but reuse the request
+    messages they build instead of building new ones, including the channel name, for
+    every call::
+
+        setpoint = channel_specification.get_channel_handle("Setpoint")
+        for value in values:
+            setpoint.write(value)
+    """
+
+    def __init__(self, document: "ChannelSpecificationDocument", channel_name: str) -> None:
+        self._document = document
+        self._channel_name = channel_name
+        # The requests are built with the document's identifier, and built again if the
+        # identifier changes because the application reconnected to FlexLogger.
+        self._identifier = None  # type: Any
+        self._read_request = None  # type: Any
+        # Each thread changes the value in its own write request.
+        self._write_requests = threading.local()
+
+    def __repr__(self) -> str:
+        return "flexlogger.automation.ChannelHandle(%r)" % self._channel_name
+
+    @property
+    def channel_name(self) -> str:
+        """The name of the channel."""
+        return self._channel_name
+
+    def read(self, timeout: float = None) -> ChannelDataPoint:
+        """Get the current value of the channel.
+
+        Like :meth:`.ChannelSpecificationDocument.get_channel_value`, this returns the
+        cached value, if there is one, when the document's value cache is enabled.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if getting the channel value fails.
+        """
+        value_cache = self._document._value_cache
+        if value_cache is not None:
+            return value_cache._get(self._channel_name, lambda _: self._read(timeout))
+        return self._read(timeout)
+
+    def write(self, channel_value: float, timeout: float = None) -> None:
+        """Set the current value of the channel.
+
+        Args:
+            channel_value: The value to set the channel to.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the channel value fails.
+        """
+        document = self._document
+        stub = document._stubs.get(
+            ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub
+        )
+        try:
+            write_requests = self._write_requests
+            if getattr(write_requests, "identifier", None) is not document._identifier:
+                self._build_write_request()
+            request = write_requests.request
+            request.channel_value = channel_value
+            stub.SetDoubleChannelValue(request, timeout=timeout)
+        except (RpcError, ValueError) as error:
+            document._raise_if_application_closed()
+            raise _to_flexlogger_error("Failed to set channel value", error) from error
+        finally:
+            document._invalidate_cached_values((self._channel_name,))
+
+    def _read(self, timeout: Optional[float]) -> ChannelDataPoint:
+        document = self._document
+        stub = document._stubs.get(
+            ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub
+        )
+        try:
+            if self._identifier is not document._identifier:
+                self._build_read_request()
+            response = stub.GetDoubleChannelValue(self._read_request, timeout=timeout)
+            # Timestamps come back from FlexLogger in UTC
+            return ChannelDataPoint(
+                self._channel_name,
+                response.channel_value,
+                response.value_timestamp.ToDatetime().replace(tzinfo=timezone.utc),
+            )
+        except (RpcError, ValueError) as error:
+            document._raise_if_application_closed()
+            raise _to_flexlogger_error("Failed to get channel value", error) from error
+
+    def _build_read_request(self) -> None:
+        identifier = self._document._identifier
+        self._read_request = ChannelSpecificationDocument_pb2.GetDoubleChannelValueRequest(
+            document_identifier=identifier, channel_name=self._channel_name
+        )
+        self._identifier = identifier
+
+    def _build_write_request(self) -> None:
+        identifier = self._document._identifier
+        self._write_requests.request = (
+            ChannelSpecificationDocument_pb2.SetDoubleChannelValueRequest(
+                document_identifier=identifier, channel_name=self._channel_name
+            )
+        )
+        self._write_requests.identifier = identifier
@@ -0,0 +1,158 @@
+from typing import Any, List, Optional, Tuple
+
+from grpc import Compression
+
+
+class ChannelOptions:
+    """Settings for the gRPC channel an :class:`.Application` uses to talk to FlexLogger.
+
+    Pass this to :class:`.Application` or :meth:`.Application.launch`::
+
+        options = ChannelOptions(keepalive_time=30, max_receive_message_length=64 * 1024 * 1024)
+        app = Application(channel_options=options)
+
+    Every setting defaults to None, meaning gRPC's default is used.
+    """
+
+    def __init__(
+        self,
+        *,
+        keepalive_time: Optional[float] = None,
+        keepalive_timeout: Optional[float] = None,
+        keepalive_permit_without_calls: bool = False,
+        max_send_message_length: Optional[int] = None,
+        max_receive_message_length: Optional[int] = None,
+        gzip_compression: bool = False,
+        initial_window_size: Optional[int] = None,
+    ) -> None:
+        """Create channel settings.
+
+        Args:
+            keepalive_time: The interval, in seconds, between keepalive pings.  Keepalive
+                pings detect a connection that was dropped while the client was idle, such as
+                between test steps, so the next call fails or reconnects right away instead of
+                stalling.  Servers may close connections that ping too often, so do not make
+                this shorter than about 10 seconds.
+            keepalive_timeout: The time, in seconds, to wait for a keepalive ping to be
+                acknowledged before closing the connection.
+            keepalive_permit_without_calls: Whether to send keepalive pings when no calls are
+                in progress.  Without this, keepalive pings are only sent while an event
+                stream or other call is open.
+            max_send_message_length: The largest request, in bytes, that can be sent, or -1
+                for no limit.
+            max_receive_message_length: The largest response, in bytes, that can be
+                received, or -1 for no limit.  gRPC's default is 4 MiB, which a
+                :meth:`.ChannelSpecificationDocument.get_channel_names` response for a
+                project with very many channels can exceed.
+            gzip_compression: Whether to compress requests with gzip.  This is only worth it
+                for large requests, such as writing many channels at once, because FlexLogger
+                runs on the same machine.
+            initial_window_size: The HTTP/2 flow control window, in bytes, for each call.
+                A larger window lets large responses be sent without waiting for the client
+                to acknowledge what it has received.  Setting this turns off gRPC's automatic
+                window sizing.
+
+        Raises:
+            ValueError: if a setting is out of range.
+        """
+        for name, seconds in (
+            ("keepalive_time", keepalive_time),
+            ("keepalive_timeout", keepalive_timeout),
+        ):
+            if seconds is not None and seconds <= 0:
+                raise ValueError("%s must be positive" % name)
+        for name, length in (
+            ("max_send_message_length", max_send_message_length),
+            ("max_receive_message_length", max_receive_message_length),
+        ):
+            if length is not None and length < -1:
+                raise ValueError("%s must be -1 or a number of bytes" % name)
+        if initial_window_size is not None and initial_window_size <= 0:
+            raise ValueError("initial_window_size must be positive")
+        self._keepalive_time = keepalive_time
+        self._keepalive_timeout = keepalive_timeout
+        self._keepalive_permit_without_calls = keepalive_permit_without_calls
+        self._max_send_message_length = max_send_message_length
+        self._max_receive_message_length = max_receive_message_length
+        self._gzip_compression = gzip_compression
+        self._initial_window_size = initial_window_size
+
+    def __repr__(self) -> str:
+        settings = [
+            "%s=%r" % (name, value)
+            for name, value in (
+                ("keepalive_time", self._keepalive_time),
+                ("keepalive_timeout", self._keepalive_timeout),
+                ("keepalive_permit_without_calls", self._keepalive_permit_without_calls),
+                ("max_send_message_length", self._max_send_message_length),
+                ("max_receive_message_length", self._max_receive_message_length),
+                ("gzip_compression", self._gzip_compression),
+                ("initial_window_size", self._initial_window_size),
+            )
+            if value is not None and value is not False
+        ]
+        return "flexlogger.automation.ChannelOptions(%s)" % ", ".join(settings)
+
+    @property
+    def keepalive_time(self) -> Optional[float]:
+        """The interval, in seconds, between keepalive pings."""
+        return self._keepalive_time
+
+    @property
+    def keepalive_timeout(self) -> Optional[float]:
+        """The time, in seconds, to wait for a keepalive ping to be acknowledged."""
+        return self._keepalive_timeout
+
+    @property
+    def keepalive_permit_without_calls(self) -> bool:
+        """Whether to send keepalive pings when no calls are in progress."""
+        return self._keepalive_permit_without_calls
+
+    @property
+    def max_send_message_length(self) -> Optional[int]:
+        """The largest request, in bytes, that can be sent, or -1 for no limit."""
+        return self._max_send_message_length
+
+    @property
+    def max_receive_message_length(self) -> Optional[int]:
+        """The largest response, in bytes, that can be received, or -1 for no limit."""
+        return self._max_receive_message_length
+
+    @property
+    def gzip_compression(self) -> bool:
+        """Whether to compress requests with gzip."""
+        return self._gzip_compression
+
+    @property
+    def initial_window_size(self) -> Optional[int]:
+        """The HTTP/2 flow control window, in bytes, for each call."""
+        return self._initial_window_size
+
+    def _to_grpc_options(self) -> List[Tuple[str, Any]]:
+        """Get the gRPC channel arguments for these settings.
+
+        >>> ChannelOptions(keepalive_time=30, max_receive_message_length=-1)._to_grpc_options()
+        [('grpc.keepalive_time_ms', 30000), ('grpc.max_receive_message_length', -1)]
+        >>> ChannelOptions(initial_window_size=1048576)._to_grpc_options()
+        [('grpc.http2.lookahead_bytes', 1048576), ('grpc.http2.bdp_probe', 0)]
+        """
+        options = []  # type: List[Tuple[str, Any]]
+        if self._keepalive_time is not None:
+            options.append(("grpc.keepalive_time_ms", int(self._keepalive_time * 1000)))
+        if self._keepalive_timeout is not None:
+            options.append(("grpc.keepalive_timeout_ms", int(self._keepalive_timeout * 1000)))
+        if self._keepalive_permit_without_calls:
+            options.append(("grpc.keepalive_permit_without_calls", 1))
+            # Otherwise gRPC stops pinging after two pings with no calls in between.
+            options.append(("grpc.http2.max_pings_without_data", 0))
+        if self._max_send_message_length is not None:
+            options.append(("grpc.max_send_message_length", self._max_send_message_length))
+        if self._max_receive_message_length is not None:
+            options.append(("grpc.max_receive_message_length", self._max_receive_message_length))
+        if self._initial_window_size is not None:
+            options.append(("grpc.http2.lookahead_bytes", self._initial_window_size))
+            options.append(("grpc.http2.bdp_probe", 0))
+        return options
+
+    def _grpc_compression(self) -> Optional[Compression]:
+        return Compression.Gzip if self._gzip_compression else None
@@ -0,0 +1,205 @@
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np  # type: ignore
+
+from ._channel_snapshot import _ChannelNameIndex, ChannelSnapshot
+from ._channel_specification_document import ChannelSpecificationDocument
+from ._flexlogger_error import FlexLoggerError
+
+
+class ChannelPoller:
+    """Reads a set of channels at a fixed rate on a background thread and keeps their history.
+
+    Every sample reads all of the channels with a single request (see
+    :meth:`.ChannelSpecificationDocument.get_channel_snapshot`) and stores the results
+    in a fixed-size ring buffer for each channel, so memory use does not grow no
+    matter how long the poller runs.  Once a channel's buffer is full, each new sample
+    overwrites the oldest one.
+
+    Use the poller in a ``with`` statement, or call :meth:`start` and :meth:`stop`::
+
+        with ChannelPoller(channel_specification, ["Channel 1", "Channel 2"], 100) as poller:
+            time.sleep(5)
+            timestamps, values = poller.window(1.0)["Channel 1"]
+    """
+
+    def __init__(
+        self,
+        channel_specification: ChannelSpecificationDocument,
+        channel_names: Iterable[str],
+        sample_rate: float,
+        history_length: int = 10000,
+    ) -> None:
+        """Create a new ChannelPoller.
+
+        Args:
+            channel_specification: The document to read the channels from.
+            channel_names: The names of the channels to read.
+            sample_rate: The rate, in Hertz, at which to read the channels.
+            history_length: The number of samples to keep for each channel.
+
+        Raises:
+            ValueError: if the arguments are invalid.
+        """
+        self._channel_name_index = _ChannelNameIndex(channel_names)
+        channel_count = len(self._channel_name_index.names)
+        if channel_count == 0:
+            raise ValueError("At least one channel name is required")
+        if len(set(self._channel_name_index.names)) != channel_count:
+            raise ValueError("Each channel can only be polled once")
+        if sample_rate <= 0:
+            raise ValueError("sample_rate must be greater than zero")
+        if history_length <= 0:
+            raise ValueError("history_length must be greater than zero")
+        self._channel_specification = channel_specification
+        self._period = 1.0 / sample_rate
+        # Each column is the ring buffer for one channel.  All channels are read
+        # together, so they share the write position.
+        self._values = np.zeros((history_length, channel_count), dtype=np.float64)
+        self._timestamps = np.zeros((history_length, channel_count), dtype=np.int64)
+        self._next_row = 0
+        self._sample_count = 0
+        self._overrun_count = 0
+        self._dropped_count = 0
+        self._last_error = None  # type: Optional[FlexLoggerError]
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None  # type: Optional[threading.Thread]
+
+    def __enter__(self) -> "ChannelPoller":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def channel_names(self) -> Tuple[str, ...]:
+        """The names of the channels being polled."""
+        return self._channel_name_index.names
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the poller is currently reading channels."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def sample_count(self) -> int:
+        """The number of samples that have been read since the poller was created."""
+        return self._sample_count
+
+    @property
+    def overrun_count(self) -> int:
+        """The number of times reading the channels took longer than the sample period."""
+        return self._overrun_count
+
+    @property
+    def dropped_count(self) -> int:
+        """The number of scheduled samples that were not read.
+
+        Samples are dropped when an earlier read overruns its sample period, or when
+        reading the channels fails (see :attr:`last_error`).
+        """
+        return self._dropped_count
+
+    @property
+    def last_error(self) -> Optional[FlexLoggerError]:
+        """The error raised by the most recent failed read, or None if no read has failed."""
+        return self._last_error
+
+    def start(self) -> None:
+        """Start reading channels on a background thread.
+
+        Calling this method while the poller is already running has no effect.
+        """
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._poll, name="FlexLogger ChannelPoller", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop reading channels and wait for the background thread to exit.
+
+        The history is kept, so :meth:`latest` and :meth:`window` can still be called.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def latest(self) -> Optional[ChannelSnapshot]:
+        """Get the most recent sample of every channel.
+
+        Returns:
+            The most recent sample, or None if no samples have been read yet.
+        """
+        with self._lock:
+            if self._sample_count == 0:
+                return None
+            row = (self._next_row - 1) % len(self._values)
+            return ChannelSnapshot(
+                self._channel_name_index, self._values[row].copy(), self._timestamps[row].copy()
+            )
+
+    def window(self, seconds: float) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Get the recent history of every channel.
+
+        Args:
+            seconds: The length of the window.  For each channel, the samples whose
+                timestamps are within this many seconds of the channel's most recent
+                sample are returned.
+
+        Returns:
+            A dictionary mapping each channel name to a tuple of (timestamps, values)
+            arrays, oldest sample first.  Timestamps are int64 nanoseconds since the
+            Unix epoch (UTC), like :attr:`.ChannelSnapshot.timestamps`.
+        """
+        with self._lock:
+            stored_count = min(self._sample_count, len(self._values))
+            rows = np.arange(self._next_row - stored_count, self._next_row) % len(self._values)
+            timestamps = self._timestamps[rows]
+            values = self._values[rows]
+        window_nanoseconds = int(seconds * 1e9)
+        history = {}  # type: Dict[str, Tuple[np.ndarray, np.ndarray]]
+        for column, channel_name in enumerate(self._channel_name_index.names):
+            channel_timestamps = timestamps[:, column]
+            if len(channel_timestamps) > 0:
+                in_window = channel_timestamps >= channel_timestamps[-1] - window_nanoseconds
+            else:
+                in_window = np.zeros(0, dtype=bool)
+            history[channel_name] = (channel_timestamps[in_window], values[in_window, column])
+        return history
+
+    def _poll(self) -> None:
+        next_sample_time = time.monotonic()
+        while not self._stop_event.is_set():
+            self._read_sample()
+            next_sample_time += self._period
+            now = time.monotonic()
+            if now > next_sample_time:
+                # Skip the samples we missed rather than trying to catch up.
+                missed_samples = int((now - next_sample_time) // self._period) + 1
+                next_sample_time += missed_samples * self._period
+                self._overrun_count += 1
+                self._dropped_count += missed_samples
+            self._stop_event.wait(next_sample_time - now)
+
+    def _read_sample(self) -> None:
+        try:
+            snapshot = self._channel_specification.get_channel_snapshot(
+                self._channel_name_index.names
+            )
+        except FlexLoggerError as error:
+            self._last_error = error
+            self._dropped_count += 1
+            return
+        with self._lock:
+            self._values[self._next_row] = snapshot.values
+            self._timestamps[self._next_row] = snapshot.timestamps
+            self._next_row = (self._next_row + 1) % len(self._values)
+            self._sample_count += 1
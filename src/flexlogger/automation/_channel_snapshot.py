@@ -0,0 +1,154 @@
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np  # type: ignore
+
+from ._channel_data_point import ChannelDataPoint
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _datetime_from_epoch_nanoseconds(nanoseconds: int) -> datetime:
+    """Convert nanoseconds since the Unix epoch to a UTC datetime.
+
+    Like protobuf's Timestamp.ToDatetime(), this truncates to microseconds.
+
+    >>> _datetime_from_epoch_nanoseconds(1600000000123456789)
+    datetime.datetime(2020, 9, 13, 12, 26, 40, 123456, tzinfo=datetime.timezone.utc)
+    """
+    return _EPOCH + timedelta(microseconds=nanoseconds // 1000)
+
+
+class _ChannelNameIndex:
+    """An immutable, interned list of channel names with a name to position lookup.
+
+    Snapshots of the same channels share a single index, so reading the same set
+    of channels repeatedly does not allocate new name strings or dictionaries.
+    """
+
+    def __init__(self, channel_names: Iterable[str]) -> None:
+        self.names = tuple(sys.intern(name) for name in channel_names)  # type: Tuple[str, ...]
+        self._positions = None  # type: Union[Dict[str, int], None]
+
+    def position(self, channel_name: str) -> int:
+        if self._positions is None:
+            # If a channel is listed more than once, the first position wins.
+            positions = {}  # type: Dict[str, int]
+            for position, name in enumerate(self.names):
+                positions.setdefault(name, position)
+            self._positions = positions
+        try:
+            return self._positions[channel_name]
+        except KeyError:
+            raise KeyError(
+                "The snapshot does not contain channel %s" % repr(channel_name)
+            ) from None
+
+
+class ChannelSnapshot:
+    """The values of several channels, stored in columnar NumPy arrays.
+
+    This is returned by :meth:`.ChannelSpecificationDocument.get_channel_snapshot`.
+    Reading a snapshot does not create a :class:`.ChannelDataPoint` (or a
+    :class:`datetime.datetime`) for each channel; those are only created when a
+    channel is looked up by name or position, or when :meth:`to_channel_data_points`
+    is called.
+
+    >>> snapshot = ChannelSnapshot(
+    ...     ["Channel 1", "Channel 2"], [1.5, 2.5], [1600000000000000000, 1600000000500000000]
+    ... )
+    >>> snapshot.values
+    array([1.5, 2.5])
+    >>> snapshot["Channel 2"]
+    flexlogger.automation.ChannelDataPoint("Channel 2", 2.500000, \
+datetime.datetime(2020, 9, 13, 12, 26, 40, 500000, tzinfo=datetime.timezone.utc))
+    """
+
+    def __init__(
+        self,
+        channel_names: Union[Sequence[str], _ChannelNameIndex],
+        values: Union[Sequence[float], np.ndarray],
+        timestamps: Union[Sequence[int], np.ndarray],
+    ) -> None:
+        """Create a new ChannelSnapshot.
+
+        Args:
+            channel_names: The names of the channels.
+            values: The values of the channels, in the same order as ``channel_names``.
+            timestamps: The timestamps of the values, as integer nanoseconds since
+                the Unix epoch (UTC), in the same order as ``channel_names``.
+        """
+        if isinstance(channel_names, _ChannelNameIndex):
+            self._index = channel_names
+        else:
+            self._index = _ChannelNameIndex(channel_names)
+        self._values = np.asarray(values, dtype=np.float64)
+        self._timestamps = np.asarray(timestamps, dtype=np.int64)
+        if not (len(self._index.names) == len(self._values) == len(self._timestamps)):
+            raise ValueError("channel_names, values and timestamps must have the same length")
+
+    def __repr__(self) -> str:
+        return "flexlogger.automation.ChannelSnapshot(%s, %s, %s)" % (
+            repr(list(self._index.names)),
+            repr(self._values.tolist()),
+            repr(self._timestamps.tolist()),
+        )
+
+    def __len__(self) -> int:
+        return len(self._index.names)
+
+    def __contains__(self, channel_name: object) -> bool:
+        return channel_name in self._index.names
+
+    def __iter__(self) -> Iterator[ChannelDataPoint]:
+        for position in range(len(self)):
+            yield self._data_point_at(position)
+
+    def __getitem__(self, key: Union[str, int]) -> ChannelDataPoint:
+        """Get the value of a channel as a :class:`.ChannelDataPoint`.
+
+        Args:
+            key: The name of the channel, or its position in the snapshot.
+        """
+        if isinstance(key, str):
+            return self._data_point_at(self._index.position(key))
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("ChannelSnapshot index out of range")
+        return self._data_point_at(key)
+
+    @property
+    def channel_names(self) -> Tuple[str, ...]:
+        """The names of the channels in the snapshot."""
+        return self._index.names
+
+    @property
+    def values(self) -> np.ndarray:
+        """The channel values, as a float64 array."""
+        return self._values
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """The value timestamps, as an int64 array of nanoseconds since the Unix epoch (UTC)."""
+        return self._timestamps
+
+    def value(self, channel_name: str) -> float:
+        """Get the value of a channel without creating a :class:`.ChannelDataPoint`.
+
+        Args:
+            channel_name: The name of the channel.
+        """
+        return float(self._values[self._index.position(channel_name)])
+
+    def to_channel_data_points(self) -> List[ChannelDataPoint]:
+        """Convert the snapshot to a list of :class:`.ChannelDataPoint` objects."""
+        return list(self)
+
+    def _data_point_at(self, position: int) -> ChannelDataPoint:
+        return ChannelDataPoint(
+            self._index.names[position],
+            float(self._values[position]),
+            _datetime_from_epoch_nanoseconds(int(self._timestamps[position])),
+        )
@@ -1,11 +1,30 @@
 from datetime import timezone
-from typing import Callable, List
+from numbers import Real
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from grpc import Channel, RpcError
+import numpy as np  # type: ignore
+from grpc import RpcError
 
 from ._channel_data_point import ChannelDataPoint
+from ._channel_handle import ChannelHandle
+from ._channel_snapshot import _ChannelNameIndex, ChannelSnapshot
+from ._channel_value_cache import ChannelValueCache
 from ._data_rate_level import DataRateLevel
-from ._flexlogger_error import FlexLoggerError
+from ._flexlogger_error import _to_flexlogger_error, FlexLoggerError
+from ._rpc import _Rpc
+from ._stub_registry import StubRegistry
 from .proto import (
     ChannelSpecificationDocument_pb2,
     ChannelSpecificationDocument_pb2_grpc,
@@ -31,6 +50,338 @@ DATA_RATE_LEVEL_PB2_MAP = {
     DataRateLevel_pb2.DATA_RATE_LEVEL_ON_DEMAND: DataRateLevel.ON_DEMAND,
 }
 
+# The maximum number of channels to read or write in a single request.  Larger
+# requests are split up so the messages stay well under the gRPC message size limit.
+MAX_CHANNELS_PER_REQUEST = 1000
+
+# The number of distinct channel lists whose interned names are kept for snapshots.
+_MAX_CHANNEL_NAME_INDEXES = 32
+
+_STUB = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub
+
+_T = TypeVar("_T")
+
+
+def _match_channel_values(
+    channel_names: Sequence[str],
+    channel_values: Sequence[ChannelSpecificationDocument_pb2.ChannelValue],
+) -> Sequence[ChannelSpecificationDocument_pb2.ChannelValue]:
+    """Return the channel values in the same order as channel_names."""
+    if len(channel_values) == len(channel_names) and all(
+        channel_value.channel_name == channel_name
+        for channel_name, channel_value in zip(channel_names, channel_values)
+    ):
+        return channel_values
+    values_by_name = {channel_value.channel_name: channel_value for channel_value in channel_values}
+    try:
+        return [values_by_name[channel_name] for channel_name in channel_names]
+    except KeyError as error:
+        raise FlexLoggerError(
+            "FlexLogger did not return a value for channel %s" % repr(error.args[0])
+        ) from None
+
+
+def _to_channel_data_points(
+    channel_names: Sequence[str],
+    channel_values: Sequence[ChannelSpecificationDocument_pb2.ChannelValue],
+) -> List[ChannelDataPoint]:
+    # Timestamps come back from FlexLogger in UTC
+    return [
+        ChannelDataPoint(
+            channel_name,
+            channel_value.channel_value,
+            channel_value.value_timestamp.ToDatetime().replace(tzinfo=timezone.utc),
+        )
+        for channel_name, channel_value in zip(channel_names, channel_values)
+    ]
+
+
+def _to_channel_snapshot(
+    channel_name_index: _ChannelNameIndex,
+    channel_values: Sequence[ChannelSpecificationDocument_pb2.ChannelValue],
+) -> ChannelSnapshot:
+    count = len(channel_values)
+    values = np.fromiter(
+        (channel_value.channel_value for channel_value in channel_values),
+        dtype=np.float64,
+        count=count,
+    )
+    # Timestamps come back from FlexLogger in UTC
+    timestamps = np.fromiter(
+        (
+            channel_value.value_timestamp.seconds * 1000000000 + channel_value.value_timestamp.nanos
+            for channel_value in channel_values
+        ),
+        dtype=np.int64,
+        count=count,
+    )
+    return ChannelSnapshot(channel_name_index, values, timestamps)
+
+
+def _get_channel_name_index(
+    channel_name_indexes: Dict[Tuple[str, ...], _ChannelNameIndex], channel_names: Iterable[str]
+) -> _ChannelNameIndex:
+    """Get the cached index for a list of channel names, creating it if needed."""
+    key = tuple(channel_names)
+    channel_name_index = channel_name_indexes.get(key)
+    if channel_name_index is None:
+        if len(channel_name_indexes) >= _MAX_CHANNEL_NAME_INDEXES:
+            channel_name_indexes.clear()
+        channel_name_index = _ChannelNameIndex(key)
+        channel_name_indexes[key] = channel_name_index
+    return channel_name_index
+
+
+def _validate_channel_values(
+    channel_values: Union[Mapping[str, float], Iterable[Tuple[str, float]]]
+) -> List[Tuple[str, float]]:
+    """Check the channel values to set and return them as a list of (name, value) pairs.
+
+    >>> _validate_channel_values({"Switch 1": 1, "Switch 2": 2.5})
+    [('Switch 1', 1.0), ('Switch 2', 2.5)]
+    >>> _validate_channel_values([("Switch 1", "high"), ("", 2), ("Switch 1", 3)])
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid channel values: 'Switch 1': the value 'high' is not a number; \
+'': the channel name must be a non-empty string; 'Switch 1': the channel is set more than once
+    """
+    if isinstance(channel_values, Mapping):
+        pairs = list(channel_values.items())  # type: List[Tuple[str, float]]
+    else:
+        pairs = []
+        for pair in channel_values:
+            try:
+                channel_name, channel_value = pair
+            except (TypeError, ValueError):
+                raise ValueError(
+                    "Channel values must be a mapping or (channel name, value) pairs, not %s"
+                    % repr(pair)
+                ) from None
+            pairs.append((channel_name, channel_value))
+    problems = []
+    seen_names = set()
+    for channel_name, channel_value in pairs:
+        if not isinstance(channel_name, str) or len(channel_name) == 0:
+            problems.append("%s: the channel name must be a non-empty string" % repr(channel_name))
+        elif channel_name in seen_names:
+            problems.append("%s: the channel is set more than once" % repr(channel_name))
+        elif not isinstance(channel_value, Real) or isinstance(channel_value, bool):
+            problems.append(
+                "%s: the value %s is not a number" % (repr(channel_name), repr(channel_value))
+            )
+        seen_names.add(channel_name)
+    if len(problems) > 0:
+        raise ValueError("Invalid channel values: " + "; ".join(problems))
+    return [(channel_name, float(channel_value)) for channel_name, channel_value in pairs]
+
+
+def _to_channel_data_point(
+    channel_name: str, response: ChannelSpecificationDocument_pb2.GetDoubleChannelValueResponse
+) -> ChannelDataPoint:
+    # Timestamps come back from FlexLogger in UTC
+    return ChannelDataPoint(
+        channel_name,
+        response.channel_value,
+        response.value_timestamp.ToDatetime().replace(tzinfo=timezone.utc),
+    )
+
+
+def _chunk(items: Sequence[_T]) -> List[Sequence[_T]]:
+    """Split items into chunks of at most MAX_CHANNELS_PER_REQUEST."""
+    return [
+        items[start : start + MAX_CHANNELS_PER_REQUEST]
+        for start in range(0, len(items), MAX_CHANNELS_PER_REQUEST)
+    ]
+
+
+def _get_channel_values_request(
+    identifier: ElementIdentifier, channel_names: Sequence[str]
+) -> ChannelSpecificationDocument_pb2.GetDoubleChannelValuesRequest:
+    return ChannelSpecificationDocument_pb2.GetDoubleChannelValuesRequest(
+        document_identifier=identifier, channel_names=channel_names
+    )
+
+
+def _set_channel_values_request(
+    identifier: ElementIdentifier, channel_values: Sequence[Tuple[str, float]]
+) -> ChannelSpecificationDocument_pb2.SetDoubleChannelValuesRequest:
+    return ChannelSpecificationDocument_pb2.SetDoubleChannelValuesRequest(
+        document_identifier=identifier,
+        channel_values=[
+            ChannelSpecificationDocument_pb2.ChannelValue(
+                channel_name=channel_name, channel_value=channel_value
+            )
+            for channel_name, channel_value in channel_values
+        ],
+    )
+
+
+def _get_filtered_channel_names_request(
+    identifier: ElementIdentifier,
+    configured_only: bool,
+    input_channels: bool,
+    output_channels: bool,
+    analog_channels: bool,
+    digital_channels: bool,
+) -> ChannelSpecificationDocument_pb2.GetFilteredChannelNamesRequest:
+    return ChannelSpecificationDocument_pb2.GetFilteredChannelNamesRequest(
+        document_identifier=identifier,
+        configuredChannels=configured_only,
+        inputChannels=input_channels,
+        outputChannels=output_channels,
+        analogChannels=analog_channels,
+        digitalChannels=digital_channels,
+    )
+
+
+def _set_channel_values_error_message(written_count: int, total_count: int) -> str:
+    message = "Failed to set channel values"
+    if written_count > 0:
+        message += " (the first %d of %d channel values were already set)" % (
+            written_count,
+            total_count,
+        )
+    return message
+
+
+# The RPCs of the document, shared with aio.ChannelSpecificationDocument.  Each request is
+# built from the document identifier followed by the arguments of the method.
+_GET_ACTUAL_DATA_RATE = _Rpc(
+    _STUB,
+    "GetActualDataRate",
+    "Failed to get the actual data rate.",
+    lambda identifier, channel_name: ChannelSpecificationDocument_pb2.GetActualDataRateRequest(
+        document_identifier=identifier, channel_name=channel_name
+    ),
+    lambda response: response.data_rate,
+)
+_GET_CHANNEL_NAMES = _Rpc(
+    _STUB,
+    "GetChannelNames",
+    "Failed to get channel names",
+    lambda identifier: ChannelSpecificationDocument_pb2.GetChannelNamesRequest(
+        document_identifier=identifier
+    ),
+    lambda response: response.channel_names,
+)
+# The response is converted by _to_channel_data_point, which also needs the channel name
+_GET_CHANNEL_VALUE = _Rpc(
+    _STUB,
+    "GetDoubleChannelValue",
+    "Failed to get channel value",
+    lambda identifier, channel_name: (
+        ChannelSpecificationDocument_pb2.GetDoubleChannelValueRequest(
+            document_identifier=identifier, channel_name=channel_name
+        )
+    ),
+    lambda response: response,
+)
+_GET_DATA_RATE = _Rpc(
+    _STUB,
+    "GetDataRate",
+    "Failed to get the data rate: data rate level invalid.",
+    lambda identifier, data_rate_level: ChannelSpecificationDocument_pb2.GetDataRateRequest(
+        document_identifier=identifier, data_rate_level=DATA_RATE_LEVEL_MAP.get(data_rate_level)
+    ),
+    lambda response: response.data_rate,
+)
+_GET_DATA_RATE_LEVEL = _Rpc(
+    _STUB,
+    "GetDataRateLevel",
+    "Failed to get the data rate level.",
+    lambda identifier, channel_name: ChannelSpecificationDocument_pb2.GetDataRateLevelRequest(
+        document_identifier=identifier, channel_name=channel_name
+    ),
+    lambda response: DATA_RATE_LEVEL_PB2_MAP.get(response.data_rate_level),
+)
+_GET_FILTERED_CHANNEL_NAMES = _Rpc(
+    _STUB,
+    "GetFilteredChannelNames",
+    "Failed to get filtered channel names",
+    _get_filtered_channel_names_request,
+    lambda response: response.channel_names,
+)
+_IS_CHANNEL_ENABLED = _Rpc(
+    _STUB,
+    "IsChannelEnabled",
+    "Failed to get channel enable state",
+    lambda identifier, channel_name: ChannelSpecificationDocument_pb2.IsChannelEnabledRequest(
+        document_identifier=identifier, channel_name=channel_name
+    ),
+    lambda response: response.channel_enabled,
+)
+_SET_CHANNEL_ENABLED = _Rpc(
+    _STUB,
+    "SetChannelEnabled",
+    "Failed to set the channel enable state",
+    lambda identifier, channel_name, channel_enabled: (
+        ChannelSpecificationDocument_pb2.SetChannelEnabledRequest(
+            document_identifier=identifier,
+            channel_name=channel_name,
+            channel_enabled=channel_enabled,
+        )
+    ),
+)
+_IS_CHANNEL_LOGGING_ENABLED = _Rpc(
+    _STUB,
+    "IsChannelLoggingEnabled",
+    "Failed to get channel logging enable state",
+    lambda identifier, channel_name: (
+        ChannelSpecificationDocument_pb2.IsChannelLoggingEnabledRequest(
+            document_identifier=identifier, channel_name=channel_name
+        )
+    ),
+    lambda response: response.channel_logging_enabled,
+)
+_SET_CHANNEL_LOGGING_ENABLED = _Rpc(
+    _STUB,
+    "SetChannelLoggingEnabled",
+    "Failed to set the channel logging state",
+    lambda identifier, channel_name, channel_logging_enabled: (
+        ChannelSpecificationDocument_pb2.SetChannelLoggingEnabledRequest(
+            document_identifier=identifier,
+            channel_name=channel_name,
+            channel_logging_enabled=channel_logging_enabled,
+        )
+    ),
+)
+_SET_CHANNEL_VALUE = _Rpc(
+    _STUB,
+    "SetDoubleChannelValue",
+    "Failed to set channel value",
+    lambda identifier, channel_name, channel_value: (
+        ChannelSpecificationDocument_pb2.SetDoubleChannelValueRequest(
+            document_identifier=identifier,
+            channel_name=channel_name,
+            channel_value=channel_value,
+        )
+    ),
+)
+_SET_DATA_RATE = _Rpc(
+    _STUB,
+    "SetDataRate",
+    "Failed to set the data rate",
+    lambda identifier, data_rate_level, data_rate: (
+        ChannelSpecificationDocument_pb2.SetDataRateRequest(
+            document_identifier=identifier,
+            data_rate_level=DATA_RATE_LEVEL_MAP.get(data_rate_level),
+            data_rate=data_rate,
+        )
+    ),
+)
+_SET_DATA_RATE_LEVEL = _Rpc(
+    _STUB,
+    "SetDataRateLevel",
+    "Failed to set the data rate level.",
+    lambda identifier, channel_name, data_rate_level: (
+        ChannelSpecificationDocument_pb2.SetDataRateLevelRequest(
+            document_identifier=identifier,
+            channel_name=channel_name,
+            data_rate_level=DATA_RATE_LEVEL_MAP.get(data_rate_level),
+        )
+    ),
+)
+
 
 class ChannelSpecificationDocument:
     """Represents the document that describes data channels.
@@ -41,280 +392,412 @@ class ChannelSpecificationDocument:
 
     def __init__(
         self,
-        channel: Channel,
+        stubs: StubRegistry,
         raise_if_application_closed: Callable[[], None],
         identifier: ElementIdentifier,
     ) -> None:
-        self._channel = channel
+        self._stubs = stubs
         self._raise_if_application_closed = raise_if_application_closed
         self._identifier = identifier
+        self._channel_name_indexes = {}  # type: Dict[Tuple[str, ...], _ChannelNameIndex]
+        self._channel_handles = {}  # type: Dict[str, ChannelHandle]
+        self._value_cache = None  # type: Optional[ChannelValueCache]
 
-    def get_actual_data_rate(self, channel_name: str) -> float:
+    def _call(self, rpc: _Rpc, timeout: Optional[float], *args: Any) -> Any:
+        return rpc.call(
+            self._stubs, self._raise_if_application_closed, timeout, self._identifier, *args
+        )
+
+    @property
+    def value_cache(self) -> Optional[ChannelValueCache]:
+        """The cache of channel values, or None if the cache is not enabled.
+
+        See :meth:`enable_value_cache`.
+        """
+        return self._value_cache
+
+    def disable_value_cache(self) -> None:
+        """Stop caching channel values, so every read goes to FlexLogger."""
+        self._value_cache = None
+
+    def enable_value_cache(self, max_age: float) -> ChannelValueCache:
+        """Cache the channel values read with :meth:`get_channel_value`.
+
+        While the cache is enabled, reading a channel that was read within the last
+        ``max_age`` seconds returns the same value without communicating with FlexLogger,
+        and reads of a channel by several threads at the same time share a single
+        request.  Setting channels with :meth:`set_channel_value`,
+        :meth:`set_channel_values` or a :class:`.ChannelHandle` removes their cached
+        values.  :meth:`get_channel_values` and :meth:`get_channel_snapshot` always read
+        from FlexLogger.
+
+        Enabling the cache again replaces the existing cache and its values.
+
+        Args:
+            max_age: The time, in seconds, for which a read value is returned from the
+                cache.
+
+        Returns:
+            The cache, which reports how many reads it has saved.
+
+        Raises:
+            ValueError: if max_age is not positive.
+        """
+        self._value_cache = ChannelValueCache(max_age)
+        return self._value_cache
+
+    def get_actual_data_rate(self, channel_name: str, timeout: float = None) -> float:
         """Get the actual data rate for the specified channel.
 
         Args:
             channel_name: The name of the channel.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
         """
-        stub = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetActualDataRate(
-                ChannelSpecificationDocument_pb2.GetActualDataRateRequest(
-                    document_identifier=self._identifier,  channel_name=channel_name
-                )
-            )
+        return self._call(_GET_ACTUAL_DATA_RATE, timeout, channel_name)
 
-            return response.data_rate
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get the actual data rate.") from error
+    def get_channel_handle(self, channel_name: str) -> ChannelHandle:
+        """Get a handle for reading and writing the specified channel repeatedly.
+
+        The handle builds its requests once, so :meth:`.ChannelHandle.read` and
+        :meth:`.ChannelHandle.write` cost less than :meth:`get_channel_value` and
+        :meth:`set_channel_value`.  Getting the handle does not communicate with
+        FlexLogger, and getting it again for the same channel returns the same handle.
 
-    def get_channel_names(self) -> List[str]:
+        Args:
+            channel_name: The name of the channel.
+        """
+        handle = self._channel_handles.get(channel_name)
+        if handle is None:
+            handle = ChannelHandle(self, channel_name)
+            self._channel_handles[channel_name] = handle
+        return handle
+
+    def get_channel_names(self, timeout: float = None) -> List[str]:
         """Get all the channel names in the document.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Raises:
             FlexLoggerError: if getting the channel names fails.
         """
-        stub = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetChannelNames(
-                ChannelSpecificationDocument_pb2.GetChannelNamesRequest(
-                    document_identifier=self._identifier
-                )
-            )
-            return response.channel_names
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get channel names") from error
+        return self._call(_GET_CHANNEL_NAMES, timeout)
 
-    def get_channel_value(self, channel_name: str) -> ChannelDataPoint:
+    def get_channel_value(self, channel_name: str, timeout: float = None) -> ChannelDataPoint:
         """Get the current value of the specified channel.
 
+        If the value cache is enabled, a recently read value may be returned instead (see
+        :meth:`enable_value_cache`).
+
         Args:
             channel_name: The name of the channel.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if getting the channel value fails.
         """
-        stub = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetDoubleChannelValue(
-                ChannelSpecificationDocument_pb2.GetDoubleChannelValueRequest(
-                    document_identifier=self._identifier, channel_name=channel_name
-                )
-            )
-            # Timestamps come back from FlexLogger in UTC
-            return ChannelDataPoint(
-                channel_name,
-                response.channel_value,
-                response.value_timestamp.ToDatetime().replace(tzinfo=timezone.utc),
+        value_cache = self._value_cache
+        if value_cache is not None:
+            return value_cache._get(
+                channel_name, lambda name: self._read_channel_value(name, timeout)
             )
+        return self._read_channel_value(channel_name, timeout)
+
+    def get_channel_values(
+        self, channel_names: Iterable[str], timeout: float = None
+    ) -> List[ChannelDataPoint]:
+        """Get the current values of the specified channels.
+
+        This makes a single request to FlexLogger for all of the channels (very large
+        lists of channels are split into several requests), so it is much faster than
+        calling :meth:`get_channel_value` for each channel.
+
+        Args:
+            channel_names: The names of the channels.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            The channel values, in the same order as ``channel_names``.
+
+        Raises:
+            FlexLoggerError: if getting the channel values fails.
+        """
+        channel_names = list(channel_names)
+        try:
+            channel_values = self._read_channel_values(channel_names, timeout=timeout)
+            return _to_channel_data_points(channel_names, channel_values)
         except (RpcError, ValueError) as error:
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get channel value") from error
+            raise _to_flexlogger_error("Failed to get channel values", error) from error
 
-    def get_data_rate(self, data_rate_level: DataRateLevel) -> float:
-        """Get the data rate for a specific date rate level in Hertz.
+    def get_channel_snapshot(
+        self, channel_names: Iterable[str], timeout: float = None
+    ) -> ChannelSnapshot:
+        """Get the current values of the specified channels as a :class:`.ChannelSnapshot`.
+
+        This reads the channels the same way as :meth:`get_channel_values`, but stores
+        the values and timestamps in NumPy arrays instead of creating a
+        :class:`.ChannelDataPoint` for each channel, which is much cheaper when
+        reading many channels at a high rate.
 
         Args:
-            data_rate_level: The data rate level to get the data rate for.
+            channel_names: The names of the channels.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            The channel values, in the same order as ``channel_names``.
 
         Raises:
-            FlexLoggerError: if the data_rate_level is invalid.
+            FlexLoggerError: if getting the channel values fails.
         """
-        stub = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub(self._channel)
+        channel_name_index = _get_channel_name_index(self._channel_name_indexes, channel_names)
         try:
-            data_rate_level_parameter = DATA_RATE_LEVEL_MAP.get(data_rate_level)
-            response = stub.GetDataRate(
-                ChannelSpecificationDocument_pb2.GetDataRateRequest(
-                    document_identifier=self._identifier, data_rate_level=data_rate_level_parameter
-                )
-            )
-
-            return response.data_rate
+            channel_values = self._read_channel_values(channel_name_index.names, timeout=timeout)
+            return _to_channel_snapshot(channel_name_index, channel_values)
         except (RpcError, ValueError) as error:
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get the data rate: data rate level invalid.") from error
+            raise _to_flexlogger_error("Failed to get channel values", error) from error
+
+    def get_data_rate(self, data_rate_level: DataRateLevel, timeout: float = None) -> float:
+        """Get the data rate for a specific date rate level in Hertz.
 
-    def get_data_rate_level(self, channel_name: str) -> DataRateLevel:
+        Args:
+            data_rate_level: The data rate level to get the data rate for.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if the data_rate_level is invalid.
+        """
+        return self._call(_GET_DATA_RATE, timeout, data_rate_level)
+
+    def get_data_rate_level(self, channel_name: str, timeout: float = None) -> DataRateLevel:
         """Get the data rate level of the specified channel
 
         Args:
             channel_name: The name of the channel.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if getting the data rate level fails.
         """
-        stub = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetDataRateLevel(
-                ChannelSpecificationDocument_pb2.GetDataRateLevelRequest(
-                    document_identifier=self._identifier, channel_name=channel_name
-                )
+        return self._call(_GET_DATA_RATE_LEVEL, timeout, channel_name)
+
+    def get_filtered_channel_names(
+        self,
+        configured_only: bool = False,
+        input_channels: bool = True,
+        output_channels: bool = True,
+        analog_channels: bool = True,
+        digital_channels: bool = True,
+        timeout: float = None,
+    ) -> List[str]:
+        """Get the names of the channels in the document of the specified types.
+
+        A channel is returned if it has one of the selected directions (input or output)
+        and one of the selected kinds (analog or digital).  For example, to get the
+        digital output channels::
+
+            channel_specification.get_filtered_channel_names(
+                input_channels=False, analog_channels=False
             )
 
-            return DATA_RATE_LEVEL_PB2_MAP.get(response.data_rate_level)
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get the data rate level.") from error
+        Args:
+            configured_only: Whether to return only configured channels.  Defaults to False.
+            input_channels: Whether to return input channels.  Defaults to True.
+            output_channels: Whether to return output channels.  Defaults to True.
+            analog_channels: Whether to return analog channels.  Defaults to True.
+            digital_channels: Whether to return digital channels.  Defaults to True.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
-    def is_channel_enabled(self, channel_name: str) -> bool:
+        Raises:
+            FlexLoggerError: if getting the channel names fails.
+        """
+        return self._call(
+            _GET_FILTERED_CHANNEL_NAMES,
+            timeout,
+            configured_only,
+            input_channels,
+            output_channels,
+            analog_channels,
+            digital_channels,
+        )
+
+    def is_channel_enabled(self, channel_name: str, timeout: float = None) -> bool:
         """Get the current enabled state of the specified channel.
 
         Args:
             channel_name: The name of the channel.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if getting the channel value fails.
         """
-        stub = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.IsChannelEnabled(
-                ChannelSpecificationDocument_pb2.IsChannelEnabledRequest(
-                    document_identifier=self._identifier, channel_name=channel_name
-                )
-            )
-
-            return response.channel_enabled
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get channel enable state") from error
+        return self._call(_IS_CHANNEL_ENABLED, timeout, channel_name)
 
-    def set_channel_enabled(self, channel_name: str, channel_enabled: bool) -> None:
+    def set_channel_enabled(
+        self, channel_name: str, channel_enabled: bool, timeout: float = None
+    ) -> None:
         """Enable or disable the specified channel.
 
         Args:
             channel_name: The name of the channel.
             channel_enabled: The channel enabled state: true to enable the channel, false to disable it.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if enabling or disabling the channel fails.
         """
-        stub = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub(self._channel)
-        try:
-            stub.SetChannelEnabled(
-                ChannelSpecificationDocument_pb2.SetChannelEnabledRequest(
-                    document_identifier=self._identifier,
-                    channel_name=channel_name,
-                    channel_enabled=channel_enabled,
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set the channel enable state") from error
+        self._call(_SET_CHANNEL_ENABLED, timeout, channel_name, channel_enabled)
 
-    def is_channel_logging_enabled(self, channel_name: str) -> bool:
+    def is_channel_logging_enabled(self, channel_name: str, timeout: float = None) -> bool:
         """Get the current logging state of the specified channel.
 
         Args:
             channel_name: The name of the channel.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if getting the channel value fails.
         """
-        stub = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.IsChannelLoggingEnabled(
-                ChannelSpecificationDocument_pb2.IsChannelLoggingEnabledRequest(
-                    document_identifier=self._identifier, channel_name=channel_name
-                )
-            )
+        return self._call(_IS_CHANNEL_LOGGING_ENABLED, timeout, channel_name)
 
-            return response.channel_logging_enabled
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get channel logging enable state") from error
-
-    def set_channel_logging_enabled(self, channel_name: str, channel_logging_enabled: bool) -> None:
+    def set_channel_logging_enabled(
+        self, channel_name: str, channel_logging_enabled: bool, timeout: float = None
+    ) -> None:
         """Enable or disable logging for the specified channel.
 
         Args:
             channel_name: The name of the channel.
             channel_logging_enabled: The channel logging enabled state: true to enable logging, false to disable it.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if enabling or disabling the channel logging fails.
         """
-        stub = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub(self._channel)
-        try:
-            stub.SetChannelLoggingEnabled(
-                ChannelSpecificationDocument_pb2.SetChannelLoggingEnabledRequest(
-                    document_identifier=self._identifier,
-                    channel_name=channel_name,
-                    channel_logging_enabled=channel_logging_enabled,
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set the channel logging state") from error
+        self._call(_SET_CHANNEL_LOGGING_ENABLED, timeout, channel_name, channel_logging_enabled)
 
-    def set_channel_value(self, channel_name: str, channel_value: float) -> None:
+    def set_channel_value(
+        self, channel_name: str, channel_value: float, timeout: float = None
+    ) -> None:
         """Set the current value of the specified channel.
 
         Args:
             channel_name: The name of the channel.
             channel_value: The value to set the channel to.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if setting the channel value fails.
         """
-        stub = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub(self._channel)
         try:
-            stub.SetDoubleChannelValue(
-                ChannelSpecificationDocument_pb2.SetDoubleChannelValueRequest(
-                    document_identifier=self._identifier,
-                    channel_name=channel_name,
-                    channel_value=channel_value,
+            self._call(_SET_CHANNEL_VALUE, timeout, channel_name, channel_value)
+        finally:
+            self._invalidate_cached_values((channel_name,))
+
+    def set_channel_values(
+        self,
+        channel_values: Union[Mapping[str, float], Iterable[Tuple[str, float]]],
+        timeout: float = None,
+    ) -> None:
+        """Set the current values of several channels at once.
+
+        This makes a single request to FlexLogger for all of the channels (very large
+        numbers of channels are split into several requests), so it is much faster than
+        calling :meth:`set_channel_value` for each channel.
+
+        Args:
+            channel_values: The values to set, either as a mapping from channel name to
+                value or as an iterable of (channel name, value) pairs.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            ValueError: if any of the channel names or values are invalid.  The message
+                lists every invalid entry, and no values are written.
+            FlexLoggerError: if setting the channel values fails.
+        """
+        values_to_set = _validate_channel_values(channel_values)
+        stub = self._stubs.get(_STUB)
+        written_count = 0
+        try:
+            for chunk in _chunk(values_to_set):
+                stub.SetDoubleChannelValues(
+                    _set_channel_values_request(self._identifier, chunk), timeout=timeout
                 )
-            )
+                written_count += len(chunk)
         except (RpcError, ValueError) as error:
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set channel value") from error
-
-    def set_data_rate(self, data_rate_level: DataRateLevel, data_rate: float) -> None:
+            raise _to_flexlogger_error(
+                _set_channel_values_error_message(written_count, len(values_to_set)), error
+            ) from error
+        finally:
+            self._invalidate_cached_values(channel_name for channel_name, _ in values_to_set)
+
+    def set_data_rate(
+        self, data_rate_level: DataRateLevel, data_rate: float, timeout: float = None
+    ) -> None:
         """Set the data rate of a specific data rate level.
 
         Args:
             data_rate_level: The data rate level to get the data rate for.
             data_rate: The value of the data rate to set in Hertz.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if setting the data rate fails.
         """
-        stub = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub(self._channel)
-        try:
-            data_rate_level_parameter = DATA_RATE_LEVEL_MAP.get(data_rate_level)
-            stub.SetDataRate(
-                ChannelSpecificationDocument_pb2.SetDataRateRequest(
-                    document_identifier=self._identifier,
-                    data_rate_level=data_rate_level_parameter,
-                    data_rate=data_rate
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set the data rate") from error
+        self._call(_SET_DATA_RATE, timeout, data_rate_level, data_rate)
 
-    def set_data_rate_level(self, channel_name: str, data_rate_level: DataRateLevel) -> None:
+    def set_data_rate_level(
+        self, channel_name: str, data_rate_level: DataRateLevel, timeout: float = None
+    ) -> None:
         """Set the data rate level of the specified channel
            Note: This may affect other channels in the same module or chassis set to the same data rate level.
 
         Args:
             channel_name: The name of the channel.
             data_rate_level: The data rate level to set.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if setting the data rate level fails.
         """
-        stub = ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentStub(self._channel)
-        try:
-            data_rate_level_parameter = DATA_RATE_LEVEL_MAP.get(data_rate_level)
-            stub.SetDataRateLevel(
-                ChannelSpecificationDocument_pb2.SetDataRateLevelRequest(
-                    document_identifier=self._identifier,
-                    channel_name=channel_name,
-                    data_rate_level=data_rate_level_parameter
-                )
+        self._call(_SET_DATA_RATE_LEVEL, timeout, channel_name, data_rate_level)
+
+    def _invalidate_cached_values(self, channel_names: Iterable[str]) -> None:
+        value_cache = self._value_cache
+        if value_cache is not None:
+            for channel_name in channel_names:
+                value_cache._invalidate(channel_name)
+
+    def _read_channel_value(self, channel_name: str, timeout: Optional[float]) -> ChannelDataPoint:
+        return _to_channel_data_point(
+            channel_name, self._call(_GET_CHANNEL_VALUE, timeout, channel_name)
+        )
+
+    def _read_channel_values(
+        self, channel_names: Sequence[str], timeout: float = None
+    ) -> List[ChannelSpecificationDocument_pb2.ChannelValue]:
+        stub = self._stubs.get(_STUB)
+        channel_values = []  # type: List[ChannelSpecificationDocument_pb2.ChannelValue]
+        for chunk in _chunk(channel_names):
+            response = stub.GetDoubleChannelValues(
+                _get_channel_values_request(self._identifier, chunk), timeout=timeout
             )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set the data rate level.") from error
+            channel_values.extend(_match_channel_values(chunk, response.channel_values))
+        return channel_values
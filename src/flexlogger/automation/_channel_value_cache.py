@@ -0,0 +1,115 @@
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from ._channel_data_point import ChannelDataPoint
+
+
+class _PendingRead:
+    """A read of a channel that other callers can wait for instead of making their own."""
+
+    __slots__ = ("done", "data_point", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.data_point = None  # type: Optional[ChannelDataPoint]
+        self.error = None  # type: Optional[BaseException]
+
+
+class ChannelValueCache:
+    """Keeps recently read channel values so repeated reads do not go to FlexLogger.
+
+    Do not create this class directly; instead, use the return value of
+    :meth:`.ChannelSpecificationDocument.enable_value_cache`.
+
+    While the cache is enabled, :meth:`.ChannelSpecificationDocument.get_channel_value`
+    returns the value read for a channel within the last ``max_age`` seconds, if there is
+    one.  If several threads read a channel that is not cached at the same time, one
+    request is made and they all get its result.  Setting a channel through the document
+    removes its cached value, so the next read gets the value that was set.  Changes
+    made in FlexLogger itself are seen once the cached value expires.
+    """
+
+    def __init__(self, max_age: float) -> None:
+        if max_age <= 0:
+            raise ValueError("max_age must be positive")
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        # The cached values and when they were read
+        self._entries = {}  # type: Dict[str, Tuple[float, ChannelDataPoint]]
+        self._pending_reads = {}  # type: Dict[str, _PendingRead]
+        self._hit_count = 0
+        self._miss_count = 0
+        self._merged_count = 0
+
+    @property
+    def max_age(self) -> float:
+        """The time, in seconds, for which a read value is returned from the cache."""
+        return self._max_age
+
+    @property
+    def hit_count(self) -> int:
+        """The number of reads returned from the cache."""
+        return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        """The number of reads that made a request to FlexLogger."""
+        return self._miss_count
+
+    @property
+    def merged_count(self) -> int:
+        """The number of reads that waited for another read's request instead of making one."""
+        return self._merged_count
+
+    def clear(self) -> None:
+        """Remove all the cached values, so the next read of every channel goes to FlexLogger."""
+        with self._lock:
+            self._entries.clear()
+            self._pending_reads.clear()
+
+    def _get(self, channel_name: str, read: Callable[[str], ChannelDataPoint]) -> ChannelDataPoint:
+        with self._lock:
+            entry = self._entries.get(channel_name)
+            if entry is not None and time.monotonic() - entry[0] < self._max_age:
+                self._hit_count += 1
+                return entry[1]
+            pending_read = self._pending_reads.get(channel_name)
+            is_reader = pending_read is None
+            if pending_read is None:
+                pending_read = _PendingRead()
+                self._pending_reads[channel_name] = pending_read
+                self._miss_count += 1
+            else:
+                self._merged_count += 1
+        if not is_reader:
+            pending_read.done.wait()
+            if pending_read.error is not None:
+                raise pending_read.error
+            data_point = pending_read.data_point
+            assert data_point is not None
+            return data_point
+        # The value is at least as old as the request, so it expires max_age after the
+        # request was made rather than after the response arrived.
+        read_time = time.monotonic()
+        try:
+            data_point = read(channel_name)
+            pending_read.data_point = data_point
+        except BaseException as error:
+            pending_read.error = error
+            raise
+        finally:
+            with self._lock:
+                # The read is no longer pending unless the channel was set while it was
+                # being made, in which case the value may be stale and is not cached.
+                if self._pending_reads.get(channel_name) is pending_read:
+                    del self._pending_reads[channel_name]
+                    if pending_read.error is None:
+                        self._entries[channel_name] = (read_time, data_point)
+            pending_read.done.set()
+        return data_point
+
+    def _invalidate(self, channel_name: str) -> None:
+        with self._lock:
+            self._entries.pop(channel_name, None)
+            self._pending_reads.pop(channel_name, None)
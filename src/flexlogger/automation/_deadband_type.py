@@ -0,0 +1,19 @@
+from enum import Enum
+
+
+class DeadbandType(Enum):
+    """An enumeration describing how a :class:`.ChannelChangeMonitor` deadband is measured."""
+
+    ABSOLUTE = 1
+    """The deadband is in the channel's units.
+
+    A value is reported when it differs from the last reported value by more than the
+    deadband.
+    """
+
+    PERCENT = 2
+    """The deadband is a percentage of the last reported value.
+
+    A value is reported when it differs from the last reported value by more than that
+    percentage of the last reported value's magnitude.
+    """
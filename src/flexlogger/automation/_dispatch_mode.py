@@ -0,0 +1,20 @@
+from enum import Enum
+
+
+class DispatchMode(Enum):
+    """An enumeration describing how a :class:`.FlexLoggerEventHandler` calls event callbacks."""
+
+    INLINE = 1
+    """Call the callbacks one after another on the thread that receives events.
+
+    A slow callback delays every other callback, and the events that follow.
+    """
+
+    PER_SUBSCRIBER = 2
+    """Give each callback its own worker thread and queue.
+
+    Each callback still receives its events in order, but a slow callback only delays
+    its own events.  Events wait in the callback's queue until the callback is ready
+    for them, so the queue keeps growing if a callback can never keep up (see
+    :meth:`.FlexLoggerEventHandler.subscriber_metrics`).
+    """
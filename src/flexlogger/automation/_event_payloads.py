@@ -1,13 +1,38 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from dateutil import parser
+
 from ._event_type import EventType
 from ._severity_level import SeverityLevel
 from .proto import Events_pb2
-from datetime import datetime
-import json
+
+try:
+    # orjson parses alarm payloads several times faster than the json module, so use it if
+    # it is installed.
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:
+    _json_loads = json.loads
+
+# Marks a cached value that has not been computed yet (None is a valid value).
+_NOT_PARSED = object()
+
+
+def _parse_alarm_time(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return parser.isoparse(value)
+    except ValueError:
+        return parser.parse(value)
 
 
 class EventPayload:
     """Represents an event payload."""
 
+    __slots__ = ("_event_type", "_event_name", "_payload", "_timestamp")
+
     def __init__(self, event_response: Events_pb2.SubscribeToEventsResponse) -> None:
         self._event_type = EventType.from_event_type_pb2(event_response.event_type)
         self._event_name = event_response.event_name
@@ -31,82 +56,94 @@ class EventPayload:
 
 
 class AlarmPayload(EventPayload):
-    """Represents an alarm event payload."""
+    """Represents an alarm event payload.
+
+    The alarm details are only decoded from the event's JSON the first time one of them is
+    read, so receiving alarms that are never inspected costs very little.
+    """
+
+    __slots__ = ("_fields", "_acknowledged_at", "_occurred_at", "_updated_at")
 
     def __init__(self, event_response: Events_pb2.SubscribeToEventsResponse) -> None:
         super().__init__(event_response)
-        json_payload = json.loads(self._payload)
-        self._alarm_id = json_payload['AlarmId']
-        self._active = json_payload['Active']
-        self._acknowledged = json_payload['Acknowledged']
-        self._acknowledged_at = json_payload['AcknowledgedAt']
-        self._occurred_at = json_payload['OccurredAt']
-        self._severity_level = json_payload['SeverityLevel']
-        self._updated_at = json_payload['UpdatedAt']
-        self._channel = json_payload['Channel']
-        self._condition = json_payload['Condition']
-        self._display_name = json_payload['DisplayName']
-        self._description = json_payload['Description']
+        self._fields = None  # type: Optional[Dict[str, Any]]
+        self._acknowledged_at = _NOT_PARSED  # type: Any
+        self._occurred_at = _NOT_PARSED  # type: Any
+        self._updated_at = _NOT_PARSED  # type: Any
+
+    def _get_field(self, name: str) -> Any:
+        fields = self._fields
+        if fields is None:
+            fields = self._fields = _json_loads(self._payload)
+        return fields[name]
 
     @property
     def alarm_id(self) -> str:
         """The alarm ID."""
-        return self._alarm_id
+        return self._get_field('AlarmId')
 
     @property
     def active(self) -> bool:
         """Whether the alarm is active."""
-        return self._active
+        return self._get_field('Active')
 
     @property
     def acknowledged(self) -> bool:
         """Whether the alarm has been acknowledged."""
-        return self._acknowledged
+        return self._get_field('Acknowledged')
 
     @property
-    def acknowledged_at(self) -> datetime:
-        """When the alarm was acknowledged."""
+    def acknowledged_at(self) -> Optional[datetime]:
+        """When the alarm was acknowledged, or None if it has not been acknowledged."""
+        if self._acknowledged_at is _NOT_PARSED:
+            self._acknowledged_at = _parse_alarm_time(self._get_field('AcknowledgedAt'))
         return self._acknowledged_at
 
     @property
     def occurred_at(self) -> datetime:
         """When the alarm occurred."""
+        if self._occurred_at is _NOT_PARSED:
+            self._occurred_at = _parse_alarm_time(self._get_field('OccurredAt'))
         return self._occurred_at
 
     @property
     def severity_level(self) -> SeverityLevel:
         """The alarm's severity level."""
-        return self._severity_level
+        return self._get_field('SeverityLevel')
 
     @property
     def updated_at(self) -> datetime:
         """When the alarm was last updated."""
+        if self._updated_at is _NOT_PARSED:
+            self._updated_at = _parse_alarm_time(self._get_field('UpdatedAt'))
         return self._updated_at
 
     @property
     def channel(self) -> str:
         """Channel associated with the alarm."""
-        return self._channel
+        return self._get_field('Channel')
 
     @property
     def condition(self) -> str:
         """The alarm condition."""
-        return self._condition
+        return self._get_field('Condition')
 
     @property
     def display_name(self) -> str:
         """The alarm's display name."""
-        return self._display_name
+        return self._get_field('DisplayName')
 
     @property
     def description(self) -> str:
         """Description of the alarm."""
-        return self._description
+        return self._get_field('Description')
 
 
 class FilePayload(EventPayload):
     """Represents a file event payload."""
 
+    __slots__ = ("_file_path",)
+
     def __init__(self, event_response: Events_pb2.SubscribeToEventsResponse) -> None:
         super().__init__(event_response)
         self._file_path = self._payload
@@ -0,0 +1,108 @@
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
+
+from .proto import Events_pb2
+
+# An event file starts with this header, followed by one record per event.  Each record is
+# the time the event was received (float64 seconds since recording started) and the length
+# of the serialized SubscribeToEventsResponse (uint32), both little-endian, followed by the
+# serialized message.
+_FILE_HEADER = b"FLEXLOGGER EVENTS 1\n"
+_RECORD_HEADER = struct.Struct("<dI")
+# The index file holds one entry per record: the record's offset in the event file (uint64)
+# and the time it was received (float64).
+_INDEX_HEADER = b"FLEXLOGGER EVENT INDEX 1\n"
+_INDEX_ENTRY = struct.Struct("<Qd")
+
+
+def _get_index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".idx")
+
+
+class EventRecorder:
+    """Writes the events received by a :class:`.FlexLoggerEventHandler` to a file.
+
+    Do not create this class directly; instead, use the return value of
+    :meth:`.FlexLoggerEventHandler.start_recording`.
+
+    Every event is recorded exactly as it was received from FlexLogger, before it is
+    passed to the callbacks, so the file can be replayed with :class:`.EventReplayer`.
+    An index of the records is written next to the file, with ``.idx`` appended to its
+    name.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Create the event file and its index, replacing any existing files.
+
+        Raises:
+            OSError: if the files cannot be created.
+        """
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._event_file = open(str(self._path), "wb")  # type: Optional[BinaryIO]
+        try:
+            self._index_file = open(str(_get_index_path(self._path)), "wb")
+        except OSError:
+            self._event_file.close()
+            raise
+        self._event_file.write(_FILE_HEADER)
+        self._index_file.write(_INDEX_HEADER)
+        self._offset = len(_FILE_HEADER)
+        self._event_count = 0
+        self._start_time = time.perf_counter()
+
+    def __enter__(self) -> "EventRecorder":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def path(self) -> Path:
+        """The path of the event file."""
+        return self._path
+
+    @property
+    def event_count(self) -> int:
+        """The number of events recorded."""
+        return self._event_count
+
+    @property
+    def closed(self) -> bool:
+        """Whether the recording has been closed."""
+        return self._event_file is None
+
+    def record(self, event_response: Events_pb2.SubscribeToEventsResponse) -> None:
+        """Append an event to the file.
+
+        Events recorded after the recording is closed are ignored.
+        """
+        data = event_response.SerializeToString()
+        with self._lock:
+            if self._event_file is None:
+                return
+            received_time = time.perf_counter() - self._start_time
+            self._event_file.write(_RECORD_HEADER.pack(received_time, len(data)))
+            self._event_file.write(data)
+            self._index_file.write(_INDEX_ENTRY.pack(self._offset, received_time))
+            self._offset += _RECORD_HEADER.size + len(data)
+            self._event_count += 1
+
+    def flush(self) -> None:
+        """Write any buffered events to disk."""
+        with self._lock:
+            if self._event_file is not None:
+                self._event_file.flush()
+                self._index_file.flush()
+
+    def close(self) -> None:
+        """Stop recording and close the files.  Closing a closed recording has no effect."""
+        with self._lock:
+            if self._event_file is None:
+                return
+            self._event_file.close()
+            self._index_file.close()
+            self._event_file = None
@@ -0,0 +1,217 @@
+import struct
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional, Tuple, Union
+
+from ._event_recorder import (
+    _FILE_HEADER,
+    _get_index_path,
+    _INDEX_ENTRY,
+    _INDEX_HEADER,
+    _RECORD_HEADER,
+)
+from ._event_type import EventType
+from ._events import FlexLoggerEventHandler
+from ._flexlogger_error import FlexLoggerError
+from .proto import Events_pb2
+
+
+class _OfflineStubRegistry:
+    """Provides no stubs, for an event handler that is not connected to FlexLogger."""
+
+    def get(self, stub_class: Any) -> Any:
+        return None
+
+
+class EventReplayer:
+    """Feeds events recorded by an :class:`.EventRecorder` to event callbacks.
+
+    The replayer has an event handler of its own that is not connected to FlexLogger.
+    Register callbacks with :meth:`register_event_callback`; :meth:`replay` then passes
+    the recorded events through the same dispatch code as live events, so callbacks can be
+    tested and benchmarked offline::
+
+        replayer = EventReplayer("alarms.events")
+        replayer.register_event_callback(on_alarm, [EventType.ALARM])
+        replayer.replay(speed=None)
+    """
+
+    def __init__(self, path: Union[str, Path], application: Any = None) -> None:
+        """Open a recorded event file.
+
+        Args:
+            path: The path of the event file.
+            application: The value to pass to the callbacks as their ``application``.
+
+        Raises:
+            FlexLoggerError: if the file is not an event recording.
+        """
+        self._path = Path(path)
+        self._index = self._read_index()
+        self._event_handler = FlexLoggerEventHandler(
+            _OfflineStubRegistry(), "", application, lambda: None  # type: ignore
+        )
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def path(self) -> Path:
+        """The path of the event file."""
+        return self._path
+
+    @property
+    def duration(self) -> float:
+        """The time, in seconds, from the first recorded event to the last one."""
+        if len(self._index) == 0:
+            return 0.0
+        return self._index[-1][1] - self._index[0][1]
+
+    @property
+    def event_handler(self) -> FlexLoggerEventHandler:
+        """The event handler that dispatches the replayed events.
+
+        Use it to set the :attr:`.FlexLoggerEventHandler.dispatch_mode` or read
+        :meth:`.FlexLoggerEventHandler.subscriber_metrics`.
+        """
+        return self._event_handler
+
+    def register_event_callback(
+        self,
+        callback: Callable,
+        event_types: Optional[List[EventType]] = None,
+        event_names: Optional[List[str]] = None,
+    ) -> None:
+        """Register a callback for replayed events.
+
+        The arguments are the same as for
+        :meth:`.FlexLoggerEventHandler.register_event_callback`.
+        """
+        self._event_handler._add_subscription(callback, event_types, event_names)
+
+    def unregister_event_callback(self, callback: Callable) -> None:
+        """Stop passing replayed events to a callback."""
+        self._event_handler._remove_subscription(callback)
+
+    def read_events(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[Tuple[float, Events_pb2.SubscribeToEventsResponse]]:
+        """Read recorded events without dispatching them.
+
+        Args:
+            start: The index of the first event to read.
+            stop: The index after the last event to read, or None to read to the end.
+
+        Returns:
+            An iterator of (time, event) tuples, where time is when the event was received,
+            in seconds since the recording started.
+        """
+        entries = self._index[start:stop]
+        if len(entries) == 0:
+            return
+        with open(str(self._path), "rb") as event_file:
+            event_file.seek(entries[0][0])
+            for _ in entries:
+                yield self._read_record(event_file)
+
+    def replay(
+        self, speed: Optional[float] = 1.0, start: int = 0, stop: Optional[int] = None
+    ) -> int:
+        """Dispatch recorded events to the registered callbacks.
+
+        With the default :attr:`.DispatchMode.INLINE`, each callback has returned by the
+        time the next event is dispatched, so a slow callback delays the rest of the replay.
+
+        Args:
+            speed: How fast to replay the events relative to when they were recorded.  1.0
+                keeps the original timing, 2.0 replays twice as fast, and None replays
+                the events as fast as possible.
+            start: The index of the first event to replay.
+            stop: The index after the last event to replay, or None to replay to the end.
+
+        Returns:
+            The number of events replayed.
+
+        Raises:
+            ValueError: if ``speed`` is not greater than zero.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be greater than zero, or None")
+        replay_start_time = time.perf_counter()
+        first_event_time = None  # type: Optional[float]
+        count = 0
+        for received_time, event_response in self.read_events(start, stop):
+            if speed is not None:
+                if first_event_time is None:
+                    first_event_time = received_time
+                delay = (
+                    replay_start_time
+                    + (received_time - first_event_time) / speed
+                    - time.perf_counter()
+                )
+                if delay > 0:
+                    time.sleep(delay)
+            self._event_handler._dispatch_event(event_response)
+            count += 1
+        return count
+
+    def _read_index(self) -> List[Tuple[int, float]]:
+        try:
+            with open(str(self._path), "rb") as event_file:
+                if event_file.read(len(_FILE_HEADER)) != _FILE_HEADER:
+                    raise FlexLoggerError("%s is not an event recording" % self._path)
+                try:
+                    with open(str(_get_index_path(self._path)), "rb") as index_file:
+                        index_data = index_file.read()
+                except FileNotFoundError:
+                    index_data = b""
+                index = self._parse_index(index_data)
+                # If the recorder was not closed, the end of the index may not match the
+                # event file, so drop index entries for incomplete records and scan the rest
+                # of the file for records that are not in the index.
+                while len(index) > 0:
+                    event_file.seek(index[-1][0])
+                    if self._skip_record(event_file) is not None:
+                        break
+                    index.pop()
+                if len(index) == 0:
+                    event_file.seek(len(_FILE_HEADER))
+                while True:
+                    offset = event_file.tell()
+                    received_time = self._skip_record(event_file)
+                    if received_time is None:
+                        break
+                    index.append((offset, received_time))
+                return index
+        except (OSError, struct.error) as error:
+            raise FlexLoggerError("Failed to read the event recording") from error
+
+    @staticmethod
+    def _parse_index(index_data: bytes) -> List[Tuple[int, float]]:
+        if not index_data.startswith(_INDEX_HEADER):
+            return []
+        entries = index_data[len(_INDEX_HEADER) :]
+        entry_count = len(entries) // _INDEX_ENTRY.size
+        return [
+            _INDEX_ENTRY.unpack_from(entries, i * _INDEX_ENTRY.size) for i in range(entry_count)
+        ]
+
+    @staticmethod
+    def _skip_record(event_file: BinaryIO) -> Optional[float]:
+        """Move past one record, returning its time, or None if there is no complete record."""
+        header = event_file.read(_RECORD_HEADER.size)
+        if len(header) < _RECORD_HEADER.size:
+            return None
+        received_time, length = _RECORD_HEADER.unpack(header)
+        if len(event_file.read(length)) < length:
+            return None
+        return received_time
+
+    @staticmethod
+    def _read_record(
+        event_file: BinaryIO,
+    ) -> Tuple[float, Events_pb2.SubscribeToEventsResponse]:
+        received_time, length = _RECORD_HEADER.unpack(event_file.read(_RECORD_HEADER.size))
+        event_response = Events_pb2.SubscribeToEventsResponse()
+        event_response.ParseFromString(event_file.read(length))
+        return received_time, event_response
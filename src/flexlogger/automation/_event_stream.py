@@ -0,0 +1,143 @@
+import asyncio
+from typing import Any, List, Optional, TYPE_CHECKING
+
+from ._async_queue import _QueueClosed, _ThreadSafeAsyncQueue
+from ._event_payloads import EventPayload
+from ._event_type import EventType
+from ._flexlogger_error import FlexLoggerError
+from ._overflow_policy import OverflowPolicy
+
+if TYPE_CHECKING:
+    from ._events import FlexLoggerEventHandler  # noqa: F401
+
+
+class EventStream:
+    """An asynchronous iterator over FlexLogger events.
+
+    Do not create this class directly; instead, use the return value of
+    :meth:`.FlexLoggerEventHandler.events`.
+
+    Events are read from FlexLogger on the event handler's thread and put in a bounded
+    queue, which is emptied by iterating over the stream with ``async for``.  When the
+    queue is full, the stream's :class:`.OverflowPolicy` decides whether to wait for the
+    consumer or to discard an event, and the counters record what happened.
+
+    Subscribing to events happens the first time the stream is iterated over or
+    entered with ``async with``.  Leaving the ``async with`` block, or calling
+    :meth:`aclose`, unsubscribes the stream.
+    """
+
+    def __init__(
+        self,
+        event_handler: "FlexLoggerEventHandler",
+        event_types: Optional[List[EventType]],
+        event_names: Optional[List[str]],
+        max_queue_size: int,
+        overflow_policy: OverflowPolicy,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self._event_handler = event_handler
+        self._event_types = event_types
+        self._event_names = event_names
+        self._loop = loop
+        self._queue = _ThreadSafeAsyncQueue(
+            loop, max_queue_size, overflow_policy
+        )  # type: _ThreadSafeAsyncQueue[EventPayload]
+        self._is_subscribed = False
+
+    def __aiter__(self) -> "EventStream":
+        return self
+
+    async def __anext__(self) -> EventPayload:
+        if not self._is_subscribed and not self._queue.closed:
+            await self._subscribe()
+        try:
+            return await self._queue.get()
+        except _QueueClosed:
+            raise StopAsyncIteration from None
+
+    async def __aenter__(self) -> "EventStream":
+        await self._subscribe()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    @property
+    def event_types(self) -> Optional[List[EventType]]:
+        """The types of events in the stream, or None for all event types."""
+        return self._event_types
+
+    @property
+    def event_names(self) -> Optional[List[str]]:
+        """The names of the events in the stream, or None for events with any name."""
+        return self._event_names
+
+    @property
+    def max_queue_size(self) -> int:
+        """The maximum number of events that can wait in the queue."""
+        return self._queue.max_size
+
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        """What happens to new events when the queue is full."""
+        return self._queue.overflow_policy
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of events waiting in the queue."""
+        return len(self._queue)
+
+    @property
+    def received_count(self) -> int:
+        """The number of events received from FlexLogger, including dropped events."""
+        return self._queue.put_count
+
+    @property
+    def delivered_count(self) -> int:
+        """The number of events returned by the iterator."""
+        return self._queue.get_count
+
+    @property
+    def dropped_count(self) -> int:
+        """The number of events discarded because the queue was full."""
+        return self._queue.dropped_count
+
+    @property
+    def blocked_count(self) -> int:
+        """The number of times receiving events had to wait because the queue was full.
+
+        This is only incremented with :attr:`.OverflowPolicy.BLOCK`.
+        """
+        return self._queue.blocked_count
+
+    async def aclose(self) -> None:
+        """Unsubscribe the stream from events.
+
+        Events that are already in the queue can still be read, after which the
+        iteration ends.
+        """
+        self._queue.close()
+        if self._is_subscribed:
+            self._is_subscribed = False
+            self._event_handler._remove_event_stream(self)
+
+    async def _subscribe(self) -> None:
+        if self._is_subscribed:
+            return
+        if self._queue.closed:
+            raise FlexLoggerError("The event stream has been closed")
+        self._is_subscribed = True
+        try:
+            # Subscribing makes blocking calls to FlexLogger, so do it on a worker thread.
+            await self._loop.run_in_executor(None, self._event_handler._add_event_stream, self)
+        except BaseException:
+            self._is_subscribed = False
+            raise
+
+    def _on_event(self, application: Any, event_type: EventType, payload: EventPayload) -> None:
+        self._queue.put(payload)
+
+    def _close(self, error: Optional[BaseException] = None) -> None:
+        self._is_subscribed = False
+        self._queue.close(error)
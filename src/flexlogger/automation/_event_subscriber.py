@@ -0,0 +1,124 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, FrozenSet, List, Optional
+
+from ._event_payloads import EventPayload
+from ._event_type import EventType
+from ._subscriber_metrics import SubscriberMetrics
+
+# Put in a worker's queue to make the worker exit.
+_STOP = object()
+
+
+class _EventSubscriber:
+    """Delivers events to one callback, either directly or on a worker thread of its own.
+
+    With a worker, :meth:`deliver` only queues the event, so a slow callback does not
+    delay the thread that dispatches events; the worker calls the callback with the
+    queued events in order.
+
+    A subscriber that replaces another one for the same callback is given the worker of
+    the one it replaces, if any, and waits for that worker to finish its queued events
+    before delivering any of its own, so the callback is never called concurrently or
+    out of order.
+    """
+
+    def __init__(
+        self,
+        callback: Callable,
+        event_types: List[EventType],
+        event_names: Optional[FrozenSet[str]],
+        use_worker: bool,
+        predecessor: Optional[threading.Thread] = None,
+    ) -> None:
+        self.callback = callback
+        self.event_types = event_types
+        self.event_names = event_names
+        self._lock = threading.Lock()
+        self._max_queue_depth = 0
+        self._delivered_count = 0
+        self._error_count = 0
+        self._last_latency = 0.0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._predecessor = predecessor
+        self._queue = None  # type: Optional[queue.Queue]
+        self._worker = None  # type: Optional[threading.Thread]
+        if use_worker:
+            self._queue = queue.Queue()
+            self._worker = threading.Thread(
+                target=self._run_worker, name="FlexLogger event subscriber", daemon=True
+            )
+            self._worker.start()
+
+    @property
+    def uses_worker(self) -> bool:
+        return self._queue is not None
+
+    def deliver(self, application: Any, event_type: EventType, payload: EventPayload) -> None:
+        dispatch_time = time.perf_counter()
+        if self._queue is None:
+            self._wait_for_predecessor()
+            self.callback(application, event_type, payload)
+            self._record_delivery(dispatch_time)
+            return
+        self._queue.put((application, event_type, payload, dispatch_time))
+        queue_depth = self._queue.qsize()
+        if queue_depth > self._max_queue_depth:
+            self._max_queue_depth = queue_depth
+
+    def stop(self) -> Optional[threading.Thread]:
+        """Let the worker finish the events already queued, then exit.
+
+        Returns:
+            The worker thread, which can be joined to wait for the queued events to be
+            delivered, or None if the subscriber has no worker.
+        """
+        if self._queue is not None:
+            self._queue.put(_STOP)
+        return self._worker
+
+    def metrics(self) -> SubscriberMetrics:
+        with self._lock:
+            return SubscriberMetrics(
+                self.callback,
+                self._queue.qsize() if self._queue is not None else 0,
+                self._max_queue_depth,
+                self._delivered_count,
+                self._error_count,
+                self._last_latency,
+                self._total_latency / self._delivered_count if self._delivered_count else 0.0,
+                self._max_latency,
+            )
+
+    def _run_worker(self) -> None:
+        assert self._queue is not None
+        self._wait_for_predecessor()
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            application, event_type, payload, dispatch_time = item
+            try:
+                self.callback(application, event_type, payload)
+            except Exception:
+                # Keep delivering the following events; the failure shows up in the metrics.
+                with self._lock:
+                    self._error_count += 1
+            self._record_delivery(dispatch_time)
+
+    def _wait_for_predecessor(self) -> None:
+        predecessor = self._predecessor
+        if predecessor is not None:
+            predecessor.join()
+            self._predecessor = None
+
+    def _record_delivery(self, dispatch_time: float) -> None:
+        latency = time.perf_counter() - dispatch_time
+        with self._lock:
+            self._delivered_count += 1
+            self._last_latency = latency
+            self._total_latency += latency
+            if latency > self._max_latency:
+                self._max_latency = latency
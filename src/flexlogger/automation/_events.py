@@ -1,19 +1,105 @@
+import asyncio
+import threading
 import time
 
+from ._dispatch_mode import DispatchMode
 from ._event_payloads import AlarmPayload
 from ._event_payloads import EventPayload
 from ._event_payloads import FilePayload
+from ._event_recorder import EventRecorder
+from ._event_stream import EventStream
+from ._event_subscriber import _EventSubscriber
 from ._event_type import EventType
-from ._flexlogger_error import FlexLoggerError
+from ._flexlogger_error import _to_flexlogger_error, FlexLoggerError
+from ._overflow_policy import OverflowPolicy
+from ._stub_registry import StubRegistry
+from ._subscriber_metrics import SubscriberMetrics
 from .proto import (
     Events_pb2,
     Events_pb2_grpc,
 )
 from .proto.EventType_pb2 import EventType as EventType_pb2
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from google.protobuf.timestamp_pb2 import Timestamp
-from grpc import Channel, RpcError
-from typing import Callable, Iterator, List
+from pathlib import Path
+from grpc import RpcError, StatusCode
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+_ALL_EVENT_TYPES = [EventType.ALARM, EventType.LOG_FILE, EventType.TEST_SESSION, EventType.CUSTOM]
+
+# How long register_event_callback() waits for the server to confirm a new subscription,
+# and the bounds of the interval between checks.
+_REGISTRATION_TIMEOUT = 5.0
+_REGISTRATION_INITIAL_POLL_INTERVAL = 0.002
+_REGISTRATION_MAX_POLL_INTERVAL = 0.05
+
+
+class _EventDispatch:
+    """The callbacks to call for events of one type.
+
+    Callbacks that did not ask for specific event names are called for every event of
+    the type.  For each event name that some callbacks did ask for, ``callbacks_by_name``
+    holds those callbacks together with the unfiltered ones, in registration order.
+    """
+
+    __slots__ = ("callbacks", "callbacks_by_name")
+
+    def __init__(
+        self,
+        callbacks: Tuple[Callable, ...],
+        callbacks_by_name: Dict[str, Tuple[Callable, ...]],
+    ) -> None:
+        self.callbacks = callbacks
+        self.callbacks_by_name = callbacks_by_name
+
+    def get(self, event_name: str) -> Tuple[Callable, ...]:
+        return self.callbacks_by_name.get(event_name, self.callbacks)
+
+
+def _is_event_stream_lost(error: Exception) -> bool:
+    """Whether ``error`` means the connection to FlexLogger was lost.
+
+    Errors that mean the event stream failed or was cancelled return False.
+    """
+    if isinstance(error, StopIteration):
+        return True
+    code = getattr(error, "code", None)
+    return code is not None and code() == StatusCode.UNAVAILABLE
+
+
+def _build_dispatch_table(
+    subscriptions: Mapping[Callable, _EventSubscriber]
+) -> Dict[EventType, _EventDispatch]:
+    """Build the lookup table from event type (and name) to the callbacks to call.
+
+    The table holds each subscriber's ``deliver`` method rather than the callback itself,
+    so that the subscriber can time the callback or hand the event to its worker.
+    """
+    dispatch_table = {}  # type: Dict[EventType, _EventDispatch]
+    for event_type in EventType:
+        matching = [
+            (subscriber.deliver, subscriber.event_names)
+            for subscriber in subscriptions.values()
+            if event_type in subscriber.event_types
+        ]
+        if len(matching) == 0:
+            continue
+        filtered_names = set()  # type: set
+        for _, event_names in matching:
+            if event_names is not None:
+                filtered_names.update(event_names)
+        dispatch_table[event_type] = _EventDispatch(
+            tuple(callback for callback, event_names in matching if event_names is None),
+            {
+                name: tuple(
+                    callback
+                    for callback, event_names in matching
+                    if event_names is None or name in event_names
+                )
+                for name in filtered_names
+            },
+        )
+    return dispatch_table
 
 
 class FlexLoggerEventHandler:
@@ -21,18 +107,24 @@ class FlexLoggerEventHandler:
     You must create a FlexLoggerEventHandler object to be able to register for events.
     """
 
-    def __init__(self, channel: Channel,
+    def __init__(self, stubs: StubRegistry,
                  client_id: str,
                  application,
                  raise_if_application_closed: Callable[[], None]) -> None:
         self._application = application
-        self._callbacks = []
-        self._channel = channel
         self._client_id = client_id
-        self._event_types_per_callback = []
+        # The subscriptions are only changed with the lock held, and the dispatch table is
+        # rebuilt and replaced (never modified) after every change, so the event thread
+        # can use it without locking.
+        self._subscriptions = {}  # type: Dict[Callable, _EventSubscriber]
+        self._subscriptions_lock = threading.Lock()
+        self._dispatch_table = {}  # type: Dict[EventType, _EventDispatch]
+        self._dispatch_mode = DispatchMode.INLINE
+        self._event_streams = []  # type: List[EventStream]
+        self._event_recorder = None  # type: Optional[EventRecorder]
         self._is_subscribed = False
         self._raise_if_application_closed = raise_if_application_closed
-        self._stub = Events_pb2_grpc.FlexLoggerEventsStub(self._channel)
+        self._stub = stubs.get(Events_pb2_grpc.FlexLoggerEventsStub)
         self._thread_executor = ThreadPoolExecutor()
 
     def __enter__(self):
@@ -41,6 +133,58 @@ class FlexLoggerEventHandler:
     def __exit__(self, *args):
         self.unregister_from_events()
 
+    @property
+    def dispatch_mode(self) -> DispatchMode:
+        """How event callbacks are called.
+
+        The default is :attr:`.DispatchMode.INLINE`.  Changing the mode applies to the
+        callbacks that are already registered as well as to new ones.  Callbacks used by
+        :meth:`events` streams are always called inline, since they only queue the event.
+        """
+        return self._dispatch_mode
+
+    @dispatch_mode.setter
+    def dispatch_mode(self, dispatch_mode: DispatchMode) -> None:
+        if not isinstance(dispatch_mode, DispatchMode):
+            raise ValueError("dispatch_mode must be a DispatchMode")
+        stopped_workers = []  # type: List[threading.Thread]
+        with self._subscriptions_lock:
+            self._dispatch_mode = dispatch_mode
+            use_worker = dispatch_mode is DispatchMode.PER_SUBSCRIBER
+            stream_callbacks = [event_stream._on_event for event_stream in self._event_streams]
+            subscriptions = {}  # type: Dict[Callable, _EventSubscriber]
+            for callback, subscriber in self._subscriptions.items():
+                if subscriber.uses_worker == use_worker or callback in stream_callbacks:
+                    subscriptions[callback] = subscriber
+                    continue
+                worker = subscriber.stop()
+                if worker is not None:
+                    stopped_workers.append(worker)
+                subscriptions[callback] = _EventSubscriber(
+                    callback, subscriber.event_types, subscriber.event_names, use_worker, worker
+                )
+            self._subscriptions = subscriptions
+            self._dispatch_table = _build_dispatch_table(subscriptions)
+        # Wait for the old workers to deliver their queued events outside the lock, since
+        # the callbacks may use the event handler.  The new subscribers also wait for them
+        # before delivering, which covers events dispatched in the meantime.
+        for worker in stopped_workers:
+            # A callback running on one of the workers may be what changed the mode.
+            if worker is not threading.current_thread():
+                worker.join()
+
+    def subscriber_metrics(self) -> Dict[Callable, SubscriberMetrics]:
+        """Get statistics about the events delivered to each registered callback.
+
+        The statistics for a callback start over when its :attr:`dispatch_mode` changes.
+
+        Returns:
+            A dictionary from each registered callback to its statistics.
+        """
+        with self._subscriptions_lock:
+            subscribers = list(self._subscriptions.items())
+        return {callback: subscriber.metrics() for callback, subscriber in subscribers}
+
     def get_registered_events(self) -> List[EventType]:
         """Gets the list of registered event types.
 
@@ -57,51 +201,240 @@ class FlexLoggerEventHandler:
             return event_types
         except (RpcError, ValueError, AttributeError) as rpc_error:
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get the registered events") from rpc_error
+            raise _to_flexlogger_error(
+                "Failed to get the registered events", rpc_error
+            ) from rpc_error
 
     def unregister_from_events(self) -> None:
         """Unregister from events."""
         try:
-            self._callbacks = []
-            self._event_types_per_callback = []
+            with self._subscriptions_lock:
+                subscribers = list(self._subscriptions.values())
+                self._subscriptions = {}
+                self._dispatch_table = {}
+            for subscriber in subscribers:
+                subscriber.stop()
             self._is_subscribed = False
+            self._close_event_streams()
             self._stub.UnsubscribeFromEvents(Events_pb2.UnsubscribeFromEventsRequest(client_id=self._client_id))
         except (RpcError, ValueError, AttributeError) as rpc_error:
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to unregister from events") from rpc_error
+            raise _to_flexlogger_error("Failed to unregister from events", rpc_error) from rpc_error
 
-    def register_event_callback(self, callback, event_types=None) -> None:
+    def register_event_callback(self, callback, event_types=None, event_names=None) -> None:
         """Register for events and specify a callback method
 
+        Each event's payload is created once and the same payload object is passed to
+        every callback that receives the event.  Callbacks are called as described by
+        :attr:`dispatch_mode`.
+
+        The first registration opens the event stream and returns once FlexLogger
+        confirms that the client is registered, so no events sent after this method
+        returns are missed.
+
         Args:
             callback: callback method. The callback method must have the following parameters:
                       application: Application      Reference to the FlexLogger application
                       event_type: EventType         The event type
                       event_payload: EventPayload   The event payload
             event_types: List of EventType to subscribe to.
+            event_names: List of event names (see :mod:`.EventNames`) to subscribe to.
+                Omit this argument or pass None to receive events with any name.
 
         Raises:
-            FlexLoggerError: if the callback registration failed.
+            FlexLoggerError: if the callback registration failed, or FlexLogger did not
+                confirm it within five seconds.
         """
+        self._register_event_callback(callback, event_types, event_names, None)
+
+    def _register_event_callback(self, callback, event_types, event_names, dispatch_mode) -> None:
         event_types_parameter = self._marshal_event_types(event_types)
         if self._is_subscribed:
             try:
                 self._stub.RegisterEvents(Events_pb2.SubscribeToEventsRequest(client_id=self._client_id,
                                                                               event_types=event_types_parameter))
-                self._add_callback_and_events_to_dictionary(callback, event_types)
+                self._add_subscription(callback, event_types, event_names, dispatch_mode)
             except (RpcError, ValueError, AttributeError) as rpc_error:
                 self._raise_if_application_closed()
-                raise FlexLoggerError("Failed to register events") from rpc_error
+                raise _to_flexlogger_error("Failed to register events", rpc_error) from rpc_error
             return
 
-        # Add function and event types to respective lists
         self._is_subscribed = True
-        self._add_callback_and_events_to_dictionary(callback, event_types)
+        self._add_subscription(callback, event_types, event_names, dispatch_mode)
+        generation = self._connection_generation()
         event_iterator = self._stub.SubscribeToEvents(
             Events_pb2.SubscribeToEventsRequest(client_id=self._client_id, event_types=event_types_parameter))
-        self._thread_executor.submit(self._event_handler, event_iterator)
-        # Wait for the server to register the client ID.
-        time.sleep(0.15)
+        event_handler_future = self._thread_executor.submit(
+            self._event_handler, event_iterator, generation)
+        try:
+            self._wait_for_registration(event_types_parameter, event_handler_future)
+        except FlexLoggerError:
+            self._is_subscribed = False
+            self._remove_subscription(callback)
+            event_iterator.cancel()
+            raise
+
+    def _wait_for_registration(self, event_types_pb2, event_handler_future: Future) -> None:
+        """Wait until the server reports the client as registered for the event types.
+
+        The server registers the client ID while it handles the SubscribeToEvents call,
+        which happens asynchronously, so poll GetRegisteredEvents with a growing delay.
+        """
+        expected = set(event_types_pb2) if event_types_pb2 is not None else set()
+        deadline = time.monotonic() + _REGISTRATION_TIMEOUT
+        delay = _REGISTRATION_INITIAL_POLL_INTERVAL
+        last_error = None  # type: Optional[BaseException]
+        while True:
+            if event_handler_future.done():
+                # Receiving events failed before the registration was confirmed.
+                error = event_handler_future.exception()
+                raise FlexLoggerError("Failed to subscribe to events") from error
+            try:
+                response = self._stub.GetRegisteredEvents(
+                    Events_pb2.GetRegisteredEventsRequest(client_id=self._client_id))
+                registered = set(response.event_types)
+                if len(registered) > 0 and expected.issubset(registered):
+                    return
+            except (RpcError, ValueError, AttributeError) as rpc_error:
+                # The server may not know about the client ID yet.
+                self._raise_if_application_closed()
+                last_error = rpc_error
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise FlexLoggerError(
+                    "Timed out waiting for the event subscription"
+                ) from last_error
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _REGISTRATION_MAX_POLL_INTERVAL)
+
+    def events(
+        self,
+        types: Optional[List[EventType]] = None,
+        names: Optional[List[str]] = None,
+        max_queue_size: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> EventStream:
+        """Get an asynchronous iterator over events.
+
+        This must be called from a coroutine.  Events are queued as they are received
+        and read with ``async for``, so a slow consumer does not delay callbacks or
+        other streams (unless ``overflow_policy`` is :attr:`.OverflowPolicy.BLOCK` and
+        the queue is full)::
+
+            async with handler.events([EventType.ALARM]) as events:
+                async for event in events:
+                    print(event.event_name)
+
+        Args:
+            types: List of EventType to receive.  Omit this argument or pass None to
+                receive all event types.
+            names: List of event names to receive.  Omit this argument or pass None to
+                receive events with any name.
+            max_queue_size: The maximum number of events to hold until they are read.
+            overflow_policy: What to do with new events when the queue is full.
+
+        Returns:
+            The event stream.  Subscribing to events happens the first time it is
+            iterated over or entered with ``async with``.
+
+        Raises:
+            ValueError: if ``max_queue_size`` or ``overflow_policy`` is invalid.
+        """
+        return EventStream(
+            self, types, names, max_queue_size, overflow_policy, asyncio.get_event_loop()
+        )
+
+    def start_recording(self, path: Union[str, Path]) -> EventRecorder:
+        """Start writing every event received from FlexLogger to a file.
+
+        Events are recorded before they are passed to the callbacks, including events that
+        no callback is registered for.  Use :class:`.EventReplayer` to replay the file.
+
+        Args:
+            path: The path of the event file.  An index is written next to it, with
+                ``.idx`` appended to its name.  Existing files are replaced.
+
+        Returns:
+            The recorder.  Call :meth:`stop_recording` (or :meth:`.EventRecorder.close`)
+            to stop recording.
+
+        Raises:
+            FlexLoggerError: if events are already being recorded, or the file cannot be
+                created.
+        """
+        if self._event_recorder is not None and not self._event_recorder.closed:
+            raise FlexLoggerError("Events are already being recorded")
+        try:
+            self._event_recorder = EventRecorder(path)
+        except OSError as error:
+            raise FlexLoggerError("Failed to create the event recording") from error
+        return self._event_recorder
+
+    def stop_recording(self) -> None:
+        """Stop recording events and close the event file."""
+        event_recorder = self._event_recorder
+        self._event_recorder = None
+        if event_recorder is not None:
+            event_recorder.close()
+
+    def _add_event_stream(self, event_stream: EventStream) -> None:
+        self._event_streams.append(event_stream)
+        try:
+            self._register_event_callback(
+                event_stream._on_event,
+                event_stream.event_types,
+                event_stream.event_names,
+                DispatchMode.INLINE,
+            )
+        except FlexLoggerError:
+            self._event_streams.remove(event_stream)
+            raise
+
+    def _remove_event_stream(self, event_stream: EventStream) -> None:
+        if event_stream in self._event_streams:
+            self._event_streams.remove(event_stream)
+        self._remove_subscription(event_stream._on_event)
+
+    def _close_event_streams(self, error: Optional[BaseException] = None) -> None:
+        event_streams = self._event_streams
+        self._event_streams = []
+        for event_stream in event_streams:
+            self._remove_subscription(event_stream._on_event)
+            event_stream._close(error)
+
+    def _add_subscription(
+        self,
+        callback: Callable,
+        event_types: Optional[List[EventType]],
+        event_names: Optional[Iterable[str]],
+        dispatch_mode: Optional[DispatchMode] = None,
+    ) -> None:
+        # If the event type is not provided, respond to all.
+        if event_types is None:
+            event_types = _ALL_EVENT_TYPES
+        with self._subscriptions_lock:
+            if dispatch_mode is None:
+                dispatch_mode = self._dispatch_mode
+            # Registering the same callback again replaces its event types and names.
+            previous = self._subscriptions.pop(callback, None)
+            previous_worker = previous.stop() if previous is not None else None
+            subscriptions = dict(self._subscriptions)
+            subscriptions[callback] = _EventSubscriber(
+                callback,
+                list(event_types),
+                frozenset(event_names) if event_names is not None else None,
+                dispatch_mode is DispatchMode.PER_SUBSCRIBER,
+                previous_worker,
+            )
+            self._subscriptions = subscriptions
+            self._dispatch_table = _build_dispatch_table(subscriptions)
+
+    def _remove_subscription(self, callback: Callable) -> None:
+        with self._subscriptions_lock:
+            subscriber = self._subscriptions.pop(callback, None)
+            if subscriber is not None:
+                subscriber.stop()
+                self._dispatch_table = _build_dispatch_table(self._subscriptions)
 
     @staticmethod
     def _marshal_event_types(event_types):
@@ -123,31 +456,83 @@ class FlexLoggerEventHandler:
 
         return event_types
 
-    def _add_callback_and_events_to_dictionary(self, callback, event_types: [EventType]):
-        # If the event type is not provided, respond to all.
-        if event_types is None:
-            event_types = [EventType.ALARM, EventType.LOG_FILE, EventType.TEST_SESSION, EventType.CUSTOM]
-
-        if callback in self._callbacks:
-            index = self._callbacks.index(callback)
-            self._event_types_per_callback[index] = event_types
-        else:
-            self._callbacks.append(callback)
-            self._event_types_per_callback.append(event_types)
-
-    def _event_handler(self, event_iterator: Iterator[Events_pb2.SubscribeToEventsResponse]) -> None:
+    def _event_handler(self,
+                       event_iterator: Iterator[Events_pb2.SubscribeToEventsResponse],
+                       generation: int = 0) -> None:
         try:
             while self._is_subscribed:
-                event_response = next(event_iterator)
+                try:
+                    event_response = next(event_iterator)
+                except (RpcError, StopIteration) as error:
+                    if not self._is_subscribed:
+                        # unregister_from_events() cancelled the stream.
+                        break
+                    if not _is_event_stream_lost(error):
+                        raise
+                    reopened = self._reopen_event_stream(generation)
+                    if reopened is None:
+                        raise
+                    event_iterator, generation = reopened
+                    continue
                 if event_response is not None:
-                    event_type = EventType.from_event_type_pb2(event_response.event_type)
-                    for i in range(len(self._callbacks)):
-                        if event_type in self._event_types_per_callback[i]:
-                            payload = self._create_payload(event_response)
-                            self._callbacks[i](self._application, event_type, payload)
+                    event_recorder = self._event_recorder
+                    if event_recorder is not None:
+                        event_recorder.record(event_response)
+                    self._dispatch_event(event_response)
         except Exception as error:
+            stream_error = FlexLoggerError("Failed to receive event.")
+            stream_error.__cause__ = error
+            self._close_event_streams(stream_error)
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to receive event.") from error
+            raise stream_error from error
+        self._close_event_streams()
+
+    def _connection_generation(self) -> int:
+        reconnecting_channel = getattr(self._application, "_reconnecting_channel", None)
+        return reconnecting_channel.generation if reconnecting_channel is not None else 0
+
+    def _reopen_event_stream(
+        self, generation: int
+    ) -> Optional[Tuple[Iterator[Events_pb2.SubscribeToEventsResponse], int]]:
+        """Subscribe to events again after the event stream ended, if the application
+        reconnects to FlexLogger.
+
+        Returns:
+            The new event stream and the generation of the connection it was opened on, or
+            None if the application does not reconnect or could not reconnect.
+        """
+        reconnecting_channel = getattr(self._application, "_reconnecting_channel", None)
+        if reconnecting_channel is None or not self._is_subscribed:
+            return None
+        if not self._application._recover(generation) or not self._is_subscribed:
+            return None
+        generation = reconnecting_channel.generation
+        with self._subscriptions_lock:
+            event_types = set()
+            for subscriber in self._subscriptions.values():
+                event_types.update(subscriber.event_types)
+        # Keep the order of _ALL_EVENT_TYPES, so the request does not depend on set order.
+        event_types_parameter = self._marshal_event_types(
+            [event_type for event_type in _ALL_EVENT_TYPES if event_type in event_types]
+        )
+        event_iterator = self._stub.SubscribeToEvents(
+            Events_pb2.SubscribeToEventsRequest(
+                client_id=self._client_id, event_types=event_types_parameter
+            )
+        )
+        return event_iterator, generation
+
+    def _dispatch_event(self, event_response: Events_pb2.SubscribeToEventsResponse) -> None:
+        event_type = EventType.from_event_type_pb2(event_response.event_type)
+        dispatch = self._dispatch_table.get(event_type)
+        if dispatch is None:
+            return
+        callbacks = dispatch.get(event_response.event_name)
+        if len(callbacks) == 0:
+            return
+        payload = self._create_payload(event_response)
+        for callback in callbacks:
+            callback(self._application, event_type, payload)
 
     @staticmethod
     def _create_payload(event_response: Events_pb2.SubscribeToEventsResponse):
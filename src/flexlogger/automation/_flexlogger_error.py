@@ -1,7 +1,7 @@
 import re
 from typing import cast
 
-from grpc import RpcError
+from grpc import RpcError, StatusCode
 
 
 class FlexLoggerError(Exception):
@@ -48,3 +48,28 @@ class FlexLoggerError(Exception):
 
         cause = cast(RpcError, self.__cause__)
         return cause.details()
+
+
+class FlexLoggerTimeoutError(FlexLoggerError):
+    """Represents a call to FlexLogger that did not complete before its timeout.
+
+    Timeouts come from the ``timeout`` argument of a method or from the
+    :class:`.TimeoutPolicy` of the :class:`.Application`.  Because this is a
+    :class:`FlexLoggerError`, existing error handling still catches it, but callers can
+    catch it separately to fail fast or retry.
+    """
+
+    def __repr__(self) -> str:
+        return f"FlexLoggerTimeoutError({repr(self.message)})"
+
+
+def _to_flexlogger_error(message: str, error: BaseException) -> FlexLoggerError:
+    """Create the error to raise for a call to FlexLogger that failed with ``error``."""
+    if isinstance(error, RpcError) and _is_deadline_exceeded(error):
+        return FlexLoggerTimeoutError(message)
+    return FlexLoggerError(message)
+
+
+def _is_deadline_exceeded(error: RpcError) -> bool:
+    code = getattr(error, "code", None)
+    return code is not None and code() == StatusCode.DEADLINE_EXCEEDED
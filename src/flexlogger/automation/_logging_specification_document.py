@@ -1,21 +1,20 @@
-from google.protobuf.duration_pb2 import Duration
-from google.protobuf.timestamp_pb2 import Timestamp
 import datetime
-from datetime import timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 from dateutil import parser
 from dateutil import tz
-from grpc import Channel, RpcError
-from typing import Callable, List
+from google.protobuf.duration_pb2 import Duration
+from google.protobuf.timestamp_pb2 import Timestamp
 
-from ._flexlogger_error import FlexLoggerError
+from ._log_file_type import LogFileType
+from ._rpc import _Rpc
 from ._start_trigger_condition import StartTriggerCondition
 from ._stop_trigger_condition import StopTriggerCondition
+from ._stub_registry import StubRegistry
 from ._test_property import TestProperty
-from ._log_file_type import LogFileType
 from ._value_change_condition import ValueChangeCondition
 from .proto import LoggingSpecificationDocument_pb2, LoggingSpecificationDocument_pb2_grpc
 from .proto.Identifiers_pb2 import ElementIdentifier
-
 from .proto.LoggingSpecificationDocument_pb2 import LogFileType as LogFileType_pb2
 
 LOG_FILE_TYPE_MAP = {
@@ -24,6 +23,315 @@ LOG_FILE_TYPE_MAP = {
     LogFileType.TDMS_BACKUP_FILES: LogFileType_pb2.TDMS_BACKUP,
 }
 
+_STUB = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub
+
+
+def _to_test_property(test_property: LoggingSpecificationDocument_pb2.TestProperty) -> TestProperty:
+    return TestProperty(
+        test_property.property_name,
+        test_property.property_value,
+        test_property.prompt_on_start,
+    )
+
+
+def _from_test_property(
+    test_property: TestProperty,
+) -> LoggingSpecificationDocument_pb2.TestProperty:
+    return LoggingSpecificationDocument_pb2.TestProperty(
+        property_name=test_property.name,
+        property_value=test_property.value,
+        prompt_on_start=test_property.prompt_on_start,
+    )
+
+
+def _value_change_fields(value_change_condition: ValueChangeCondition) -> Dict[str, Any]:
+    # The fields the start and stop trigger requests have in common
+    return {
+        "channel_name": value_change_condition.channel_name,
+        "value_change_type": value_change_condition.value_change_type.to_value_change_type_pb2(),
+        "threshold": value_change_condition.threshold,
+        "min_value": value_change_condition.min_value,
+        "max_value": value_change_condition.max_value,
+    }
+
+
+def _to_timestamp(time: datetime.datetime) -> Timestamp:
+    timestamp = Timestamp()
+    timestamp.FromDatetime(time)
+    return timestamp
+
+
+def _to_duration(duration: datetime.timedelta) -> Duration:
+    test_duration = Duration()
+    test_duration.FromTimedelta(duration)
+    return test_duration
+
+
+def _read_start_trigger_settings(
+    response: LoggingSpecificationDocument_pb2.GetStartTriggerSettingsResponse,
+) -> Tuple[StartTriggerCondition, Any]:
+    start_trigger_condition = StartTriggerCondition.from_start_trigger_condition_pb2(
+        response.start_trigger_condition
+    )
+    if start_trigger_condition == StartTriggerCondition.TEST_START:
+        return start_trigger_condition, None
+    elif start_trigger_condition == StartTriggerCondition.CHANNEL_VALUE_CHANGE:
+        return start_trigger_condition, ValueChangeCondition(response.start_trigger_settings)
+    else:
+        utc_start_time = parser.parse(response.start_trigger_settings)
+        utc_start_time = utc_start_time.replace(tzinfo=tz.tzutc())
+        return start_trigger_condition, utc_start_time.astimezone(tz.tzlocal())
+
+
+def _read_stop_trigger_settings(
+    response: LoggingSpecificationDocument_pb2.GetStopTriggerSettingsResponse,
+) -> Tuple[StopTriggerCondition, Any]:
+    stop_trigger_condition = StopTriggerCondition.from_stop_trigger_condition_pb2(
+        response.stop_trigger_condition
+    )
+    if stop_trigger_condition == StopTriggerCondition.TEST_STOP:
+        return stop_trigger_condition, None
+    elif stop_trigger_condition == StopTriggerCondition.CHANNEL_VALUE_CHANGE:
+        return stop_trigger_condition, ValueChangeCondition(response.stop_trigger_settings)
+    else:
+        return stop_trigger_condition, response.stop_trigger_settings
+
+
+# The RPCs of the document, shared with aio.LoggingSpecificationDocument.  Each request is
+# built from the document identifier followed by the arguments of the method.
+_GET_LOG_FILE_BASE_PATH = _Rpc(
+    _STUB,
+    "GetLogFileBasePath",
+    "Failed to get log file base path",
+    lambda identifier: LoggingSpecificationDocument_pb2.GetLogFileBasePathRequest(
+        document_identifier=identifier
+    ),
+    lambda response: response.log_file_base_path,
+)
+_GET_RESOLVED_LOG_FILE_BASE_PATH = _Rpc(
+    _STUB,
+    "GetResolvedLogFileBasePath",
+    "Failed to get resolved log file base path",
+    lambda identifier: LoggingSpecificationDocument_pb2.GetResolvedLogFileBasePathRequest(
+        document_identifier=identifier
+    ),
+    lambda response: response.resolved_log_file_base_path,
+)
+_SET_LOG_FILE_BASE_PATH = _Rpc(
+    _STUB,
+    "SetLogFileBasePath",
+    "Failed to set log file base path",
+    lambda identifier, log_file_base_path: (
+        LoggingSpecificationDocument_pb2.SetLogFileBasePathRequest(
+            document_identifier=identifier, log_file_base_path=log_file_base_path
+        )
+    ),
+)
+_GET_LOG_FILE_NAME = _Rpc(
+    _STUB,
+    "GetLogFileName",
+    "Failed to get log file name",
+    lambda identifier: LoggingSpecificationDocument_pb2.GetLogFileNameRequest(
+        document_identifier=identifier
+    ),
+    lambda response: response.log_file_name,
+)
+_GET_RESOLVED_LOG_FILE_NAME = _Rpc(
+    _STUB,
+    "GetResolvedLogFileName",
+    "Failed to get resolved log file name",
+    lambda identifier: LoggingSpecificationDocument_pb2.GetResolvedLogFileNameRequest(
+        document_identifier=identifier
+    ),
+    lambda response: response.resolved_log_file_name,
+)
+_SET_LOG_FILE_NAME = _Rpc(
+    _STUB,
+    "SetLogFileName",
+    "Failed to set log file name",
+    lambda identifier, log_file_name: LoggingSpecificationDocument_pb2.SetLogFileNameRequest(
+        document_identifier=identifier, log_file_name=log_file_name
+    ),
+)
+_GET_LOG_FILE_DESCRIPTION = _Rpc(
+    _STUB,
+    "GetLogFileDescription",
+    "Failed to get log file description",
+    lambda identifier: LoggingSpecificationDocument_pb2.GetLogFileDescriptionRequest(
+        document_identifier=identifier
+    ),
+    lambda response: response.log_file_description,
+)
+_SET_LOG_FILE_DESCRIPTION = _Rpc(
+    _STUB,
+    "SetLogFileDescription",
+    "Failed to set log file description",
+    lambda identifier, log_file_description: (
+        LoggingSpecificationDocument_pb2.SetLogFileDescriptionRequest(
+            document_identifier=identifier, log_file_description=log_file_description
+        )
+    ),
+)
+_GET_LOG_FILES = _Rpc(
+    _STUB,
+    "GetLogFiles",
+    "Failed to get data files",
+    lambda identifier, log_file_type: LoggingSpecificationDocument_pb2.GetLogFilesRequest(
+        document_identifier=identifier, log_file_type=LOG_FILE_TYPE_MAP[log_file_type]
+    ),
+    lambda response: [log_file for log_file in response.log_files],
+)
+_REMOVE_LOG_FILES = _Rpc(
+    _STUB,
+    "RemoveLogFiles",
+    "Failed to remove log files",
+    lambda identifier, delete_files: LoggingSpecificationDocument_pb2.RemoveLogFilesRequest(
+        document_identifier=identifier, delete_files=delete_files
+    ),
+)
+_GET_TEST_PROPERTIES = _Rpc(
+    _STUB,
+    "GetTestProperties",
+    "Failed to get test properties",
+    lambda identifier: LoggingSpecificationDocument_pb2.GetTestPropertiesRequest(
+        document_identifier=identifier
+    ),
+    lambda response: [_to_test_property(x) for x in response.test_properties],
+)
+_SET_TEST_PROPERTIES = _Rpc(
+    _STUB,
+    "SetTestProperties",
+    "Failed to set test properties",
+    lambda identifier, test_properties: LoggingSpecificationDocument_pb2.SetTestPropertiesRequest(
+        document_identifier=identifier,
+        test_properties=[_from_test_property(x) for x in test_properties],
+    ),
+)
+_GET_TEST_PROPERTY = _Rpc(
+    _STUB,
+    "GetTestProperty",
+    "Failed to get test property",
+    lambda identifier, property_name: LoggingSpecificationDocument_pb2.GetTestPropertyRequest(
+        document_identifier=identifier, property_name=property_name
+    ),
+    lambda response: _to_test_property(response.test_property),
+)
+_SET_TEST_PROPERTY = _Rpc(
+    _STUB,
+    "SetTestProperty",
+    "Failed to set test property",
+    lambda identifier, property_name, property_value, prompt_on_start: (
+        LoggingSpecificationDocument_pb2.SetTestPropertyRequest(
+            document_identifier=identifier,
+            test_property=LoggingSpecificationDocument_pb2.TestProperty(
+                property_name=property_name,
+                property_value=property_value,
+                prompt_on_start=prompt_on_start,
+            ),
+        )
+    ),
+)
+_REMOVE_TEST_PROPERTY = _Rpc(
+    _STUB,
+    "RemoveTestProperty",
+    "Failed to remove test property",
+    lambda identifier, property_name: LoggingSpecificationDocument_pb2.RemoveTestPropertyRequest(
+        document_identifier=identifier, property_name=property_name
+    ),
+)
+_GET_START_TRIGGER_SETTINGS = _Rpc(
+    _STUB,
+    "GetStartTriggerSettings",
+    "Failed to get the start trigger settings",
+    lambda identifier: LoggingSpecificationDocument_pb2.GetStartTriggerSettingsRequest(
+        document_identifier=identifier
+    ),
+    _read_start_trigger_settings,
+)
+_GET_STOP_TRIGGER_SETTINGS = _Rpc(
+    _STUB,
+    "GetStopTriggerSettings",
+    "Failed to get the stop trigger settings",
+    lambda identifier: LoggingSpecificationDocument_pb2.GetStopTriggerSettingsRequest(
+        document_identifier=identifier
+    ),
+    _read_stop_trigger_settings,
+)
+_SET_TEST_START_TRIGGER_SETTINGS = _Rpc(
+    _STUB,
+    "SetTestStartTriggerSettings",
+    "Failed to set the start trigger to Test Start",
+    lambda identifier: LoggingSpecificationDocument_pb2.SetTestStartTriggerSettingsRequest(
+        document_identifier=identifier
+    ),
+)
+_SET_VALUE_CHANGE_START_TRIGGER_SETTINGS = _Rpc(
+    _STUB,
+    "SetValueChangeStartTriggerSettings",
+    "Failed to set the start trigger to Channel Value Change",
+    lambda identifier, value_change_condition: (
+        LoggingSpecificationDocument_pb2.SetValueChangeStartTriggerSettingsRequest(
+            document_identifier=identifier,
+            leading_time=value_change_condition.time,
+            **_value_change_fields(value_change_condition)
+        )
+    ),
+)
+_SET_TIME_START_TRIGGER_SETTINGS = _Rpc(
+    _STUB,
+    "SetTimeStartTriggerSettings",
+    "Failed to set the start trigger to Absolute Time",
+    lambda identifier, time: LoggingSpecificationDocument_pb2.SetTimeStartTriggerSettingsRequest(
+        document_identifier=identifier, time=_to_timestamp(time)
+    ),
+)
+_SET_TEST_STOP_TRIGGER_SETTINGS = _Rpc(
+    _STUB,
+    "SetTestStopTriggerSettings",
+    "Failed to set the stop trigger to Test Stop",
+    lambda identifier: LoggingSpecificationDocument_pb2.SetTestStopTriggerSettingsRequest(
+        document_identifier=identifier
+    ),
+)
+_SET_VALUE_CHANGE_STOP_TRIGGER_SETTINGS = _Rpc(
+    _STUB,
+    "SetValueChangeStopTriggerSettings",
+    "Failed to set the stop trigger to Channel Value Change",
+    lambda identifier, value_change_condition: (
+        LoggingSpecificationDocument_pb2.SetValueChangeStopTriggerSettingsRequest(
+            document_identifier=identifier,
+            trailing_time=value_change_condition.time,
+            **_value_change_fields(value_change_condition)
+        )
+    ),
+)
+_SET_TIME_STOP_TRIGGER_SETTINGS = _Rpc(
+    _STUB,
+    "SetTimeStopTriggerSettings",
+    "Failed to set the stop trigger to Test Time Elapsed",
+    lambda identifier, duration: LoggingSpecificationDocument_pb2.SetTimeStopTriggerSettingsRequest(
+        document_identifier=identifier, duration=_to_duration(duration)
+    ),
+)
+_IS_RETRIGGERING_ENABLED = _Rpc(
+    _STUB,
+    "IsRetriggeringEnabled",
+    "Failed to get the re-triggering configuration",
+    lambda identifier: LoggingSpecificationDocument_pb2.IsRetriggeringEnabledRequest(
+        document_identifier=identifier
+    ),
+    lambda response: response.is_retriggering_enabled,
+)
+_SET_RETRIGGERING = _Rpc(
+    _STUB,
+    "SetRetriggering",
+    "Failed to set the re-triggering configuration",
+    lambda identifier, retriggering: LoggingSpecificationDocument_pb2.SetRetriggeringRequest(
+        document_identifier=identifier, is_retriggering_enabled=retriggering
+    ),
+)
+
+
 class LoggingSpecificationDocument:
     """Represents a document that describes how data is logged.
 
@@ -33,38 +341,41 @@ class LoggingSpecificationDocument:
 
     def __init__(
         self,
-        channel: Channel,
+        stubs: StubRegistry,
         raise_if_application_closed: Callable[[], None],
         identifier: ElementIdentifier,
     ) -> None:
-        self._channel = channel
+        self._stubs = stubs
         self._raise_if_application_closed = raise_if_application_closed
         self._identifier = identifier
 
-    def get_log_file_base_path(self) -> str:
+    def _call(self, rpc: _Rpc, timeout: Optional[float], *args: Any) -> Any:
+        return rpc.call(
+            self._stubs, self._raise_if_application_closed, timeout, self._identifier, *args
+        )
+
+    def get_log_file_base_path(self, timeout: float = None) -> str:
         """Get the log file base path.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             The base path for the log file.
 
         Raises:
             FlexLoggerError: if getting the log file base path fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetLogFileBasePath(
-                LoggingSpecificationDocument_pb2.GetLogFileBasePathRequest(
-                    document_identifier=self._identifier
-                )
-            )
-            return response.log_file_base_path
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get log file base path") from error
-
-    def get_resolved_log_file_base_path(self) -> str:
+        return self._call(_GET_LOG_FILE_BASE_PATH, timeout)
+
+    def get_resolved_log_file_base_path(self, timeout: float = None) -> str:
         """Get the resolved log file base path.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             The resolved base path for the log file.
             The resolved base path will have any placeholders replaced with
@@ -75,62 +386,43 @@ class LoggingSpecificationDocument:
         Raises:
             FlexLoggerError: if getting the resolved log file base path fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetResolvedLogFileBasePath(
-                LoggingSpecificationDocument_pb2.GetResolvedLogFileBasePathRequest(
-                    document_identifier=self._identifier
-                )
-            )
-            return response.resolved_log_file_base_path
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get resolved log file base path") from error
-
-    def set_log_file_base_path(self, log_file_base_path: str) -> None:
+        return self._call(_GET_RESOLVED_LOG_FILE_BASE_PATH, timeout)
+
+    def set_log_file_base_path(self, log_file_base_path: str, timeout: float = None) -> None:
         """Set the log file base path.
 
         Args:
             log_file_base_path: The log file base path.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if setting the log file base path fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            stub.SetLogFileBasePath(
-                LoggingSpecificationDocument_pb2.SetLogFileBasePathRequest(
-                    document_identifier=self._identifier, log_file_base_path=log_file_base_path
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set log file base path") from error
-
-    def get_log_file_name(self) -> str:
+        self._call(_SET_LOG_FILE_BASE_PATH, timeout, log_file_base_path)
+
+    def get_log_file_name(self, timeout: float = None) -> str:
         """Get the log file name.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             The file name that will be logged to.
 
         Raises:
             FlexLoggerError: if getting the log file name fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetLogFileName(
-                LoggingSpecificationDocument_pb2.GetLogFileNameRequest(
-                    document_identifier=self._identifier
-                )
-            )
-            return response.log_file_name
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get log file name") from error
-
-    def get_resolved_log_file_name(self) -> str:
+        return self._call(_GET_LOG_FILE_NAME, timeout)
+
+    def get_resolved_log_file_name(self, timeout: float = None) -> str:
         """Get the resolved log file name.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             The resolved file name that will be logged to.
             The resolved file name will have any placeholders replaced with
@@ -141,84 +433,56 @@ class LoggingSpecificationDocument:
         Raises:
             FlexLoggerError: if getting the resolved log file name fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetResolvedLogFileName(
-                LoggingSpecificationDocument_pb2.GetResolvedLogFileNameRequest(
-                    document_identifier=self._identifier
-                )
-            )
-            return response.resolved_log_file_name
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get resolved log file name") from error
-
-    def set_log_file_name(self, log_file_name: str) -> None:
+        return self._call(_GET_RESOLVED_LOG_FILE_NAME, timeout)
+
+    def set_log_file_name(self, log_file_name: str, timeout: float = None) -> None:
         """Set the log file name.
 
         Args:
             log_file_name: The log file name.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if setting the log file name fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            stub.SetLogFileName(
-                LoggingSpecificationDocument_pb2.SetLogFileNameRequest(
-                    document_identifier=self._identifier, log_file_name=log_file_name
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set log file name") from error
-
-    def get_log_file_description(self) -> str:
+        self._call(_SET_LOG_FILE_NAME, timeout, log_file_name)
+
+    def get_log_file_description(self, timeout: float = None) -> str:
         """Get the log file description.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             The description of the log file.
 
         Raises:
             FlexLoggerError: if getting the log file description fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetLogFileDescription(
-                LoggingSpecificationDocument_pb2.GetLogFileDescriptionRequest(
-                    document_identifier=self._identifier
-                )
-            )
-            return response.log_file_description
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get log file description") from error
-
-    def set_log_file_description(self, log_file_description: str) -> None:
+        return self._call(_GET_LOG_FILE_DESCRIPTION, timeout)
+
+    def set_log_file_description(self, log_file_description: str, timeout: float = None) -> None:
         """Set the log file description.
 
         Args:
             log_file_description: The log file description.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if setting the log file description fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            stub.SetLogFileDescription(
-                LoggingSpecificationDocument_pb2.SetLogFileDescriptionRequest(
-                    document_identifier=self._identifier, log_file_description=log_file_description
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set log file description") from error
-
-    def get_log_files(self, log_file_type: LogFileType) -> List[str]:
+        self._call(_SET_LOG_FILE_DESCRIPTION, timeout, log_file_description)
+
+    def get_log_files(self, log_file_type: LogFileType, timeout: float = None) -> List[str]:
         """Get log files in the data files pane of the project.
 
         Args:
             log_file_type: The type of log files to get.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Returns:
             A list of the log files in the project.
@@ -227,103 +491,54 @@ class LoggingSpecificationDocument:
         Raises:
             FlexLoggerError: if getting the log files fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetLogFiles(
-                LoggingSpecificationDocument_pb2.GetLogFilesRequest(
-                    document_identifier=self._identifier,
-                    log_file_type = LOG_FILE_TYPE_MAP[log_file_type]
-                )
-            )
-            return [log_file for log_file in response.log_files]
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get data files") from error
-
-    def remove_log_files(self, delete_files: bool = False) -> None:
+        return self._call(_GET_LOG_FILES, timeout, log_file_type)
+
+    def remove_log_files(self, delete_files: bool = False, timeout: float = None) -> None:
         """Remove log files from the data files pane of the project.
 
         Args:
             delete_files: True to delete files on disk, False to remove only from project.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if removing the log files fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            stub.RemoveLogFiles(
-                LoggingSpecificationDocument_pb2.RemoveLogFilesRequest(
-                    document_identifier=self._identifier,
-                    delete_files=delete_files
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to remove log files") from error
-
-    def _convert_to_test_property(
-        self, test_property: LoggingSpecificationDocument_pb2.TestProperty
-    ) -> TestProperty:
-        return TestProperty(
-            test_property.property_name,
-            test_property.property_value,
-            test_property.prompt_on_start,
-        )
+        self._call(_REMOVE_LOG_FILES, timeout, delete_files)
 
-    def _convert_from_test_property(
-        self, test_property: TestProperty
-    ) -> LoggingSpecificationDocument_pb2.TestProperty:
-        return LoggingSpecificationDocument_pb2.TestProperty(
-            property_name=test_property.name,
-            property_value=test_property.value,
-            prompt_on_start=test_property.prompt_on_start,
-        )
-
-    def get_test_properties(self) -> List[TestProperty]:
+    def get_test_properties(self, timeout: float = None) -> List[TestProperty]:
         """Get all test properties.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             A list of the test properties on this document.
 
         Raises:
             FlexLoggerError: if getting the test properties fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetTestProperties(
-                LoggingSpecificationDocument_pb2.GetTestPropertiesRequest(
-                    document_identifier=self._identifier
-                )
-            )
-            return [self._convert_to_test_property(x) for x in response.test_properties]
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get test properties") from error
-
-    def set_test_properties(self, test_properties: List[TestProperty]) -> None:
+        return self._call(_GET_TEST_PROPERTIES, timeout)
+
+    def set_test_properties(
+        self, test_properties: List[TestProperty], timeout: float = None
+    ) -> None:
         """Set test properties.
 
         Args:
             test_properties: A list of test properties to add or modify on this document.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if setting the test properties fails.
         """
         if len(test_properties) == 0:
             return
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            stub.SetTestProperties(
-                LoggingSpecificationDocument_pb2.SetTestPropertiesRequest(
-                    document_identifier=self._identifier,
-                    test_properties=[self._convert_from_test_property(x) for x in test_properties]
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set test properties") from error
-        
-    def get_test_property(self, test_property_name: str) -> TestProperty:
+        self._call(_SET_TEST_PROPERTIES, timeout, test_properties)
+
+    def get_test_property(self, test_property_name: str, timeout: float = None) -> TestProperty:
         """Get the test property with the specified name.
 
         Throws a :class:`FlexLoggerError` if a property with the
@@ -331,6 +546,8 @@ class LoggingSpecificationDocument:
 
         Args:
             test_property_name: The name of the test property.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Returns:
             The :class:`TestProperty` with the specified name.
@@ -339,20 +556,14 @@ class LoggingSpecificationDocument:
             FlexLoggerError: if a property with the specified name does
                 not exist, or if getting the property fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetTestProperty(
-                LoggingSpecificationDocument_pb2.GetTestPropertyRequest(
-                    document_identifier=self._identifier, property_name=test_property_name
-                )
-            )
-            return self._convert_to_test_property(response.test_property)
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get test property") from error
+        return self._call(_GET_TEST_PROPERTY, timeout, test_property_name)
 
     def set_test_property(
-        self, property_name: str, property_value: str, prompt_on_start: bool = False
+        self,
+        property_name: str,
+        property_value: str,
+        prompt_on_start: bool = False,
+        timeout: float = None,
     ) -> None:
         """Set the information for a test property.
 
@@ -364,6 +575,8 @@ class LoggingSpecificationDocument:
                 already exists with the same :attr:`~TestProperty.name`, that test property
                 will be updated with the new information passed to this method. Otherwise, a new
                 test property will be created to reflect the specified test information.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
             property_value: The property value to set.
 
@@ -374,46 +587,29 @@ class LoggingSpecificationDocument:
         Raises:
             FlexLoggerError: if setting the property fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            test_property = LoggingSpecificationDocument_pb2.TestProperty(
-                property_name=property_name,
-                property_value=property_value,
-                prompt_on_start=prompt_on_start,
-            )
-            stub.SetTestProperty(
-                LoggingSpecificationDocument_pb2.SetTestPropertyRequest(
-                    document_identifier=self._identifier, test_property=test_property
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set test property") from error
-
-    def remove_test_property(self, test_property_name: str) -> None:
+        self._call(_SET_TEST_PROPERTY, timeout, property_name, property_value, prompt_on_start)
+
+    def remove_test_property(self, test_property_name: str, timeout: float = None) -> None:
         """Removes the test property with the specified name.
 
         Args:
             test_property_name: The name of the test property.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if a property with the specified name does not
                 exist, or if removing the property fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            stub.RemoveTestProperty(
-                LoggingSpecificationDocument_pb2.RemoveTestPropertyRequest(
-                    document_identifier=self._identifier, property_name=test_property_name
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to remove test property") from error
-
-    def get_start_trigger_settings(self):
+        self._call(_REMOVE_TEST_PROPERTY, timeout, test_property_name)
+
+    def get_start_trigger_settings(self, timeout: float = None):
         """Get the start trigger settings.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             A tuple containing 2 strings:
             - The start trigger condition
@@ -426,31 +622,15 @@ class LoggingSpecificationDocument:
         Raises:
             FlexLoggerError: if getting the start trigger settings fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetStartTriggerSettings(
-                LoggingSpecificationDocument_pb2.GetStartTriggerSettingsRequest(
-                    document_identifier=self._identifier
-                )
-            )
-            start_trigger_condition = StartTriggerCondition.from_start_trigger_condition_pb2(response.start_trigger_condition)
-            if start_trigger_condition == StartTriggerCondition.TEST_START:
-                return start_trigger_condition, None
-            elif start_trigger_condition == StartTriggerCondition.CHANNEL_VALUE_CHANGE:
-                value_change_condition = ValueChangeCondition(response.start_trigger_settings)
-                return start_trigger_condition, value_change_condition
-            else:
-                utc_start_time = parser.parse(response.start_trigger_settings)
-                utc_start_time = utc_start_time.replace(tzinfo=tz.tzutc())
-                start_time = utc_start_time.astimezone(tz.tzlocal())
-                return start_trigger_condition, start_time
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get the start trigger settings") from error
-
-    def get_stop_trigger_settings(self) -> tuple[StopTriggerCondition, str]:
+        return self._call(_GET_START_TRIGGER_SETTINGS, timeout)
+
+    def get_stop_trigger_settings(self, timeout: float = None) -> tuple[StopTriggerCondition, str]:
         """Get the stop trigger settings.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             A tuple containing 2 strings:
             - The stop trigger condition
@@ -463,195 +643,116 @@ class LoggingSpecificationDocument:
         Raises:
             FlexLoggerError: if getting the stop trigger settings fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.GetStopTriggerSettings(
-                LoggingSpecificationDocument_pb2.GetStopTriggerSettingsRequest(
-                    document_identifier=self._identifier
-                )
-            )
-            stop_trigger_condition = StopTriggerCondition.from_stop_trigger_condition_pb2(response.stop_trigger_condition)
-            if stop_trigger_condition == StopTriggerCondition.TEST_STOP:
-                return stop_trigger_condition, None
-            elif stop_trigger_condition == StopTriggerCondition.CHANNEL_VALUE_CHANGE:
-                value_change_condition = ValueChangeCondition(response.stop_trigger_settings)
-                return stop_trigger_condition, value_change_condition
-            else:
-                return stop_trigger_condition, response.stop_trigger_settings
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get the stop trigger settings") from error
-
-    def set_start_trigger_settings_to_test_start(self) -> None:
+        return self._call(_GET_STOP_TRIGGER_SETTINGS, timeout)
+
+    def set_start_trigger_settings_to_test_start(self, timeout: float = None) -> None:
         """Set the start trigger to Test Start
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Raises:
             FlexLoggerError: if setting the start trigger fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            stub.SetTestStartTriggerSettings(
-                LoggingSpecificationDocument_pb2.SetTestStartTriggerSettingsRequest(
-                    document_identifier=self._identifier
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set the start trigger to Test Start") from error
-
-    def set_start_trigger_settings_to_value_change(self, value_change_condition: ValueChangeCondition) -> None:
+        self._call(_SET_TEST_START_TRIGGER_SETTINGS, timeout)
+
+    def set_start_trigger_settings_to_value_change(
+        self, value_change_condition: ValueChangeCondition, timeout: float = None
+    ) -> None:
         """Set the start trigger to Channel Value Change
 
         Args:
             value_change_condition: The value change parameters as an object of type ValueChangeCondition
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if setting the start trigger fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            stub.SetValueChangeStartTriggerSettings(
-                LoggingSpecificationDocument_pb2.SetValueChangeStartTriggerSettingsRequest(
-                    document_identifier=self._identifier,
-                    channel_name=value_change_condition.channel_name,
-                    value_change_type=value_change_condition.value_change_type.to_value_change_type_pb2(),
-                    threshold=value_change_condition.threshold,
-                    min_value=value_change_condition.min_value,
-                    max_value=value_change_condition.max_value,
-                    leading_time=value_change_condition.time
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set the start trigger to Channel Value Change") from error
-
-    def set_start_trigger_settings_to_absolute_time(self, time: datetime) -> None:
+        self._call(_SET_VALUE_CHANGE_START_TRIGGER_SETTINGS, timeout, value_change_condition)
+
+    def set_start_trigger_settings_to_absolute_time(
+        self, time: datetime, timeout: float = None
+    ) -> None:
         """Set the start trigger to Absolute Time
 
         Args:
             time: Test start time. If it's timezone-naive, it's assumed to be in UTC.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if setting the start trigger fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            test_start_time = Timestamp()
-            test_start_time.FromDatetime(time)
-            stub.SetTimeStartTriggerSettings(
-                LoggingSpecificationDocument_pb2.SetTimeStartTriggerSettingsRequest(
-                    document_identifier=self._identifier,
-                    time=test_start_time
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set the start trigger to Absolute Time") from error
-
-    def set_stop_trigger_settings_to_test_stop(self) -> None:
+        self._call(_SET_TIME_START_TRIGGER_SETTINGS, timeout, time)
+
+    def set_stop_trigger_settings_to_test_stop(self, timeout: float = None) -> None:
         """Set the stop trigger to Test Stop
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Raises:
             FlexLoggerError: if setting the stop trigger fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            stub.SetTestStopTriggerSettings(
-                LoggingSpecificationDocument_pb2.SetTestStopTriggerSettingsRequest(
-                    document_identifier=self._identifier
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set the stop trigger to Test Stop") from error
-
-    def set_stop_trigger_settings_to_value_change(self, value_change_condition: ValueChangeCondition) -> None:
+        self._call(_SET_TEST_STOP_TRIGGER_SETTINGS, timeout)
+
+    def set_stop_trigger_settings_to_value_change(
+        self, value_change_condition: ValueChangeCondition, timeout: float = None
+    ) -> None:
         """Set the stop trigger to Channel Value Change
 
         Args:
             value_change_condition: The value change parameters as an object of type ValueChangeCondition
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if setting the stop trigger fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            stub.SetValueChangeStopTriggerSettings(
-                LoggingSpecificationDocument_pb2.SetValueChangeStopTriggerSettingsRequest(
-                    document_identifier=self._identifier,
-                    channel_name=value_change_condition.channel_name,
-                    value_change_type=value_change_condition.value_change_type.to_value_change_type_pb2(),
-                    threshold=value_change_condition.threshold,
-                    min_value=value_change_condition.min_value,
-                    max_value=value_change_condition.max_value,
-                    trailing_time=value_change_condition.time
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set the stop trigger to Channel Value Change") from error
-
-    def set_stop_trigger_settings_to_duration(self, duration: datetime.timedelta) -> None:
+        self._call(_SET_VALUE_CHANGE_STOP_TRIGGER_SETTINGS, timeout, value_change_condition)
+
+    def set_stop_trigger_settings_to_duration(
+        self, duration: datetime.timedelta, timeout: float = None
+    ) -> None:
         """Set the stop trigger to Test Time Elapsed
 
         Args:
             duration: The length of time after which to stop the test.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if setting the stop trigger fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            test_duration = Duration()
-            test_duration.FromTimedelta(duration)
-            stub.SetTimeStopTriggerSettings(
-                LoggingSpecificationDocument_pb2.SetTimeStopTriggerSettingsRequest(
-                    document_identifier=self._identifier,
-                    duration=test_duration
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set the stop trigger to Test Time Elapsed") from error
-
-    def is_retriggering_enabled(self) -> bool:
+        self._call(_SET_TIME_STOP_TRIGGER_SETTINGS, timeout, duration)
+
+    def is_retriggering_enabled(self, timeout: float = None) -> bool:
         """Get the re-triggering configuration.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             True if re-triggering is enabled, False otherwise
 
         Raises:
             FlexLoggerError: if getting the re-triggering configuration fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            response = stub.IsRetriggeringEnabled(
-                LoggingSpecificationDocument_pb2.IsRetriggeringEnabledRequest(
-                    document_identifier=self._identifier
-                )
-            )
-            return response.is_retriggering_enabled
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get the re-triggering configuration") from error
-
-    def set_retriggering(self, retriggering: bool) -> None:
+        return self._call(_IS_RETRIGGERING_ENABLED, timeout)
+
+    def set_retriggering(self, retriggering: bool, timeout: float = None) -> None:
         """Set the re-triggering configuration.
 
         Args:
             retriggering: True to enable re-triggering, False to disable it.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if setting the re-triggering configuration fails.
         """
-        stub = LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentStub(self._channel)
-        try:
-            stub.SetRetriggering(
-                LoggingSpecificationDocument_pb2.SetRetriggeringRequest(
-                    document_identifier=self._identifier,
-                    is_retriggering_enabled=retriggering
-                )
-            )
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to set the re-triggering configuration") from error
+        self._call(_SET_RETRIGGERING, timeout, retriggering)
@@ -0,0 +1,40 @@
+import time
+from typing import Any, Callable
+
+from grpc import FutureCancelledError, UnaryUnaryClientInterceptor
+
+from ._rpc_metrics import _RpcMetricsCollector
+
+
+class _MetricsInterceptor(UnaryUnaryClientInterceptor):
+    """Records the latency and outcome of every unary call made on a channel.
+
+    Streaming calls, such as the event stream, stay open for as long as the client is
+    subscribed, so their duration is not a useful latency and they are not recorded.
+    """
+
+    def __init__(self, collector: _RpcMetricsCollector) -> None:
+        self._collector = collector
+
+    def intercept_unary_unary(
+        self, continuation: Callable, client_call_details: Any, request: Any
+    ) -> Any:
+        method = client_call_details.method
+        if isinstance(method, bytes):
+            method = method.decode("utf-8")
+        start_time = time.perf_counter()
+        outcome = continuation(client_call_details, request)
+
+        def on_done(call: Any) -> None:
+            self._collector.record(method, time.perf_counter() - start_time, _failed(call))
+
+        # For blocking calls the outcome is already complete, so this runs immediately.
+        outcome.add_done_callback(on_done)
+        return outcome
+
+
+def _failed(call: Any) -> bool:
+    try:
+        return call.exception() is not None
+    except FutureCancelledError:
+        return True
@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class OverflowPolicy(Enum):
+    """An enumeration describing what to do when a bounded queue is full."""
+
+    BLOCK = 1
+    """Wait until the consumer makes room in the queue.
+
+    Nothing is lost, but while the queue is full no further items are received, so a
+    slow consumer slows down the producer.
+    """
+
+    DROP_OLDEST = 2
+    """Discard the oldest item in the queue to make room for the new one."""
+
+    DROP_NEWEST = 3
+    """Discard the new item and keep the items already in the queue."""
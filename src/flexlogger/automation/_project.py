@@ -1,15 +1,17 @@
 import os.path
 import pathlib
-from typing import Callable
+from typing import Any, Callable, Dict, Tuple
 from typing import Optional
 
 from google.protobuf import empty_pb2
-from grpc import Channel, RpcError
+from grpc import RpcError
 
 from ._channel_specification_document import ChannelSpecificationDocument
-from ._flexlogger_error import FlexLoggerError
+from ._flexlogger_error import _to_flexlogger_error
 from ._logging_specification_document import LoggingSpecificationDocument
 from ._screen_document import ScreenDocument
+from ._session_tracker import _SessionTracker
+from ._stub_registry import StubRegistry
 from ._test_session import TestSession
 from ._test_specification_document import TestSpecificationDocument
 from .proto import (
@@ -24,67 +26,114 @@ class Project:
 
     Do not create this class directly; instead, use the return value of
     :meth:`.Application.open_project`.
+
+    The documents opened from a project are cached, so opening a document again returns
+    the same object without asking FlexLogger for it, until the project is closed.
     """
 
     def __init__(
         self,
-        channel: Channel,
+        stubs: StubRegistry,
         raise_if_application_closed: Callable[[], None],
         identifier: ProjectIdentifier,
+        session_tracker: Optional[_SessionTracker] = None,
     ) -> None:
-        self._channel = channel
+        self._stubs = stubs
         self._raise_if_application_closed = raise_if_application_closed
         self._identifier = identifier
-        self._test_session = TestSession(self._channel, raise_if_application_closed)
+        self._session_tracker = session_tracker
+        # The documents opened from this project, keyed by the name of the method that
+        # opened them and the screen name, if any
+        self._documents = {}  # type: Dict[Tuple[str, str], Any]
+        self._test_session = TestSession(self._stubs, raise_if_application_closed)
 
-    def open_channel_specification_document(self) -> ChannelSpecificationDocument:
+    def open_channel_specification_document(
+        self, timeout: float = None, use_cache: bool = True
+    ) -> ChannelSpecificationDocument:
         """Open the channel specification document in the project.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+            use_cache: Whether to return the document opened by an earlier call, if any,
+                instead of asking FlexLogger for it again.  Defaults to True.  If False,
+                the document is opened again and replaces the cached one.
+
         Returns:
             The opened document.
 
         Raises:
             FlexLoggerError: if opening the document fails.
         """
-        stub = Project_pb2_grpc.ProjectStub(self._channel)
+        if use_cache:
+            cached_document = self._documents.get(("OpenChannelSpecificationDocument", ""))
+            if cached_document is not None:
+                return cached_document
+        stub = self._stubs.get(Project_pb2_grpc.ProjectStub)
+        request = Project_pb2.OpenChannelSpecificationDocumentRequest(project=self._identifier)
         try:
-            response = stub.OpenChannelSpecificationDocument(
-                Project_pb2.OpenChannelSpecificationDocumentRequest(project=self._identifier)
-            )
-            return ChannelSpecificationDocument(
-                self._channel, self._raise_if_application_closed, response.document_identifier
+            response = stub.OpenChannelSpecificationDocument(request, timeout=timeout)
+            document = ChannelSpecificationDocument(
+                self._stubs, self._raise_if_application_closed, response.document_identifier
             )
+            self._add_document(document, "OpenChannelSpecificationDocument", request)
+            return document
         except (RpcError, ValueError) as error:
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to open channel specification document") from error
+            raise _to_flexlogger_error(
+                "Failed to open channel specification document", error
+            ) from error
 
-    def open_logging_specification_document(self) -> LoggingSpecificationDocument:
+    def open_logging_specification_document(
+        self, timeout: float = None, use_cache: bool = True
+    ) -> LoggingSpecificationDocument:
         """Open the logging specification document in the project.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+            use_cache: Whether to return the document opened by an earlier call, if any,
+                instead of asking FlexLogger for it again.  Defaults to True.  If False,
+                the document is opened again and replaces the cached one.
+
         Returns:
             The opened document.
 
         Raises:
             FlexLoggerError: if opening the document fails.
         """
-        stub = Project_pb2_grpc.ProjectStub(self._channel)
+        if use_cache:
+            cached_document = self._documents.get(("OpenLoggingSpecificationDocument", ""))
+            if cached_document is not None:
+                return cached_document
+        stub = self._stubs.get(Project_pb2_grpc.ProjectStub)
+        request = Project_pb2.OpenLoggingSpecificationDocumentRequest(project=self._identifier)
         try:
-            response = stub.OpenLoggingSpecificationDocument(
-                Project_pb2.OpenLoggingSpecificationDocumentRequest(project=self._identifier)
-            )
-            return LoggingSpecificationDocument(
-                self._channel, self._raise_if_application_closed, response.document_identifier
+            response = stub.OpenLoggingSpecificationDocument(request, timeout=timeout)
+            document = LoggingSpecificationDocument(
+                self._stubs, self._raise_if_application_closed, response.document_identifier
             )
+            self._add_document(document, "OpenLoggingSpecificationDocument", request)
+            return document
         except (RpcError, ValueError) as error:
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to open logging specification document") from error
+            raise _to_flexlogger_error(
+                "Failed to open logging specification document", error
+            ) from error
 
-    def open_screen_document(self, filename: str) -> ScreenDocument:
+    def open_screen_document(
+        self, filename: str, timeout: float = None, use_cache: bool = True
+    ) -> ScreenDocument:
         """Open the specified screen document in the project.
 
         Args:
             filename: The name of the screen document to open.  Including
                 the .flxscr extension in this argument is optional.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+            use_cache: Whether to return the document opened by an earlier call, if any,
+                instead of asking FlexLogger for it again.  Defaults to True.  If False,
+                the document is opened again and replaces the cached one.
 
         Returns:
             The opened document.
@@ -93,68 +142,103 @@ class Project:
             FlexLoggerError: if a screen document of the specified name does
                 not exist, or if opening the document fails.
         """
-        stub = Project_pb2_grpc.ProjectStub(self._channel)
+        if use_cache:
+            cached_document = self._documents.get(("OpenScreenDocument", _screen_name(filename)))
+            if cached_document is not None:
+                return cached_document
+        stub = self._stubs.get(Project_pb2_grpc.ProjectStub)
+        request = Project_pb2.OpenScreenDocumentRequest(
+            project=self._identifier, screen_name=filename
+        )
         try:
-            response = stub.OpenScreenDocument(
-                Project_pb2.OpenScreenDocumentRequest(
-                    project=self._identifier, screen_name=filename
-                )
-            )
-            return ScreenDocument(
-                self._channel, self._raise_if_application_closed, response.document_identifier
+            response = stub.OpenScreenDocument(request, timeout=timeout)
+            document = ScreenDocument(
+                self._stubs, self._raise_if_application_closed, response.document_identifier
             )
+            self._add_document(document, "OpenScreenDocument", request, _screen_name(filename))
+            return document
         except (RpcError, ValueError) as error:
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to open screen document") from error
+            raise _to_flexlogger_error("Failed to open screen document", error) from error
 
-    def open_test_specification_document(self) -> TestSpecificationDocument:
+    def open_test_specification_document(
+        self, timeout: float = None, use_cache: bool = True
+    ) -> TestSpecificationDocument:
         """Open the test specification document in the project.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+            use_cache: Whether to return the document opened by an earlier call, if any,
+                instead of asking FlexLogger for it again.  Defaults to True.  If False,
+                the document is opened again and replaces the cached one.
+
         Returns:
             The opened document.
 
         Raises:
             FlexLoggerError: if opening the document fails.
         """
-        stub = Project_pb2_grpc.ProjectStub(self._channel)
+        if use_cache:
+            cached_document = self._documents.get(("OpenTestSpecificationDocument", ""))
+            if cached_document is not None:
+                return cached_document
+        stub = self._stubs.get(Project_pb2_grpc.ProjectStub)
+        request = Project_pb2.OpenTestSpecificationDocumentRequest(project=self._identifier)
         try:
-            response = stub.OpenTestSpecificationDocument(
-                Project_pb2.OpenTestSpecificationDocumentRequest(project=self._identifier)
-            )
-            return TestSpecificationDocument(
-                self._channel, self._raise_if_application_closed, response.document_identifier
+            response = stub.OpenTestSpecificationDocument(request, timeout=timeout)
+            document = TestSpecificationDocument(
+                self._stubs, self._raise_if_application_closed, response.document_identifier
             )
+            self._add_document(document, "OpenTestSpecificationDocument", request)
+            return document
         except (RpcError, ValueError) as error:
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to open test specification document") from error
+            raise _to_flexlogger_error(
+                "Failed to open test specification document", error
+            ) from error
 
-    def close(self) -> None:
+    def close(self, timeout: float = None) -> None:
         """Close the project.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Raises:
             FlexLoggerError: if closing the project fails.
         """
-        stub = Project_pb2_grpc.ProjectStub(self._channel)
+        stub = self._stubs.get(Project_pb2_grpc.ProjectStub)
         try:
-            stub.Close(Project_pb2.CloseProjectRequest(allow_prompts=False, project=self._identifier))
+            stub.Close(
+                Project_pb2.CloseProjectRequest(allow_prompts=False, project=self._identifier),
+                timeout=timeout,
+            )
+            self._documents.clear()
+            if self._session_tracker is not None:
+                self._session_tracker.remove_project(self)
         except (RpcError, ValueError) as error:
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to close project") from error
+            raise _to_flexlogger_error("Failed to close project", error) from error
 
-    def save(self) -> None:
+    def save(self, timeout: float = None) -> None:
         """Save the project.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Raises:
             FlexLoggerError: if saving the project fails due to a communication error.
             If there is no communication error with the FlexLogger application, this function will not raise an
             exception, but instead return a boolean indicating if the project was properly saved.
         """
-        stub = Project_pb2_grpc.ProjectStub(self._channel)
+        stub = self._stubs.get(Project_pb2_grpc.ProjectStub)
         try:
-            stub.Save(empty_pb2.Empty())
+            stub.Save(empty_pb2.Empty(), timeout=timeout)
         except (RpcError, ValueError) as error:
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to save project") from error
+            raise _to_flexlogger_error("Failed to save project", error) from error
 
     @property
     def test_session(self) -> TestSession:
@@ -167,7 +251,7 @@ class Project:
 
         Returns: The saved project file path if it exists, None otherwise
         """
-        stub = Project_pb2_grpc.ProjectStub(self._channel)
+        stub = self._stubs.get(Project_pb2_grpc.ProjectStub)
         try:
             response = stub.GetProjectFilePath(
                 Project_pb2.GetProjectFilePathRequest(project=self._identifier)
@@ -177,7 +261,7 @@ class Project:
             return pathlib.Path(response.project_file_path) if response.project_file_path else None
         except (RpcError, ValueError) as error:
             self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get project file path") from error
+            raise _to_flexlogger_error("Failed to get project file path", error) from error
 
     @property
     def project_name(self) -> Optional[str]:
@@ -188,3 +272,20 @@ class Project:
         project_path = self.project_file_path
 
         return os.path.basename(os.path.splitext(project_path)[0])
+
+    def _add_document(
+        self, document: Any, open_method: str, request: Any, screen_name: str = ""
+    ) -> None:
+        """Cache a document, and remember how it was opened so it can be reopened after a
+        reconnect.
+        """
+        self._documents[(open_method, screen_name)] = document
+        if self._session_tracker is not None:
+            self._session_tracker.add_document(document, self, open_method, request)
+
+
+def _screen_name(filename: str) -> str:
+    """Get the name of a screen, which can be given with or without its extension."""
+    if filename.lower().endswith(".flxscr"):
+        return filename[: -len(".flxscr")]
+    return filename
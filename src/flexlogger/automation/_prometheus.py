@@ -0,0 +1,84 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Union
+
+from ._rpc_metrics import RpcMethodMetrics
+
+
+def export_prometheus_metrics(
+    metrics: Dict[str, RpcMethodMetrics], path: Union[str, Path] = None
+) -> str:
+    """Format RPC metrics in the Prometheus text exposition format.
+
+    The output has ``flexlogger_rpc_calls_total``, ``flexlogger_rpc_errors_total`` and
+    ``flexlogger_rpc_retries_total`` counters and a ``flexlogger_rpc_latency_seconds``
+    histogram, each labeled with the gRPC method name.
+
+    Args:
+        metrics: The metrics to export, as returned by :meth:`.Application.metrics`.
+        path: A file to write the metrics to, such as a file in the directory read by the
+            node exporter's textfile collector.  The file is replaced atomically, so a
+            collector never reads a partly written file.
+            Defaults to None, meaning the metrics are only returned.
+
+    Returns:
+        The metrics in the Prometheus text format.
+    """
+    method_metrics = sorted(metrics.values(), key=lambda m: m.method)
+    lines = [
+        "# HELP flexlogger_rpc_calls_total The number of FlexLogger automation calls made.",
+        "# TYPE flexlogger_rpc_calls_total counter",
+    ]  # type: List[str]
+    for m in method_metrics:
+        lines.append("flexlogger_rpc_calls_total{%s} %d" % (_method_label(m), m.count))
+    lines.append(
+        "# HELP flexlogger_rpc_errors_total The number of FlexLogger automation calls that failed."
+    )
+    lines.append("# TYPE flexlogger_rpc_errors_total counter")
+    for m in method_metrics:
+        lines.append("flexlogger_rpc_errors_total{%s} %d" % (_method_label(m), m.error_count))
+    lines.append(
+        "# HELP flexlogger_rpc_retries_total The number of FlexLogger automation calls retried."
+    )
+    lines.append("# TYPE flexlogger_rpc_retries_total counter")
+    for m in method_metrics:
+        lines.append("flexlogger_rpc_retries_total{%s} %d" % (_method_label(m), m.retry_count))
+    lines.append(
+        "# HELP flexlogger_rpc_latency_seconds The latency of FlexLogger automation calls."
+    )
+    lines.append("# TYPE flexlogger_rpc_latency_seconds histogram")
+    for m in method_metrics:
+        label = _method_label(m)
+        cumulative_count = 0
+        for bound, bucket_count in zip(m.bucket_bounds, m.bucket_counts):
+            cumulative_count += bucket_count
+            lines.append(
+                'flexlogger_rpc_latency_seconds_bucket{%s,le="%r"} %d'
+                % (label, bound, cumulative_count)
+            )
+        lines.append('flexlogger_rpc_latency_seconds_bucket{%s,le="+Inf"} %d' % (label, m.count))
+        lines.append("flexlogger_rpc_latency_seconds_sum{%s} %r" % (label, m.total_latency))
+        lines.append("flexlogger_rpc_latency_seconds_count{%s} %d" % (label, m.count))
+    text = "\n".join(lines) + "\n"
+    if path is not None:
+        _write_atomically(Path(path), text)
+    return text
+
+
+def _method_label(metrics: RpcMethodMetrics) -> str:
+    escaped = metrics.method.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return 'method="%s"' % escaped
+
+
+def _write_atomically(path: Path, text: str) -> None:
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=str(path.parent), prefix=path.name, suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as temporary_file:
+            temporary_file.write(text)
+        os.replace(temporary_path, str(path))
+    except BaseException:
+        os.remove(temporary_path)
+        raise
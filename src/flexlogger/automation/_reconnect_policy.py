@@ -0,0 +1,52 @@
+class ReconnectPolicy:
+    """Settings for reconnecting to FlexLogger after it restarts.
+
+    Without a reconnect policy, an :class:`.Application` and every object created from it
+    stop working when FlexLogger closes.  With one, when a call fails because FlexLogger is
+    unavailable, or the event stream ends, the application connects to FlexLogger again,
+    reopens the projects and documents that were open, and subscribes to events again, so
+    the existing objects keep working::
+
+        app = Application(reconnect_policy=ReconnectPolicy(max_recovery_time=120))
+
+    While reconnecting, calls wait for up to ``max_recovery_time``.  Calls that only read
+    from FlexLogger are then sent again and return normally.  Calls that change state, such
+    as :meth:`.TestSession.start`, raise a :class:`.FlexLoggerError`, because they may have
+    taken effect before FlexLogger closed, but later calls work.
+    """
+
+    def __init__(self, *, max_recovery_time: float = 60.0, retry_interval: float = 1.0) -> None:
+        """Create a reconnect policy.
+
+        Args:
+            max_recovery_time: The longest time, in seconds, to spend trying to reconnect
+                before giving up and raising the error that started the recovery.
+                Defaults to 60.
+            retry_interval: The time, in seconds, to wait between attempts to reconnect.
+                Defaults to 1.
+
+        Raises:
+            ValueError: if a setting is not positive.
+        """
+        if max_recovery_time <= 0:
+            raise ValueError("max_recovery_time must be positive")
+        if retry_interval <= 0:
+            raise ValueError("retry_interval must be positive")
+        self._max_recovery_time = max_recovery_time
+        self._retry_interval = retry_interval
+
+    def __repr__(self) -> str:
+        return "flexlogger.automation.ReconnectPolicy(max_recovery_time=%r, retry_interval=%r)" % (
+            self._max_recovery_time,
+            self._retry_interval,
+        )
+
+    @property
+    def max_recovery_time(self) -> float:
+        """The longest time, in seconds, to spend trying to reconnect."""
+        return self._max_recovery_time
+
+    @property
+    def retry_interval(self) -> float:
+        """The time, in seconds, to wait between attempts to reconnect."""
+        return self._retry_interval
@@ -0,0 +1,229 @@
+from typing import Any, Callable, Dict, Tuple
+
+import grpc
+
+from ._retry_policy import _is_idempotent
+
+
+class _ReconnectingChannel(grpc.Channel):
+    """A channel that can be switched to a new connection when FlexLogger restarts.
+
+    Stubs keep a reference to the channel they were created with, so the objects created
+    from an Application keep working after the connection is replaced.  The application is
+    asked to recover in two cases:
+
+    * The connection was lost since the last call, for instance because FlexLogger closed
+      and gRPC reconnected to a new instance on the same port.  The application recovers
+      before the next call is sent, and the call's project and document identifiers are
+      updated, so the call works.
+    * A unary call fails because FlexLogger is unavailable.  If the call only reads from
+      FlexLogger, it is sent again on the new connection with its identifiers updated.
+    """
+
+    def __init__(
+        self,
+        channel: grpc.Channel,
+        recover: Callable[[int], bool],
+        update_request: Callable[[Any], Any],
+    ) -> None:
+        """Create a reconnecting channel.
+
+        Args:
+            channel: The channel to use until it is replaced.
+            recover: Called with the channel's generation when its connection was lost or
+                a call fails because FlexLogger is unavailable.  It returns whether the
+                application is connected again, which it may be because another call already
+                recovered.
+            update_request: Called with a request to get a copy of it with the identifiers
+                from before the recovery replaced.
+        """
+        self._channel = channel
+        self._generation = 0
+        self._recover = recover
+        self._update_request = update_request
+        self._unary_unary_callables = {}  # type: Dict[str, _ReconnectingUnaryUnaryMultiCallable]
+        # The generation whose connection was lost, or -1
+        self._lost_generation = -1
+        self._watch_connectivity = self._connectivity_watcher()
+        channel.subscribe(self._watch_connectivity)
+
+    @property
+    def generation(self) -> int:
+        """The number of times the connection has been replaced."""
+        return self._generation
+
+    def _replace_channel(self, channel: grpc.Channel) -> grpc.Channel:
+        """Send calls to a new channel, and return the channel that was replaced."""
+        previous_channel = self._channel
+        previous_channel.unsubscribe(self._watch_connectivity)
+        self._channel = channel
+        self._generation += 1
+        self._watch_connectivity = self._connectivity_watcher()
+        channel.subscribe(self._watch_connectivity)
+        return previous_channel
+
+    def _connectivity_watcher(self) -> Callable[[grpc.ChannelConnectivity], None]:
+        """Create a callback that records when the current channel's connection is lost."""
+        generation = self._generation
+        was_ready = [False]
+
+        def on_connectivity_change(connectivity: grpc.ChannelConnectivity) -> None:
+            if connectivity == grpc.ChannelConnectivity.READY:
+                was_ready[0] = True
+            elif was_ready[0]:
+                self._lost_generation = generation
+
+        return on_connectivity_change
+
+    def subscribe(self, callback: Callable, try_to_connect: bool = False) -> None:
+        self._channel.subscribe(callback, try_to_connect)
+
+    def unsubscribe(self, callback: Callable) -> None:
+        self._channel.unsubscribe(callback)
+
+    def unary_unary(  # type: ignore
+        self,
+        method: str,
+        request_serializer: Callable = None,
+        response_deserializer: Callable = None,
+        _registered_method: bool = False,
+    ) -> grpc.UnaryUnaryMultiCallable:
+        # Interceptors ask for the multi-callable on every call, so reuse one per method.
+        multi_callable = self._unary_unary_callables.get(method)
+        if multi_callable is None:
+            multi_callable = _ReconnectingUnaryUnaryMultiCallable(
+                self, method, request_serializer, response_deserializer, _registered_method
+            )
+            self._unary_unary_callables[method] = multi_callable
+        return multi_callable
+
+    def unary_stream(  # type: ignore
+        self,
+        method: str,
+        request_serializer: Callable = None,
+        response_deserializer: Callable = None,
+        _registered_method: bool = False,
+    ) -> grpc.UnaryStreamMultiCallable:
+        return _CurrentChannelMultiCallable(  # type: ignore
+            self, "unary_stream", method, request_serializer, response_deserializer
+        )
+
+    def stream_unary(  # type: ignore
+        self,
+        method: str,
+        request_serializer: Callable = None,
+        response_deserializer: Callable = None,
+        _registered_method: bool = False,
+    ) -> grpc.StreamUnaryMultiCallable:
+        return _CurrentChannelMultiCallable(  # type: ignore
+            self, "stream_unary", method, request_serializer, response_deserializer
+        )
+
+    def stream_stream(  # type: ignore
+        self,
+        method: str,
+        request_serializer: Callable = None,
+        response_deserializer: Callable = None,
+        _registered_method: bool = False,
+    ) -> grpc.StreamStreamMultiCallable:
+        return _CurrentChannelMultiCallable(  # type: ignore
+            self, "stream_stream", method, request_serializer, response_deserializer
+        )
+
+    def close(self) -> None:
+        self._channel.unsubscribe(self._watch_connectivity)
+        self._channel.close()
+
+    def __enter__(self) -> "_ReconnectingChannel":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class _ReconnectingUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(
+        self,
+        owner: _ReconnectingChannel,
+        method: str,
+        request_serializer: Callable,
+        response_deserializer: Callable,
+        registered_method: bool,
+    ) -> None:
+        self._owner = owner
+        self._method = method
+        self._request_serializer = request_serializer
+        self._response_deserializer = response_deserializer
+        self._registered_method = registered_method
+        self._idempotent = _is_idempotent(method)
+        self._current = (-1, None)  # type: Tuple[int, Any]
+
+    def __call__(self, request: Any, **kwargs: Any) -> Any:  # type: ignore
+        return self._invoke("__call__", request, kwargs)
+
+    def with_call(self, request: Any, **kwargs: Any) -> Any:  # type: ignore
+        return self._invoke("with_call", request, kwargs)
+
+    def future(self, request: Any, **kwargs: Any) -> Any:  # type: ignore
+        # Futures complete in the background, so they are not recovered.
+        return self._current_callable()[1].future(request, **kwargs)
+
+    def _current_callable(self) -> Tuple[int, Any]:
+        generation, multi_callable = self._current
+        if generation != self._owner.generation:
+            generation = self._owner.generation
+            multi_callable = self._owner._channel.unary_unary(
+                self._method,
+                self._request_serializer,
+                self._response_deserializer,
+                self._registered_method,
+            )
+            self._current = (generation, multi_callable)
+        return generation, multi_callable
+
+    def _invoke(self, name: str, request: Any, kwargs: Dict[str, Any]) -> Any:
+        generation, multi_callable = self._current_callable()
+        if self._owner._lost_generation == generation and self._owner._recover(generation):
+            generation, multi_callable = self._current_callable()
+            request = self._owner._update_request(request)
+        try:
+            return getattr(multi_callable, name)(request, **kwargs)
+        except grpc.RpcError as error:
+            if error.code() != grpc.StatusCode.UNAVAILABLE:
+                raise
+            if not self._owner._recover(generation) or not self._idempotent:
+                raise
+        _, multi_callable = self._current_callable()
+        return getattr(multi_callable, name)(self._owner._update_request(request), **kwargs)
+
+
+class _CurrentChannelMultiCallable:
+    """Makes streaming calls on whichever channel is current when the call is made."""
+
+    def __init__(
+        self,
+        owner: _ReconnectingChannel,
+        kind: str,
+        method: str,
+        request_serializer: Callable,
+        response_deserializer: Callable,
+    ) -> None:
+        self._owner = owner
+        self._kind = kind
+        self._method = method
+        self._request_serializer = request_serializer
+        self._response_deserializer = response_deserializer
+
+    def _multi_callable(self) -> Any:
+        return getattr(self._owner._channel, self._kind)(
+            self._method, self._request_serializer, self._response_deserializer
+        )
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._multi_callable()(*args, **kwargs)
+
+    def with_call(self, *args: Any, **kwargs: Any) -> Any:
+        return self._multi_callable().with_call(*args, **kwargs)
+
+    def future(self, *args: Any, **kwargs: Any) -> Any:
+        return self._multi_callable().future(*args, **kwargs)
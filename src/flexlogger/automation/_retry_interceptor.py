@@ -0,0 +1,94 @@
+import random
+import time
+from typing import Any, Callable, Optional
+
+from grpc import StatusCode, UnaryUnaryClientInterceptor
+
+from ._retry_policy import _MethodIdempotency, _RetryBudget, RetryPolicy
+from ._rpc_metrics import _RpcMetricsCollector
+
+
+class _RetryAttempts:
+    """Decides whether, and after how long, one call is retried."""
+
+    def __init__(
+        self, interceptor: "_RetryInterceptorBase", method: str, client_call_details: Any
+    ) -> None:
+        self._interceptor = interceptor
+        self._method = method
+        self._deadline = (
+            time.monotonic() + client_call_details.timeout
+            if client_call_details.timeout is not None
+            else None
+        )
+        self._attempt = 1
+        self.client_call_details = client_call_details
+
+    def backoff_after(self, code: StatusCode) -> Optional[float]:
+        """Record the status code of an attempt.
+
+        Returns:
+            The time, in seconds, to wait before the next attempt, or None if the outcome of
+            this attempt should be returned.  Before the next attempt, its timeout is
+            updated in :attr:`client_call_details`.
+        """
+        policy = self._interceptor._policy
+        budget = self._interceptor._budget
+        if code not in policy.retryable_status_codes:
+            if code == StatusCode.OK:
+                budget.record_success()
+            return None
+        budget.record_failure()
+        if self._attempt >= policy.max_attempts or not budget.can_retry():
+            return None
+        backoff = policy._backoff(self._attempt, self._interceptor._random)
+        if self._deadline is not None:
+            remaining = self._deadline - time.monotonic() - backoff
+            if remaining <= 0:
+                return None
+            self.client_call_details = self.client_call_details._replace(timeout=remaining)
+        if self._interceptor._metrics is not None:
+            self._interceptor._metrics.record_retry(self._method)
+        self._attempt += 1
+        return backoff
+
+
+class _RetryInterceptorBase:
+    """The retry decisions shared by the synchronous and asyncio retry interceptors."""
+
+    def __init__(self, policy: RetryPolicy, metrics: Optional[_RpcMetricsCollector] = None) -> None:
+        self._policy = policy
+        self._metrics = metrics
+        self._idempotency = _MethodIdempotency()
+        self._budget = _RetryBudget(policy)
+        self._random = random.Random()
+
+    def _start_attempts(self, client_call_details: Any) -> Optional[_RetryAttempts]:
+        """Get the retry state for a call, or None if the call is never retried."""
+        method = client_call_details.method
+        if isinstance(method, bytes):
+            method = method.decode("utf-8")
+        if not self._idempotency.get(method):
+            return None
+        return _RetryAttempts(self, method, client_call_details)
+
+
+class _RetryInterceptor(_RetryInterceptorBase, UnaryUnaryClientInterceptor):
+    """Retries unary calls that only read from FlexLogger when they fail with a transient error.
+
+    If a call has a timeout, it is the time allowed for every attempt and backoff together,
+    and the call is not retried once that time has run out.
+    """
+
+    def intercept_unary_unary(
+        self, continuation: Callable, client_call_details: Any, request: Any
+    ) -> Any:
+        attempts = self._start_attempts(client_call_details)
+        if attempts is None:
+            return continuation(client_call_details, request)
+        while True:
+            outcome = continuation(attempts.client_call_details, request)
+            backoff = attempts.backoff_after(outcome.code())
+            if backoff is None:
+                return outcome
+            time.sleep(backoff)
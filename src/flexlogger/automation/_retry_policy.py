@@ -0,0 +1,213 @@
+import random
+from threading import Lock
+from typing import Dict, FrozenSet, Iterable
+
+from grpc import StatusCode
+
+# Calls that only read state from FlexLogger, so sending one again cannot change what
+# FlexLogger does.  Calls that open documents or change state, such as starting the test
+# session or adding a note, could take effect twice if the first attempt reached FlexLogger.
+_IDEMPOTENT_METHOD_PREFIXES = ("Get", "Is")
+
+
+class RetryPolicy:
+    """Settings for retrying calls to FlexLogger that fail with a transient error.
+
+    Only calls that read from FlexLogger, such as
+    :meth:`.ChannelSpecificationDocument.get_channel_value` and
+    :attr:`.TestSession.state`, are retried.  Calls that change state, such as
+    :meth:`.TestSession.start`, :meth:`.TestSession.stop` and :meth:`.TestSession.add_note`,
+    are never retried, because the first attempt may have reached FlexLogger even though it
+    failed.
+
+    Retries wait for a random time between zero and an exponentially growing backoff, so
+    that clients which failed at the same moment do not all retry at the same moment.  A
+    retry budget stops retrying while most calls are failing, such as when FlexLogger has
+    closed, so that failures are reported quickly instead of being retried for every call::
+
+        policy = RetryPolicy(max_attempts=5, initial_backoff=0.2)
+        app = Application(retry_policy=policy)
+
+    If the application also has a :class:`.TimeoutPolicy`, or a call is given a timeout,
+    the timeout applies to the call as a whole, including the retries.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 4,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 5.0,
+        backoff_multiplier: float = 2.0,
+        retryable_status_codes: Iterable[StatusCode] = (StatusCode.UNAVAILABLE,),
+        budget_max_tokens: float = 10.0,
+        budget_token_ratio: float = 0.1,
+    ) -> None:
+        """Create a retry policy.
+
+        Args:
+            max_attempts: The largest number of times to attempt a call, including the
+                first attempt.
+                Defaults to 4.
+            initial_backoff: The largest time, in seconds, to wait before the first retry.
+                Defaults to 0.1.
+            max_backoff: The largest time, in seconds, to wait before any retry.
+                Defaults to 5.
+            backoff_multiplier: The factor the largest wait grows by after each retry.
+                Defaults to 2.
+            retryable_status_codes: The gRPC status codes that are retried.
+                Defaults to UNAVAILABLE only.
+            budget_max_tokens: The size of the retry budget.  Each failed attempt takes one
+                token from the budget and each successful call adds ``budget_token_ratio``
+                tokens, up to this size.  Calls are only retried while more than half of the
+                tokens are left.
+                Defaults to 10.
+            budget_token_ratio: The number of tokens each successful call adds to the retry
+                budget.
+                Defaults to 0.1, meaning retries stop if more than about one call in ten
+                fails.
+
+        Raises:
+            ValueError: if a setting is out of range.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        for name, value in (
+            ("initial_backoff", initial_backoff),
+            ("max_backoff", max_backoff),
+        ):
+            if value < 0:
+                raise ValueError("%s must not be negative" % name)
+        if backoff_multiplier < 1:
+            raise ValueError("backoff_multiplier must be at least 1")
+        if budget_max_tokens <= 0:
+            raise ValueError("budget_max_tokens must be positive")
+        if budget_token_ratio <= 0:
+            raise ValueError("budget_token_ratio must be positive")
+        self._max_attempts = max_attempts
+        self._initial_backoff = initial_backoff
+        self._max_backoff = max_backoff
+        self._backoff_multiplier = backoff_multiplier
+        self._retryable_status_codes = frozenset(retryable_status_codes)
+        self._budget_max_tokens = budget_max_tokens
+        self._budget_token_ratio = budget_token_ratio
+
+    def __repr__(self) -> str:
+        return (
+            "flexlogger.automation.RetryPolicy(max_attempts=%r, initial_backoff=%r, "
+            "max_backoff=%r, backoff_multiplier=%r)"
+            % (
+                self._max_attempts,
+                self._initial_backoff,
+                self._max_backoff,
+                self._backoff_multiplier,
+            )
+        )
+
+    @property
+    def max_attempts(self) -> int:
+        """The largest number of times to attempt a call, including the first attempt."""
+        return self._max_attempts
+
+    @property
+    def initial_backoff(self) -> float:
+        """The largest time, in seconds, to wait before the first retry."""
+        return self._initial_backoff
+
+    @property
+    def max_backoff(self) -> float:
+        """The largest time, in seconds, to wait before any retry."""
+        return self._max_backoff
+
+    @property
+    def backoff_multiplier(self) -> float:
+        """The factor the largest wait grows by after each retry."""
+        return self._backoff_multiplier
+
+    @property
+    def retryable_status_codes(self) -> FrozenSet[StatusCode]:
+        """The gRPC status codes that are retried."""
+        return self._retryable_status_codes
+
+    @property
+    def budget_max_tokens(self) -> float:
+        """The size of the retry budget."""
+        return self._budget_max_tokens
+
+    @property
+    def budget_token_ratio(self) -> float:
+        """The number of tokens each successful call adds to the retry budget."""
+        return self._budget_token_ratio
+
+    def _backoff(self, retry_number: int, random_source: random.Random) -> float:
+        """Get the time to wait before a retry, where the first retry is number 1.
+
+        >>> policy = RetryPolicy(initial_backoff=1, max_backoff=3, backoff_multiplier=2)
+        >>> [policy._backoff(n, random.Random(0)) <= b for n, b in [(1, 1), (2, 2), (3, 3)]]
+        [True, True, True]
+        >>> policy._backoff(10, random.Random(0)) <= 3
+        True
+        """
+        ceiling = self._initial_backoff * self._backoff_multiplier ** (retry_number - 1)
+        return random_source.uniform(0, min(ceiling, self._max_backoff))
+
+
+def _is_idempotent(method: str) -> bool:
+    """Get whether a gRPC method only reads from FlexLogger, so it is safe to retry.
+
+    >>> _is_idempotent("/package.TestSession/GetState")
+    True
+    >>> _is_idempotent("/package.ChannelSpecificationDocument/IsChannelEnabled")
+    True
+    >>> _is_idempotent("/package.TestSession/AddNote")
+    False
+    >>> _is_idempotent("/package.Project/OpenChannelSpecificationDocument")
+    False
+    """
+    return method.rsplit("/", 1)[-1].startswith(_IDEMPOTENT_METHOD_PREFIXES)
+
+
+class _MethodIdempotency:
+    """Caches whether each method is safe to retry, since the same methods are called often."""
+
+    def __init__(self) -> None:
+        self._idempotent = {}  # type: Dict[str, bool]
+
+    def get(self, method: str) -> bool:
+        try:
+            return self._idempotent[method]
+        except KeyError:
+            idempotent = _is_idempotent(method)
+            self._idempotent[method] = idempotent
+            return idempotent
+
+
+class _RetryBudget:
+    """A token bucket that limits retries while most calls are failing.
+
+    >>> budget = _RetryBudget(RetryPolicy(budget_max_tokens=4, budget_token_ratio=1))
+    >>> budget.record_failure(); budget.can_retry()
+    True
+    >>> budget.record_failure(); budget.can_retry()
+    False
+    >>> budget.record_success(); budget.can_retry()
+    True
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self._max_tokens = policy.budget_max_tokens
+        self._token_ratio = policy.budget_token_ratio
+        self._tokens = policy.budget_max_tokens
+        self._lock = Lock()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._token_ratio)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+
+    def can_retry(self) -> bool:
+        with self._lock:
+            return self._tokens > self._max_tokens / 2
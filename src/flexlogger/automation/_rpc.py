@@ -0,0 +1,72 @@
+from typing import Any, Callable
+
+from grpc import RpcError
+
+from ._flexlogger_error import _to_flexlogger_error
+from ._stub_registry import StubRegistry
+
+
+def _ignore_response(response: Any) -> None:
+    return None
+
+
+class _Rpc:
+    """Describes a FlexLogger RPC: the stub method, its request and how to read its response.
+
+    The classes in this package and in :mod:`.aio` describe each RPC once with this class,
+    so the only difference between them is whether the stub method is awaited.
+    """
+
+    __slots__ = ("stub_class", "method_name", "error_message", "build_request", "read_response")
+
+    def __init__(
+        self,
+        stub_class: type,
+        method_name: str,
+        error_message: str,
+        build_request: Callable[..., Any],
+        read_response: Callable[[Any], Any] = _ignore_response,
+    ) -> None:
+        """Describe an RPC.
+
+        Args:
+            stub_class: The class of the stub that makes the RPC.
+            method_name: The name of the stub method.
+            error_message: The message of the :class:`.FlexLoggerError` raised if the RPC
+                fails.
+            build_request: Builds the request message from the arguments of :meth:`call`.
+            read_response: Converts the response message to the result of :meth:`call`.
+                Defaults to ignoring the response and returning None.
+        """
+        self.stub_class = stub_class
+        self.method_name = method_name
+        self.error_message = error_message
+        self.build_request = build_request
+        self.read_response = read_response
+
+    def call(
+        self,
+        stubs: StubRegistry,
+        raise_if_application_closed: Callable[[], None],
+        timeout: float = None,
+        *args: Any
+    ) -> Any:
+        """Make the RPC and return the result read from its response.
+
+        Args:
+            stubs: The registry to get the stub from.
+            raise_if_application_closed: Called when the RPC fails, to raise a more
+                specific error if the application has been closed.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+            args: The arguments to build the request from.
+
+        Raises:
+            FlexLoggerError: if the RPC fails.
+        """
+        stub = stubs.get(self.stub_class)
+        try:
+            response = getattr(stub, self.method_name)(self.build_request(*args), timeout=timeout)
+            return self.read_response(response)
+        except (RpcError, ValueError) as error:
+            raise_if_application_closed()
+            raise _to_flexlogger_error(self.error_message, error) from error
@@ -0,0 +1,165 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Dict, List, Tuple
+
+# The upper bounds, in seconds, of the latency histogram buckets.  A latency equal to a
+# bound is counted in that bucket, and latencies above the last bound are counted in an
+# extra overflow bucket.
+_LATENCY_BUCKET_BOUNDS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class RpcMethodMetrics:
+    """Statistics about the calls to one FlexLogger automation RPC method.
+
+    This is returned by :meth:`.Application.metrics`.  Latencies are measured in the
+    client, from when the request is sent to when the response is received, so they
+    include the time spent in gRPC and on the network as well as in FlexLogger.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        count: int,
+        error_count: int,
+        total_latency: float,
+        bucket_bounds: Tuple[float, ...],
+        bucket_counts: Tuple[int, ...],
+        retry_count: int = 0,
+    ) -> None:
+        self._method = method
+        self._count = count
+        self._error_count = error_count
+        self._total_latency = total_latency
+        self._bucket_bounds = bucket_bounds
+        self._bucket_counts = bucket_counts
+        self._retry_count = retry_count
+
+    def __repr__(self) -> str:
+        return (
+            "flexlogger.automation.RpcMethodMetrics(%r, count=%d, error_count=%d, "
+            "retry_count=%d, mean_latency=%f)"
+            % (self._method, self._count, self._error_count, self._retry_count, self.mean_latency)
+        )
+
+    @property
+    def method(self) -> str:
+        """The full name of the gRPC method, such as
+        "/national_instruments.flex_logger.automation.protocols.FlexLoggerApplication/GetVersion".
+        """
+        return self._method
+
+    @property
+    def count(self) -> int:
+        """The number of calls to the method that have completed."""
+        return self._count
+
+    @property
+    def error_count(self) -> int:
+        """The number of calls to the method that failed."""
+        return self._error_count
+
+    @property
+    def retry_count(self) -> int:
+        """The number of times a failed call to the method was retried.
+
+        Calls are only retried if the application was created with a
+        :class:`.RetryPolicy`.  A call that succeeds on a retry is counted once in
+        :attr:`count`, and its latency includes the failed attempts and the time waited
+        between them.
+        """
+        return self._retry_count
+
+    @property
+    def total_latency(self) -> float:
+        """The sum of the latencies, in seconds, of the calls to the method."""
+        return self._total_latency
+
+    @property
+    def mean_latency(self) -> float:
+        """The mean latency, in seconds, of the calls to the method."""
+        return self._total_latency / self._count if self._count else 0.0
+
+    @property
+    def bucket_bounds(self) -> Tuple[float, ...]:
+        """The upper bounds, in seconds, of the latency histogram buckets."""
+        return self._bucket_bounds
+
+    @property
+    def bucket_counts(self) -> Tuple[int, ...]:
+        """The number of calls in each latency histogram bucket.
+
+        A call is counted in the first bucket whose bound is greater than or equal to its
+        latency.  There is one more count than there are :attr:`bucket_bounds`; the last
+        count is the number of calls slower than the largest bound.
+        """
+        return self._bucket_counts
+
+
+class _MethodCounters:
+    __slots__ = ("count", "error_count", "retry_count", "total_latency", "bucket_counts")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.error_count = 0
+        self.retry_count = 0
+        self.total_latency = 0.0
+        self.bucket_counts = [0] * (len(_LATENCY_BUCKET_BOUNDS) + 1)  # type: List[int]
+
+
+class _RpcMetricsCollector:
+    """Counts the calls to each RPC method and sorts their latencies into fixed buckets."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._methods = {}  # type: Dict[str, _MethodCounters]
+
+    def record(self, method: str, latency: float, failed: bool) -> None:
+        bucket_index = bisect_left(_LATENCY_BUCKET_BOUNDS, latency)
+        with self._lock:
+            counters = self._counters(method)
+            counters.count += 1
+            if failed:
+                counters.error_count += 1
+            counters.total_latency += latency
+            counters.bucket_counts[bucket_index] += 1
+
+    def record_retry(self, method: str) -> None:
+        with self._lock:
+            self._counters(method).retry_count += 1
+
+    def snapshot(self) -> Dict[str, RpcMethodMetrics]:
+        with self._lock:
+            return {
+                method: RpcMethodMetrics(
+                    method,
+                    counters.count,
+                    counters.error_count,
+                    counters.total_latency,
+                    _LATENCY_BUCKET_BOUNDS,
+                    tuple(counters.bucket_counts),
+                    counters.retry_count,
+                )
+                for method, counters in self._methods.items()
+            }
+
+    def _counters(self, method: str) -> _MethodCounters:
+        counters = self._methods.get(method)
+        if counters is None:
+            counters = _MethodCounters()
+            self._methods[method] = counters
+        return counters
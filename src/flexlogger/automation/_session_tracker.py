@@ -0,0 +1,172 @@
+import os.path
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from ._stub_registry import StubRegistry
+from .proto import (
+    FlexLoggerApplication_pb2,  # type: ignore
+    FlexLoggerApplication_pb2_grpc,  # type: ignore
+    Project_pb2,  # type: ignore
+    Project_pb2_grpc,  # type: ignore
+)
+
+# The fields requests identify projects and documents with
+_IDENTIFIER_FIELD_NAMES = ("project", "document_identifier")
+
+
+class _SessionTracker:
+    """Remembers how the projects and documents created from an Application were opened.
+
+    After FlexLogger restarts, the identifiers of its projects and documents change.
+    :meth:`rehydrate` reopens the projects and documents and gives the existing objects
+    the new identifiers.  Objects are referenced weakly, so tracking them does not keep
+    them alive.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        # Each project and the path it was opened from
+        self._projects = WeakKeyDictionary()  # type: WeakKeyDictionary
+        # Each document, the project it is in, and the name and request of the Project
+        # method that opened it
+        self._documents = WeakKeyDictionary()  # type: WeakKeyDictionary
+        # The identifiers from before the last recovery, keyed by their type and serialized
+        # value, and the identifiers that replaced them
+        self._replacements = {}  # type: Dict[Tuple[str, bytes], Any]
+
+    def add_project(self, project: Any, path: str) -> None:
+        """Track a project, and stop tracking the projects and documents that refer to other
+        FlexLogger projects, since opening a project closes the active one.
+        """
+        project_id = project._identifier.project_id
+        with self._lock:
+            self._remove_projects(lambda other_project_id: other_project_id != project_id)
+            self._projects[project] = path
+
+    def add_document(self, document: Any, project: Any, open_method: str, request: Any) -> None:
+        with self._lock:
+            self._documents[document] = (project, open_method, request)
+
+    def remove_project(self, project: Any) -> None:
+        """Stop tracking a project that was closed, and the projects and documents that
+        refer to the same FlexLogger project.
+        """
+        project_id = project._identifier.project_id
+        with self._lock:
+            self._remove_projects(lambda other_project_id: other_project_id == project_id)
+
+    def _remove_projects(self, should_remove: Callable[[str], bool]) -> None:
+        """Stop tracking the projects and documents whose project ID ``should_remove`` accepts.
+
+        The caller must hold the lock.
+        """
+        for other_project in list(self._projects.keys()):
+            if should_remove(other_project._identifier.project_id):
+                del self._projects[other_project]
+        for document, (_, _, request) in list(self._documents.items()):
+            if should_remove(request.project.project_id):
+                del self._documents[document]
+
+    def update_request(self, request: Any) -> Any:
+        """Get a copy of a request with the identifiers from before the last recovery
+        replaced, or the request itself if it has none.
+        """
+        replacements = self._replacements
+        updated_request = None
+        fields = request.DESCRIPTOR.fields_by_name
+        for field_name in _IDENTIFIER_FIELD_NAMES:
+            if field_name not in fields or not request.HasField(field_name):
+                continue
+            replacement = replacements.get(_identifier_key(getattr(request, field_name)))
+            if replacement is not None:
+                if updated_request is None:
+                    updated_request = type(request)()
+                    updated_request.CopyFrom(request)
+                getattr(updated_request, field_name).CopyFrom(replacement)
+        return updated_request if updated_request is not None else request
+
+    def rehydrate(self, stubs: StubRegistry, timeout: Optional[float]) -> None:
+        """Reopen the tracked projects and documents and update their identifiers.
+
+        Nothing is changed unless every project and document is reopened, so this can be
+        called again if it fails.  If a tracked project is still open, FlexLogger has not
+        restarted and the identifiers are still valid.
+
+        Raises:
+            RpcError: if reopening a project or document fails.
+        """
+        with self._lock:
+            projects = list(self._projects.items())  # type: List[Tuple[Any, str]]
+            documents = list(self._documents.items())  # type: List[Tuple[Any, Tuple]]
+        if len(projects) == 0:
+            return
+        application_stub = stubs.get(FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub)
+        project_stub = stubs.get(Project_pb2_grpc.ProjectStub)
+        response = application_stub.GetActiveProject(
+            FlexLoggerApplication_pb2.GetActiveProjectRequest(), timeout=timeout
+        )
+        active_project = None
+        active_project_path = None
+        if response.active_project_available:
+            active_project = response.project
+            if any(p._identifier.project_id == active_project.project_id for p, _ in projects):
+                return
+            active_project_path = project_stub.GetProjectFilePath(
+                Project_pb2.GetProjectFilePathRequest(project=active_project), timeout=timeout
+            ).project_file_path
+
+        new_project_identifiers = {}  # type: Dict[str, Any]
+        for project, path in projects:
+            old_project_id = project._identifier.project_id
+            if old_project_id in new_project_identifiers:
+                continue
+            if active_project_path is None or not _is_same_path(path, active_project_path):
+                active_project = application_stub.OpenProject(
+                    FlexLoggerApplication_pb2.OpenProjectRequest(project_path=path),
+                    timeout=timeout,
+                ).project
+                active_project_path = path
+            new_project_identifiers[old_project_id] = active_project
+
+        new_document_identifiers = {}  # type: Dict[Tuple[str, str, bytes], Any]
+        document_updates = []  # type: List[Tuple[Any, Any, Any, Any]]
+        for document, (project, open_method, request) in documents:
+            new_project_identifier = new_project_identifiers.get(request.project.project_id)
+            if new_project_identifier is None:
+                continue
+            new_request = type(request)()
+            new_request.CopyFrom(request)
+            new_request.project.CopyFrom(new_project_identifier)
+            key = (request.project.project_id, open_method, request.SerializeToString())
+            new_identifier = new_document_identifiers.get(key)
+            if new_identifier is None:
+                new_identifier = getattr(project_stub, open_method)(
+                    new_request, timeout=timeout
+                ).document_identifier
+                new_document_identifiers[key] = new_identifier
+            document_updates.append((document, project, new_request, new_identifier))
+
+        replacements = {}  # type: Dict[Tuple[str, bytes], Any]
+        with self._lock:
+            for project, _ in projects:
+                new_project_identifier = new_project_identifiers[project._identifier.project_id]
+                replacements[_identifier_key(project._identifier)] = new_project_identifier
+                project._identifier = new_project_identifier
+            for document, project, new_request, new_identifier in document_updates:
+                replacements[_identifier_key(document._identifier)] = new_identifier
+                document._identifier = new_identifier
+                _, open_method, _ = self._documents.get(document, (None, None, None))
+                if open_method is not None:
+                    self._documents[document] = (project, open_method, new_request)
+            self._replacements = replacements
+
+
+def _identifier_key(identifier: Any) -> Tuple[str, bytes]:
+    return identifier.DESCRIPTOR.full_name, identifier.SerializeToString(deterministic=True)
+
+
+def _is_same_path(path: str, other_path: str) -> bool:
+    return os.path.normcase(os.path.normpath(path)) == os.path.normcase(
+        os.path.normpath(other_path)
+    )
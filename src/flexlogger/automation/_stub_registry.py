@@ -0,0 +1,50 @@
+from typing import Any, Dict, Type, TypeVar
+
+from grpc import Channel
+
+from ._flexlogger_error import FlexLoggerError
+
+_StubT = TypeVar("_StubT")
+
+
+class StubRegistry:
+    """Creates gRPC service stubs for a connection to FlexLogger and shares them.
+
+    Creating a stub looks up and wraps every method of the service, so rather than
+    creating a new stub for every call, the Application and all of the objects
+    created from it share one registry and get each stub from it.
+    """
+
+    def __init__(self, channel: Channel) -> None:
+        self._channel = channel
+        self._stubs = {}  # type: Dict[type, Any]
+        self._closed = False
+
+    @property
+    def channel(self) -> Channel:
+        """The gRPC channel the stubs use."""
+        return self._channel
+
+    def get(self, stub_class: Type[_StubT]) -> _StubT:
+        """Get the stub of the given type, creating it the first time it is requested.
+
+        Raises:
+            FlexLoggerError: if the registry has been closed.
+        """
+        if self._closed:
+            raise FlexLoggerError("Application has already been disconnected")
+        stub = self._stubs.get(stub_class)
+        if stub is None:
+            # If two threads get here at the same time, both create a stub and one of them
+            # is thrown away, which is harmless.
+            stub = stub_class(self._channel)  # type: ignore
+            self._stubs[stub_class] = stub
+        return stub
+
+    def close(self) -> None:
+        """Stop handing out stubs, because the channel has been closed.
+
+        Objects created from the Application keep a reference to the registry, so this
+        makes their calls fail with a FlexLoggerError instead of using the closed channel.
+        """
+        self._closed = True
@@ -0,0 +1,82 @@
+from typing import Callable
+
+
+class SubscriberMetrics:
+    """Statistics about the events delivered to one event callback.
+
+    This is returned by :meth:`.FlexLoggerEventHandler.subscriber_metrics`.  Latencies
+    are measured from when the event handler dispatched the event to when the callback
+    returned, so with :attr:`.DispatchMode.PER_SUBSCRIBER` they include the time the event
+    spent waiting in the callback's queue.
+    """
+
+    def __init__(
+        self,
+        callback: Callable,
+        queue_depth: int,
+        max_queue_depth: int,
+        delivered_count: int,
+        error_count: int,
+        last_latency: float,
+        mean_latency: float,
+        max_latency: float,
+    ) -> None:
+        self._callback = callback
+        self._queue_depth = queue_depth
+        self._max_queue_depth = max_queue_depth
+        self._delivered_count = delivered_count
+        self._error_count = error_count
+        self._last_latency = last_latency
+        self._mean_latency = mean_latency
+        self._max_latency = max_latency
+
+    def __repr__(self) -> str:
+        return (
+            "flexlogger.automation.SubscriberMetrics(%s, queue_depth=%d, delivered_count=%d, "
+            "mean_latency=%f)"
+            % (repr(self._callback), self._queue_depth, self._delivered_count, self._mean_latency)
+        )
+
+    @property
+    def callback(self) -> Callable:
+        """The callback the statistics are for."""
+        return self._callback
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of events waiting to be delivered to the callback."""
+        return self._queue_depth
+
+    @property
+    def max_queue_depth(self) -> int:
+        """The largest number of events that have waited to be delivered at once."""
+        return self._max_queue_depth
+
+    @property
+    def delivered_count(self) -> int:
+        """The number of events the callback has been called with."""
+        return self._delivered_count
+
+    @property
+    def error_count(self) -> int:
+        """The number of times the callback raised an exception.
+
+        Exceptions are only caught with :attr:`.DispatchMode.PER_SUBSCRIBER`; with
+        :attr:`.DispatchMode.INLINE`, an exception stops the event handler.
+        """
+        return self._error_count
+
+    @property
+    def last_latency(self) -> float:
+        """The latency, in seconds, of the most recently delivered event."""
+        return self._last_latency
+
+    @property
+    def mean_latency(self) -> float:
+        """The mean latency, in seconds, of the delivered events."""
+        return self._mean_latency
+
+    @property
+    def max_latency(self) -> float:
+        """The largest latency, in seconds, of the delivered events."""
+        return self._max_latency
@@ -1,9 +1,8 @@
 from datetime import timedelta
-from typing import Callable
+from typing import Any, Callable, Optional
 
-from grpc import Channel, RpcError
-
-from ._flexlogger_error import FlexLoggerError
+from ._rpc import _Rpc
+from ._stub_registry import StubRegistry
 from ._test_session_state import TestSessionState
 from .proto import (
     TestSession_pb2,
@@ -24,6 +23,66 @@ STATE_MAP = {
 }
 
 
+def _to_test_session_state(
+    response: TestSession_pb2.GetTestSessionStateResponse,
+) -> TestSessionState:
+    state = STATE_MAP.get(response.test_session_state)
+    if state is None:
+        raise RuntimeError("The test session is in an undefined state.")
+    return state
+
+
+# The RPCs of the test session, shared with aio.TestSession
+_ADD_NOTE = _Rpc(
+    TestSession_pb2_grpc.TestSessionStub,
+    "AddNote",
+    "Failed to add note",
+    lambda note: TestSession_pb2.AddNoteRequest(note=note),
+)
+_GET_STATE = _Rpc(
+    TestSession_pb2_grpc.TestSessionStub,
+    "GetState",
+    "Failed to get test session state",
+    TestSession_pb2.GetTestSessionStateRequest,
+    _to_test_session_state,
+)
+_START = _Rpc(
+    TestSession_pb2_grpc.TestSessionStub,
+    "Start",
+    "Failed to start test session",
+    TestSession_pb2.StartTestSessionRequest,
+    lambda response: response.test_session_started,
+)
+_STOP = _Rpc(
+    TestSession_pb2_grpc.TestSessionStub,
+    "Stop",
+    "Failed to stop test session",
+    TestSession_pb2.StopTestSessionRequest,
+    lambda response: response.test_session_stopped,
+)
+_PAUSE = _Rpc(
+    TestSession_pb2_grpc.TestSessionStub,
+    "Pause",
+    "Failed to pause test session",
+    TestSession_pb2.PauseTestSessionRequest,
+    lambda response: response.test_session_paused,
+)
+_RESUME = _Rpc(
+    TestSession_pb2_grpc.TestSessionStub,
+    "Resume",
+    "Failed to resume test session",
+    TestSession_pb2.ResumeTestSessionRequest,
+    lambda response: response.test_session_resumed,
+)
+_GET_ELAPSED_TEST_TIME = _Rpc(
+    TestSession_pb2_grpc.TestSessionStub,
+    "GetElapsedTestTime",
+    "Failed to query elapsed test time",
+    TestSession_pb2.GetElapsedTestTimeRequest,
+    lambda response: timedelta(seconds=response.elapsed_test_time),
+)
+
+
 class TestSession:
     """Represents a test session for a project.
 
@@ -31,11 +90,16 @@ class TestSession:
     :attr:`.Project.test_session`.
     """
 
-    def __init__(self, channel: Channel, raise_if_application_closed: Callable[[], None]) -> None:
-        self._channel = channel
+    def __init__(
+        self, stubs: StubRegistry, raise_if_application_closed: Callable[[], None]
+    ) -> None:
+        self._stubs = stubs
         self._raise_if_application_closed = raise_if_application_closed
 
-    def add_note(self, note: str) -> None:
+    def _call(self, rpc: _Rpc, timeout: Optional[float], *args: Any) -> Any:
+        return rpc.call(self._stubs, self._raise_if_application_closed, timeout, *args)
+
+    def add_note(self, note: str, timeout: float = None) -> None:
         """Add a note to the current log file.
 
         This method requires the test session to be in the
@@ -43,17 +107,14 @@ class TestSession:
 
         Args:
             note: The note to add to the log file.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
 
         Raises:
             FlexLoggerError: if the test session is not in the
                 :attr:`.TestSessionState.RUNNING` state, or if adding the note fails.
         """
-        stub = TestSession_pb2_grpc.TestSessionStub(self._channel)
-        try:
-            stub.AddNote(TestSession_pb2.AddNoteRequest(note=note))
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to add note") from error
+        self._call(_ADD_NOTE, timeout, note)
 
     @property
     def state(self) -> TestSessionState:
@@ -63,86 +124,67 @@ class TestSession:
             FlexLoggerError: if getting the current state fails.
         """
         self._raise_if_application_closed()
-        stub = TestSession_pb2_grpc.TestSessionStub(self._channel)
-        try:
-            get_test_session_state_response = stub.GetState(
-                TestSession_pb2.GetTestSessionStateRequest()
-            )
-            state = STATE_MAP.get(get_test_session_state_response.test_session_state)
-            if state is None:
-                raise RuntimeError("The test session is in an undefined state.")
-            return state
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to get test session state") from error
-
-    def start(self) -> bool:
+        return self._call(_GET_STATE, None)
+
+    def start(self, timeout: float = None) -> bool:
         """Start the test session, if possible.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             True if the test was started, otherwise False.
 
         Raises:
             FlexLoggerError: if starting the test session fails.
         """
-        stub = TestSession_pb2_grpc.TestSessionStub(self._channel)
-        try:
-            start_test_session_response = stub.Start(TestSession_pb2.StartTestSessionRequest())
-            return start_test_session_response.test_session_started
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to start test session") from error
-
-    def stop(self) -> bool:
+        return self._call(_START, timeout)
+
+    def stop(self, timeout: float = None) -> bool:
         """Stop the test session, if possible.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             True if the test was stopped, otherwise False.
 
         Raises:
             FlexLoggerError: if stopping the test session fails.
         """
-        stub = TestSession_pb2_grpc.TestSessionStub(self._channel)
-        try:
-            stop_test_session_response = stub.Stop(TestSession_pb2.StopTestSessionRequest())
-            return stop_test_session_response.test_session_stopped
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to stop test session") from error
-
-    def pause(self) -> bool:
+        return self._call(_STOP, timeout)
+
+    def pause(self, timeout: float = None) -> bool:
         """Pauses the test session, if possible.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             True if the test was paused, otherwise False.
 
         Raises:
             FlexLoggerError: if pausing the test session fails.
         """
-        stub = TestSession_pb2_grpc.TestSessionStub(self._channel)
-        try:
-            pause_test_session_response = stub.Pause(TestSession_pb2.PauseTestSessionRequest())
-            return pause_test_session_response.test_session_paused
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to pause test session") from error
-
-    def resume(self) -> bool:
+        return self._call(_PAUSE, timeout)
+
+    def resume(self, timeout: float = None) -> bool:
         """Resumes the test session, if possible.
 
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
         Returns:
             True if the test was resumed, otherwise False.
 
         Raises:
             FlexLoggerError: if resuming the test session fails.
         """
-        stub = TestSession_pb2_grpc.TestSessionStub(self._channel)
-        try:
-            resume_test_session_response = stub.Resume(TestSession_pb2.ResumeTestSessionRequest())
-            return resume_test_session_response.test_session_resumed
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to resume test session") from error
+        return self._call(_RESUME, timeout)
 
     @property
     def elapsed_test_time(self) -> timedelta:
@@ -155,12 +197,4 @@ class TestSession:
         Raises:
             FlexLoggerError: if no test has ever been run since the project was loaded
         """
-        stub = TestSession_pb2_grpc.TestSessionStub(self._channel)
-        try:
-            get_elapsed_test_time_response = stub.GetElapsedTestTime(
-                TestSession_pb2.GetElapsedTestTimeRequest()
-            )
-            return timedelta(seconds=get_elapsed_test_time_response.elapsed_test_time)
-        except (RpcError, ValueError) as error:
-            self._raise_if_application_closed()
-            raise FlexLoggerError("Failed to query elapsed test time") from error
+        return self._call(_GET_ELAPSED_TEST_TIME, None)
@@ -1,7 +1,6 @@
 from typing import Callable
 
-from grpc import Channel
-
+from ._stub_registry import StubRegistry
 from .proto.Identifiers_pb2 import ElementIdentifier
 
 
@@ -17,10 +16,10 @@ class TestSpecificationDocument:
 
     def __init__(
         self,
-        channel: Channel,
+        stubs: StubRegistry,
         raise_if_application_closed: Callable[[], None],
         identifier: ElementIdentifier,
     ) -> None:
-        self._channel = channel
+        self._stubs = stubs
         self._raise_if_application_closed = raise_if_application_closed
         self._identifier = identifier
@@ -0,0 +1,147 @@
+from typing import Dict, Optional
+
+# Calls that open, save or close a project, or close FlexLogger, which can take much longer
+# than other calls for large projects.
+_PROJECT_METHODS = {
+    "FlexLoggerApplication/OpenProject",
+    "Project/Save",
+    "Project/Close",
+    "Document/Close",
+    "Application/Disconnect",
+}
+
+# Calls that start, stop, pause or resume the test session, which wait for the hardware.
+_SESSION_CONTROL_METHODS = {
+    "TestSession/Start",
+    "TestSession/Stop",
+    "TestSession/Pause",
+    "TestSession/Resume",
+}
+
+_READ_METHOD_PREFIXES = ("Get", "Is", "Open")
+
+
+class TimeoutPolicy:
+    """Default timeouts for the calls an :class:`.Application` makes to FlexLogger.
+
+    Each call to FlexLogger falls into one of these categories:
+
+    * project: opening, saving and closing projects, and closing FlexLogger.
+    * session_control: starting, stopping, pausing and resuming the test session.
+    * reads: getting values and settings, and opening documents.
+    * writes: everything else, such as setting values and settings.
+
+    A call that does not complete within the timeout for its category raises
+    :class:`.FlexLoggerTimeoutError`.  Methods that take a ``timeout`` argument use it
+    instead of the policy's timeout.  The event stream is not subject to a timeout, since
+    it stays open for as long as the client is subscribed to events::
+
+        policy = TimeoutPolicy(reads=2.0, writes=5.0)
+        app = Application(timeout_policy=policy)
+    """
+
+    def __init__(
+        self,
+        *,
+        reads: Optional[float] = 10.0,
+        writes: Optional[float] = 10.0,
+        session_control: Optional[float] = 60.0,
+        project: Optional[float] = 300.0,
+    ) -> None:
+        """Create a timeout policy.
+
+        Args:
+            reads: The timeout, in seconds, for reads, or None for no timeout.
+                Defaults to 10.
+            writes: The timeout, in seconds, for writes, or None for no timeout.
+                Defaults to 10.
+            session_control: The timeout, in seconds, for controlling the test session, or
+                None for no timeout.
+                Defaults to 60.
+            project: The timeout, in seconds, for opening, saving and closing projects, or
+                None for no timeout.
+                Defaults to 300.
+
+        Raises:
+            ValueError: if a timeout is not positive.
+        """
+        for name, timeout in (
+            ("reads", reads),
+            ("writes", writes),
+            ("session_control", session_control),
+            ("project", project),
+        ):
+            if timeout is not None and timeout <= 0:
+                raise ValueError("The %s timeout must be positive" % name)
+        self._reads = reads
+        self._writes = writes
+        self._session_control = session_control
+        self._project = project
+
+    def __repr__(self) -> str:
+        return (
+            "flexlogger.automation.TimeoutPolicy(reads=%r, writes=%r, session_control=%r, "
+            "project=%r)" % (self._reads, self._writes, self._session_control, self._project)
+        )
+
+    @property
+    def reads(self) -> Optional[float]:
+        """The timeout, in seconds, for reads, or None for no timeout."""
+        return self._reads
+
+    @property
+    def writes(self) -> Optional[float]:
+        """The timeout, in seconds, for writes, or None for no timeout."""
+        return self._writes
+
+    @property
+    def session_control(self) -> Optional[float]:
+        """The timeout, in seconds, for controlling the test session, or None for no timeout."""
+        return self._session_control
+
+    @property
+    def project(self) -> Optional[float]:
+        """The timeout, in seconds, for opening, saving and closing projects, or None for no
+        timeout.
+        """
+        return self._project
+
+    def _timeout_for(self, method: str) -> Optional[float]:
+        """Get the timeout for a gRPC method.
+
+        >>> policy = TimeoutPolicy(reads=1, writes=2, session_control=3, project=4)
+        >>> policy._timeout_for("/package.ChannelSpecificationDocument/GetChannelNames")
+        1
+        >>> policy._timeout_for("/package.ChannelSpecificationDocument/SetDataRate")
+        2
+        >>> policy._timeout_for("/package.TestSession/Start")
+        3
+        >>> policy._timeout_for("/package.FlexLoggerApplication/OpenProject")
+        4
+        """
+        # Method names look like "/package.Service/Method"
+        service, method_name = method.rsplit("/", 2)[-2:]
+        service_and_method = service.rsplit(".", 1)[-1] + "/" + method_name
+        if service_and_method in _PROJECT_METHODS:
+            return self._project
+        if service_and_method in _SESSION_CONTROL_METHODS:
+            return self._session_control
+        if method_name.startswith(_READ_METHOD_PREFIXES):
+            return self._reads
+        return self._writes
+
+
+class _MethodTimeouts:
+    """Caches the policy's timeout for each method, since the same methods are called often."""
+
+    def __init__(self, policy: TimeoutPolicy) -> None:
+        self._policy = policy
+        self._timeouts = {}  # type: Dict[str, Optional[float]]
+
+    def get(self, method: str) -> Optional[float]:
+        try:
+            return self._timeouts[method]
+        except KeyError:
+            timeout = self._policy._timeout_for(method)
+            self._timeouts[method] = timeout
+            return timeout
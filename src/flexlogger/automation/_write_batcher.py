@@ -0,0 +1,227 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from ._channel_specification_document import _validate_channel_values, ChannelSpecificationDocument
+from ._flexlogger_error import FlexLoggerError
+
+
+class WriteBatcher:
+    """Collects channel writes and sends them to FlexLogger together.
+
+    Each call to :meth:`.ChannelSpecificationDocument.set_channel_value` is a separate
+    request.  A batcher instead keeps the values passed to :meth:`write`, from any number
+    of threads, and sends them with a single
+    :meth:`.ChannelSpecificationDocument.set_channel_values` request when it is flushed.
+    If a channel is written more than once between flushes, only the last value is sent.
+
+    Flush the batcher explicitly with :meth:`flush`, for instance once per control loop
+    iteration, or give it a ``flush_interval`` and start it to flush on a background
+    thread::
+
+        with WriteBatcher(channel_specification, flush_interval=0.01) as batcher:
+            for step in steps:
+                batcher.write("Setpoint", step.setpoint)
+                batcher.write("Valve", step.valve)
+    """
+
+    def __init__(
+        self, channel_specification: ChannelSpecificationDocument, flush_interval: float = None
+    ) -> None:
+        """Create a new WriteBatcher.
+
+        Args:
+            channel_specification: The document to write the channels to.
+            flush_interval: The time, in seconds, between flushes while the batcher is
+                running.  Defaults to None, meaning the batcher is only flushed by calling
+                :meth:`flush` or :meth:`stop`.
+
+        Raises:
+            ValueError: if flush_interval is not positive.
+        """
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        self._channel_specification = channel_specification
+        self._flush_interval = flush_interval
+        self._lock = threading.Lock()
+        # Held while flushing so batches are sent in the order they were collected
+        self._flush_lock = threading.Lock()
+        self._pending = OrderedDict()  # type: OrderedDict[str, float]
+        self._pending_write_count = 0
+        self._write_count = 0
+        self._flush_count = 0
+        self._folded_write_count = 0
+        self._last_flush_write_count = 0
+        self._last_flush_channel_count = 0
+        self._last_flush_duration = 0.0
+        self._max_flush_duration = 0.0
+        self._last_error = None  # type: Optional[FlexLoggerError]
+        self._stop_event = threading.Event()
+        self._thread = None  # type: Optional[threading.Thread]
+
+    def __enter__(self) -> "WriteBatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def flush_interval(self) -> Optional[float]:
+        """The time, in seconds, between flushes while the batcher is running."""
+        return self._flush_interval
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the batcher is currently flushing on a background thread."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pending_channel_count(self) -> int:
+        """The number of channels that will be written by the next flush."""
+        return len(self._pending)
+
+    @property
+    def write_count(self) -> int:
+        """The number of times :meth:`write` has been called."""
+        return self._write_count
+
+    @property
+    def flush_count(self) -> int:
+        """The number of flushes that sent values to FlexLogger."""
+        return self._flush_count
+
+    @property
+    def folded_write_count(self) -> int:
+        """The number of written values that were replaced by a later write before being sent."""
+        return self._folded_write_count
+
+    @property
+    def last_flush_write_count(self) -> int:
+        """The number of writes collected into the most recent flush."""
+        return self._last_flush_write_count
+
+    @property
+    def last_flush_channel_count(self) -> int:
+        """The number of channels sent by the most recent flush."""
+        return self._last_flush_channel_count
+
+    @property
+    def last_flush_duration(self) -> float:
+        """The time, in seconds, that the most recent flush took."""
+        return self._last_flush_duration
+
+    @property
+    def max_flush_duration(self) -> float:
+        """The time, in seconds, that the slowest flush took."""
+        return self._max_flush_duration
+
+    @property
+    def last_error(self) -> Optional[FlexLoggerError]:
+        """The error raised by the most recent failed background flush, if any."""
+        return self._last_error
+
+    def write(self, channel_name: str, channel_value: float) -> None:
+        """Set the value to write to a channel on the next flush.
+
+        This does not communicate with FlexLogger, and can be called from any thread.
+
+        Args:
+            channel_name: The name of the channel.
+            channel_value: The value to set the channel to.
+
+        Raises:
+            ValueError: if the channel name or value is invalid.
+        """
+        ((channel_name, channel_value),) = _validate_channel_values([(channel_name, channel_value)])
+        with self._lock:
+            if channel_name in self._pending:
+                self._folded_write_count += 1
+            self._pending[channel_name] = channel_value
+            self._pending_write_count += 1
+            self._write_count += 1
+
+    def flush(self, timeout: float = None) -> int:
+        """Send the collected values to FlexLogger.
+
+        If sending the values fails, they are kept for the next flush, except for
+        channels that were written again in the meantime.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            The number of channels that were written.
+
+        Raises:
+            FlexLoggerError: if setting the channel values fails.
+        """
+        with self._flush_lock:
+            with self._lock:
+                values = self._pending
+                write_count = self._pending_write_count
+                self._pending = OrderedDict()
+                self._pending_write_count = 0
+            if len(values) == 0:
+                return 0
+            start_time = time.perf_counter()
+            try:
+                self._channel_specification.set_channel_values(values, timeout=timeout)
+            except FlexLoggerError:
+                with self._lock:
+                    for channel_name, channel_value in values.items():
+                        if channel_name not in self._pending:
+                            self._pending[channel_name] = channel_value
+                            self._pending_write_count += 1
+                raise
+            duration = time.perf_counter() - start_time
+            self._flush_count += 1
+            self._last_flush_write_count = write_count
+            self._last_flush_channel_count = len(values)
+            self._last_flush_duration = duration
+            self._max_flush_duration = max(self._max_flush_duration, duration)
+            return len(values)
+
+    def start(self) -> None:
+        """Start flushing every ``flush_interval`` seconds on a background thread.
+
+        Calling this method while the batcher is already running, or when it has no
+        ``flush_interval``, has no effect.
+        """
+        if self._flush_interval is None or self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="FlexLogger WriteBatcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, if it is running, and flush the remaining values.
+
+        Raises:
+            FlexLoggerError: if setting the remaining channel values fails.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        assert self._flush_interval is not None
+        next_flush_time = time.monotonic() + self._flush_interval
+        while not self._stop_event.wait(next_flush_time - time.monotonic()):
+            try:
+                self.flush()
+            except FlexLoggerError as error:
+                self._last_error = error
+            next_flush_time += self._flush_interval
+            now = time.monotonic()
+            if now > next_flush_time:
+                # Skip the flushes we missed rather than trying to catch up.
+                next_flush_time += (
+                    (now - next_flush_time) // self._flush_interval + 1
+                ) * self._flush_interval
@@ -0,0 +1,13 @@
+# flake8: noqa
+"""Asynchronous versions of the FlexLogger automation classes, for use with asyncio.
+
+The classes in this package have the same methods as the classes with the same names in
+:mod:`flexlogger.automation`, but every method that communicates with FlexLogger is a
+coroutine, so many operations can be in progress at once on a single event loop.
+"""
+
+from ._application import Application
+from ._project import Project
+from ._test_session import TestSession
+from ._channel_specification_document import ChannelSpecificationDocument
+from ._logging_specification_document import LoggingSpecificationDocument
@@ -0,0 +1,344 @@
+import asyncio
+import time
+import uuid
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+
+from google.protobuf import empty_pb2
+from grpc import RpcError, StatusCode
+from grpc.aio import insecure_channel, UsageError
+
+from ._project import Project
+from ._retry_interceptor import _RetryInterceptor
+from ._timeout_interceptor import _TimeoutInterceptor
+from .._application import _APP_CLOSE_TIMEOUT, Application as _SyncApplication
+from .._channel_options import ChannelOptions
+from .._flexlogger_error import _to_flexlogger_error, FlexLoggerError
+from .._retry_policy import RetryPolicy
+from .._stub_registry import StubRegistry
+from .._timeout_policy import TimeoutPolicy
+from ..proto import (
+    Application_pb2,  # type: ignore
+    Application_pb2_grpc,  # type: ignore
+    AutomationClientType_pb2,  # type: ignore
+    FlexLoggerApplication_pb2,  # type: ignore
+    FlexLoggerApplication_pb2_grpc,  # type: ignore
+)
+
+
+class Application:
+    """Represents the FlexLogger application, for use with asyncio.
+
+    Do not create this class directly; instead, use :meth:`connect` or :meth:`launch`::
+
+        async with await Application.connect() as app:
+            project = await app.open_project(path)
+    """
+
+    def __init__(
+        self,
+        server_port: int,
+        channel_options: ChannelOptions = None,
+        timeout_policy: TimeoutPolicy = None,
+        retry_policy: RetryPolicy = None,
+    ) -> None:
+        self._server_port = server_port
+        self._channel_options = channel_options
+        self._timeout_policy = timeout_policy
+        self._retry_policy = retry_policy
+        self._channel = None  # type: Any
+        self._stubs = None  # type: Any
+        self._launched = False
+        self._client_id = uuid.uuid4().hex
+
+    async def __aenter__(self) -> "Application":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        # Only exit the application if this was created with Application.launch()
+        # If the user wants to override this behavior they can call close()
+        # or disconnect() explicitly.
+        await self._disconnect(exit_application=self._launched)
+
+    @property
+    def server_port(self) -> int:
+        """The port that the automation server is listening to."""
+        return self._server_port
+
+    @classmethod
+    async def connect(
+        cls,
+        server_port: int = None,
+        channel_options: ChannelOptions = None,
+        timeout_policy: TimeoutPolicy = None,
+        retry_policy: RetryPolicy = None,
+    ) -> "Application":
+        """Connect to an already running instance of FlexLogger.
+
+        Args:
+            server_port: The port that the automation server is listening to.  Omit this
+                argument or pass None to detect the port of a running FlexLogger automatically.
+            channel_options: Settings for the gRPC channel, such as keepalive and message
+                size limits.
+                Defaults to None, meaning gRPC's defaults are used.
+            timeout_policy: The default timeouts for calls to FlexLogger.  Methods that take
+                a ``timeout`` argument can override them for a single call.
+                Defaults to None, meaning calls wait indefinitely unless they are given a
+                timeout.
+            retry_policy: How to retry calls that only read from FlexLogger when they fail
+                with a transient error, such as the connection being briefly unavailable.
+                Defaults to None, meaning calls are not retried.
+
+        Returns:
+            The connected Application object
+
+        Raises:
+            FlexLoggerError: if connecting fails.
+        """
+        _SyncApplication._raise_if_unsupported_platform()
+        if server_port is None:
+            server_port = _SyncApplication._detect_server_port()
+        application = cls(server_port, channel_options, timeout_policy, retry_policy)
+        await application._connect()
+        return application
+
+    @classmethod
+    async def launch(
+        cls,
+        *,
+        timeout: float = 40,
+        path: Union[str, Path] = None,
+        channel_options: ChannelOptions = None,
+        timeout_policy: TimeoutPolicy = None,
+        retry_policy: RetryPolicy = None
+    ) -> "Application":
+        """Launch a new instance of FlexLogger.
+
+        Note that if this method is used to initialize an "async with" statement, when
+        the Application goes out of scope FlexLogger will be closed.  To prevent this,
+        call :meth:`~.aio.Application.disconnect()`.
+
+        Args:
+            timeout: The length of time, in seconds, to wait for FlexLogger to launch
+                before raising an exception.
+                Defaults to 40.
+            path: The path to the FlexLogger executable to launch.
+                Defaults to None, meaning the latest installed version will be launched.
+            channel_options: Settings for the gRPC channel, such as keepalive and message
+                size limits.
+                Defaults to None, meaning gRPC's defaults are used.
+            timeout_policy: The default timeouts for calls to FlexLogger.  Methods that take
+                a ``timeout`` argument can override them for a single call.
+                Defaults to None, meaning calls wait indefinitely unless they are given a
+                timeout.
+            retry_policy: How to retry calls that only read from FlexLogger when they fail
+                with a transient error, such as the connection being briefly unavailable.
+                Defaults to None, meaning calls are not retried.
+
+        Returns:
+            The created Application object
+
+        Raises:
+            FlexLoggerError: if launching FlexLogger or connecting to it fails.
+        """
+        _SyncApplication._raise_if_unsupported_platform()
+        if isinstance(path, str):
+            path = Path(path)
+        # Launching waits on a Windows event, so do it on a worker thread to keep the
+        # event loop responsive.
+        server_port = await asyncio.get_event_loop().run_in_executor(
+            None, lambda: _SyncApplication._launch_flexlogger(timeout_in_seconds=timeout, path=path)
+        )
+        application = await cls.connect(
+            server_port=server_port,
+            channel_options=channel_options,
+            timeout_policy=timeout_policy,
+            retry_policy=retry_policy,
+        )
+        application._launched = True
+        return application
+
+    async def close(self) -> None:
+        """Close the application and disconnect from the automation server.
+
+        Further calls to this object will fail.
+        """
+        await self._disconnect(exit_application=True)
+
+    async def disconnect(self) -> None:
+        """Disconnect from the automation server, but leave the application running.
+
+        Further calls to this object will fail.
+        """
+        await self._disconnect(exit_application=False)
+
+    async def _connect(self) -> None:
+        if self._server_port <= 0:
+            raise ValueError("Tried to connect to invalid port number %d" % self._server_port)
+        # The first interceptor sees each call first, so a timeout from the policy covers
+        # every retry of the call.
+        interceptors = []  # type: List[Any]
+        if self._timeout_policy is not None:
+            interceptors.append(_TimeoutInterceptor(self._timeout_policy))
+        if self._retry_policy is not None:
+            interceptors.append(_RetryInterceptor(self._retry_policy))
+        if self._channel_options is None:
+            self._channel = insecure_channel(
+                "localhost:%d" % self._server_port, interceptors=interceptors
+            )
+        else:
+            self._channel = insecure_channel(
+                "localhost:%d" % self._server_port,
+                options=self._channel_options._to_grpc_options(),
+                compression=self._channel_options._grpc_compression(),
+                interceptors=interceptors,
+            )
+        self._stubs = StubRegistry(self._channel)
+        try:
+            stub = self._stubs.get(FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub)
+            await stub.Initialize(
+                FlexLoggerApplication_pb2.InitializeRequest(
+                    client_type=AutomationClientType_pb2.CLIENT_TYPE_PYTHON
+                )
+            )
+        except RpcError as error:
+            # Ignore UNIMPLEMENTED exceptions. Older FLexLogger does not support the Initialize
+            # message.
+            if error.code() != StatusCode.UNIMPLEMENTED:
+                await self._channel.close()
+                self._channel = None
+                self._stubs = None
+                raise _to_flexlogger_error(
+                    'Failed to connect to FlexLogger. Ensure the "Automation server" preference is '
+                    "enabled in the application. ",
+                    error,
+                ) from error
+
+    async def _disconnect(self, exit_application: bool) -> None:
+        if self._channel is not None:
+            stub = self._stubs.get(Application_pb2_grpc.ApplicationStub)
+            loop = asyncio.get_event_loop()
+            pid_to_wait_for = None
+            if exit_application:
+                # Listing the network connections can take a while, so do it on a worker thread.
+                pid_to_wait_for = await loop.run_in_executor(
+                    None, _SyncApplication._find_flexlogger_pid, self._server_port
+                )
+            try:
+                if exit_application:
+                    # If there is an active project, close it so closing the
+                    # app won't prompt to save it.
+                    active_project = await self.get_active_project()
+                    if active_project is not None:
+                        await active_project.close()
+                await stub.Disconnect(
+                    Application_pb2.DisconnectRequest(exit_application=exit_application)
+                )
+                if pid_to_wait_for is not None:
+                    # Wait 60 seconds for the process to exit
+                    timeout_end_time = time.time() + _APP_CLOSE_TIMEOUT
+                    process_still_running = True
+                    while time.time() < timeout_end_time and process_still_running:
+                        await asyncio.sleep(0.2)
+                        process_still_running = _SyncApplication._is_flexlogger_process(
+                            pid_to_wait_for
+                        )
+            except (RpcError, UsageError, ValueError, AttributeError) as rpc_error:
+                self._raise_exception_if_closed()
+                raise _to_flexlogger_error("Failed to disconnect", rpc_error) from rpc_error
+            finally:
+                channel = self._channel
+                self._channel = None
+                self._stubs.close()
+                self._stubs = None
+                await channel.close()
+
+    def _raise_exception_if_closed(self) -> None:
+        if self._channel is None:
+            raise FlexLoggerError("Application has already been disconnected") from None
+
+    async def open_project(self, path: Union[str, Path], timeout: float = None) -> Project:
+        """Open a project.
+
+        Args:
+            path: The path to the project you want to open.
+            timeout: The timeout in seconds.
+                     If the value is None or negative, the project timeout of the application's
+                     :class:`.TimeoutPolicy` is used, and if there is no timeout policy the call
+                     will wait indefinitely.
+
+        Returns:
+            The opened project.
+
+        Raises:
+            FlexLoggerError: if opening the project fails or the timeout is reached.
+        """
+        if timeout is not None and timeout < 0:
+            timeout = None
+        try:
+            stub = self._stubs.get(FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub)
+            response = await stub.OpenProject(
+                FlexLoggerApplication_pb2.OpenProjectRequest(project_path=str(path)),
+                timeout=timeout,
+            )
+
+            # FlexLogger can hang if you open and then immediately close a project,
+            # this seems sufficient to prevent that.
+            await asyncio.sleep(1.0)
+            return Project(self._stubs, self._raise_exception_if_closed, response.project)
+        # This method gets its stub from self._stubs, and this raises an AttributeError
+        # if self._stubs is None, so catch this as well.
+        except (RpcError, UsageError, ValueError, AttributeError) as rpc_error:
+            self._raise_exception_if_closed()
+            raise _to_flexlogger_error("Failed to open project", rpc_error) from rpc_error
+
+    async def get_active_project(self, timeout: float = None) -> Optional[Project]:
+        """Gets the currently active (open) project.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            The active project, or None if a project is not currently open.
+
+        Raises:
+            FlexLoggerError: if getting the active project fails.
+        """
+        try:
+            stub = self._stubs.get(FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub)
+            response = await stub.GetActiveProject(
+                FlexLoggerApplication_pb2.GetActiveProjectRequest(), timeout=timeout
+            )
+            if response.active_project_available:
+                return Project(self._stubs, self._raise_exception_if_closed, response.project)
+            else:
+                return None
+        # This method gets its stub from self._stubs, and this raises an AttributeError
+        # if self._stubs is None, so catch this as well.
+        except (RpcError, UsageError, ValueError, AttributeError) as rpc_error:
+            self._raise_exception_if_closed()
+            raise _to_flexlogger_error("Failed to get the active project", rpc_error) from rpc_error
+
+    async def get_version(self, timeout: float = None) -> Tuple[str, str]:
+        """Gets the FlexLogger server version.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            A tuple containing the FlexLogger versions (internal version and user visible version).
+
+        Raises:
+            FlexLoggerError: if getting the version fails.
+        """
+        try:
+            stub = self._stubs.get(FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationStub)
+            response = await stub.GetVersion(empty_pb2.Empty(), timeout=timeout)
+            return response.version, response.version_string
+        # This method gets its stub from self._stubs, and this raises an AttributeError
+        # if self._stubs is None, so catch this as well.
+        except (RpcError, UsageError, ValueError, AttributeError) as rpc_error:
+            self._raise_exception_if_closed()
+            raise _to_flexlogger_error("Failed to get version", rpc_error) from rpc_error
@@ -0,0 +1,383 @@
+import asyncio
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from grpc import RpcError
+from grpc.aio import UsageError
+
+from ._rpc import _call_rpc
+from .._channel_data_point import ChannelDataPoint
+from .._channel_snapshot import _ChannelNameIndex, ChannelSnapshot
+from .._channel_specification_document import (
+    _chunk,
+    _GET_ACTUAL_DATA_RATE,
+    _get_channel_name_index,
+    _GET_CHANNEL_NAMES,
+    _GET_CHANNEL_VALUE,
+    _get_channel_values_request,
+    _GET_DATA_RATE,
+    _GET_DATA_RATE_LEVEL,
+    _GET_FILTERED_CHANNEL_NAMES,
+    _IS_CHANNEL_ENABLED,
+    _IS_CHANNEL_LOGGING_ENABLED,
+    _match_channel_values,
+    _SET_CHANNEL_ENABLED,
+    _SET_CHANNEL_LOGGING_ENABLED,
+    _SET_CHANNEL_VALUE,
+    _set_channel_values_error_message,
+    _set_channel_values_request,
+    _SET_DATA_RATE,
+    _SET_DATA_RATE_LEVEL,
+    _STUB,
+    _to_channel_data_point,
+    _to_channel_data_points,
+    _to_channel_snapshot,
+    _validate_channel_values,
+)
+from .._data_rate_level import DataRateLevel
+from .._flexlogger_error import _to_flexlogger_error
+from .._rpc import _Rpc
+from .._stub_registry import StubRegistry
+from ..proto import ChannelSpecificationDocument_pb2
+from ..proto.Identifiers_pb2 import ElementIdentifier
+
+
+class ChannelSpecificationDocument:
+    """Represents the document that describes data channels.
+
+    Do not create this class directly; instead, use the return value of
+    :meth:`.aio.Project.open_channel_specification_document`.
+    """
+
+    def __init__(
+        self,
+        stubs: StubRegistry,
+        raise_if_application_closed: Callable[[], None],
+        identifier: ElementIdentifier,
+    ) -> None:
+        self._stubs = stubs
+        self._raise_if_application_closed = raise_if_application_closed
+        self._identifier = identifier
+        self._channel_name_indexes = {}  # type: Dict[Tuple[str, ...], _ChannelNameIndex]
+
+    async def _call(self, rpc: _Rpc, timeout: Optional[float], *args: Any) -> Any:
+        return await _call_rpc(
+            rpc, self._stubs, self._raise_if_application_closed, timeout, self._identifier, *args
+        )
+
+    async def get_actual_data_rate(self, channel_name: str, timeout: float = None) -> float:
+        """Get the actual data rate for the specified channel.
+
+        Args:
+            channel_name: The name of the channel.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+        """
+        return await self._call(_GET_ACTUAL_DATA_RATE, timeout, channel_name)
+
+    async def get_channel_names(self, timeout: float = None) -> List[str]:
+        """Get all the channel names in the document.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if getting the channel names fails.
+        """
+        return await self._call(_GET_CHANNEL_NAMES, timeout)
+
+    async def get_channel_value(self, channel_name: str, timeout: float = None) -> ChannelDataPoint:
+        """Get the current value of the specified channel.
+
+        Args:
+            channel_name: The name of the channel.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if getting the channel value fails.
+        """
+        return _to_channel_data_point(
+            channel_name, await self._call(_GET_CHANNEL_VALUE, timeout, channel_name)
+        )
+
+    async def get_channel_values(
+        self, channel_names: Iterable[str], timeout: float = None
+    ) -> List[ChannelDataPoint]:
+        """Get the current values of the specified channels.
+
+        Very large lists of channels are split into several requests, which are
+        sent at the same time.
+
+        Args:
+            channel_names: The names of the channels.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            The channel values, in the same order as ``channel_names``.
+
+        Raises:
+            FlexLoggerError: if getting the channel values fails.
+        """
+        channel_names = list(channel_names)
+        try:
+            channel_values = await self._read_channel_values(channel_names, timeout=timeout)
+            return _to_channel_data_points(channel_names, channel_values)
+        except (RpcError, UsageError, ValueError) as error:
+            self._raise_if_application_closed()
+            raise _to_flexlogger_error("Failed to get channel values", error) from error
+
+    async def get_channel_snapshot(
+        self, channel_names: Iterable[str], timeout: float = None
+    ) -> ChannelSnapshot:
+        """Get the current values of the specified channels as a :class:`.ChannelSnapshot`.
+
+        Args:
+            channel_names: The names of the channels.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            The channel values, in the same order as ``channel_names``.
+
+        Raises:
+            FlexLoggerError: if getting the channel values fails.
+        """
+        channel_name_index = _get_channel_name_index(self._channel_name_indexes, channel_names)
+        try:
+            channel_values = await self._read_channel_values(
+                channel_name_index.names, timeout=timeout
+            )
+            return _to_channel_snapshot(channel_name_index, channel_values)
+        except (RpcError, UsageError, ValueError) as error:
+            self._raise_if_application_closed()
+            raise _to_flexlogger_error("Failed to get channel values", error) from error
+
+    async def get_data_rate(self, data_rate_level: DataRateLevel, timeout: float = None) -> float:
+        """Get the data rate for a specific date rate level in Hertz.
+
+        Args:
+            data_rate_level: The data rate level to get the data rate for.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if the data_rate_level is invalid.
+        """
+        return await self._call(_GET_DATA_RATE, timeout, data_rate_level)
+
+    async def get_data_rate_level(self, channel_name: str, timeout: float = None) -> DataRateLevel:
+        """Get the data rate level of the specified channel
+
+        Args:
+            channel_name: The name of the channel.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if getting the data rate level fails.
+        """
+        return await self._call(_GET_DATA_RATE_LEVEL, timeout, channel_name)
+
+    async def get_filtered_channel_names(
+        self,
+        configured_only: bool = False,
+        input_channels: bool = True,
+        output_channels: bool = True,
+        analog_channels: bool = True,
+        digital_channels: bool = True,
+        timeout: float = None,
+    ) -> List[str]:
+        """Get the names of the channels in the document of the specified types.
+
+        A channel is returned if it has one of the selected directions (input or output)
+        and one of the selected kinds (analog or digital).
+
+        Args:
+            configured_only: Whether to return only configured channels.  Defaults to False.
+            input_channels: Whether to return input channels.  Defaults to True.
+            output_channels: Whether to return output channels.  Defaults to True.
+            analog_channels: Whether to return analog channels.  Defaults to True.
+            digital_channels: Whether to return digital channels.  Defaults to True.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if getting the channel names fails.
+        """
+        return await self._call(
+            _GET_FILTERED_CHANNEL_NAMES,
+            timeout,
+            configured_only,
+            input_channels,
+            output_channels,
+            analog_channels,
+            digital_channels,
+        )
+
+    async def is_channel_enabled(self, channel_name: str, timeout: float = None) -> bool:
+        """Get the current enabled state of the specified channel.
+
+        Args:
+            channel_name: The name of the channel.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if getting the channel value fails.
+        """
+        return await self._call(_IS_CHANNEL_ENABLED, timeout, channel_name)
+
+    async def set_channel_enabled(
+        self, channel_name: str, channel_enabled: bool, timeout: float = None
+    ) -> None:
+        """Enable or disable the specified channel.
+
+        Args:
+            channel_name: The name of the channel.
+            channel_enabled: The channel enabled state: true to enable the channel, false to
+                disable it.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if enabling or disabling the channel fails.
+        """
+        await self._call(_SET_CHANNEL_ENABLED, timeout, channel_name, channel_enabled)
+
+    async def is_channel_logging_enabled(self, channel_name: str, timeout: float = None) -> bool:
+        """Get the current logging state of the specified channel.
+
+        Args:
+            channel_name: The name of the channel.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if getting the channel value fails.
+        """
+        return await self._call(_IS_CHANNEL_LOGGING_ENABLED, timeout, channel_name)
+
+    async def set_channel_logging_enabled(
+        self, channel_name: str, channel_logging_enabled: bool, timeout: float = None
+    ) -> None:
+        """Enable or disable logging for the specified channel.
+
+        Args:
+            channel_name: The name of the channel.
+            channel_logging_enabled: The channel logging enabled state: true to enable logging,
+                false to disable it.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if enabling or disabling the channel logging fails.
+        """
+        await self._call(
+            _SET_CHANNEL_LOGGING_ENABLED, timeout, channel_name, channel_logging_enabled
+        )
+
+    async def set_channel_value(
+        self, channel_name: str, channel_value: float, timeout: float = None
+    ) -> None:
+        """Set the current value of the specified channel.
+
+        Args:
+            channel_name: The name of the channel.
+            channel_value: The value to set the channel to.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the channel value fails.
+        """
+        await self._call(_SET_CHANNEL_VALUE, timeout, channel_name, channel_value)
+
+    async def set_channel_values(
+        self,
+        channel_values: Union[Mapping[str, float], Iterable[Tuple[str, float]]],
+        timeout: float = None,
+    ) -> None:
+        """Set the current values of several channels at once.
+
+        Very large numbers of channels are split into several requests, which are sent
+        one after another, in order.
+
+        Args:
+            channel_values: The values to set, either as a mapping from channel name to
+                value or as an iterable of (channel name, value) pairs.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            ValueError: if any of the channel names or values are invalid.  The message
+                lists every invalid entry, and no values are written.
+            FlexLoggerError: if setting the channel values fails.
+        """
+        values_to_set = _validate_channel_values(channel_values)
+        stub = self._stubs.get(_STUB)
+        written_count = 0
+        try:
+            for chunk in _chunk(values_to_set):
+                await stub.SetDoubleChannelValues(
+                    _set_channel_values_request(self._identifier, chunk), timeout=timeout
+                )
+                written_count += len(chunk)
+        except (RpcError, UsageError, ValueError) as error:
+            self._raise_if_application_closed()
+            raise _to_flexlogger_error(
+                _set_channel_values_error_message(written_count, len(values_to_set)), error
+            ) from error
+
+    async def set_data_rate(
+        self, data_rate_level: DataRateLevel, data_rate: float, timeout: float = None
+    ) -> None:
+        """Set the data rate of a specific data rate level.
+
+        Args:
+            data_rate_level: The data rate level to get the data rate for.
+            data_rate: The value of the data rate to set in Hertz.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the data rate fails.
+        """
+        await self._call(_SET_DATA_RATE, timeout, data_rate_level, data_rate)
+
+    async def set_data_rate_level(
+        self, channel_name: str, data_rate_level: DataRateLevel, timeout: float = None
+    ) -> None:
+        """Set the data rate level of the specified channel
+           Note: This may affect other channels in the same module or chassis set to the same
+           data rate level.
+
+        Args:
+            channel_name: The name of the channel.
+            data_rate_level: The data rate level to set.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the data rate level fails.
+        """
+        await self._call(_SET_DATA_RATE_LEVEL, timeout, channel_name, data_rate_level)
+
+    async def _read_channel_values(
+        self, channel_names: Sequence[str], timeout: float = None
+    ) -> List[ChannelSpecificationDocument_pb2.ChannelValue]:
+        stub = self._stubs.get(_STUB)
+        chunks = _chunk(channel_names)
+        responses = await asyncio.gather(
+            *(
+                stub.GetDoubleChannelValues(
+                    _get_channel_values_request(self._identifier, chunk), timeout=timeout
+                )
+                for chunk in chunks
+            )
+        )
+        channel_values = []  # type: List[ChannelSpecificationDocument_pb2.ChannelValue]
+        for chunk, response in zip(chunks, responses):
+            channel_values.extend(_match_channel_values(chunk, response.channel_values))
+        return channel_values
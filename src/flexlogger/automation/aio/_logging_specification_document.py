@@ -0,0 +1,478 @@
+import datetime
+from typing import Any, Callable, List, Optional, Tuple
+
+from ._rpc import _call_rpc
+from .._log_file_type import LogFileType
+from .._logging_specification_document import (
+    _GET_LOG_FILE_BASE_PATH,
+    _GET_LOG_FILE_DESCRIPTION,
+    _GET_LOG_FILE_NAME,
+    _GET_LOG_FILES,
+    _GET_RESOLVED_LOG_FILE_BASE_PATH,
+    _GET_RESOLVED_LOG_FILE_NAME,
+    _GET_START_TRIGGER_SETTINGS,
+    _GET_STOP_TRIGGER_SETTINGS,
+    _GET_TEST_PROPERTIES,
+    _GET_TEST_PROPERTY,
+    _IS_RETRIGGERING_ENABLED,
+    _REMOVE_LOG_FILES,
+    _REMOVE_TEST_PROPERTY,
+    _SET_LOG_FILE_BASE_PATH,
+    _SET_LOG_FILE_DESCRIPTION,
+    _SET_LOG_FILE_NAME,
+    _SET_RETRIGGERING,
+    _SET_TEST_PROPERTIES,
+    _SET_TEST_PROPERTY,
+    _SET_TEST_START_TRIGGER_SETTINGS,
+    _SET_TEST_STOP_TRIGGER_SETTINGS,
+    _SET_TIME_START_TRIGGER_SETTINGS,
+    _SET_TIME_STOP_TRIGGER_SETTINGS,
+    _SET_VALUE_CHANGE_START_TRIGGER_SETTINGS,
+    _SET_VALUE_CHANGE_STOP_TRIGGER_SETTINGS,
+)
+from .._rpc import _Rpc
+from .._stop_trigger_condition import StopTriggerCondition
+from .._stub_registry import StubRegistry
+from .._test_property import TestProperty
+from .._value_change_condition import ValueChangeCondition
+from ..proto.Identifiers_pb2 import ElementIdentifier
+
+
+class LoggingSpecificationDocument:
+    """Represents a document that describes how data is logged.
+
+    Do not create this class directly; instead, use the return value of
+    :meth:`.aio.Project.open_logging_specification_document`.
+    """
+
+    def __init__(
+        self,
+        stubs: StubRegistry,
+        raise_if_application_closed: Callable[[], None],
+        identifier: ElementIdentifier,
+    ) -> None:
+        self._stubs = stubs
+        self._raise_if_application_closed = raise_if_application_closed
+        self._identifier = identifier
+
+    async def _call(self, rpc: _Rpc, timeout: Optional[float], *args: Any) -> Any:
+        return await _call_rpc(
+            rpc, self._stubs, self._raise_if_application_closed, timeout, self._identifier, *args
+        )
+
+    async def get_log_file_base_path(self, timeout: float = None) -> str:
+        """Get the log file base path.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            The base path for the log file.
+
+        Raises:
+            FlexLoggerError: if getting the log file base path fails.
+        """
+        return await self._call(_GET_LOG_FILE_BASE_PATH, timeout)
+
+    async def get_resolved_log_file_base_path(self, timeout: float = None) -> str:
+        """Get the resolved log file base path.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            The resolved base path for the log file.
+            The resolved base path will have any placeholders replaced with
+            actual values. Note that time sourced placeholders such as
+            {Second} are resolved at the time of the call, and may resolve
+            to a different time on a subsequent call or when a log file is created.
+
+        Raises:
+            FlexLoggerError: if getting the resolved log file base path fails.
+        """
+        return await self._call(_GET_RESOLVED_LOG_FILE_BASE_PATH, timeout)
+
+    async def set_log_file_base_path(self, log_file_base_path: str, timeout: float = None) -> None:
+        """Set the log file base path.
+
+        Args:
+            log_file_base_path: The log file base path.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the log file base path fails.
+        """
+        await self._call(_SET_LOG_FILE_BASE_PATH, timeout, log_file_base_path)
+
+    async def get_log_file_name(self, timeout: float = None) -> str:
+        """Get the log file name.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            The file name that will be logged to.
+
+        Raises:
+            FlexLoggerError: if getting the log file name fails.
+        """
+        return await self._call(_GET_LOG_FILE_NAME, timeout)
+
+    async def get_resolved_log_file_name(self, timeout: float = None) -> str:
+        """Get the resolved log file name.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            The resolved file name that will be logged to.
+            The resolved file name will have any placeholders replaced with
+            actual values. Note that time sourced placeholders such as
+            {Second} are resolved at the time of the call, and may resolve
+            to a different time on a subsequent call or when a log file is created.
+
+        Raises:
+            FlexLoggerError: if getting the resolved log file name fails.
+        """
+        return await self._call(_GET_RESOLVED_LOG_FILE_NAME, timeout)
+
+    async def set_log_file_name(self, log_file_name: str, timeout: float = None) -> None:
+        """Set the log file name.
+
+        Args:
+            log_file_name: The log file name.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the log file name fails.
+        """
+        await self._call(_SET_LOG_FILE_NAME, timeout, log_file_name)
+
+    async def get_log_file_description(self, timeout: float = None) -> str:
+        """Get the log file description.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            The description of the log file.
+
+        Raises:
+            FlexLoggerError: if getting the log file description fails.
+        """
+        return await self._call(_GET_LOG_FILE_DESCRIPTION, timeout)
+
+    async def set_log_file_description(
+        self, log_file_description: str, timeout: float = None
+    ) -> None:
+        """Set the log file description.
+
+        Args:
+            log_file_description: The log file description.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the log file description fails.
+        """
+        await self._call(_SET_LOG_FILE_DESCRIPTION, timeout, log_file_description)
+
+    async def get_log_files(self, log_file_type: LogFileType, timeout: float = None) -> List[str]:
+        """Get log files in the data files pane of the project.
+
+        Args:
+            log_file_type: The type of log files to get.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            A list of the log files in the project.
+            The entries are sorted chronologically with the most recent file last.
+
+        Raises:
+            FlexLoggerError: if getting the log files fails.
+        """
+        return await self._call(_GET_LOG_FILES, timeout, log_file_type)
+
+    async def remove_log_files(self, delete_files: bool = False, timeout: float = None) -> None:
+        """Remove log files from the data files pane of the project.
+
+        Args:
+            delete_files: True to delete files on disk, False to remove only from project.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if removing the log files fails.
+        """
+        await self._call(_REMOVE_LOG_FILES, timeout, delete_files)
+
+    async def get_test_properties(self, timeout: float = None) -> List[TestProperty]:
+        """Get all test properties.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            A list of the test properties on this document.
+
+        Raises:
+            FlexLoggerError: if getting the test properties fails.
+        """
+        return await self._call(_GET_TEST_PROPERTIES, timeout)
+
+    async def set_test_properties(
+        self, test_properties: List[TestProperty], timeout: float = None
+    ) -> None:
+        """Set test properties.
+
+        Args:
+            test_properties: A list of test properties to add or modify on this document.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the test properties fails.
+        """
+        if len(test_properties) == 0:
+            return
+        await self._call(_SET_TEST_PROPERTIES, timeout, test_properties)
+
+    async def get_test_property(
+        self, test_property_name: str, timeout: float = None
+    ) -> TestProperty:
+        """Get the test property with the specified name.
+
+        Throws a :class:`FlexLoggerError` if a property with the
+        specified name does not exist.
+
+        Args:
+            test_property_name: The name of the test property.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            The :class:`TestProperty` with the specified name.
+
+        Raises:
+            FlexLoggerError: if a property with the specified name does
+                not exist, or if getting the property fails.
+        """
+        return await self._call(_GET_TEST_PROPERTY, timeout, test_property_name)
+
+    async def set_test_property(
+        self,
+        property_name: str,
+        property_value: str,
+        prompt_on_start: bool = False,
+        timeout: float = None,
+    ) -> None:
+        """Set the information for a test property.
+
+        Use this method to add a new test property or to modify an existing
+        test property.
+
+        Args:
+            property_name: The name of the test property. If a test property
+                already exists with the same :attr:`~TestProperty.name`, that test property
+                will be updated with the new information passed to this method. Otherwise, a new
+                test property will be created to reflect the specified test information.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+            property_value: The property value to set.
+
+            prompt_on_start: Whether this property should be set when the test session starts.
+                Defaults to False. If this is set to True, the operator should be prompted to
+                define this property when the test session starts.
+
+        Raises:
+            FlexLoggerError: if setting the property fails.
+        """
+        await self._call(
+            _SET_TEST_PROPERTY, timeout, property_name, property_value, prompt_on_start
+        )
+
+    async def remove_test_property(self, test_property_name: str, timeout: float = None) -> None:
+        """Removes the test property with the specified name.
+
+        Args:
+            test_property_name: The name of the test property.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if a property with the specified name does not
+                exist, or if removing the property fails.
+        """
+        await self._call(_REMOVE_TEST_PROPERTY, timeout, test_property_name)
+
+    async def get_start_trigger_settings(self, timeout: float = None):
+        """Get the start trigger settings.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            A tuple containing 2 strings:
+            - The start trigger condition
+            - The start trigger settings
+              The object returned varies based on the start trigger condition.
+                - When the start trigger condition is TEST_START, the object is None
+                - When the start trigger condition is CHANNEL_VALUE_CHANGE, the object is of
+                  type ValueChangeCondition
+                - When the start trigger condition is ABSOLUTE_TIME, the object is a datetime
+                  object containing the test start time.
+
+        Raises:
+            FlexLoggerError: if getting the start trigger settings fails.
+        """
+        return await self._call(_GET_START_TRIGGER_SETTINGS, timeout)
+
+    async def get_stop_trigger_settings(
+        self, timeout: float = None
+    ) -> Tuple[StopTriggerCondition, str]:
+        """Get the stop trigger settings.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            A tuple containing 2 strings:
+            - The stop trigger condition
+            - The stop trigger settings
+              The object returned varies based on the stop trigger condition.
+                - When the stop trigger condition is TEST_STOP, the object is None
+                - When the stop trigger condition is CHANNEL_VALUE_CHANGE, the object is of
+                  type ValueChangeCondition
+                - When the stop trigger condition is TEST_TIME_ELAPSED, the object is a string
+                  containing the test duration
+
+        Raises:
+            FlexLoggerError: if getting the stop trigger settings fails.
+        """
+        return await self._call(_GET_STOP_TRIGGER_SETTINGS, timeout)
+
+    async def set_start_trigger_settings_to_test_start(self, timeout: float = None) -> None:
+        """Set the start trigger to Test Start
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the start trigger fails.
+        """
+        await self._call(_SET_TEST_START_TRIGGER_SETTINGS, timeout)
+
+    async def set_start_trigger_settings_to_value_change(
+        self, value_change_condition: ValueChangeCondition, timeout: float = None
+    ) -> None:
+        """Set the start trigger to Channel Value Change
+
+        Args:
+            value_change_condition: The value change parameters as an object of type
+                ValueChangeCondition
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the start trigger fails.
+        """
+        await self._call(_SET_VALUE_CHANGE_START_TRIGGER_SETTINGS, timeout, value_change_condition)
+
+    async def set_start_trigger_settings_to_absolute_time(
+        self, time: datetime.datetime, timeout: float = None
+    ) -> None:
+        """Set the start trigger to Absolute Time
+
+        Args:
+            time: Test start time. If it's timezone-naive, it's assumed to be in UTC.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the start trigger fails.
+        """
+        await self._call(_SET_TIME_START_TRIGGER_SETTINGS, timeout, time)
+
+    async def set_stop_trigger_settings_to_test_stop(self, timeout: float = None) -> None:
+        """Set the stop trigger to Test Stop
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the stop trigger fails.
+        """
+        await self._call(_SET_TEST_STOP_TRIGGER_SETTINGS, timeout)
+
+    async def set_stop_trigger_settings_to_value_change(
+        self, value_change_condition: ValueChangeCondition, timeout: float = None
+    ) -> None:
+        """Set the stop trigger to Channel Value Change
+
+        Args:
+            value_change_condition: The value change parameters as an object of type
+                ValueChangeCondition
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the stop trigger fails.
+        """
+        await self._call(_SET_VALUE_CHANGE_STOP_TRIGGER_SETTINGS, timeout, value_change_condition)
+
+    async def set_stop_trigger_settings_to_duration(
+        self, duration: datetime.timedelta, timeout: float = None
+    ) -> None:
+        """Set the stop trigger to Test Time Elapsed
+
+        Args:
+            duration: The length of time after which to stop the test.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the stop trigger fails.
+        """
+        await self._call(_SET_TIME_STOP_TRIGGER_SETTINGS, timeout, duration)
+
+    async def is_retriggering_enabled(self, timeout: float = None) -> bool:
+        """Get the re-triggering configuration.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            True if re-triggering is enabled, False otherwise
+
+        Raises:
+            FlexLoggerError: if getting the re-triggering configuration fails.
+        """
+        return await self._call(_IS_RETRIGGERING_ENABLED, timeout)
+
+    async def set_retriggering(self, retriggering: bool, timeout: float = None) -> None:
+        """Set the re-triggering configuration.
+
+        Args:
+            retriggering: True to enable re-triggering, False to disable it.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if setting the re-triggering configuration fails.
+        """
+        await self._call(_SET_RETRIGGERING, timeout, retriggering)
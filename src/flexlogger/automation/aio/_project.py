@@ -0,0 +1,203 @@
+import os.path
+import pathlib
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from google.protobuf import empty_pb2
+from grpc import RpcError
+from grpc.aio import UsageError
+
+from ._channel_specification_document import ChannelSpecificationDocument
+from ._logging_specification_document import LoggingSpecificationDocument
+from ._test_session import TestSession
+from .._flexlogger_error import _to_flexlogger_error
+from .._stub_registry import StubRegistry
+from ..proto import (
+    Project_pb2,  # type: ignore
+    Project_pb2_grpc,  # type: ignore
+)
+from ..proto.Identifiers_pb2 import ProjectIdentifier
+
+
+class Project:
+    """Represents a FlexLogger project.
+
+    Do not create this class directly; instead, use the return value of
+    :meth:`.aio.Application.open_project`.
+
+    The documents opened from a project are cached, so opening a document again returns
+    the same object without asking FlexLogger for it, until the project is closed.
+    """
+
+    def __init__(
+        self,
+        stubs: StubRegistry,
+        raise_if_application_closed: Callable[[], None],
+        identifier: ProjectIdentifier,
+    ) -> None:
+        self._stubs = stubs
+        self._raise_if_application_closed = raise_if_application_closed
+        self._identifier = identifier
+        # The documents opened from this project, keyed by the name of the method that
+        # opened them
+        self._documents = {}  # type: Dict[str, Any]
+        self._test_session = TestSession(self._stubs, raise_if_application_closed)
+
+    async def open_channel_specification_document(
+        self, timeout: float = None, use_cache: bool = True
+    ) -> ChannelSpecificationDocument:
+        """Open the channel specification document in the project.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+            use_cache: Whether to return the document opened by an earlier call, if any,
+                instead of asking FlexLogger for it again.  Defaults to True.  If False,
+                the document is opened again and replaces the cached one.
+
+        Returns:
+            The opened document.
+
+        Raises:
+            FlexLoggerError: if opening the document fails.
+        """
+        if use_cache:
+            cached_document = self._documents.get("OpenChannelSpecificationDocument")
+            if cached_document is not None:
+                return cached_document
+        stub = self._stubs.get(Project_pb2_grpc.ProjectStub)
+        try:
+            response = await stub.OpenChannelSpecificationDocument(
+                Project_pb2.OpenChannelSpecificationDocumentRequest(project=self._identifier),
+                timeout=timeout,
+            )
+            document = ChannelSpecificationDocument(
+                self._stubs, self._raise_if_application_closed, response.document_identifier
+            )
+            self._documents["OpenChannelSpecificationDocument"] = document
+            return document
+        except (RpcError, UsageError, ValueError) as error:
+            self._raise_if_application_closed()
+            raise _to_flexlogger_error(
+                "Failed to open channel specification document", error
+            ) from error
+
+    async def open_logging_specification_document(
+        self, timeout: float = None, use_cache: bool = True
+    ) -> LoggingSpecificationDocument:
+        """Open the logging specification document in the project.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+            use_cache: Whether to return the document opened by an earlier call, if any,
+                instead of asking FlexLogger for it again.  Defaults to True.  If False,
+                the document is opened again and replaces the cached one.
+
+        Returns:
+            The opened document.
+
+        Raises:
+            FlexLoggerError: if opening the document fails.
+        """
+        if use_cache:
+            cached_document = self._documents.get("OpenLoggingSpecificationDocument")
+            if cached_document is not None:
+                return cached_document
+        stub = self._stubs.get(Project_pb2_grpc.ProjectStub)
+        try:
+            response = await stub.OpenLoggingSpecificationDocument(
+                Project_pb2.OpenLoggingSpecificationDocumentRequest(project=self._identifier),
+                timeout=timeout,
+            )
+            document = LoggingSpecificationDocument(
+                self._stubs, self._raise_if_application_closed, response.document_identifier
+            )
+            self._documents["OpenLoggingSpecificationDocument"] = document
+            return document
+        except (RpcError, UsageError, ValueError) as error:
+            self._raise_if_application_closed()
+            raise _to_flexlogger_error(
+                "Failed to open logging specification document", error
+            ) from error
+
+    async def close(self, timeout: float = None) -> None:
+        """Close the project.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if closing the project fails.
+        """
+        stub = self._stubs.get(Project_pb2_grpc.ProjectStub)
+        try:
+            await stub.Close(
+                Project_pb2.CloseProjectRequest(allow_prompts=False, project=self._identifier),
+                timeout=timeout,
+            )
+            self._documents.clear()
+        except (RpcError, UsageError, ValueError) as error:
+            self._raise_if_application_closed()
+            raise _to_flexlogger_error("Failed to close project", error) from error
+
+    async def save(self, timeout: float = None) -> None:
+        """Save the project.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if saving the project fails.
+        """
+        stub = self._stubs.get(Project_pb2_grpc.ProjectStub)
+        try:
+            await stub.Save(empty_pb2.Empty(), timeout=timeout)
+        except (RpcError, UsageError, ValueError) as error:
+            self._raise_if_application_closed()
+            raise _to_flexlogger_error("Failed to save project", error) from error
+
+    @property
+    def test_session(self) -> TestSession:
+        """Get the test session for the project."""
+        return self._test_session
+
+    @property
+    def project_file_path(self) -> Awaitable[Optional[pathlib.Path]]:
+        """Get the project file path on disk
+
+        This property must be awaited: ``path = await project.project_file_path``.
+
+        Returns: The saved project file path if it exists, None otherwise
+        """
+        return self._get_project_file_path()
+
+    @property
+    def project_name(self) -> Awaitable[Optional[str]]:
+        """Get the project name
+
+        This property must be awaited: ``name = await project.project_name``.
+
+        Returns: The project name if the file path exists, None otherwise
+        """
+        return self._get_project_name()
+
+    async def _get_project_file_path(self, timeout: float = None) -> Optional[pathlib.Path]:
+        stub = self._stubs.get(Project_pb2_grpc.ProjectStub)
+        try:
+            response = await stub.GetProjectFilePath(
+                Project_pb2.GetProjectFilePathRequest(project=self._identifier), timeout=timeout
+            )
+            # return a Path() if the returned path is not empty, otherwise return None
+            # pathlib.Path() treats empty string as "current directory" which could be confusing
+            return pathlib.Path(response.project_file_path) if response.project_file_path else None
+        except (RpcError, UsageError, ValueError) as error:
+            self._raise_if_application_closed()
+            raise _to_flexlogger_error("Failed to get project file path", error) from error
+
+    async def _get_project_name(self, timeout: float = None) -> Optional[str]:
+        project_path = await self._get_project_file_path(timeout=timeout)
+        if project_path is None:
+            return None
+        return os.path.basename(os.path.splitext(project_path)[0])
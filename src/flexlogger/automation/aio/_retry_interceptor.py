@@ -0,0 +1,29 @@
+import asyncio
+from typing import Any, Callable
+
+from grpc.aio import UnaryUnaryClientInterceptor
+
+from .._retry_interceptor import _RetryInterceptorBase
+
+
+class _RetryInterceptor(_RetryInterceptorBase, UnaryUnaryClientInterceptor):
+    """Retries unary calls that only read from FlexLogger when they fail with a transient error.
+
+    If a call has a timeout, it is the time allowed for every attempt and backoff together,
+    and the call is not retried once that time has run out.
+    """
+
+    async def intercept_unary_unary(
+        self, continuation: Callable, client_call_details: Any, request: Any
+    ) -> Any:
+        attempts = self._start_attempts(client_call_details)
+        if attempts is None:
+            return await continuation(client_call_details, request)
+        while True:
+            call = await continuation(attempts.client_call_details, request)
+            # Waiting for the status code, rather than the response, does not raise if the
+            # call failed.
+            backoff = attempts.backoff_after(await call.code())
+            if backoff is None:
+                return call
+            await asyncio.sleep(backoff)
@@ -0,0 +1,31 @@
+from typing import Any, Callable
+
+from grpc import RpcError
+from grpc.aio import UsageError
+
+from .._flexlogger_error import _to_flexlogger_error
+from .._rpc import _Rpc
+from .._stub_registry import StubRegistry
+
+
+async def _call_rpc(
+    rpc: _Rpc,
+    stubs: StubRegistry,
+    raise_if_application_closed: Callable[[], None],
+    timeout: float = None,
+    *args: Any
+) -> Any:
+    """Make an RPC and return the result read from its response.
+
+    This is the asynchronous version of :meth:`._Rpc.call`.
+
+    Raises:
+        FlexLoggerError: if the RPC fails.
+    """
+    stub = stubs.get(rpc.stub_class)
+    try:
+        response = await getattr(stub, rpc.method_name)(rpc.build_request(*args), timeout=timeout)
+        return rpc.read_response(response)
+    except (RpcError, UsageError, ValueError) as error:
+        raise_if_application_closed()
+        raise _to_flexlogger_error(rpc.error_message, error) from error
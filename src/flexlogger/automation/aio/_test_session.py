@@ -0,0 +1,143 @@
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Optional
+
+from ._rpc import _call_rpc
+from .._rpc import _Rpc
+from .._stub_registry import StubRegistry
+from .._test_session import (
+    _ADD_NOTE,
+    _GET_ELAPSED_TEST_TIME,
+    _GET_STATE,
+    _PAUSE,
+    _RESUME,
+    _START,
+    _STOP,
+)
+from .._test_session_state import TestSessionState
+
+
+class TestSession:
+    """Represents a test session for a project.
+
+    Do not create this class directly; instead, use the property
+    :attr:`.aio.Project.test_session`.
+    """
+
+    def __init__(
+        self, stubs: StubRegistry, raise_if_application_closed: Callable[[], None]
+    ) -> None:
+        self._stubs = stubs
+        self._raise_if_application_closed = raise_if_application_closed
+
+    async def _call(self, rpc: _Rpc, timeout: Optional[float], *args: Any) -> Any:
+        return await _call_rpc(rpc, self._stubs, self._raise_if_application_closed, timeout, *args)
+
+    async def add_note(self, note: str, timeout: float = None) -> None:
+        """Add a note to the current log file.
+
+        This method requires the test session to be in the
+        :attr:`.TestSessionState.RUNNING` state.
+
+        Args:
+            note: The note to add to the log file.
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Raises:
+            FlexLoggerError: if the test session is not in the
+                :attr:`.TestSessionState.RUNNING` state, or if adding the note fails.
+        """
+        await self._call(_ADD_NOTE, timeout, note)
+
+    @property
+    def state(self) -> Awaitable[TestSessionState]:
+        """Get the current state of the test session.
+
+        This property must be awaited: ``state = await test_session.state``.
+
+        Raises:
+            FlexLoggerError: if getting the current state fails.
+        """
+        return self._get_state()
+
+    async def start(self, timeout: float = None) -> bool:
+        """Start the test session, if possible.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            True if the test was started, otherwise False.
+
+        Raises:
+            FlexLoggerError: if starting the test session fails.
+        """
+        return await self._call(_START, timeout)
+
+    async def stop(self, timeout: float = None) -> bool:
+        """Stop the test session, if possible.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            True if the test was stopped, otherwise False.
+
+        Raises:
+            FlexLoggerError: if stopping the test session fails.
+        """
+        return await self._call(_STOP, timeout)
+
+    async def pause(self, timeout: float = None) -> bool:
+        """Pauses the test session, if possible.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            True if the test was paused, otherwise False.
+
+        Raises:
+            FlexLoggerError: if pausing the test session fails.
+        """
+        return await self._call(_PAUSE, timeout)
+
+    async def resume(self, timeout: float = None) -> bool:
+        """Resumes the test session, if possible.
+
+        Args:
+            timeout: The time, in seconds, to wait for FlexLogger to respond.
+                Defaults to None, meaning the application's :class:`.TimeoutPolicy` is used.
+
+        Returns:
+            True if the test was resumed, otherwise False.
+
+        Raises:
+            FlexLoggerError: if resuming the test session fails.
+        """
+        return await self._call(_RESUME, timeout)
+
+    @property
+    def elapsed_test_time(self) -> Awaitable[timedelta]:
+        """Queries the elapsed test time
+
+        This property must be awaited: ``elapsed = await test_session.elapsed_test_time``.
+
+        Returns:
+            The current tests's elapsed time if a test is running or paused,
+            the most recent test's elapsed time if a test has been run and stopped.
+
+        Raises:
+            FlexLoggerError: if no test has ever been run since the project was loaded
+        """
+        return self._get_elapsed_test_time()
+
+    async def _get_state(self, timeout: float = None) -> TestSessionState:
+        self._raise_if_application_closed()
+        return await self._call(_GET_STATE, timeout)
+
+    async def _get_elapsed_test_time(self, timeout: float = None) -> timedelta:
+        return await self._call(_GET_ELAPSED_TEST_TIME, timeout)
@@ -0,0 +1,24 @@
+from typing import Any, Callable
+
+from grpc.aio import UnaryUnaryClientInterceptor
+
+from .._timeout_policy import _MethodTimeouts, TimeoutPolicy
+
+
+class _TimeoutInterceptor(UnaryUnaryClientInterceptor):
+    """Gives unary calls that were made without a timeout the timeout from a policy."""
+
+    def __init__(self, policy: TimeoutPolicy) -> None:
+        self._timeouts = _MethodTimeouts(policy)
+
+    async def intercept_unary_unary(
+        self, continuation: Callable, client_call_details: Any, request: Any
+    ) -> Any:
+        if client_call_details.timeout is None:
+            method = client_call_details.method
+            if isinstance(method, bytes):
+                method = method.decode("utf-8")
+            timeout = self._timeouts.get(method)
+            if timeout is not None:
+                client_call_details = client_call_details._replace(timeout=timeout)
+        return await continuation(client_call_details, request)
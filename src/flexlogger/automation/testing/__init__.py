@@ -0,0 +1,15 @@
+# flake8: noqa
+"""Tools for testing and benchmarking FlexLogger automation clients without FlexLogger.
+
+:class:`FakeFlexLoggerServer` runs an in-process fake of the FlexLogger automation server
+that clients can connect to with ``Application(server_port=server.port)``.
+"""
+
+from ._fake_server import FakeFlexLoggerServer
+from ._fake_channel import FakeChannel
+from ._scripted_event import ScriptedEvent
+from ._waveforms import Waveform
+from ._waveforms import ConstantWaveform
+from ._waveforms import SineWaveform
+from ._waveforms import SquareWaveform
+from ._waveforms import SawtoothWaveform
@@ -0,0 +1,45 @@
+from typing import Union
+
+from ._waveforms import ConstantWaveform, Waveform
+from .._data_rate_level import DataRateLevel
+
+
+class FakeChannel:
+    """The configuration of one channel of a :class:`.FakeFlexLoggerServer`.
+
+    Reading an input channel returns the value of its waveform at the server's clock time.
+    Output channels return the last value written to them, starting with the waveform's
+    value at time zero.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        waveform: Union[Waveform, float] = 0.0,
+        is_output: bool = False,
+        is_digital: bool = False,
+        enabled: bool = True,
+        logging_enabled: bool = True,
+        data_rate_level: DataRateLevel = DataRateLevel.SLOW,
+    ) -> None:
+        """Create a new FakeChannel.
+
+        Args:
+            name: The channel name.
+            waveform: The channel's signal, or a number for a constant value.
+            is_output: Whether the channel is an output channel, which clients can write.
+            is_digital: Whether the channel is a digital channel.
+            enabled: Whether the channel is enabled.
+            logging_enabled: Whether logging is enabled for the channel.
+            data_rate_level: The channel's data rate level.
+        """
+        self.name = name
+        self.waveform = waveform if isinstance(waveform, Waveform) else ConstantWaveform(waveform)
+        self.is_output = is_output
+        self.is_digital = is_digital
+        self.enabled = enabled
+        self.logging_enabled = logging_enabled
+        self.data_rate_level = data_rate_level
+
+    def __repr__(self) -> str:
+        return "FakeChannel(%r, %r, is_output=%r)" % (self.name, self.waveform, self.is_output)
@@ -0,0 +1,287 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import grpc
+
+from ._fake_channel import FakeChannel
+from ._scripted_event import ScriptedEvent
+from ._servicers import _add_servicers_to_server, _FakeFlexLoggerState
+from .._event_type import EventType
+
+
+class _LatencyInterceptor(grpc.ServerInterceptor):
+    """Delays unary calls by the server's configured latency, fails the calls the server
+    was told to fail, rejects document calls for a project that is not open, and counts
+    every call.
+    """
+
+    def __init__(self, server: "FakeFlexLoggerServer") -> None:
+        self._server = server
+
+    def intercept_service(self, continuation, handler_call_details):  # type: ignore
+        handler = continuation(handler_call_details)
+        service_name, method_name = handler_call_details.method.rsplit("/", 2)[-2:]
+        self._server._count_call(method_name)
+        if handler is None or handler.unary_unary is None:
+            return handler
+        failure_code = self._server._take_failure(method_name)
+        if failure_code is not None:
+
+            def failing_behavior(request, context):  # type: ignore
+                context.abort(failure_code, "Injected failure")
+
+            return self._replace_behavior(handler, failing_behavior)
+        behavior = handler.unary_unary
+        if service_name.endswith("Document"):
+            # Every document call identifies the document, and so the project it is in.
+            document_behavior = behavior
+            state = self._server._state
+
+            def checked_behavior(request, context):  # type: ignore
+                with state.lock:
+                    project_id = state.project_id
+                if request.document_identifier.project_id != project_id:
+                    context.abort(grpc.StatusCode.NOT_FOUND, "The project is not open")
+                return document_behavior(request, context)
+
+            behavior = checked_behavior
+        latency = self._server.method_latencies.get(method_name, self._server.latency)
+        if latency > 0:
+            undelayed_behavior = behavior
+
+            def delayed_behavior(request, context):  # type: ignore
+                time.sleep(latency)
+                return undelayed_behavior(request, context)
+
+            behavior = delayed_behavior
+        if behavior is handler.unary_unary:
+            return handler
+        return self._replace_behavior(handler, behavior)
+
+    @staticmethod
+    def _replace_behavior(handler, behavior):  # type: ignore
+        return grpc.unary_unary_rpc_method_handler(
+            behavior,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+
+class FakeFlexLoggerServer:
+    """An in-process stand-in for the FlexLogger automation server.
+
+    The fake implements the FlexLoggerApplication, Project, TestSession,
+    ChannelSpecificationDocument, LoggingSpecificationDocument and FlexLoggerEvents services
+    (and Disconnect from the Application service) in memory, so clients can be tested and
+    benchmarked without FlexLogger, on any platform::
+
+        channels = [FakeChannel("Temperature", SineWaveform(5, 0.1, 20))]
+        with FakeFlexLoggerServer(channels, latency=0.001) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channels = project.open_channel_specification_document()
+                print(channels.get_channel_value("Temperature"))
+
+    Projects are not read from disk: opening any path succeeds, and every project has the
+    same channels.  Starting and stopping the test session sends the test session and log
+    file events FlexLogger would, and other events can be sent with :meth:`send_event` or
+    :meth:`play_events`.
+    """
+
+    def __init__(
+        self,
+        channels: Optional[Iterable[Union[FakeChannel, str]]] = None,
+        latency: float = 0.0,
+        method_latencies: Optional[Mapping[str, float]] = None,
+        clock: Optional[Callable[[], float]] = None,
+        version: Tuple[str, str] = ("0.0.0.0", "Fake FlexLogger"),
+        max_workers: int = 10,
+    ) -> None:
+        """Create a new FakeFlexLoggerServer.
+
+        Args:
+            channels: The project's channels.  Names are converted to input channels with a
+                constant value of zero.  Omit this argument or pass None for a single
+                channel named "Channel 1".
+            latency: The time, in seconds, to wait before handling each call, to simulate
+                a slower server.  Event streams are not delayed.
+            method_latencies: Latencies for individual methods, which override
+                ``latency``.  The keys are method names, like "GetDoubleChannelValues".
+            clock: A function that returns the time, in seconds, since the server started.
+                It is used for the channel waveforms and the elapsed test time.  Omit this
+                argument or pass None to use the time since :meth:`start` was called.
+            version: The internal and user visible versions to report.
+            max_workers: The number of threads that handle calls.  Each open event stream
+                uses one of them.
+        """
+        if latency < 0:
+            raise ValueError("latency must not be negative")
+        self.latency = latency
+        self.method_latencies = dict(method_latencies or {})  # type: Dict[str, float]
+        self._start_time = time.monotonic()
+        self._state = _FakeFlexLoggerState(
+            (
+                channel if isinstance(channel, FakeChannel) else FakeChannel(channel)
+                for channel in (channels or [])
+            ),
+            clock if clock is not None else self._time_since_start,
+        )
+        self._version = version
+        self._max_workers = max_workers
+        self._call_counts = {}  # type: Dict[str, int]
+        self._call_counts_lock = threading.Lock()
+        self._failures = {}  # type: Dict[str, List[grpc.StatusCode]]
+        self._server = None  # type: Optional[grpc.Server]
+        self._port = 0
+
+    def __enter__(self) -> "FakeFlexLoggerServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def port(self) -> int:
+        """The port the server is listening on, or 0 if it is not running."""
+        return self._port
+
+    @property
+    def channels(self) -> List[FakeChannel]:
+        """The project's channels."""
+        with self._state.lock:
+            return list(self._state.channels.values())
+
+    @property
+    def call_counts(self) -> Dict[str, int]:
+        """The number of calls made to each method, keyed by method name."""
+        with self._call_counts_lock:
+            return dict(self._call_counts)
+
+    @property
+    def notes(self) -> List[str]:
+        """The notes added to the test session."""
+        with self._state.lock:
+            return list(self._state.notes)
+
+    def start(self) -> None:
+        """Start listening on a free port on localhost."""
+        if self._server is not None:
+            return
+        self._start_on_port(0)
+
+    def stop(self) -> None:
+        """End the event streams and stop the server."""
+        if self._server is None:
+            return
+        with self._state.lock:
+            self._state.end_event_streams()
+        self._server.stop(grace=None)
+        self._server = None
+        self._port = 0
+
+    def fail_next_calls(
+        self, method_name: str, count: int = 1, code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE
+    ) -> None:
+        """Make the next calls to a method fail, to simulate a transient error.
+
+        Args:
+            method_name: The name of the method, like "GetDoubleChannelValue".
+            count: The number of calls to fail.
+            code: The status code the calls fail with.
+        """
+        with self._call_counts_lock:
+            self._failures.setdefault(method_name, []).extend([code] * count)
+
+    def restart(self, downtime: float = 0.0) -> None:
+        """Simulate FlexLogger closing and starting again on the same port.
+
+        The event streams end, and the open project, test session, notes, log files and
+        output channel values are forgotten, so the identifiers clients were given are no
+        longer valid.  The channels and their waveforms are kept.
+
+        Args:
+            downtime: The time, in seconds, to wait before starting again.
+        """
+        port = self._port
+        self.stop()
+        with self._state.lock:
+            channels = list(self._state.channels.values())
+            clock = self._state.clock
+        self._state = _FakeFlexLoggerState(channels, clock)
+        if downtime > 0:
+            time.sleep(downtime)
+        self._start_on_port(port)
+
+    def get_channel_value(self, channel_name: str) -> float:
+        """Get the value a client would read from a channel now."""
+        with self._state.lock:
+            channel = self._state.channels[channel_name]
+            if channel.is_output:
+                return self._state.output_values[channel_name]
+            return channel.waveform.value_at(self._state.clock())
+
+    def send_event(self, event_type: EventType, event_name: str, payload: str = "") -> None:
+        """Send an event to every client that is subscribed to its type.
+
+        Args:
+            event_type: The type of the event.
+            event_name: The name of the event (see :mod:`.EventNames`).
+            payload: The event payload.
+        """
+        with self._state.lock:
+            self._state.send_event(event_type.to_event_type_pb2(), event_name, payload)
+
+    def play_events(self, events: Iterable[ScriptedEvent]) -> threading.Thread:
+        """Send a script of events on a background thread.
+
+        Events are scheduled relative to when the script starts, so the delays do not
+        accumulate the time taken to send each event.
+
+        Args:
+            events: The events to send, in order.
+
+        Returns:
+            The thread that sends the events.  Join it to wait for the script to finish.
+        """
+        script = list(events)
+
+        def play() -> None:
+            send_time = time.perf_counter()
+            for event in script:
+                send_time += event.delay
+                delay = send_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                self.send_event(event.event_type, event.event_name, event.payload)
+
+        thread = threading.Thread(target=play, name="FlexLogger fake event script", daemon=True)
+        thread.start()
+        return thread
+
+    def _time_since_start(self) -> float:
+        return time.monotonic() - self._start_time
+
+    def _count_call(self, method_name: str) -> None:
+        with self._call_counts_lock:
+            self._call_counts[method_name] = self._call_counts.get(method_name, 0) + 1
+
+    def _take_failure(self, method_name: str) -> Optional[grpc.StatusCode]:
+        with self._call_counts_lock:
+            failures = self._failures.get(method_name)
+            if not failures:
+                return None
+            return failures.pop(0)
+
+    def _start_on_port(self, port: int) -> None:
+        server = grpc.server(
+            ThreadPoolExecutor(max_workers=self._max_workers),
+            interceptors=[_LatencyInterceptor(self)],
+        )
+        _add_servicers_to_server(server, self._state, self._version)
+        self._port = server.add_insecure_port("localhost:%d" % port)
+        self._start_time = time.monotonic()
+        server.start()
+        self._server = server
@@ -0,0 +1,28 @@
+from .._event_type import EventType
+
+
+class ScriptedEvent:
+    """An event for :meth:`.FakeFlexLoggerServer.play_events` to send."""
+
+    def __init__(
+        self, delay: float, event_type: EventType, event_name: str, payload: str = ""
+    ) -> None:
+        """Create a new ScriptedEvent.
+
+        Args:
+            delay: The time, in seconds, to wait after the previous event (or after the
+                script starts, for the first event) before sending this one.
+            event_type: The type of the event.
+            event_name: The name of the event (see :mod:`.EventNames`).
+            payload: The event payload.  For alarm events, this is the alarm's JSON
+                description; for log file events, it is the file path.
+        """
+        if delay < 0:
+            raise ValueError("delay must not be negative")
+        self.delay = delay
+        self.event_type = event_type
+        self.event_name = event_name
+        self.payload = payload
+
+    def __repr__(self) -> str:
+        return "ScriptedEvent(%r, %s, %r)" % (self.delay, self.event_type, self.event_name)
@@ -0,0 +1,753 @@
+import json
+import os
+import queue
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import grpc
+from google.protobuf import empty_pb2
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from ._fake_channel import FakeChannel
+from .._channel_specification_document import DATA_RATE_LEVEL_MAP, DATA_RATE_LEVEL_PB2_MAP
+from .._data_rate_level import DataRateLevel
+from .._event_names import (
+    LOG_FILE_CLOSED,
+    LOG_FILE_CREATED,
+    TEST_PAUSED,
+    TEST_RESUMED,
+    TEST_STARTED,
+    TEST_STOPPED,
+)
+from ..proto import (
+    Application_pb2,
+    Application_pb2_grpc,
+    ChannelSpecificationDocument_pb2,
+    ChannelSpecificationDocument_pb2_grpc,
+    Events_pb2,
+    Events_pb2_grpc,
+    FlexLoggerApplication_pb2,
+    FlexLoggerApplication_pb2_grpc,
+    Identifiers_pb2,
+    LoggingSpecificationDocument_pb2,
+    LoggingSpecificationDocument_pb2_grpc,
+    Project_pb2,
+    Project_pb2_grpc,
+    TestSession_pb2,
+    TestSession_pb2_grpc,
+)
+from ..proto.EventType_pb2 import EventType as EventType_pb2
+from ..proto.LoggingSpecificationDocument_pb2 import LogFileType as LogFileType_pb2
+from ..proto.StartTriggerCondition_pb2 import StartTriggerCondition as StartTriggerCondition_pb2
+from ..proto.StopTriggerCondition_pb2 import StopTriggerCondition as StopTriggerCondition_pb2
+from ..proto.TestSessionState_pb2 import TestSessionState as TestSessionState_pb2
+
+_ALL_EVENT_TYPES = frozenset(
+    [
+        EventType_pb2.EVENT_TYPE_ALARM,
+        EventType_pb2.EVENT_TYPE_LOG_FILE,
+        EventType_pb2.EVENT_TYPE_TEST_SESSION,
+        EventType_pb2.EVENT_TYPE_CUSTOM,
+    ]
+)
+
+_DEFAULT_DATA_RATES = {
+    DataRateLevel.SLOW: 1.0,
+    DataRateLevel.MEDIUM: 100.0,
+    DataRateLevel.FAST: 1000.0,
+    DataRateLevel.COUNTER: 100.0,
+    DataRateLevel.DIGITAL: 100.0,
+    DataRateLevel.ON_DEMAND: 10.0,
+}
+
+# Put in an event client's queue to end its event stream.
+_END_OF_EVENTS = None
+
+
+def _format_time_span(duration: timedelta) -> str:
+    """Format a duration the way FlexLogger reports it, for instance "1.02:03:04"."""
+    hours, remainder = divmod(int(duration.total_seconds()), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    days, hours = divmod(hours, 24)
+    text = "%02d:%02d:%02d" % (hours, minutes, seconds)
+    if days > 0:
+        text = "%d.%s" % (days, text)
+    if duration.microseconds > 0:
+        text += ".%07d" % (duration.microseconds * 10)
+    return text
+
+
+def _now() -> Timestamp:
+    timestamp = Timestamp()
+    timestamp.GetCurrentTime()
+    return timestamp
+
+
+class _EventClient:
+    def __init__(self, event_types: Iterable[int]) -> None:
+        self.event_types = set(event_types)  # type: Set[int]
+        self.queue = queue.Queue()  # type: queue.Queue
+
+    def wants(self, event_type: int) -> bool:
+        return len(self.event_types) == 0 or event_type in self.event_types
+
+
+class _FakeFlexLoggerState:
+    """The state shared by the fake services.  Every access happens with the lock held."""
+
+    def __init__(self, channels: Iterable[FakeChannel], clock: Callable[[], float]) -> None:
+        self.lock = threading.RLock()
+        self.clock = clock
+        self.channels = OrderedDict(
+            (channel.name, channel) for channel in channels
+        )  # type: Dict[str, FakeChannel]
+        if len(self.channels) == 0:
+            self.channels["Channel 1"] = FakeChannel("Channel 1")
+        self.output_values = {
+            channel.name: channel.waveform.value_at(0.0)
+            for channel in self.channels.values()
+            if channel.is_output
+        }  # type: Dict[str, float]
+        self.data_rates = dict(_DEFAULT_DATA_RATES)
+        self.client_types = []  # type: List[int]
+        self.disconnect_requests = []  # type: List[bool]
+        self.project_id = None  # type: Optional[str]
+        self.project_path = ""
+        self.test_session_state = TestSessionState_pb2.TEST_SESSION_STATE_IDLE
+        self.elapsed_before_current_run = 0.0
+        self.run_start_time = 0.0
+        self.notes = []  # type: List[str]
+        self.log_file_base_path = ""
+        self.log_file_name = "Log"
+        self.log_file_description = ""
+        self.log_files = []  # type: List[str]
+        self.test_properties = OrderedDict()  # type: Dict[str, Tuple[str, bool]]
+        self.start_trigger = (StartTriggerCondition_pb2.START_TRIGGER_CONDITION_TEST_START, "")
+        self.stop_trigger = (StopTriggerCondition_pb2.STOP_TRIGGER_CONDITION_TEST_STOP, "")
+        self.retriggering_enabled = False
+        self.event_clients = {}  # type: Dict[str, _EventClient]
+
+    def get_channel(self, channel_name: str, context: grpc.ServicerContext) -> FakeChannel:
+        channel = self.channels.get(channel_name)
+        if channel is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, "Unknown channel %s" % channel_name)
+        # context.abort() raises, but is not annotated as never returning.
+        assert channel is not None
+        return channel
+
+    def read_channel(self, channel_name: str, context: grpc.ServicerContext) -> float:
+        channel = self.get_channel(channel_name, context)
+        if channel.is_output:
+            return self.output_values[channel_name]
+        return channel.waveform.value_at(self.clock())
+
+    def check_writable(self, channel_name: str, context: grpc.ServicerContext) -> None:
+        if not self.get_channel(channel_name, context).is_output:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "%s is not an output channel" % channel_name
+            )
+
+    def elapsed_test_time(self) -> float:
+        if self.test_session_state == TestSessionState_pb2.TEST_SESSION_STATE_RUNNING:
+            return self.elapsed_before_current_run + self.clock() - self.run_start_time
+        return self.elapsed_before_current_run
+
+    def current_log_file(self) -> str:
+        return os.path.join(
+            self.log_file_base_path, "%s %d.tdms" % (self.log_file_name, len(self.log_files) + 1)
+        )
+
+    def send_event(self, event_type: int, event_name: str, payload: str = "") -> None:
+        event = Events_pb2.SubscribeToEventsResponse(
+            event_type=event_type, event_name=event_name, payload=payload, timestamp=_now()
+        )
+        for client in self.event_clients.values():
+            if client.wants(event_type):
+                client.queue.put(event)
+
+    def end_event_streams(self) -> None:
+        for client in self.event_clients.values():
+            client.queue.put(_END_OF_EVENTS)
+        self.event_clients.clear()
+
+
+class _FlexLoggerApplicationServicer(FlexLoggerApplication_pb2_grpc.FlexLoggerApplicationServicer):
+    def __init__(self, state: _FakeFlexLoggerState, version: Tuple[str, str]) -> None:
+        self._state = state
+        self._version = version
+
+    def OpenProject(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.project_id = uuid.uuid4().hex
+            self._state.project_path = request.project_path
+            return FlexLoggerApplication_pb2.OpenProjectResponse(
+                project=Identifiers_pb2.ProjectIdentifier(project_id=self._state.project_id)
+            )
+
+    def GetActiveProject(self, request, context):  # type: ignore
+        with self._state.lock:
+            if self._state.project_id is None:
+                return FlexLoggerApplication_pb2.GetActiveProjectResponse(
+                    active_project_available=False
+                )
+            return FlexLoggerApplication_pb2.GetActiveProjectResponse(
+                active_project_available=True,
+                project=Identifiers_pb2.ProjectIdentifier(project_id=self._state.project_id),
+            )
+
+    def GetVersion(self, request, context):  # type: ignore
+        return FlexLoggerApplication_pb2.GetVersionResponse(
+            version=self._version[0], version_string=self._version[1]
+        )
+
+    def Initialize(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.client_types.append(request.client_type)
+        return empty_pb2.Empty()
+
+
+class _ApplicationServicer(Application_pb2_grpc.ApplicationServicer):
+    def __init__(self, state: _FakeFlexLoggerState) -> None:
+        self._state = state
+
+    def Disconnect(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.disconnect_requests.append(request.exit_application)
+        return Application_pb2.DisconnectResponse()
+
+
+class _ProjectServicer(Project_pb2_grpc.ProjectServicer):
+    def __init__(self, state: _FakeFlexLoggerState) -> None:
+        self._state = state
+
+    def _check_project(self, project: Any, context: grpc.ServicerContext) -> None:
+        if self._state.project_id is None or project.project_id != self._state.project_id:
+            context.abort(grpc.StatusCode.NOT_FOUND, "The project is not open")
+
+    def _open_document(self, project: Any, file_name: str, context: grpc.ServicerContext) -> Any:
+        with self._state.lock:
+            self._check_project(project, context)
+            return Identifiers_pb2.ElementIdentifier(
+                project_id=project.project_id, file_name=file_name, element_id=file_name
+            )
+
+    def OpenChannelSpecificationDocument(self, request, context):  # type: ignore
+        return Project_pb2.OpenChannelSpecificationDocumentResponse(
+            document_identifier=self._open_document(
+                request.project, "Channel Specification.flxio", context
+            )
+        )
+
+    def OpenLoggingSpecificationDocument(self, request, context):  # type: ignore
+        return Project_pb2.OpenLoggingSpecificationDocumentResponse(
+            document_identifier=self._open_document(
+                request.project, "Logging Specification.flxio", context
+            )
+        )
+
+    def OpenScreenDocument(self, request, context):  # type: ignore
+        return Project_pb2.OpenScreenDocumentResponse(
+            document_identifier=self._open_document(request.project, request.screen_name, context)
+        )
+
+    def OpenTestSpecificationDocument(self, request, context):  # type: ignore
+        return Project_pb2.OpenTestSpecificationDocumentResponse(
+            document_identifier=self._open_document(
+                request.project, "Test Specification.flxio", context
+            )
+        )
+
+    def Close(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._check_project(request.project, context)
+            self._state.project_id = None
+            self._state.project_path = ""
+        return Project_pb2.CloseProjectResponse()
+
+    def GetProjectFilePath(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._check_project(request.project, context)
+            return Project_pb2.GetProjectFilePathResponse(
+                project_file_path=self._state.project_path
+            )
+
+    def Save(self, request, context):  # type: ignore
+        return empty_pb2.Empty()
+
+
+class _TestSessionServicer(TestSession_pb2_grpc.TestSessionServicer):
+    def __init__(self, state: _FakeFlexLoggerState) -> None:
+        self._state = state
+
+    def AddNote(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.notes.append(request.note)
+        return TestSession_pb2.AddNoteResponse()
+
+    def GetState(self, request, context):  # type: ignore
+        with self._state.lock:
+            return TestSession_pb2.GetTestSessionStateResponse(
+                test_session_state=self._state.test_session_state
+            )
+
+    def Start(self, request, context):  # type: ignore
+        state = self._state
+        with state.lock:
+            if state.test_session_state != TestSessionState_pb2.TEST_SESSION_STATE_IDLE:
+                return TestSession_pb2.StartTestSessionResponse(test_session_started=False)
+            state.test_session_state = TestSessionState_pb2.TEST_SESSION_STATE_RUNNING
+            state.elapsed_before_current_run = 0.0
+            state.run_start_time = state.clock()
+            state.send_event(EventType_pb2.EVENT_TYPE_TEST_SESSION, TEST_STARTED)
+            state.send_event(
+                EventType_pb2.EVENT_TYPE_LOG_FILE, LOG_FILE_CREATED, state.current_log_file()
+            )
+        return TestSession_pb2.StartTestSessionResponse(test_session_started=True)
+
+    def Stop(self, request, context):  # type: ignore
+        state = self._state
+        with state.lock:
+            if state.test_session_state == TestSessionState_pb2.TEST_SESSION_STATE_IDLE:
+                return TestSession_pb2.StopTestSessionResponse(test_session_stopped=False)
+            state.elapsed_before_current_run = state.elapsed_test_time()
+            state.test_session_state = TestSessionState_pb2.TEST_SESSION_STATE_IDLE
+            log_file = state.current_log_file()
+            state.log_files.append(log_file)
+            state.send_event(EventType_pb2.EVENT_TYPE_LOG_FILE, LOG_FILE_CLOSED, log_file)
+            state.send_event(EventType_pb2.EVENT_TYPE_TEST_SESSION, TEST_STOPPED)
+        return TestSession_pb2.StopTestSessionResponse(test_session_stopped=True)
+
+    def Pause(self, request, context):  # type: ignore
+        state = self._state
+        with state.lock:
+            if state.test_session_state != TestSessionState_pb2.TEST_SESSION_STATE_RUNNING:
+                return TestSession_pb2.PauseTestSessionResponse(test_session_paused=False)
+            state.elapsed_before_current_run = state.elapsed_test_time()
+            state.test_session_state = TestSessionState_pb2.TEST_SESSION_STATE_PAUSED
+            state.send_event(EventType_pb2.EVENT_TYPE_TEST_SESSION, TEST_PAUSED)
+        return TestSession_pb2.PauseTestSessionResponse(test_session_paused=True)
+
+    def Resume(self, request, context):  # type: ignore
+        state = self._state
+        with state.lock:
+            if state.test_session_state != TestSessionState_pb2.TEST_SESSION_STATE_PAUSED:
+                return TestSession_pb2.ResumeTestSessionResponse(test_session_resumed=False)
+            state.test_session_state = TestSessionState_pb2.TEST_SESSION_STATE_RUNNING
+            state.run_start_time = state.clock()
+            state.send_event(EventType_pb2.EVENT_TYPE_TEST_SESSION, TEST_RESUMED)
+        return TestSession_pb2.ResumeTestSessionResponse(test_session_resumed=True)
+
+    def GetElapsedTestTime(self, request, context):  # type: ignore
+        with self._state.lock:
+            return TestSession_pb2.GetElapsedTestTimeResponse(
+                elapsed_test_time=self._state.elapsed_test_time()
+            )
+
+
+class _ChannelSpecificationDocumentServicer(
+    ChannelSpecificationDocument_pb2_grpc.ChannelSpecificationDocumentServicer
+):
+    def __init__(self, state: _FakeFlexLoggerState) -> None:
+        self._state = state
+
+    def GetChannelNames(self, request, context):  # type: ignore
+        with self._state.lock:
+            return ChannelSpecificationDocument_pb2.GetChannelNamesResponse(
+                channel_names=list(self._state.channels)
+            )
+
+    def GetFilteredChannelNames(self, request, context):  # type: ignore
+        with self._state.lock:
+            channel_names = [
+                channel.name
+                for channel in self._state.channels.values()
+                if (channel.enabled or not request.configuredChannels)
+                and (request.outputChannels if channel.is_output else request.inputChannels)
+                and (request.digitalChannels if channel.is_digital else request.analogChannels)
+            ]
+        return ChannelSpecificationDocument_pb2.GetChannelNamesResponse(channel_names=channel_names)
+
+    def GetDoubleChannelValue(self, request, context):  # type: ignore
+        with self._state.lock:
+            value = self._state.read_channel(request.channel_name, context)
+        return ChannelSpecificationDocument_pb2.GetDoubleChannelValueResponse(
+            channel_value=value, value_timestamp=_now()
+        )
+
+    def SetDoubleChannelValue(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.check_writable(request.channel_name, context)
+            self._state.output_values[request.channel_name] = request.channel_value
+        return ChannelSpecificationDocument_pb2.SetDoubleChannelValueResponse()
+
+    def GetDoubleChannelValues(self, request, context):  # type: ignore
+        response = ChannelSpecificationDocument_pb2.GetDoubleChannelValuesResponse()
+        timestamp = _now()
+        with self._state.lock:
+            for channel_name in request.channel_names:
+                response.channel_values.add(
+                    channel_name=channel_name,
+                    channel_value=self._state.read_channel(channel_name, context),
+                    value_timestamp=timestamp,
+                )
+        return response
+
+    def SetDoubleChannelValues(self, request, context):  # type: ignore
+        with self._state.lock:
+            # Check every channel first so that a bad request writes nothing.
+            for channel_value in request.channel_values:
+                self._state.check_writable(channel_value.channel_name, context)
+            for channel_value in request.channel_values:
+                self._state.output_values[channel_value.channel_name] = channel_value.channel_value
+        return empty_pb2.Empty()
+
+    def IsChannelEnabled(self, request, context):  # type: ignore
+        with self._state.lock:
+            channel = self._state.get_channel(request.channel_name, context)
+            return ChannelSpecificationDocument_pb2.IsChannelEnabledResponse(
+                channel_enabled=channel.enabled
+            )
+
+    def SetChannelEnabled(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.get_channel(request.channel_name, context).enabled = request.channel_enabled
+        return ChannelSpecificationDocument_pb2.SetChannelEnabledResponse()
+
+    def IsChannelLoggingEnabled(self, request, context):  # type: ignore
+        with self._state.lock:
+            channel = self._state.get_channel(request.channel_name, context)
+            return ChannelSpecificationDocument_pb2.IsChannelLoggingEnabledResponse(
+                channel_logging_enabled=channel.logging_enabled
+            )
+
+    def SetChannelLoggingEnabled(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.get_channel(request.channel_name, context).logging_enabled = (
+                request.channel_logging_enabled
+            )
+        return ChannelSpecificationDocument_pb2.SetChannelLoggingEnabledResponse()
+
+    def _get_data_rate_level(self, data_rate_level_pb2: int, context: Any) -> DataRateLevel:
+        data_rate_level = DATA_RATE_LEVEL_PB2_MAP.get(data_rate_level_pb2)
+        if data_rate_level is None:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid data rate level")
+        assert data_rate_level is not None
+        return data_rate_level
+
+    def GetDataRate(self, request, context):  # type: ignore
+        data_rate_level = self._get_data_rate_level(request.data_rate_level, context)
+        with self._state.lock:
+            return ChannelSpecificationDocument_pb2.GetDataRateResponse(
+                data_rate=self._state.data_rates[data_rate_level]
+            )
+
+    def SetDataRate(self, request, context):  # type: ignore
+        data_rate_level = self._get_data_rate_level(request.data_rate_level, context)
+        with self._state.lock:
+            self._state.data_rates[data_rate_level] = request.data_rate
+        return empty_pb2.Empty()
+
+    def GetDataRateLevel(self, request, context):  # type: ignore
+        with self._state.lock:
+            channel = self._state.get_channel(request.channel_name, context)
+            return ChannelSpecificationDocument_pb2.GetDataRateLevelResponse(
+                data_rate_level=DATA_RATE_LEVEL_MAP[channel.data_rate_level]
+            )
+
+    def SetDataRateLevel(self, request, context):  # type: ignore
+        data_rate_level = self._get_data_rate_level(request.data_rate_level, context)
+        with self._state.lock:
+            self._state.get_channel(request.channel_name, context).data_rate_level = data_rate_level
+        return empty_pb2.Empty()
+
+    def GetActualDataRate(self, request, context):  # type: ignore
+        with self._state.lock:
+            channel = self._state.get_channel(request.channel_name, context)
+            return ChannelSpecificationDocument_pb2.GetActualDataRateResponse(
+                data_rate=self._state.data_rates[channel.data_rate_level]
+            )
+
+
+class _LoggingSpecificationDocumentServicer(
+    LoggingSpecificationDocument_pb2_grpc.LoggingSpecificationDocumentServicer
+):
+    def __init__(self, state: _FakeFlexLoggerState) -> None:
+        self._state = state
+
+    def GetLogFileBasePath(self, request, context):  # type: ignore
+        with self._state.lock:
+            return LoggingSpecificationDocument_pb2.GetLogFileBasePathResponse(
+                log_file_base_path=self._state.log_file_base_path
+            )
+
+    def SetLogFileBasePath(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.log_file_base_path = request.log_file_base_path
+        return LoggingSpecificationDocument_pb2.SetLogFileBasePathResponse()
+
+    def GetLogFileName(self, request, context):  # type: ignore
+        with self._state.lock:
+            return LoggingSpecificationDocument_pb2.GetLogFileNameResponse(
+                log_file_name=self._state.log_file_name
+            )
+
+    def SetLogFileName(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.log_file_name = request.log_file_name
+        return LoggingSpecificationDocument_pb2.SetLogFileNameResponse()
+
+    def GetLogFileDescription(self, request, context):  # type: ignore
+        with self._state.lock:
+            return LoggingSpecificationDocument_pb2.GetLogFileDescriptionResponse(
+                log_file_description=self._state.log_file_description
+            )
+
+    def SetLogFileDescription(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.log_file_description = request.log_file_description
+        return empty_pb2.Empty()
+
+    def GetLogFiles(self, request, context):  # type: ignore
+        with self._state.lock:
+            log_files = (
+                list(self._state.log_files) if request.log_file_type == LogFileType_pb2.TDMS else []
+            )
+        return LoggingSpecificationDocument_pb2.GetLogFilesResponse(log_files=log_files)
+
+    def RemoveLogFiles(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.log_files = []
+        return empty_pb2.Empty()
+
+    def _to_test_property(self, name: str) -> Any:
+        value, prompt_on_start = self._state.test_properties[name]
+        return LoggingSpecificationDocument_pb2.TestProperty(
+            property_name=name, property_value=value, prompt_on_start=prompt_on_start
+        )
+
+    def GetTestProperties(self, request, context):  # type: ignore
+        with self._state.lock:
+            return LoggingSpecificationDocument_pb2.GetTestPropertiesResponse(
+                test_properties=[
+                    self._to_test_property(name) for name in self._state.test_properties
+                ]
+            )
+
+    def SetTestProperties(self, request, context):  # type: ignore
+        with self._state.lock:
+            for test_property in request.test_properties:
+                self._state.test_properties[test_property.property_name] = (
+                    test_property.property_value,
+                    test_property.prompt_on_start,
+                )
+        return empty_pb2.Empty()
+
+    def GetTestProperty(self, request, context):  # type: ignore
+        with self._state.lock:
+            if request.property_name not in self._state.test_properties:
+                context.abort(
+                    grpc.StatusCode.NOT_FOUND, "Unknown test property %s" % request.property_name
+                )
+            return LoggingSpecificationDocument_pb2.GetTestPropertyResponse(
+                test_property=self._to_test_property(request.property_name)
+            )
+
+    def SetTestProperty(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.test_properties[request.test_property.property_name] = (
+                request.test_property.property_value,
+                request.test_property.prompt_on_start,
+            )
+        return LoggingSpecificationDocument_pb2.SetTestPropertyResponse()
+
+    def RemoveTestProperty(self, request, context):  # type: ignore
+        with self._state.lock:
+            if self._state.test_properties.pop(request.property_name, None) is None:
+                context.abort(
+                    grpc.StatusCode.NOT_FOUND, "Unknown test property %s" % request.property_name
+                )
+        return LoggingSpecificationDocument_pb2.RemoveTestPropertyResponse()
+
+    def GetResolvedLogFileBasePath(self, request, context):  # type: ignore
+        with self._state.lock:
+            return LoggingSpecificationDocument_pb2.GetResolvedLogFileBasePathResponse(
+                resolved_log_file_base_path=self._state.log_file_base_path
+            )
+
+    def GetResolvedLogFileName(self, request, context):  # type: ignore
+        with self._state.lock:
+            return LoggingSpecificationDocument_pb2.GetResolvedLogFileNameResponse(
+                resolved_log_file_name=self._state.log_file_name
+            )
+
+    def GetStartTriggerSettings(self, request, context):  # type: ignore
+        with self._state.lock:
+            condition, settings = self._state.start_trigger
+        return LoggingSpecificationDocument_pb2.GetStartTriggerSettingsResponse(
+            start_trigger_condition=condition, start_trigger_settings=settings
+        )
+
+    def GetStopTriggerSettings(self, request, context):  # type: ignore
+        with self._state.lock:
+            condition, settings = self._state.stop_trigger
+        return LoggingSpecificationDocument_pb2.GetStopTriggerSettingsResponse(
+            stop_trigger_condition=condition, stop_trigger_settings=settings
+        )
+
+    def _value_change_settings(self, request: Any, time: float, context: Any) -> str:
+        self._state.get_channel(request.channel_name, context)
+        return json.dumps(
+            {
+                "ChannelName": request.channel_name,
+                "ValueChangeType": request.value_change_type,
+                "Threshold": request.threshold,
+                "MinValue": request.min_value,
+                "MaxValue": request.max_value,
+                "Time": time,
+            }
+        )
+
+    def SetTestStartTriggerSettings(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.start_trigger = (
+                StartTriggerCondition_pb2.START_TRIGGER_CONDITION_TEST_START,
+                "",
+            )
+        return empty_pb2.Empty()
+
+    def SetValueChangeStartTriggerSettings(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.start_trigger = (
+                StartTriggerCondition_pb2.START_TRIGGER_CONDITION_CHANNEL_VALUE_CHANGE,
+                self._value_change_settings(request, request.leading_time, context),
+            )
+        return empty_pb2.Empty()
+
+    def SetTimeStartTriggerSettings(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.start_trigger = (
+                StartTriggerCondition_pb2.START_TRIGGER_CONDITION_TIME,
+                request.time.ToDatetime().isoformat(),
+            )
+        return empty_pb2.Empty()
+
+    def SetTestStopTriggerSettings(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.stop_trigger = (
+                StopTriggerCondition_pb2.STOP_TRIGGER_CONDITION_TEST_STOP,
+                "",
+            )
+        return empty_pb2.Empty()
+
+    def SetValueChangeStopTriggerSettings(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.stop_trigger = (
+                StopTriggerCondition_pb2.STOP_TRIGGER_CONDITION_CHANNEL_VALUE_CHANGE,
+                self._value_change_settings(request, request.trailing_time, context),
+            )
+        return empty_pb2.Empty()
+
+    def SetTimeStopTriggerSettings(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.stop_trigger = (
+                StopTriggerCondition_pb2.STOP_TRIGGER_CONDITION_TIME_ELAPSED,
+                _format_time_span(request.duration.ToTimedelta()),
+            )
+        return empty_pb2.Empty()
+
+    def IsRetriggeringEnabled(self, request, context):  # type: ignore
+        with self._state.lock:
+            return LoggingSpecificationDocument_pb2.IsRetriggeringEnabledResponse(
+                is_retriggering_enabled=self._state.retriggering_enabled
+            )
+
+    def SetRetriggering(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.retriggering_enabled = request.is_retriggering_enabled
+        return empty_pb2.Empty()
+
+
+class _FlexLoggerEventsServicer(Events_pb2_grpc.FlexLoggerEventsServicer):
+    def __init__(self, state: _FakeFlexLoggerState) -> None:
+        self._state = state
+
+    def SendEvent(self, request, context):  # type: ignore
+        with self._state.lock:
+            self._state.send_event(request.event_type, request.event_name, request.payload)
+        return empty_pb2.Empty()
+
+    def SubscribeToEvents(self, request, context):  # type: ignore
+        client = _EventClient(request.event_types)
+        with self._state.lock:
+            previous = self._state.event_clients.get(request.client_id)
+            if previous is not None:
+                previous.queue.put(_END_OF_EVENTS)
+            self._state.event_clients[request.client_id] = client
+        try:
+            yield from self._stream_events(client, context)
+        finally:
+            with self._state.lock:
+                if self._state.event_clients.get(request.client_id) is client:
+                    del self._state.event_clients[request.client_id]
+
+    @staticmethod
+    def _stream_events(client: _EventClient, context: grpc.ServicerContext) -> Iterator[Any]:
+        while context.is_active():
+            try:
+                event = client.queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if event is _END_OF_EVENTS:
+                return
+            yield event
+
+    def UnsubscribeFromEvents(self, request, context):  # type: ignore
+        with self._state.lock:
+            client = self._state.event_clients.pop(request.client_id, None)
+            if client is not None:
+                client.queue.put(_END_OF_EVENTS)
+        return empty_pb2.Empty()
+
+    def RegisterEvents(self, request, context):  # type: ignore
+        with self._state.lock:
+            client = self._state.event_clients.get(request.client_id)
+            if client is None:
+                context.abort(grpc.StatusCode.NOT_FOUND, "Unknown client %s" % request.client_id)
+            assert client is not None
+            if len(request.event_types) == 0:
+                client.event_types.clear()
+            elif len(client.event_types) > 0:
+                client.event_types.update(request.event_types)
+        return empty_pb2.Empty()
+
+    def GetRegisteredEvents(self, request, context):  # type: ignore
+        with self._state.lock:
+            client = self._state.event_clients.get(request.client_id)
+            if client is None:
+                event_types = set()  # type: Set[int]
+            elif len(client.event_types) == 0:
+                event_types = set(_ALL_EVENT_TYPES)
+            else:
+                event_types = set(client.event_types)
+        return Events_pb2.GetRegisteredEventsResponse(event_types=sorted(event_types))
+
+
+def _add_servicers_to_server(
+    server: grpc.Server, state: _FakeFlexLoggerState, version: Tuple[str, str]
+) -> None:
+    FlexLoggerApplication_pb2_grpc.add_FlexLoggerApplicationServicer_to_server(
+        _FlexLoggerApplicationServicer(state, version), server
+    )
+    Application_pb2_grpc.add_ApplicationServicer_to_server(_ApplicationServicer(state), server)
+    Project_pb2_grpc.add_ProjectServicer_to_server(_ProjectServicer(state), server)
+    TestSession_pb2_grpc.add_TestSessionServicer_to_server(_TestSessionServicer(state), server)
+    ChannelSpecificationDocument_pb2_grpc.add_ChannelSpecificationDocumentServicer_to_server(
+        _ChannelSpecificationDocumentServicer(state), server
+    )
+    LoggingSpecificationDocument_pb2_grpc.add_LoggingSpecificationDocumentServicer_to_server(
+        _LoggingSpecificationDocumentServicer(state), server
+    )
+    Events_pb2_grpc.add_FlexLoggerEventsServicer_to_server(_FlexLoggerEventsServicer(state), server)
@@ -0,0 +1,107 @@
+import math
+
+
+class Waveform:
+    """The base class for the synthetic signals of a :class:`.FakeChannel`.
+
+    Subclasses override :meth:`value_at`.  Waveforms are evaluated at the server's clock
+    time, so the values a client reads are reproducible when the server is given a
+    deterministic clock.
+    """
+
+    def value_at(self, time: float) -> float:
+        """Get the value of the waveform.
+
+        Args:
+            time: The time, in seconds, since the fake server started.
+        """
+        raise NotImplementedError()
+
+
+class ConstantWaveform(Waveform):
+    """A waveform that always has the same value."""
+
+    def __init__(self, value: float = 0.0) -> None:
+        self.value = value
+
+    def __repr__(self) -> str:
+        return "ConstantWaveform(%r)" % self.value
+
+    def value_at(self, time: float) -> float:
+        return self.value
+
+
+class SineWaveform(Waveform):
+    """A sine wave: ``offset + amplitude * sin(2 * pi * frequency * time + phase)``."""
+
+    def __init__(
+        self,
+        amplitude: float = 1.0,
+        frequency: float = 1.0,
+        offset: float = 0.0,
+        phase: float = 0.0,
+    ) -> None:
+        self.amplitude = amplitude
+        self.frequency = frequency
+        self.offset = offset
+        self.phase = phase
+
+    def __repr__(self) -> str:
+        return "SineWaveform(amplitude=%r, frequency=%r, offset=%r, phase=%r)" % (
+            self.amplitude,
+            self.frequency,
+            self.offset,
+            self.phase,
+        )
+
+    def value_at(self, time: float) -> float:
+        return self.offset + self.amplitude * math.sin(
+            2 * math.pi * self.frequency * time + self.phase
+        )
+
+
+class SquareWaveform(Waveform):
+    """A square wave that alternates between ``low`` and ``high``.
+
+    Each period starts with ``high`` for ``duty_cycle`` of the period.
+    """
+
+    def __init__(
+        self, low: float = 0.0, high: float = 1.0, frequency: float = 1.0, duty_cycle: float = 0.5
+    ) -> None:
+        self.low = low
+        self.high = high
+        self.frequency = frequency
+        self.duty_cycle = duty_cycle
+
+    def __repr__(self) -> str:
+        return "SquareWaveform(low=%r, high=%r, frequency=%r, duty_cycle=%r)" % (
+            self.low,
+            self.high,
+            self.frequency,
+            self.duty_cycle,
+        )
+
+    def value_at(self, time: float) -> float:
+        position = (time * self.frequency) % 1.0
+        return self.high if position < self.duty_cycle else self.low
+
+
+class SawtoothWaveform(Waveform):
+    """A ramp from ``low`` to ``high`` that repeats ``frequency`` times a second."""
+
+    def __init__(self, low: float = 0.0, high: float = 1.0, frequency: float = 1.0) -> None:
+        self.low = low
+        self.high = high
+        self.frequency = frequency
+
+    def __repr__(self) -> str:
+        return "SawtoothWaveform(low=%r, high=%r, frequency=%r)" % (
+            self.low,
+            self.high,
+            self.frequency,
+        )
+
+    def value_at(self, time: float) -> float:
+        position = (time * self.frequency) % 1.0
+        return self.low + (self.high - self.low) * position
@@ -0,0 +1,277 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Dict, List
+
+import pytest  # type: ignore
+from flexlogger.automation import (
+    Application,
+    ChannelDataPoint,
+    ChannelSnapshot,
+    DataRateLevel,
+    FlexLoggerError,
+    LogFileType,
+    TestProperty,
+    TestSessionState,
+    ValueChangeCondition,
+    ValueChangeType,
+    aio,
+)
+from flexlogger.automation._stub_registry import StubRegistry
+from flexlogger.automation.proto import TestSession_pb2_grpc
+from flexlogger.automation.testing import FakeChannel, FakeFlexLoggerServer
+
+from .utils import copy_project
+
+
+def run(awaitable: Awaitable[Any]) -> Any:
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
+
+
+_PARITY_CHANNELS = [
+    FakeChannel("Input", 1.5),
+    FakeChannel("Output", 0.0, is_output=True),
+    FakeChannel("Digital", 1.0, is_digital=True, data_rate_level=DataRateLevel.DIGITAL),
+]
+
+
+def _value_change_condition() -> ValueChangeCondition:
+    condition = ValueChangeCondition()
+    condition.channel_name = "Input"
+    condition.value_change_type = ValueChangeType.RISE_ABOVE_VALUE
+    condition.threshold = 2.5
+    condition.time = 1.0
+    return condition
+
+
+# The calls made on each document by the parity test, as (document, method, arguments)
+_PARITY_CALLS = [
+    ("logging", "set_log_file_base_path", ("C:\\Data",)),
+    ("logging", "get_log_file_base_path", ()),
+    ("logging", "get_resolved_log_file_base_path", ()),
+    ("logging", "set_log_file_name", ("Run.tdms",)),
+    ("logging", "get_log_file_name", ()),
+    ("logging", "get_resolved_log_file_name", ()),
+    ("logging", "set_log_file_description", ("Parity",)),
+    ("logging", "get_log_file_description", ()),
+    ("logging", "get_log_files", (LogFileType.TDMS,)),
+    ("logging", "remove_log_files", ()),
+    ("logging", "set_test_properties", ([TestProperty("Operator", "Ann", False)],)),
+    ("logging", "set_test_property", ("Batch", "7", True)),
+    ("logging", "get_test_properties", ()),
+    ("logging", "get_test_property", ("Batch",)),
+    ("logging", "remove_test_property", ("Batch",)),
+    ("logging", "get_test_property", ("Batch",)),
+    ("logging", "set_start_trigger_settings_to_value_change", (_value_change_condition(),)),
+    ("logging", "get_start_trigger_settings", ()),
+    ("logging", "set_start_trigger_settings_to_absolute_time", (datetime(2026, 1, 2, 3, 4, 5),)),
+    ("logging", "get_start_trigger_settings", ()),
+    ("logging", "set_start_trigger_settings_to_test_start", ()),
+    ("logging", "get_start_trigger_settings", ()),
+    ("logging", "set_stop_trigger_settings_to_value_change", (_value_change_condition(),)),
+    ("logging", "get_stop_trigger_settings", ()),
+    ("logging", "set_stop_trigger_settings_to_duration", (timedelta(minutes=5),)),
+    ("logging", "get_stop_trigger_settings", ()),
+    ("logging", "set_stop_trigger_settings_to_test_stop", ()),
+    ("logging", "get_stop_trigger_settings", ()),
+    ("logging", "set_retriggering", (True,)),
+    ("logging", "is_retriggering_enabled", ()),
+    ("channels", "get_channel_names", ()),
+    ("channels", "get_filtered_channel_names", (False, True, False, True, False)),
+    ("channels", "get_channel_value", ("Input",)),
+    ("channels", "get_channel_value", ("Missing",)),
+    ("channels", "set_channel_value", ("Output", 4.0)),
+    ("channels", "set_channel_values", ({"Output": 5.0},)),
+    ("channels", "get_channel_values", (["Output", "Input"],)),
+    ("channels", "get_channel_snapshot", (["Input", "Output"],)),
+    ("channels", "set_channel_enabled", ("Digital", False)),
+    ("channels", "is_channel_enabled", ("Digital",)),
+    ("channels", "set_channel_logging_enabled", ("Input", False)),
+    ("channels", "is_channel_logging_enabled", ("Input",)),
+    ("channels", "set_data_rate", (DataRateLevel.FAST, 2000.0)),
+    ("channels", "get_data_rate", (DataRateLevel.FAST,)),
+    ("channels", "set_data_rate_level", ("Input", DataRateLevel.FAST)),
+    ("channels", "get_data_rate_level", ("Input",)),
+    ("channels", "get_actual_data_rate", ("Input",)),
+    ("test_session", "start", ()),
+    ("test_session", "add_note", ("Note",)),
+    ("test_session", "pause", ()),
+    ("test_session", "resume", ()),
+    ("test_session", "stop", ()),
+]
+
+
+def _describe(result: Any) -> Any:
+    if isinstance(result, (list, tuple)):
+        return [_describe(item) for item in result]
+    if isinstance(result, ChannelDataPoint):
+        # Timestamps differ between runs, so only the name and value are compared
+        return (result.name, result.value)
+    if isinstance(result, ChannelSnapshot):
+        return (list(result.channel_names), list(result.values))
+    if isinstance(result, (TestProperty, ValueChangeCondition)):
+        return repr(result)
+    return result
+
+
+def _call_all(documents: Dict[str, Any]) -> List[Any]:
+    results = []  # type: List[Any]
+    for document, method, arguments in _PARITY_CALLS:
+        try:
+            results.append(_describe(getattr(documents[document], method)(*arguments)))
+        except FlexLoggerError as error:
+            results.append(type(error))
+    return results
+
+
+async def _call_all_async(documents: Dict[str, Any]) -> List[Any]:
+    results = []  # type: List[Any]
+    for document, method, arguments in _PARITY_CALLS:
+        try:
+            results.append(_describe(await getattr(documents[document], method)(*arguments)))
+        except FlexLoggerError as error:
+            results.append(type(error))
+    return results
+
+
+class TestAio:
+    @pytest.mark.integration  # type: ignore
+    def test__connect_to_running_application__get_version__version_matches(
+        self, app: Application
+    ) -> None:
+        async def get_version() -> Any:
+            async with await aio.Application.connect(app.server_port) as aio_app:
+                return await aio_app.get_version()
+
+        assert app.get_version() == run(get_version())
+
+    @pytest.mark.integration  # type: ignore
+    def test__open_project__get_channel_values_concurrently__values_returned(
+        self, app: Application
+    ) -> None:
+        async def read_channels(project_path: Any) -> Any:
+            async with await aio.Application.connect(app.server_port) as aio_app:
+                project = await aio_app.open_project(project_path)
+                try:
+                    channel_specification = await project.open_channel_specification_document()
+                    return await asyncio.gather(
+                        channel_specification.get_channel_value("Channel 1"),
+                        channel_specification.get_channel_value("Channel 2"),
+                        channel_specification.get_channel_values(["Channel 2", "Channel 1"]),
+                    )
+                finally:
+                    await project.close()
+
+        with copy_project("ProjectWithProducedData") as project_path:
+            channel_1, channel_2, both_channels = run(read_channels(project_path))
+
+        assert "Channel 1" == channel_1.name
+        assert "Channel 2" == channel_2.name
+        assert ["Channel 2", "Channel 1"] == [value.name for value in both_channels]
+
+    @pytest.mark.integration  # type: ignore
+    def test__open_project__start_and_stop_test_session__states_match(
+        self, app: Application
+    ) -> None:
+        async def start_and_stop(project_path: Any) -> Any:
+            async with await aio.Application.connect(app.server_port) as aio_app:
+                project = await aio_app.open_project(project_path)
+                try:
+                    test_session = project.test_session
+                    started = await test_session.start()
+                    running_state = await test_session.state
+                    stopped = await test_session.stop()
+                    idle_state = await test_session.state
+                    return started, running_state, stopped, idle_state
+                finally:
+                    await project.close()
+
+        with copy_project("ProjectWithProducedData") as project_path:
+            started, running_state, stopped, idle_state = run(start_and_stop(project_path))
+
+        assert started
+        assert TestSessionState.RUNNING == running_state
+        assert stopped
+        assert TestSessionState.IDLE == idle_state
+
+    @pytest.mark.integration  # type: ignore
+    def test__open_project__get_logging_name__logging_name_matches_user_setting(
+        self, app: Application
+    ) -> None:
+        async def get_log_file_name(project_path: Any) -> Any:
+            async with await aio.Application.connect(app.server_port) as aio_app:
+                project = await aio_app.open_project(project_path)
+                try:
+                    logging_specification = await project.open_logging_specification_document()
+                    return await logging_specification.get_log_file_name()
+                finally:
+                    await project.close()
+
+        with copy_project("ProjectWithLoggingSpecification") as project_path:
+            assert r"MyData.tdms" == run(get_log_file_name(project_path))
+
+    @pytest.mark.integration  # type: ignore
+    def test__disconnect__get_version__exception_raised(self, app: Application) -> None:
+        async def get_version_after_disconnect() -> None:
+            aio_app = await aio.Application.connect(app.server_port)
+            await aio_app.disconnect()
+            await aio_app.get_version()
+
+        with pytest.raises(FlexLoggerError):
+            run(get_version_after_disconnect())
+
+    @pytest.mark.unit  # type: ignore
+    def test__closed_stub_registry__get_stub__exception_raised(self) -> None:
+        stubs = StubRegistry(None)  # type: ignore
+        stubs.close()
+
+        with pytest.raises(FlexLoggerError):
+            stubs.get(TestSession_pb2_grpc.TestSessionStub)
+
+    @pytest.mark.unit  # type: ignore
+    def test__open_document_twice__document_opened_once(self) -> None:
+        async def open_twice(server_port: int) -> Any:
+            async with await aio.Application.connect(server_port) as aio_app:
+                project = await aio_app.open_project("Test.flxproj")
+                first_document = await project.open_logging_specification_document()
+                second_document = await project.open_logging_specification_document()
+                return first_document is second_document
+
+        with FakeFlexLoggerServer() as server:
+            same_document = run(open_twice(server.port))
+            open_count = server.call_counts["OpenLoggingSpecificationDocument"]
+
+        assert same_document
+        assert 1 == open_count
+
+    @pytest.mark.unit  # type: ignore
+    def test__same_calls_on_sync_and_aio_clients__same_results(self) -> None:
+        with FakeFlexLoggerServer(_PARITY_CHANNELS) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                documents = {
+                    "logging": project.open_logging_specification_document(),
+                    "channels": project.open_channel_specification_document(),
+                    "test_session": project.test_session,
+                }
+                sync_results = _call_all(documents)
+                sync_state = project.test_session.state
+
+        async def call_all_async(server_port: int) -> Any:
+            async with await aio.Application.connect(server_port) as aio_app:
+                project = await aio_app.open_project("Test.flxproj")
+                documents = {
+                    "logging": await project.open_logging_specification_document(),
+                    "channels": await project.open_channel_specification_document(),
+                    "test_session": project.test_session,
+                }
+                return await _call_all_async(documents), await project.test_session.state
+
+        with FakeFlexLoggerServer(_PARITY_CHANNELS) as server:
+            aio_results, aio_state = run(call_all_async(server.port))
+
+        assert sync_results == aio_results
+        assert sync_state == aio_state
@@ -0,0 +1,94 @@
+import time
+
+import pytest  # type: ignore
+from flexlogger.automation import Application, ChannelCatalog, DataRateLevel
+from flexlogger.automation.testing import FakeChannel, FakeFlexLoggerServer
+
+_CHANNELS = [
+    FakeChannel("Input", 1.0),
+    FakeChannel("Disabled input", 2.0, enabled=False),
+    FakeChannel("Output", 0.0, is_output=True, data_rate_level=DataRateLevel.FAST),
+    FakeChannel("Digital output", 0.0, is_output=True, is_digital=True, logging_enabled=False),
+]
+
+
+class TestChannelCatalog:
+    @pytest.mark.unit  # type: ignore
+    def test__filtered_channel_names__names_of_selected_types_returned(self) -> None:
+        with FakeFlexLoggerServer(_CHANNELS) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+
+                digital_outputs = channel_specification.get_filtered_channel_names(
+                    input_channels=False, analog_channels=False
+                )
+                configured = channel_specification.get_filtered_channel_names(configured_only=True)
+
+        assert ["Digital output"] == list(digital_outputs)
+        assert ["Input", "Output", "Digital output"] == list(configured)
+
+    @pytest.mark.unit  # type: ignore
+    def test__channel_catalog__classify_channels_twice__each_setting_fetched_once(self) -> None:
+        with FakeFlexLoggerServer(_CHANNELS) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                catalog = ChannelCatalog(project.open_channel_specification_document())
+
+                for _ in range(2):
+                    input_channel_names = catalog.input_channel_names
+                    output_channel_names = catalog.output_channel_names
+                    enabled = [catalog.is_channel_enabled(name) for name in input_channel_names]
+                    logging_enabled = [
+                        catalog.is_channel_logging_enabled(name) for name in output_channel_names
+                    ]
+                    data_rate_level = catalog.get_data_rate_level("Output")
+                call_counts = server.call_counts
+
+        assert ("Input", "Disabled input") == input_channel_names
+        assert ("Output", "Digital output") == output_channel_names
+        assert catalog.is_output_channel("Digital output")
+        assert not catalog.is_input_channel("Output")
+        assert [True, False] == enabled
+        assert [True, False] == logging_enabled
+        assert DataRateLevel.FAST == data_rate_level
+        assert 2 == call_counts["GetFilteredChannelNames"]
+        assert 2 == call_counts["IsChannelEnabled"]
+        assert 2 == call_counts["IsChannelLoggingEnabled"]
+        assert 1 == call_counts["GetDataRateLevel"]
+
+    @pytest.mark.unit  # type: ignore
+    def test__channel_catalog__refresh__changed_settings_fetched(self) -> None:
+        with FakeFlexLoggerServer(_CHANNELS) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                catalog = ChannelCatalog(channel_specification)
+                enabled_before = catalog.is_channel_enabled("Input")
+                channel_specification.set_channel_enabled("Input", False)
+
+                enabled_cached = catalog.is_channel_enabled("Input")
+                catalog.refresh(["Input"])
+                enabled_after = catalog.is_channel_enabled("Input")
+
+        assert enabled_before
+        assert enabled_cached
+        assert not enabled_after
+
+    @pytest.mark.unit  # type: ignore
+    def test__channel_catalog_with_max_age__information_expires__fetched_again(self) -> None:
+        with FakeFlexLoggerServer(_CHANNELS) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                catalog = ChannelCatalog(project.open_channel_specification_document(), 0.05)
+                catalog.configured_channel_names
+                catalog.configured_channel_names
+                time.sleep(0.1)
+                catalog.configured_channel_names
+
+                assert 2 == server.call_counts["GetFilteredChannelNames"]
+
+    @pytest.mark.unit  # type: ignore
+    def test__channel_catalog_with_invalid_max_age__exception_raised(self) -> None:
+        with pytest.raises(ValueError):
+            ChannelCatalog(None, max_age=0)  # type: ignore
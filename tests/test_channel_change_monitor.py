@@ -0,0 +1,160 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Iterable, List, Sequence
+
+import pytest  # type: ignore
+from flexlogger.automation import (
+    ChannelChangeMonitor,
+    ChannelDataPoint,
+    ChannelSnapshot,
+    DeadbandType,
+)
+
+
+class _ScriptedChannelSpecification:
+    """Stands in for a ChannelSpecificationDocument whose channels step through given values.
+
+    Each read returns the next row of values, and the last row once they run out.
+    """
+
+    def __init__(self, rows: Sequence[Sequence[float]]) -> None:
+        self.read_count = 0
+        self._rows = rows
+
+    def get_channel_snapshot(self, channel_names: Iterable[str]) -> ChannelSnapshot:
+        names = list(channel_names)
+        row = self._rows[min(self.read_count, len(self._rows) - 1)]
+        self.read_count += 1
+        return ChannelSnapshot(names, row[: len(names)], [self.read_count] * len(names))
+
+
+def _wait_for_polls(monitor: ChannelChangeMonitor, count: int, timeout: float = 5) -> None:
+    start = time.time()
+    while monitor.poll_count < count and time.time() - start < timeout:
+        time.sleep(0.01)
+
+
+def run(awaitable: Awaitable[Any]) -> Any:
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
+
+
+class TestChannelChangeMonitor:
+    @pytest.mark.unit  # type: ignore
+    def test__absolute_deadband__only_larger_changes_reported(self) -> None:
+        channel_specification = _ScriptedChannelSpecification(
+            [[10.0], [10.4], [10.6], [10.9], [11.2], [11.2]]
+        )
+        reported = []  # type: List[float]
+        monitor = ChannelChangeMonitor(channel_specification, 200)  # type: ignore
+        monitor.add_channel("A", deadband=0.5, callback=lambda point: reported.append(point.value))
+
+        with monitor:
+            _wait_for_polls(monitor, 8)
+
+        assert [10.0, 10.6, 11.2] == reported
+        assert 3 == monitor.report_count
+
+    @pytest.mark.unit  # type: ignore
+    def test__percent_deadband__changes_relative_to_last_reported_value(self) -> None:
+        channel_specification = _ScriptedChannelSpecification(
+            [[100.0, -100.0], [104.0, -106.0], [106.0, -106.0], [110.0, -110.0]]
+        )
+        reported = []  # type: List[ChannelDataPoint]
+        monitor = ChannelChangeMonitor(channel_specification, 200)  # type: ignore
+        for name in ("A", "B"):
+            monitor.add_channel(
+                name, deadband=5, deadband_type=DeadbandType.PERCENT, callback=reported.append
+            )
+
+        with monitor:
+            _wait_for_polls(monitor, 6)
+
+        assert [("A", 100.0), ("B", -100.0), ("B", -106.0), ("A", 106.0)] == [
+            (point.name, point.value) for point in reported
+        ]
+
+    @pytest.mark.unit  # type: ignore
+    def test__min_interval__changes_held_back_until_interval_passes(self) -> None:
+        channel_specification = _ScriptedChannelSpecification([[float(i)] for i in range(1000)])
+        reported = []  # type: List[float]
+        monitor = ChannelChangeMonitor(channel_specification, 200)  # type: ignore
+        monitor.add_channel(
+            "A", min_interval=0.1, callback=lambda point: reported.append(point.value)
+        )
+
+        with monitor:
+            time.sleep(0.35)
+
+        assert 2 <= len(reported) <= 5
+        assert monitor.poll_count > 2 * len(reported)
+
+    @pytest.mark.unit  # type: ignore
+    def test__max_interval__unchanged_value_reported_again(self) -> None:
+        channel_specification = _ScriptedChannelSpecification([[1.0]])
+        reported = []  # type: List[float]
+        monitor = ChannelChangeMonitor(channel_specification, 200)  # type: ignore
+        monitor.add_channel(
+            "A", max_interval=0.05, callback=lambda point: reported.append(point.value)
+        )
+
+        with monitor:
+            time.sleep(0.3)
+
+        assert len(reported) >= 3
+        assert {1.0} == set(reported)
+
+    @pytest.mark.unit  # type: ignore
+    def test__callback_raises__error_counted_and_monitor_keeps_running(self) -> None:
+        channel_specification = _ScriptedChannelSpecification([[1.0], [2.0], [3.0]])
+        monitor = ChannelChangeMonitor(channel_specification, 200)  # type: ignore
+
+        def fail(data_point: ChannelDataPoint) -> None:
+            raise RuntimeError("callback failed")
+
+        monitor.add_channel("A", callback=fail)
+        with monitor:
+            _wait_for_polls(monitor, 5)
+
+        assert 3 == monitor.callback_error_count
+        assert 3 == monitor.report_count
+
+    @pytest.mark.unit  # type: ignore
+    def test__changes__async_iteration__reported_values_received_until_stopped(self) -> None:
+        channel_specification = _ScriptedChannelSpecification([[1.0, 5.0], [2.0, 5.0], [3.0, 5.0]])
+        monitor = ChannelChangeMonitor(channel_specification, 200)  # type: ignore
+        monitor.add_channel("A")
+        monitor.add_channel("B")
+
+        async def receive() -> List[ChannelDataPoint]:
+            received = []
+            async with monitor.changes() as changes:
+                monitor.start()
+                async for data_point in changes:
+                    received.append(data_point)
+                    if len(received) == 4:
+                        monitor.stop()
+            return received
+
+        received = run(receive())
+
+        assert [("A", 1.0), ("B", 5.0), ("A", 2.0), ("A", 3.0)] == [
+            (point.name, point.value) for point in received
+        ]
+
+    @pytest.mark.unit  # type: ignore
+    def test__invalid_settings__exception_raised(self) -> None:
+        with pytest.raises(ValueError):
+            ChannelChangeMonitor(None, 0)  # type: ignore
+        monitor = ChannelChangeMonitor(None, 10)  # type: ignore
+        with pytest.raises(ValueError):
+            monitor.add_channel("A", deadband=-1)
+        with pytest.raises(ValueError):
+            monitor.add_channel("A", min_interval=1, max_interval=0.5)
+        with pytest.raises(ValueError):
+            monitor.add_channel("A", deadband_type="percent")  # type: ignore
+        with pytest.raises(KeyError):
+            monitor.remove_channel("A")
@@ -0,0 +1,45 @@
+import pytest  # type: ignore
+from flexlogger.automation import Application, ChannelOptions, FlexLoggerError
+from flexlogger.automation.testing import FakeChannel, FakeFlexLoggerServer
+
+
+class TestChannelOptions:
+    @pytest.mark.unit  # type: ignore
+    def test__small_max_receive_message_length__get_channel_names__raises(self) -> None:
+        channel_names = ["Channel %d" % i for i in range(200)]
+        options = ChannelOptions(max_receive_message_length=1024)
+        with FakeFlexLoggerServer(channel_names) as server:
+            with Application(server_port=server.port, channel_options=options) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+
+                with pytest.raises(FlexLoggerError):
+                    channel_specification.get_channel_names()
+
+    @pytest.mark.unit  # type: ignore
+    def test__all_options_set__bulk_read_and_write__values_transferred(self) -> None:
+        channel_names = ["Output %d" % i for i in range(50)]
+        options = ChannelOptions(
+            keepalive_time=30,
+            keepalive_timeout=10,
+            keepalive_permit_without_calls=True,
+            max_send_message_length=-1,
+            max_receive_message_length=-1,
+            gzip_compression=True,
+            initial_window_size=1024 * 1024,
+        )
+        channels = [FakeChannel(name, 0.0, is_output=True) for name in channel_names]
+        with FakeFlexLoggerServer(channels) as server:
+            with Application(server_port=server.port, channel_options=options) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                channel_specification.set_channel_values({name: 2.0 for name in channel_names})
+
+                values = channel_specification.get_channel_values(channel_names)
+
+        assert [2.0] * len(channel_names) == [value.value for value in values]
+
+    @pytest.mark.unit  # type: ignore
+    def test__negative_keepalive_time__create__raises(self) -> None:
+        with pytest.raises(ValueError):
+            ChannelOptions(keepalive_time=-1)
@@ -0,0 +1,102 @@
+import time
+from typing import Iterable, List
+
+import pytest  # type: ignore
+from flexlogger.automation import (
+    Application,
+    ChannelPoller,
+    ChannelSnapshot,
+    FlexLoggerError,
+)
+
+from .utils import open_project
+
+
+class _CountingChannelSpecification:
+    """Stands in for a ChannelSpecificationDocument whose channels count up on every read."""
+
+    def __init__(self, fail_reads: bool = False) -> None:
+        self.read_count = 0
+        self._fail_reads = fail_reads
+
+    def get_channel_snapshot(self, channel_names: Iterable[str]) -> ChannelSnapshot:
+        if self._fail_reads:
+            raise FlexLoggerError("Failed to get channel values")
+        self.read_count += 1
+        names = list(channel_names)
+        timestamp = self.read_count * 1000000000
+        return ChannelSnapshot(
+            names,
+            [self.read_count * (i + 1) for i in range(len(names))],
+            [timestamp] * len(names),
+        )
+
+
+def _wait_for_samples(poller: ChannelPoller, count: int, timeout: float = 5) -> None:
+    start = time.time()
+    while poller.sample_count < count and time.time() - start < timeout:
+        time.sleep(0.01)
+
+
+class TestChannelPoller:
+    @pytest.mark.unit  # type: ignore
+    def test__poller_running__latest__returns_most_recent_sample(self) -> None:
+        channel_specification = _CountingChannelSpecification()
+        with ChannelPoller(channel_specification, ["A", "B"], 200) as poller:  # type: ignore
+            _wait_for_samples(poller, 3)
+        latest = poller.latest()
+
+        assert latest is not None
+        assert ("A", "B") == latest.channel_names
+        assert [poller.sample_count, 2 * poller.sample_count] == latest.values.tolist()
+        assert not poller.is_running
+
+    @pytest.mark.unit  # type: ignore
+    def test__poller_wrapped_around__window__returns_history_in_order(self) -> None:
+        channel_specification = _CountingChannelSpecification()
+        with ChannelPoller(
+            channel_specification, ["A", "B"], 500, history_length=4  # type: ignore
+        ) as poller:
+            _wait_for_samples(poller, 10)
+
+        timestamps, values = poller.window(2.5)["B"]
+
+        last = poller.sample_count
+        assert [2 * (last - 2), 2 * (last - 1), 2 * last] == values.tolist()
+        assert sorted(timestamps.tolist()) == timestamps.tolist()
+        assert 4 == len(poller.window(1000)["A"][0])
+
+    @pytest.mark.unit  # type: ignore
+    def test__poller_not_started__latest_and_window__empty(self) -> None:
+        poller = ChannelPoller(_CountingChannelSpecification(), ["A"], 10)  # type: ignore
+
+        assert poller.latest() is None
+        assert 0 == len(poller.window(1)["A"][1])
+
+    @pytest.mark.unit  # type: ignore
+    def test__reads_fail__samples_counted_as_dropped(self) -> None:
+        channel_specification = _CountingChannelSpecification(fail_reads=True)
+        with ChannelPoller(channel_specification, ["A"], 200) as poller:  # type: ignore
+            time.sleep(0.1)
+
+        assert 0 == poller.sample_count
+        assert poller.dropped_count > 0
+        assert isinstance(poller.last_error, FlexLoggerError)
+
+    @pytest.mark.unit  # type: ignore
+    def test__duplicate_channel_names__exception_raised(self) -> None:
+        with pytest.raises(ValueError):
+            ChannelPoller(_CountingChannelSpecification(), ["A", "A"], 10)  # type: ignore
+
+    @pytest.mark.integration  # type: ignore
+    def test__project_with_channels__poll__values_recorded(self, app: Application) -> None:
+        with open_project(app, "ProjectWithProducedData") as project:
+            channel_specification = project.open_channel_specification_document()
+            channel_names = ["Channel 1", "Channel 2"]  # type: List[str]
+            with ChannelPoller(channel_specification, channel_names, 20) as poller:
+                _wait_for_samples(poller, 5)
+
+        assert poller.sample_count >= 5
+        timestamps, values = poller.window(60)["Channel 1"]
+        assert len(values) == poller.sample_count
+        assert timestamps[0] < timestamps[-1]
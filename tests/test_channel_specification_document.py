@@ -1,17 +1,21 @@
 from datetime import datetime, timedelta, timezone
 from time import sleep
-from typing import Iterator
+from typing import Iterator, List
+import threading
 import time
 
 import pytest  # type: ignore
 from flexlogger.automation import (
     Application,
     ChannelDataPoint,
+    ChannelSnapshot,
     ChannelSpecificationDocument,
     DataRateLevel,
     FlexLoggerError,
 )
 
+from flexlogger.automation.testing import FakeChannel, FakeFlexLoggerServer
+
 from .utils import get_project_path, open_project
 
 
@@ -62,6 +66,50 @@ class TestChannelSpecificationDocument:
         with pytest.raises(FlexLoggerError):
             channel_specification.get_channel_value("Not a channel")
 
+    @pytest.mark.integration  # type: ignore
+    def test__project_with_channels__get_values__values_returned_in_requested_order(
+        self, app: Application, channels_with_produced_data: ChannelSpecificationDocument
+    ) -> None:
+        channel_specification = channels_with_produced_data
+
+        channel_values = channel_specification.get_channel_values(
+            ["Channel 2", "Channel 1", "Channel 2"]
+        )
+
+        assert ["Channel 2", "Channel 1", "Channel 2"] == [value.name for value in channel_values]
+        assert channel_values[0].value == channel_values[2].value
+        assert all(value.timestamp.tzinfo == timezone.utc for value in channel_values)
+
+    @pytest.mark.integration  # type: ignore
+    def test__project_with_channels__get_values_for_no_channels__empty_list_returned(
+        self, app: Application, channels_with_produced_data: ChannelSpecificationDocument
+    ) -> None:
+        channel_specification = channels_with_produced_data
+
+        assert [] == channel_specification.get_channel_values([])
+
+    @pytest.mark.integration  # type: ignore
+    def test__get_channel_values_for_channel_that_does_not_exist__exception_raised(
+        self, app: Application, channels_with_produced_data: ChannelSpecificationDocument
+    ) -> None:
+        channel_specification = channels_with_produced_data
+        with pytest.raises(FlexLoggerError):
+            channel_specification.get_channel_values(["Channel 1", "Not a channel"])
+
+    @pytest.mark.integration  # type: ignore
+    def test__project_with_channels__get_snapshot__snapshot_matches_channel_values(
+        self, app: Application, channels_with_produced_data: ChannelSpecificationDocument
+    ) -> None:
+        channel_specification = channels_with_produced_data
+
+        snapshot = channel_specification.get_channel_snapshot(["Channel 1", "Channel 2"])
+
+        assert ("Channel 1", "Channel 2") == snapshot.channel_names
+        assert "float64" == snapshot.values.dtype.name
+        assert "int64" == snapshot.timestamps.dtype.name
+        assert snapshot.value("Channel 2") == snapshot["Channel 2"].value
+        assert snapshot["Channel 1"].timestamp.tzinfo == timezone.utc
+
     @pytest.mark.integration  # type: ignore
     def test__project_with_writable_channels__set_channel_value__channel_value_updated(
         self, app: Application
@@ -98,6 +146,46 @@ class TestChannelSpecificationDocument:
         with pytest.raises(FlexLoggerError):
             channel_specification.set_channel_value("Channel 1", 42)
 
+    @pytest.mark.integration  # type: ignore
+    def test__project_with_writable_channels__set_channel_values__channel_values_updated(
+        self, app: Application
+    ) -> None:
+        with open_project(app, "ProjectWithSwitchboard") as project:
+            channel_specification = project.open_channel_specification_document()
+            channel_specification.set_channel_values({"Switch 42": 12.5, "Switch 43": 25})
+
+            wait_for_channel_value_changed_timeout = 5
+            start = time.time()
+            updated_values = channel_specification.get_channel_values(["Switch 42", "Switch 43"])
+            while [value.value for value in updated_values] != [12.5, 25] and (
+                time.time() - start < wait_for_channel_value_changed_timeout
+            ):
+                sleep(0.1)
+                updated_values = channel_specification.get_channel_values(
+                    ["Switch 42", "Switch 43"]
+                )
+
+            assert [12.5, 25] == [value.value for value in updated_values]
+
+    @pytest.mark.integration  # type: ignore
+    def test__set_channel_values_with_invalid_entries__value_error_lists_each_entry(
+        self, app: Application, channels_with_produced_data: ChannelSpecificationDocument
+    ) -> None:
+        channel_specification = channels_with_produced_data
+        with pytest.raises(ValueError) as error_info:
+            channel_specification.set_channel_values([("Switch 1", "high"), (42, 1.0)])
+
+        assert "'Switch 1'" in str(error_info.value)
+        assert "42" in str(error_info.value)
+
+    @pytest.mark.integration  # type: ignore
+    def test__set_channel_values_for_readonly_channel__exception_raised(
+        self, app: Application, channels_with_produced_data: ChannelSpecificationDocument
+    ) -> None:
+        channel_specification = channels_with_produced_data
+        with pytest.raises(FlexLoggerError):
+            channel_specification.set_channel_values([("Channel 1", 42)])
+
     @pytest.mark.integration  # type: ignore
     def test__close_project_with_channels__get_value__exception_raised(
         self, app: Application
@@ -116,6 +204,146 @@ class TestChannelSpecificationDocument:
         )
         assert expected_repr == repr(channel_data_point)
 
+    @pytest.mark.unit  # type: ignore
+    def test__channel_snapshot__lookup_by_name_and_position__channel_data_points_created(
+        self,
+    ) -> None:
+        timestamp = datetime(2021, 5, 4, 3, 2, 1, 123456, tzinfo=timezone.utc)
+        nanoseconds = int(timestamp.timestamp()) * 1000000000 + 123456789
+        snapshot = ChannelSnapshot(["A", "B"], [1.5, -2.0], [nanoseconds, nanoseconds])
+
+        assert 2 == len(snapshot)
+        assert "B" in snapshot
+        assert -2.0 == snapshot["B"].value
+        assert timestamp == snapshot["B"].timestamp
+        assert "A" == snapshot[-2].name
+        assert ["A", "B"] == [data_point.name for data_point in snapshot.to_channel_data_points()]
+        with pytest.raises(KeyError):
+            snapshot["C"]
+        with pytest.raises(IndexError):
+            snapshot[2]
+
+    @pytest.mark.unit  # type: ignore
+    def test__channel_snapshot_with_mismatched_lengths__exception_raised(self) -> None:
+        with pytest.raises(ValueError):
+            ChannelSnapshot(["A", "B"], [1.0], [0, 0])
+
+    @pytest.mark.unit  # type: ignore
+    def test__channel_handles__read_and_write__values_match(self) -> None:
+        channels = [FakeChannel("Input", 4.5), FakeChannel("Output", 0.0, is_output=True)]
+        with FakeFlexLoggerServer(channels) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                input_handle = channel_specification.get_channel_handle("Input")
+                output_handle = channel_specification.get_channel_handle("Output")
+
+                data_point = input_handle.read()
+                output_handle.write(1.0)
+                output_handle.write(2.0)
+
+                assert input_handle is channel_specification.get_channel_handle("Input")
+                assert "Input" == data_point.name
+                assert 4.5 == data_point.value
+                assert 2.0 == output_handle.read().value
+                assert 2.0 == server.get_channel_value("Output")
+
+    @pytest.mark.unit  # type: ignore
+    def test__channel_handle_for_missing_channel__read__exception_raised(self) -> None:
+        with FakeFlexLoggerServer([FakeChannel("Input")]) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                handle = channel_specification.get_channel_handle("Missing")
+
+                with pytest.raises(FlexLoggerError):
+                    handle.read()
+
+    @pytest.mark.unit  # type: ignore
+    def test__value_cache_enabled__read_twice__second_read_served_from_cache(self) -> None:
+        with FakeFlexLoggerServer([FakeChannel("Input", 4.5)]) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                cache = channel_specification.enable_value_cache(0.1)
+
+                first = channel_specification.get_channel_value("Input")
+                second = channel_specification.get_channel_value("Input")
+                time.sleep(0.15)
+                channel_specification.get_channel_value("Input")
+                read_count = server.call_counts["GetDoubleChannelValue"]
+
+        assert first is second
+        assert 2 == read_count
+        assert 1 == cache.hit_count
+        assert 2 == cache.miss_count
+
+    @pytest.mark.unit  # type: ignore
+    def test__value_cache_enabled__concurrent_reads__one_request_made(self) -> None:
+        with FakeFlexLoggerServer(
+            [FakeChannel("Input", 4.5)], method_latencies={"GetDoubleChannelValue": 0.2}
+        ) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                cache = channel_specification.enable_value_cache(10)
+                values = []  # type: List[float]
+
+                def read() -> None:
+                    values.append(channel_specification.get_channel_value("Input").value)
+
+                threads = [threading.Thread(target=read) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                    time.sleep(0.01)
+                for thread in threads:
+                    thread.join()
+                read_count = server.call_counts["GetDoubleChannelValue"]
+
+        assert [4.5] * 4 == values
+        assert 1 == read_count
+        assert 1 == cache.miss_count
+        assert 3 == cache.merged_count
+
+    @pytest.mark.unit  # type: ignore
+    def test__value_cache_enabled__read_slower_than_max_age__value_not_served_from_cache(
+        self,
+    ) -> None:
+        with FakeFlexLoggerServer(
+            [FakeChannel("Input", 4.5)], method_latencies={"GetDoubleChannelValue": 0.2}
+        ) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                cache = channel_specification.enable_value_cache(0.1)
+
+                channel_specification.get_channel_value("Input")
+                channel_specification.get_channel_value("Input")
+                read_count = server.call_counts["GetDoubleChannelValue"]
+
+        assert 2 == read_count
+        assert 0 == cache.hit_count
+        assert 2 == cache.miss_count
+
+    @pytest.mark.unit  # type: ignore
+    def test__value_cache_enabled__set_channel_value__new_value_read(self) -> None:
+        with FakeFlexLoggerServer([FakeChannel("Output", 0.0, is_output=True)]) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                channel_specification.enable_value_cache(10)
+                handle = channel_specification.get_channel_handle("Output")
+
+                before = channel_specification.get_channel_value("Output").value
+                channel_specification.set_channel_value("Output", 1.0)
+                after_set = handle.read().value
+                channel_specification.set_channel_values({"Output": 2.0})
+                after_set_values = channel_specification.get_channel_value("Output").value
+                handle.write(3.0)
+                after_write = channel_specification.get_channel_value("Output").value
+
+        assert [0.0, 1.0, 2.0, 3.0] == [before, after_set, after_set_values, after_write]
+
     @pytest.mark.integration  # type: ignore
     def test__project_with_writable_channels__disable_channel__channel_disabled(
         self, app: Application
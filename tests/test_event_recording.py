@@ -0,0 +1,121 @@
+import time
+from pathlib import Path
+from typing import Any, List
+
+import pytest  # type: ignore
+from flexlogger.automation import (
+    EventNames,
+    EventRecorder,
+    EventReplayer,
+    EventType,
+    FlexLoggerError,
+)
+from flexlogger.automation.proto import Events_pb2
+from flexlogger.automation.proto.EventType_pb2 import EventType as EventType_pb2
+
+from .test_events import create_offline_event_handler
+
+
+def _create_event(event_type: Any, event_name: str) -> Events_pb2.SubscribeToEventsResponse:
+    return Events_pb2.SubscribeToEventsResponse(event_type=event_type, event_name=event_name)
+
+
+def _record(path: Path, event_names: List[str], interval: float = 0.0) -> None:
+    with EventRecorder(path) as recorder:
+        for event_name in event_names:
+            recorder.record(_create_event(EventType_pb2.EVENT_TYPE_CUSTOM, event_name))
+            if interval > 0:
+                time.sleep(interval)
+
+
+class TestEventRecording:
+    @pytest.mark.unit  # type: ignore
+    def test__events_recorded__replay_as_fast_as_possible__callbacks_receive_events_in_order(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "test.events"
+        event_names = ["Event %d" % i for i in range(100)]
+        _record(path, event_names)
+        replayer = EventReplayer(path)
+        received = []
+        replayer.register_event_callback(
+            lambda application, event_type, payload: received.append(payload.event_name)
+        )
+
+        count = replayer.replay(speed=None)
+
+        assert 100 == count
+        assert 100 == len(replayer)
+        assert event_names == received
+
+    @pytest.mark.unit  # type: ignore
+    def test__events_recorded__replay_with_filter__only_matching_events_dispatched(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "test.events"
+        with EventRecorder(path) as recorder:
+            recorder.record(_create_event(EventType_pb2.EVENT_TYPE_ALARM, EventNames.ALARM_ADDED))
+            recorder.record(_create_event(EventType_pb2.EVENT_TYPE_CUSTOM, "Custom"))
+        replayer = EventReplayer(path)
+        received = []
+        replayer.register_event_callback(
+            lambda application, event_type, payload: received.append(event_type),
+            [EventType.CUSTOM],
+        )
+
+        replayer.replay(speed=None)
+
+        assert [EventType.CUSTOM] == received
+
+    @pytest.mark.unit  # type: ignore
+    def test__events_recorded__replay_at_double_speed__takes_half_the_time(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "test.events"
+        _record(path, ["1", "2", "3"], interval=0.1)
+        replayer = EventReplayer(path)
+
+        start_time = time.perf_counter()
+        replayer.replay(speed=2.0)
+        elapsed_time = time.perf_counter() - start_time
+
+        assert 0.2 <= replayer.duration < 0.4
+        assert replayer.duration / 2 - 0.01 <= elapsed_time < replayer.duration
+
+    @pytest.mark.unit  # type: ignore
+    def test__recording_not_closed__replay__flushed_events_replayed(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.events"
+        recorder = EventRecorder(path)
+        recorder.record(_create_event(EventType_pb2.EVENT_TYPE_CUSTOM, "1"))
+        recorder.record(_create_event(EventType_pb2.EVENT_TYPE_CUSTOM, "2"))
+        recorder.flush()
+        # Lose the index and leave a partial record at the end of the file
+        (tmp_path / "test.events.idx").unlink()
+        with open(str(path), "ab") as event_file:
+            event_file.write(b"\x00\x01")
+
+        replayer = EventReplayer(path)
+
+        assert ["1", "2"] == [event.event_name for _, event in replayer.read_events()]
+        recorder.close()
+
+    @pytest.mark.unit  # type: ignore
+    def test__event_handler__start_recording_twice__exception_raised(self, tmp_path: Path) -> None:
+        event_handler = create_offline_event_handler()
+        recorder = event_handler.start_recording(tmp_path / "test.events")
+
+        with pytest.raises(FlexLoggerError):
+            event_handler.start_recording(tmp_path / "other.events")
+
+        event_handler.stop_recording()
+        assert recorder.closed
+
+    @pytest.mark.unit  # type: ignore
+    def test__file_is_not_recording__create_replayer__exception_raised(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "test.events"
+        path.write_bytes(b"not events")
+
+        with pytest.raises(FlexLoggerError):
+            EventReplayer(path)
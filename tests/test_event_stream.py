@@ -0,0 +1,150 @@
+import asyncio
+import threading
+from typing import Any, List
+
+import pytest  # type: ignore
+from flexlogger.automation import (
+    EventPayload,
+    EventStream,
+    EventType,
+    FlexLoggerError,
+    OverflowPolicy,
+)
+from flexlogger.automation.proto import Events_pb2
+from flexlogger.automation.proto.EventType_pb2 import EventType as EventType_pb2
+
+
+class _FakeEventHandler:
+    """Stands in for a FlexLoggerEventHandler so events can be fed in directly."""
+
+    def __init__(self) -> None:
+        self.event_streams = []  # type: List[EventStream]
+
+    def _add_event_stream(self, event_stream: EventStream) -> None:
+        self.event_streams.append(event_stream)
+
+    def _remove_event_stream(self, event_stream: EventStream) -> None:
+        self.event_streams.remove(event_stream)
+
+
+def _create_payload(event_name: str) -> EventPayload:
+    return EventPayload(
+        Events_pb2.SubscribeToEventsResponse(
+            event_type=EventType_pb2.EVENT_TYPE_CUSTOM, event_name=event_name
+        )
+    )
+
+
+def _send_events(event_stream: EventStream, event_names: List[str]) -> None:
+    for event_name in event_names:
+        event_stream._on_event(None, EventType.CUSTOM, _create_payload(event_name))
+
+
+def _run(coroutine: Any) -> Any:
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def _read_all(event_stream: EventStream) -> List[str]:
+    return [event.event_name async for event in event_stream]
+
+
+def _create_event_stream(
+    event_handler: _FakeEventHandler, max_queue_size: int, overflow_policy: OverflowPolicy
+) -> EventStream:
+    return EventStream(
+        event_handler,  # type: ignore
+        None,
+        None,
+        max_queue_size,
+        overflow_policy,
+        asyncio.get_event_loop(),
+    )
+
+
+class TestEventStream:
+    @pytest.mark.unit  # type: ignore
+    def test__block_policy__send_more_events_than_queue_size__all_events_received_in_order(
+        self,
+    ) -> None:
+        event_names = ["Event %d" % i for i in range(20)]
+
+        async def receive() -> Any:
+            event_handler = _FakeEventHandler()
+            event_stream = _create_event_stream(event_handler, 2, OverflowPolicy.BLOCK)
+            async with event_stream:
+                producer = threading.Thread(target=_send_events, args=(event_stream, event_names))
+                producer.start()
+                received = []
+                async for event in event_stream:
+                    received.append(event.event_name)
+                    if len(received) == len(event_names):
+                        break
+                producer.join()
+            return received, event_stream, event_handler
+
+        received, event_stream, event_handler = _run(receive())
+
+        assert event_names == received
+        assert 0 == event_stream.dropped_count
+        assert 20 == event_stream.received_count
+        assert 20 == event_stream.delivered_count
+        assert [] == event_handler.event_streams
+
+    @pytest.mark.unit  # type: ignore
+    def test__drop_oldest_policy__send_more_events_than_queue_size__newest_events_kept(
+        self,
+    ) -> None:
+        async def receive() -> Any:
+            event_stream = _create_event_stream(_FakeEventHandler(), 2, OverflowPolicy.DROP_OLDEST)
+            async with event_stream:
+                _send_events(event_stream, ["1", "2", "3", "4", "5"])
+            return await _read_all(event_stream), event_stream
+
+        received, event_stream = _run(receive())
+
+        assert ["4", "5"] == received
+        assert 3 == event_stream.dropped_count
+        assert 5 == event_stream.received_count
+
+    @pytest.mark.unit  # type: ignore
+    def test__drop_newest_policy__send_more_events_than_queue_size__oldest_events_kept(
+        self,
+    ) -> None:
+        async def receive() -> Any:
+            event_stream = _create_event_stream(_FakeEventHandler(), 2, OverflowPolicy.DROP_NEWEST)
+            async with event_stream:
+                _send_events(event_stream, ["1", "2", "3", "4", "5"])
+            return await _read_all(event_stream), event_stream
+
+        received, event_stream = _run(receive())
+
+        assert ["1", "2"] == received
+        assert 3 == event_stream.dropped_count
+        assert 0 == event_stream.queue_depth
+
+    @pytest.mark.unit  # type: ignore
+    def test__stream_closed_with_error__iterate__queued_events_then_error_raised(self) -> None:
+        async def receive() -> List[str]:
+            event_stream = _create_event_stream(_FakeEventHandler(), 10, OverflowPolicy.BLOCK)
+            await event_stream.__aenter__()
+            _send_events(event_stream, ["1"])
+            event_stream._close(FlexLoggerError("Failed to receive event."))
+            received = []
+            with pytest.raises(FlexLoggerError):
+                async for event in event_stream:
+                    received.append(event.event_name)
+            return received
+
+        assert ["1"] == _run(receive())
+
+    @pytest.mark.unit  # type: ignore
+    def test__invalid_queue_size__create_stream__exception_raised(self) -> None:
+        async def create() -> None:
+            _create_event_stream(_FakeEventHandler(), 0, OverflowPolicy.BLOCK)
+
+        with pytest.raises(ValueError):
+            _run(create())
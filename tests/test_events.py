@@ -1,11 +1,22 @@
 from .utils import open_project
+import asyncio
 import datetime
+import threading
+import time
 from flexlogger.automation import (
+    AlarmPayload,
     Application,
+    DispatchMode,
     EventPayload,
     EventNames,
-    EventType
+    EventType,
+    FlexLoggerError,
+    FlexLoggerEventHandler,
 )
+from flexlogger.automation import _events
+from flexlogger.automation.proto import Events_pb2
+from flexlogger.automation.proto.EventType_pb2 import EventType as EventType_pb2
+import grpc  # type: ignore
 import pytest  # type: ignore
 
 received_event_type = None
@@ -29,6 +40,101 @@ def generic_event_handler(application: Application, event_type: EventType, paylo
     print("Event received: {}".format(event_type))
 
 
+class _FakeStubRegistry:
+    def get(self, stub_class):
+        return None
+
+
+class _FakeEventsStub:
+    """Stands in for the events service, which registers the client after a few checks."""
+
+    def __init__(self, checks_before_registered: int) -> None:
+        self.checks_before_registered = checks_before_registered
+        self.check_count = 0
+        self.cancelled = threading.Event()
+
+    def SubscribeToEvents(self, request):
+        stub = self
+
+        class _Call:
+            def __next__(self):
+                stub.cancelled.wait()
+                raise RuntimeError("cancelled")
+
+            def cancel(self):
+                stub.cancelled.set()
+
+        self.event_types = list(request.event_types)
+        return _Call()
+
+    def GetRegisteredEvents(self, request):
+        self.check_count += 1
+        registered = self.check_count > self.checks_before_registered
+        return Events_pb2.GetRegisteredEventsResponse(
+            event_types=self.event_types if registered else []
+        )
+
+
+class _FakeEventsStubRegistry:
+    def __init__(self, stub: _FakeEventsStub) -> None:
+        self.stub = stub
+
+    def get(self, stub_class):
+        return self.stub
+
+
+class _FakeRpcError(grpc.RpcError):
+    def __init__(self, code: grpc.StatusCode) -> None:
+        self._code = code
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+
+class _FailingEventStream:
+    """Stands in for an event stream that fails with an error instead of returning events."""
+
+    def __init__(self, error: Exception, before_raising=lambda: None) -> None:
+        self.error = error
+        self.before_raising = before_raising
+
+    def __next__(self):
+        self.before_raising()
+        raise self.error
+
+
+class _FakeReconnectingApplication:
+    """Stands in for an application with a ReconnectPolicy that cannot reconnect."""
+
+    def __init__(self) -> None:
+        self._reconnecting_channel = self
+        self.generation = 0
+        self.recovered_generations = []
+
+    def _recover(self, generation: int) -> bool:
+        self.recovered_generations.append(generation)
+        return False
+
+
+def create_offline_event_handler() -> FlexLoggerEventHandler:
+    """Create an event handler that is not connected to FlexLogger.
+
+    Events can be passed to its _dispatch_event() method directly.
+    """
+    return FlexLoggerEventHandler(_FakeStubRegistry(), "client", None, lambda: None)
+
+
+def create_subscribed_event_handler(application) -> FlexLoggerEventHandler:
+    """Create an event handler that is not connected to FlexLogger, but acts as if it was
+    subscribed to events.
+
+    Event streams can be passed to its _event_handler() method directly.
+    """
+    event_handler = FlexLoggerEventHandler(_FakeStubRegistry(), "client", application, lambda: None)
+    event_handler._is_subscribed = True
+    return event_handler
+
+
 class TestEvents:
     @staticmethod
     def wait_for_registered_events(event_handler, timeout=3) -> [EventType]:
@@ -151,3 +257,272 @@ class TestEvents:
             event_received = self.wait_for_event(EventType.ALARM)
             assert event_received
             event_handler.unregister_from_events()
+
+    @pytest.mark.integration  # type: ignore
+    def test__iterate_events__start_session__session_event_received(self, app: Application) -> None:
+        async def wait_for_test_started(session) -> EventPayload:
+            event_handler = app.event_handler
+            async with event_handler.events([EventType.TEST_SESSION]) as events:
+                session.start()
+                async for event in events:
+                    if event.event_name == EventNames.TEST_STARTED:
+                        return event
+
+        with open_project(app, "ProjectWithProducedData") as project:
+            loop = asyncio.new_event_loop()
+            try:
+                event = loop.run_until_complete(
+                    asyncio.wait_for(wait_for_test_started(project.test_session), 5)
+                )
+            finally:
+                loop.close()
+                app.event_handler.unregister_from_events()
+            assert EventType.TEST_SESSION == event.event_type
+
+    @pytest.mark.unit  # type: ignore
+    def test__callbacks_for_types_and_names__dispatch_events__matching_callbacks_called_in_order(
+        self,
+    ) -> None:
+        event_handler = create_offline_event_handler()
+        received = []
+
+        def record(label):
+            return lambda application, event_type, payload: received.append((label, payload))
+
+        all_session_events = record("all session events")
+        test_started_events = record("test started events")
+        alarm_events = record("alarm events")
+        event_handler._add_subscription(all_session_events, [EventType.TEST_SESSION], None)
+        event_handler._add_subscription(
+            test_started_events, [EventType.TEST_SESSION], [EventNames.TEST_STARTED]
+        )
+        event_handler._add_subscription(alarm_events, [EventType.ALARM], None)
+
+        for event_name in [EventNames.TEST_STARTED, EventNames.TEST_STOPPED]:
+            event_handler._dispatch_event(
+                Events_pb2.SubscribeToEventsResponse(
+                    event_type=EventType_pb2.EVENT_TYPE_TEST_SESSION, event_name=event_name
+                )
+            )
+
+        assert ["all session events", "test started events", "all session events"] == [
+            label for label, _ in received
+        ]
+        # The payload is created once and shared by every callback for the event
+        assert received[0][1] is received[1][1]
+        assert EventNames.TEST_STOPPED == received[2][1].event_name
+
+    @pytest.mark.unit  # type: ignore
+    def test__callback_removed__dispatch_event__callback_not_called(self) -> None:
+        event_handler = create_offline_event_handler()
+        received = []
+
+        def callback(application, event_type, payload):
+            received.append(payload)
+
+        event_handler._add_subscription(callback, None, None)
+        event_handler._remove_subscription(callback)
+        event_handler._dispatch_event(
+            Events_pb2.SubscribeToEventsResponse(event_type=EventType_pb2.EVENT_TYPE_CUSTOM)
+        )
+
+        assert [] == received
+
+    @pytest.mark.unit  # type: ignore
+    def test__per_subscriber_mode__slow_callback__fast_callback_not_blocked(self) -> None:
+        event_handler = create_offline_event_handler()
+        event_handler.dispatch_mode = DispatchMode.PER_SUBSCRIBER
+        release_slow_callback = threading.Event()
+        fast_done = threading.Event()
+        slow_received = []
+        fast_received = []
+
+        def slow_callback(application, event_type, payload):
+            release_slow_callback.wait(5)
+            slow_received.append(payload.event_name)
+
+        def fast_callback(application, event_type, payload):
+            fast_received.append(payload.event_name)
+            if len(fast_received) == 10:
+                fast_done.set()
+
+        event_handler._add_subscription(slow_callback, None, None)
+        event_handler._add_subscription(fast_callback, None, None)
+        event_names = ["Event %d" % i for i in range(10)]
+        for event_name in event_names:
+            event_handler._dispatch_event(
+                Events_pb2.SubscribeToEventsResponse(
+                    event_type=EventType_pb2.EVENT_TYPE_CUSTOM, event_name=event_name
+                )
+            )
+
+        assert fast_done.wait(5)
+        assert event_names == fast_received
+        assert [] == slow_received
+        release_slow_callback.set()
+        deadline = time.monotonic() + 5
+        while len(slow_received) < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert event_names == slow_received
+
+        metrics = event_handler.subscriber_metrics()
+        assert 10 == metrics[slow_callback].delivered_count
+        assert 10 == metrics[fast_callback].delivered_count
+        assert 0 == metrics[slow_callback].queue_depth
+        assert metrics[slow_callback].max_queue_depth > 1
+        assert metrics[slow_callback].max_latency >= metrics[slow_callback].mean_latency > 0
+        event_handler._remove_subscription(slow_callback)
+        event_handler._remove_subscription(fast_callback)
+
+    @pytest.mark.unit  # type: ignore
+    def test__event_stream_unavailable__application_recovers_connection(self) -> None:
+        application = _FakeReconnectingApplication()
+        event_handler = create_subscribed_event_handler(application)
+        event_stream = _FailingEventStream(_FakeRpcError(grpc.StatusCode.UNAVAILABLE))
+
+        with pytest.raises(FlexLoggerError):
+            event_handler._event_handler(event_stream)
+
+        assert [0] == application.recovered_generations
+
+    @pytest.mark.unit  # type: ignore
+    def test__event_stream_fails__application_does_not_recover_connection(self) -> None:
+        application = _FakeReconnectingApplication()
+        event_handler = create_subscribed_event_handler(application)
+        event_stream = _FailingEventStream(_FakeRpcError(grpc.StatusCode.INTERNAL))
+
+        with pytest.raises(FlexLoggerError):
+            event_handler._event_handler(event_stream)
+
+        assert [] == application.recovered_generations
+
+    @pytest.mark.unit  # type: ignore
+    def test__unregister_cancels_event_stream__handler_exits_without_recovering(self) -> None:
+        application = _FakeReconnectingApplication()
+        event_handler = create_subscribed_event_handler(application)
+
+        def unregister():
+            event_handler._is_subscribed = False
+
+        event_stream = _FailingEventStream(_FakeRpcError(grpc.StatusCode.CANCELLED), unregister)
+
+        event_handler._event_handler(event_stream)
+
+        assert [] == application.recovered_generations
+
+    @pytest.mark.unit  # type: ignore
+    def test__per_subscriber_backlog__switch_to_inline__events_delivered_once_in_order(
+        self,
+    ) -> None:
+        event_handler = create_offline_event_handler()
+        event_handler.dispatch_mode = DispatchMode.PER_SUBSCRIBER
+        lock = threading.Lock()
+        running_callbacks = []
+        max_running_callbacks = [0]
+        received = []
+
+        def slow_callback(application, event_type, payload):
+            with lock:
+                running_callbacks.append(payload.event_name)
+                max_running_callbacks[0] = max(max_running_callbacks[0], len(running_callbacks))
+            time.sleep(0.01)
+            with lock:
+                running_callbacks.remove(payload.event_name)
+                received.append(payload.event_name)
+
+        def dispatch(event_name):
+            event_handler._dispatch_event(
+                Events_pb2.SubscribeToEventsResponse(
+                    event_type=EventType_pb2.EVENT_TYPE_CUSTOM, event_name=event_name
+                )
+            )
+
+        event_handler._add_subscription(slow_callback, None, None)
+        event_names = ["Event %d" % i for i in range(10)]
+        for event_name in event_names[:5]:
+            dispatch(event_name)
+        assert event_handler.subscriber_metrics()[slow_callback].queue_depth > 0
+
+        event_handler.dispatch_mode = DispatchMode.INLINE
+        for event_name in event_names[5:]:
+            dispatch(event_name)
+
+        assert event_names == received
+        assert 1 == max_running_callbacks[0]
+        event_handler._remove_subscription(slow_callback)
+
+    @pytest.mark.unit  # type: ignore
+    def test__inline_mode__dispatch_event__metrics_recorded(self) -> None:
+        event_handler = create_offline_event_handler()
+
+        def callback(application, event_type, payload):
+            pass
+
+        event_handler._add_subscription(callback, None, None)
+        for _ in range(3):
+            event_handler._dispatch_event(
+                Events_pb2.SubscribeToEventsResponse(event_type=EventType_pb2.EVENT_TYPE_CUSTOM)
+            )
+
+        metrics = event_handler.subscriber_metrics()[callback]
+        assert DispatchMode.INLINE == event_handler.dispatch_mode
+        assert 3 == metrics.delivered_count
+        assert 0 == metrics.queue_depth
+        assert 0 == metrics.error_count
+
+    @pytest.mark.unit  # type: ignore
+    def test__alarm_event__read_payload__fields_decoded_on_first_access(self) -> None:
+        payload = AlarmPayload(
+            Events_pb2.SubscribeToEventsResponse(
+                event_type=EventType_pb2.EVENT_TYPE_ALARM,
+                event_name=EventNames.ALARM_ADDED,
+                payload='{"AlarmId": "1", "Active": true, "Acknowledged": false, '
+                '"AcknowledgedAt": null, "OccurredAt": "2021-03-04T12:34:56.1234567Z", '
+                '"SeverityLevel": "High", "UpdatedAt": "2021-03-04T12:35:00-06:00", '
+                '"Channel": "Channel 1", "Condition": "> 5", "DisplayName": "Too hot", '
+                '"Description": ""}',
+            )
+        )
+
+        assert payload._fields is None
+        assert payload.active
+        assert "High" == payload.severity_level
+        assert payload.acknowledged_at is None
+        occurred_at = payload.occurred_at
+        assert (
+            datetime.datetime(2021, 3, 4, 12, 34, 56, 123456, tzinfo=datetime.timezone.utc)
+            == occurred_at
+        )
+        assert occurred_at is payload.occurred_at
+        assert (
+            datetime.datetime(2021, 3, 4, 18, 35, 0, tzinfo=datetime.timezone.utc)
+            == payload.updated_at
+        )
+
+    @pytest.mark.unit  # type: ignore
+    def test__server_registers_late__register_callback__returns_once_registered(self) -> None:
+        stub = _FakeEventsStub(checks_before_registered=3)
+        event_handler = FlexLoggerEventHandler(
+            _FakeEventsStubRegistry(stub), "client", None, lambda: None  # type: ignore
+        )
+
+        event_handler.register_event_callback(generic_event_handler, [EventType.ALARM])
+
+        assert 4 == stub.check_count
+        stub.cancelled.set()
+
+    @pytest.mark.unit  # type: ignore
+    def test__server_never_registers__register_callback__exception_raised(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_events, "_REGISTRATION_TIMEOUT", 0.05)
+        stub = _FakeEventsStub(checks_before_registered=1000000)
+        event_handler = FlexLoggerEventHandler(
+            _FakeEventsStubRegistry(stub), "client", None, lambda: None  # type: ignore
+        )
+
+        with pytest.raises(FlexLoggerError):
+            event_handler.register_event_callback(generic_event_handler, [EventType.ALARM])
+
+        assert stub.cancelled.is_set()
+        assert {} == event_handler.subscriber_metrics()
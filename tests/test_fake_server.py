@@ -0,0 +1,141 @@
+import threading
+import time
+from typing import Any, List
+
+import pytest  # type: ignore
+from flexlogger.automation import (
+    Application,
+    EventType,
+    EventNames,
+    FlexLoggerError,
+    LogFileType,
+    TestSessionState,
+)
+from flexlogger.automation.testing import (
+    FakeChannel,
+    FakeFlexLoggerServer,
+    SawtoothWaveform,
+    ScriptedEvent,
+    SineWaveform,
+    SquareWaveform,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+class TestFakeServer:
+    @pytest.mark.unit  # type: ignore
+    def test__input_channel_with_waveform__read_value__waveform_value_at_clock_time(
+        self,
+    ) -> None:
+        clock = _Clock()
+        channels = [
+            FakeChannel("Sine", SineWaveform(amplitude=2.0, frequency=1.0)),
+            FakeChannel("Square", SquareWaveform(low=-1.0, high=1.0, frequency=1.0)),
+        ]
+        with FakeFlexLoggerServer(channels, clock=clock) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                clock.time = 0.25
+                values = channel_specification.get_channel_values(["Sine", "Square"])
+                clock.time = 0.75
+                later_values = channel_specification.get_channel_values(["Sine", "Square"])
+
+        assert [2.0, 1.0] == [point.value for point in values]
+        assert [-2.0, -1.0] == [point.value for point in later_values]
+
+    @pytest.mark.unit  # type: ignore
+    def test__output_channel__write_value__value_read_back(self) -> None:
+        channels = [FakeChannel("Input", 1.0), FakeChannel("Output", 0.0, is_output=True)]
+        with FakeFlexLoggerServer(channels) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                channel_specification.set_channel_value("Output", 3.5)
+                with pytest.raises(FlexLoggerError):
+                    channel_specification.set_channel_value("Input", 3.5)
+                with pytest.raises(FlexLoggerError):
+                    channel_specification.get_channel_value("Unknown")
+
+                assert 3.5 == channel_specification.get_channel_value("Output").value
+                assert 3.5 == server.get_channel_value("Output")
+
+    @pytest.mark.unit  # type: ignore
+    def test__test_session__start_and_stop__state_events_and_log_files_updated(self) -> None:
+        clock = _Clock()
+        received = []  # type: List[str]
+        all_received = threading.Event()
+
+        def on_event(application: Any, event_type: EventType, payload: Any) -> None:
+            received.append(payload.event_name)
+            if len(received) == 4:
+                all_received.set()
+
+        with FakeFlexLoggerServer(clock=clock) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                logging_specification = project.open_logging_specification_document()
+                app.event_handler.register_event_callback(on_event)
+                test_session = project.test_session
+
+                assert test_session.start()
+                assert TestSessionState.RUNNING == test_session.state
+                clock.time = 10.0
+                assert 10.0 == test_session.elapsed_test_time.total_seconds()
+                assert test_session.stop()
+                assert not test_session.stop()
+
+                assert ["Log 1.tdms"] == logging_specification.get_log_files(LogFileType.TDMS)
+                assert all_received.wait(5)
+                app.event_handler.unregister_from_events()
+
+        assert [
+            EventNames.TEST_STARTED,
+            EventNames.LOG_FILE_CREATED,
+            EventNames.LOG_FILE_CLOSED,
+            EventNames.TEST_STOPPED,
+        ] == received
+
+    @pytest.mark.unit  # type: ignore
+    def test__scripted_events__play_events__events_received_in_order(self) -> None:
+        received = []  # type: List[str]
+        all_received = threading.Event()
+
+        def on_event(application: Any, event_type: EventType, payload: Any) -> None:
+            received.append(payload.event_name)
+            if len(received) == 3:
+                all_received.set()
+
+        script = [ScriptedEvent(0.01, EventType.CUSTOM, "Event %d" % i) for i in range(3)]
+        with FakeFlexLoggerServer() as server:
+            with Application(server_port=server.port) as app:
+                app.event_handler.register_event_callback(on_event, [EventType.CUSTOM])
+                server.play_events(script).join()
+                assert all_received.wait(5)
+                app.event_handler.unregister_from_events()
+
+        assert ["Event 0", "Event 1", "Event 2"] == received
+
+    @pytest.mark.unit  # type: ignore
+    def test__method_latency__call_method__call_delayed(self) -> None:
+        with FakeFlexLoggerServer(method_latencies={"GetVersion": 0.1}) as server:
+            with Application(server_port=server.port) as app:
+                start_time = time.perf_counter()
+                app.get_version()
+                elapsed_time = time.perf_counter() - start_time
+
+                assert elapsed_time >= 0.1
+                assert 1 == server.call_counts["GetVersion"]
+
+    @pytest.mark.unit  # type: ignore
+    def test__sawtooth_waveform__value_at__ramps_and_repeats(self) -> None:
+        waveform = SawtoothWaveform(low=0.0, high=10.0, frequency=2.0)
+
+        assert [0.0, 5.0, 0.0] == [waveform.value_at(time) for time in (0.0, 0.25, 0.5)]
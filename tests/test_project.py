@@ -4,6 +4,7 @@ from time import sleep
 import os
 import pytest  # type: ignore
 from flexlogger.automation import Application, FlexLoggerError
+from flexlogger.automation.testing import FakeFlexLoggerServer
 
 from .utils import (
     assert_no_flexloggers_running,
@@ -252,3 +253,59 @@ class TestProject:
     def test__open_default_project__save__no_error(self, app: Application) -> None:
         with open_project(app, "DefaultProject") as project:
             project.save()
+
+    @pytest.mark.unit  # type: ignore
+    def test__open_documents_twice__documents_opened_once(self) -> None:
+        with FakeFlexLoggerServer() as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                logging_specification = project.open_logging_specification_document()
+                screen = project.open_screen_document("Screen")
+
+                assert channel_specification is project.open_channel_specification_document()
+                assert logging_specification is project.open_logging_specification_document()
+                assert screen is project.open_screen_document("Screen.flxscr")
+                call_counts = server.call_counts
+                assert 1 == call_counts["OpenChannelSpecificationDocument"]
+                assert 1 == call_counts["OpenLoggingSpecificationDocument"]
+                assert 1 == call_counts["OpenScreenDocument"]
+
+    @pytest.mark.unit  # type: ignore
+    def test__open_document_without_cache__document_opened_again_and_cached(self) -> None:
+        with FakeFlexLoggerServer() as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                first_document = project.open_channel_specification_document()
+
+                second_document = project.open_channel_specification_document(use_cache=False)
+
+                assert first_document is not second_document
+                assert second_document is project.open_channel_specification_document()
+                assert 2 == server.call_counts["OpenChannelSpecificationDocument"]
+
+    @pytest.mark.unit  # type: ignore
+    def test__close_project__open_document__raises_exception(self) -> None:
+        with FakeFlexLoggerServer() as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                project.open_channel_specification_document()
+                project.close()
+
+                with pytest.raises(FlexLoggerError):
+                    project.open_channel_specification_document()
+
+    @pytest.mark.unit  # type: ignore
+    def test__disconnect_application__using_objects_raises_flexlogger_error(self) -> None:
+        with FakeFlexLoggerServer() as server:
+            app = Application(server_port=server.port)
+            project = app.open_project("Test.flxproj")
+            channel_specification = project.open_channel_specification_document()
+            app.disconnect()
+
+            with pytest.raises(FlexLoggerError):
+                app.get_version()
+            with pytest.raises(FlexLoggerError):
+                app.open_project("Test.flxproj")
+            with pytest.raises(FlexLoggerError):
+                channel_specification.get_channel_names()
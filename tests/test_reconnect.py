@@ -0,0 +1,133 @@
+import threading
+import time
+from typing import Any, List
+
+import pytest  # type: ignore
+from flexlogger.automation import (
+    Application,
+    EventType,
+    FlexLoggerError,
+    ReconnectPolicy,
+    TestSessionState,
+)
+from flexlogger.automation.testing import FakeChannel, FakeFlexLoggerServer
+
+_FAST_RECONNECT = ReconnectPolicy(max_recovery_time=10, retry_interval=0.05)
+
+
+def _wait_for_client_to_notice_restart() -> None:
+    # gRPC reports that the connection closed on a background thread.
+    time.sleep(0.5)
+
+
+class TestReconnect:
+    @pytest.mark.unit  # type: ignore
+    def test__reconnect_policy__flexlogger_restarts__existing_objects_keep_working(
+        self,
+    ) -> None:
+        channels = [FakeChannel("Input", 2.0), FakeChannel("Output", 0.0, is_output=True)]
+        with FakeFlexLoggerServer(channels) as server:
+            with Application(server_port=server.port, reconnect_policy=_FAST_RECONNECT) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                logging_specification = project.open_logging_specification_document()
+                output_handle = channel_specification.get_channel_handle("Output")
+                output_handle.write(1.0)
+                old_document_identifier = channel_specification._identifier
+
+                server.restart()
+                _wait_for_client_to_notice_restart()
+                value = channel_specification.get_channel_value("Input")
+                output_handle.write(5.0)
+                logging_specification.set_log_file_name("After restart")
+                log_file_name = logging_specification.get_log_file_name()
+                state = project.test_session.state
+
+                assert old_document_identifier != channel_specification._identifier
+                assert channel_specification is project.open_channel_specification_document()
+                assert 2.0 == value.value
+                assert 5.0 == server.get_channel_value("Output")
+                assert "After restart" == log_file_name
+                assert TestSessionState.IDLE == state
+
+    @pytest.mark.unit  # type: ignore
+    def test__reconnect_policy__open_second_project__only_second_project_reopened(
+        self,
+    ) -> None:
+        with FakeFlexLoggerServer() as server:
+            with Application(server_port=server.port, reconnect_policy=_FAST_RECONNECT) as app:
+                first_project = app.open_project("A.flxproj")
+                first_project_identifier = first_project._identifier
+                second_project = app.open_project("B.flxproj")
+                open_project_count = server.call_counts["OpenProject"]
+
+                server.restart()
+                _wait_for_client_to_notice_restart()
+                state = second_project.test_session.state
+                reopen_count = server.call_counts["OpenProject"] - open_project_count
+
+                assert TestSessionState.IDLE == state
+                assert 1 == reopen_count
+                assert first_project_identifier == first_project._identifier
+
+    @pytest.mark.unit  # type: ignore
+    def test__reconnect_policy__write_fails_while_unavailable__raises_then_works(self) -> None:
+        with FakeFlexLoggerServer() as server:
+            with Application(server_port=server.port, reconnect_policy=_FAST_RECONNECT) as app:
+                project = app.open_project("Test.flxproj")
+                server.restart()
+                _wait_for_client_to_notice_restart()
+                # The write may have taken effect before FlexLogger closed, so it is not sent
+                # again.
+                server.fail_next_calls("AddNote")
+
+                with pytest.raises(FlexLoggerError):
+                    project.test_session.add_note("Lost")
+                project.test_session.add_note("Kept")
+
+                assert ["Kept"] == server.notes
+
+    @pytest.mark.unit  # type: ignore
+    def test__reconnect_policy__flexlogger_does_not_come_back__raises_within_bound(
+        self,
+    ) -> None:
+        policy = ReconnectPolicy(max_recovery_time=0.3, retry_interval=0.05)
+        with FakeFlexLoggerServer() as server:
+            app = Application(server_port=server.port, reconnect_policy=policy)
+            app.open_project("Test.flxproj")
+            server.stop()
+
+            start_time = time.monotonic()
+            with pytest.raises(FlexLoggerError):
+                app.get_version()
+            elapsed_time = time.monotonic() - start_time
+            with pytest.raises(FlexLoggerError):
+                app.disconnect()
+
+        assert elapsed_time < 5
+
+    @pytest.mark.unit  # type: ignore
+    def test__reconnect_policy__flexlogger_restarts__events_resubscribed(self) -> None:
+        received = []  # type: List[str]
+        event_received = threading.Event()
+
+        def on_event(application: Any, event_type: Any, payload: Any) -> None:
+            received.append(payload.event_name)
+            event_received.set()
+
+        with FakeFlexLoggerServer() as server:
+            with Application(server_port=server.port, reconnect_policy=_FAST_RECONNECT) as app:
+                app.open_project("Test.flxproj")
+                app.event_handler.register_event_callback(on_event, [EventType.CUSTOM])
+                server.restart(downtime=0.2)
+
+                # An event sent before the client subscribes again is lost, so send it until
+                # it is received.
+                for _ in range(100):
+                    server.send_event(EventType.CUSTOM, "After restart")
+                    if event_received.wait(0.05):
+                        break
+                app.event_handler.unregister_from_events()
+
+        assert event_received.is_set()
+        assert {"After restart"} == set(received)
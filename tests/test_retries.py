@@ -0,0 +1,102 @@
+import asyncio
+from typing import Any
+
+import pytest  # type: ignore
+from flexlogger.automation import (
+    aio,
+    Application,
+    FlexLoggerError,
+    RetryPolicy,
+    TestSessionState,
+)
+from flexlogger.automation.testing import FakeChannel, FakeFlexLoggerServer
+
+_FAST_RETRIES = RetryPolicy(initial_backoff=0.001, max_backoff=0.01)
+
+
+class TestRetries:
+    @pytest.mark.unit  # type: ignore
+    def test__retry_policy__transient_read_failure__read_succeeds_and_retries_counted(
+        self,
+    ) -> None:
+        with FakeFlexLoggerServer([FakeChannel("Channel 1", 3.0)]) as server:
+            with Application(
+                server_port=server.port, collect_metrics=True, retry_policy=_FAST_RETRIES
+            ) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                server.fail_next_calls("GetDoubleChannelValue", count=2)
+
+                value = channel_specification.get_channel_value("Channel 1")
+
+                metrics = app.metrics()
+        get_value_metrics = next(
+            m for m in metrics.values() if m.method.endswith("/GetDoubleChannelValue")
+        )
+
+        assert 3.0 == value.value
+        assert 3 == server.call_counts["GetDoubleChannelValue"]
+        assert 2 == get_value_metrics.retry_count
+        assert 1 == get_value_metrics.count
+        assert 0 == get_value_metrics.error_count
+
+    @pytest.mark.unit  # type: ignore
+    def test__retry_policy__transient_add_note_failure__not_retried(self) -> None:
+        with FakeFlexLoggerServer() as server:
+            with Application(server_port=server.port, retry_policy=_FAST_RETRIES) as app:
+                project = app.open_project("Test.flxproj")
+                project.test_session.start()
+                server.fail_next_calls("AddNote")
+
+                with pytest.raises(FlexLoggerError):
+                    project.test_session.add_note("Note")
+
+                project.test_session.stop()
+
+        assert 1 == server.call_counts["AddNote"]
+        assert [] == server.notes
+
+    @pytest.mark.unit  # type: ignore
+    def test__retry_policy__persistent_failure__gives_up_after_max_attempts(self) -> None:
+        policy = RetryPolicy(max_attempts=3, initial_backoff=0.001, max_backoff=0.01)
+        with FakeFlexLoggerServer() as server:
+            with Application(server_port=server.port, retry_policy=policy) as app:
+                server.fail_next_calls("GetVersion", count=10)
+
+                with pytest.raises(FlexLoggerError):
+                    app.get_version()
+
+        assert 3 == server.call_counts["GetVersion"]
+
+    @pytest.mark.unit  # type: ignore
+    def test__retry_policy__budget_exhausted__stops_retrying(self) -> None:
+        policy = RetryPolicy(
+            max_attempts=10, initial_backoff=0.001, max_backoff=0.01, budget_max_tokens=4
+        )
+        with FakeFlexLoggerServer() as server:
+            with Application(server_port=server.port, retry_policy=policy) as app:
+                server.fail_next_calls("GetVersion", count=10)
+
+                with pytest.raises(FlexLoggerError):
+                    app.get_version()
+
+        # The budget allows retries while more than half of its four tokens are left.
+        assert 2 == server.call_counts["GetVersion"]
+
+    @pytest.mark.unit  # type: ignore
+    def test__aio_retry_policy__transient_state_failure__state_returned(self) -> None:
+        async def get_state(port: int) -> Any:
+            async with await aio.Application.connect(port, retry_policy=_FAST_RETRIES) as app:
+                project = await app.open_project("Test.flxproj")
+                server.fail_next_calls("GetState")
+                return await project.test_session.state
+
+        with FakeFlexLoggerServer() as server:
+            loop = asyncio.new_event_loop()
+            try:
+                state = loop.run_until_complete(get_state(server.port))
+            finally:
+                loop.close()
+
+        assert TestSessionState.IDLE == state
+        assert 2 == server.call_counts["GetState"]
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest  # type: ignore
+from flexlogger.automation import (
+    Application,
+    export_prometheus_metrics,
+    FlexLoggerError,
+    RpcMethodMetrics,
+)
+from flexlogger.automation.testing import FakeChannel, FakeFlexLoggerServer
+
+_GET_CHANNEL_VALUE_METHOD = (
+    "/national_instruments.flex_logger.automation.protocols."
+    "ChannelSpecificationDocument/GetDoubleChannelValue"
+)
+
+
+class TestRpcMetrics:
+    @pytest.mark.unit  # type: ignore
+    def test__collect_metrics__make_calls__calls_and_errors_counted(self) -> None:
+        with FakeFlexLoggerServer([FakeChannel("Channel 1", 1.0)], latency=0.003) as server:
+            with Application(server_port=server.port, collect_metrics=True) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                channel_specification.get_channel_value("Channel 1")
+                channel_specification.get_channel_value("Channel 1")
+                with pytest.raises(FlexLoggerError):
+                    channel_specification.get_channel_value("Unknown")
+
+            metrics = app.metrics()[_GET_CHANNEL_VALUE_METHOD]
+
+        assert 3 == metrics.count
+        assert 1 == metrics.error_count
+        assert 3 == sum(metrics.bucket_counts)
+        assert len(metrics.bucket_bounds) + 1 == len(metrics.bucket_counts)
+        # Every call took at least the fake server's 3 ms of latency
+        assert 0 == sum(
+            count
+            for bound, count in zip(metrics.bucket_bounds, metrics.bucket_counts)
+            if bound < 0.003
+        )
+        assert metrics.mean_latency >= 0.003
+
+    @pytest.mark.unit  # type: ignore
+    def test__metrics_not_collected__get_metrics__empty(self) -> None:
+        with FakeFlexLoggerServer() as server:
+            with Application(server_port=server.port) as app:
+                app.get_version()
+
+                assert {} == app.metrics()
+
+    @pytest.mark.unit  # type: ignore
+    def test__metrics__export_prometheus_metrics__histogram_written_to_file(
+        self, tmp_path: Path
+    ) -> None:
+        bounds = (0.001, 0.01)
+        metrics = {
+            "/Service/Method": RpcMethodMetrics("/Service/Method", 4, 1, 0.5, bounds, (1, 2, 1))
+        }
+        path = tmp_path / "flexlogger.prom"
+
+        text = export_prometheus_metrics(metrics, path)
+
+        assert text == path.read_text()
+        assert 'flexlogger_rpc_calls_total{method="/Service/Method"} 4' in text
+        assert 'flexlogger_rpc_errors_total{method="/Service/Method"} 1' in text
+        assert [
+            'flexlogger_rpc_latency_seconds_bucket{method="/Service/Method",le="0.001"} 1',
+            'flexlogger_rpc_latency_seconds_bucket{method="/Service/Method",le="0.01"} 3',
+            'flexlogger_rpc_latency_seconds_bucket{method="/Service/Method",le="+Inf"} 4',
+            'flexlogger_rpc_latency_seconds_sum{method="/Service/Method"} 0.5',
+            'flexlogger_rpc_latency_seconds_count{method="/Service/Method"} 4',
+        ] == [line for line in text.splitlines() if "flexlogger_rpc_latency_seconds_" in line]
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Any
+
+import pytest  # type: ignore
+from flexlogger.automation import (
+    aio,
+    Application,
+    FlexLoggerError,
+    FlexLoggerTimeoutError,
+    TimeoutPolicy,
+)
+from flexlogger.automation.testing import FakeChannel, FakeFlexLoggerServer
+
+
+class TestTimeouts:
+    @pytest.mark.unit  # type: ignore
+    def test__timeout_policy__slow_read__raises_timeout_error(self) -> None:
+        policy = TimeoutPolicy(reads=0.05)
+        with FakeFlexLoggerServer(method_latencies={"GetVersion": 0.5}) as server:
+            with Application(server_port=server.port, timeout_policy=policy) as app:
+                with pytest.raises(FlexLoggerTimeoutError) as error_info:
+                    app.get_version()
+
+        assert isinstance(error_info.value, FlexLoggerError)
+        assert str(error_info.value).startswith("Failed to get version")
+
+    @pytest.mark.unit  # type: ignore
+    def test__timeout_policy__override_timeout__call_completes(self) -> None:
+        policy = TimeoutPolicy(reads=0.05)
+        with FakeFlexLoggerServer(method_latencies={"GetVersion": 0.2}) as server:
+            with Application(server_port=server.port, timeout_policy=policy) as app:
+                version = app.get_version(timeout=5)
+
+        assert "0.0.0.0" == version[0]
+
+    @pytest.mark.unit  # type: ignore
+    def test__no_timeout_policy__per_call_timeout__raises_timeout_error(self) -> None:
+        channels = [FakeChannel("Output", 0.0, is_output=True)]
+        latencies = {"SetDoubleChannelValue": 0.5}
+        with FakeFlexLoggerServer(channels, method_latencies=latencies) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+
+                with pytest.raises(FlexLoggerTimeoutError):
+                    channel_specification.set_channel_value("Output", 1.0, timeout=0.05)
+                with pytest.raises(FlexLoggerError) as error_info:
+                    channel_specification.set_channel_value("Unknown", 1.0)
+
+        assert not isinstance(error_info.value, FlexLoggerTimeoutError)
+
+    @pytest.mark.unit  # type: ignore
+    def test__aio_timeout_policy__slow_write__raises_timeout_error(self) -> None:
+        policy = TimeoutPolicy(writes=0.05)
+
+        async def start_and_stop(port: int) -> Any:
+            async with await aio.Application.connect(port, timeout_policy=policy) as app:
+                project = await app.open_project("Test.flxproj")
+                await project.test_session.start()
+                with pytest.raises(FlexLoggerTimeoutError):
+                    await project.test_session.add_note("Note")
+                return await project.test_session.stop()
+
+        with FakeFlexLoggerServer(method_latencies={"AddNote": 0.5}) as server:
+            loop = asyncio.new_event_loop()
+            try:
+                stopped = loop.run_until_complete(start_and_stop(server.port))
+            finally:
+                loop.close()
+
+        assert stopped
@@ -0,0 +1,98 @@
+import threading
+import time
+
+import grpc  # type: ignore
+import pytest  # type: ignore
+from flexlogger.automation import Application, FlexLoggerError, WriteBatcher
+from flexlogger.automation.testing import FakeChannel, FakeFlexLoggerServer
+
+_CHANNELS = [
+    FakeChannel("Output 0", 0.0, is_output=True),
+    FakeChannel("Output 1", 0.0, is_output=True),
+]
+
+
+class TestWriteBatcher:
+    @pytest.mark.unit  # type: ignore
+    def test__writes_from_several_threads__flush__last_values_sent_in_one_request(self) -> None:
+        with FakeFlexLoggerServer(_CHANNELS) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                batcher = WriteBatcher(project.open_channel_specification_document())
+
+                def write(channel_name: str) -> None:
+                    for value in range(1, 11):
+                        batcher.write(channel_name, value)
+
+                threads = [
+                    threading.Thread(target=write, args=(channel.name,)) for channel in _CHANNELS
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                channel_count = batcher.flush()
+                empty_flush_channel_count = batcher.flush()
+
+                values = [server.get_channel_value(channel.name) for channel in _CHANNELS]
+                call_counts = server.call_counts
+
+        assert [10.0, 10.0] == values
+        assert 2 == channel_count
+        assert 0 == empty_flush_channel_count
+        assert 1 == call_counts["SetDoubleChannelValues"]
+        assert 0 == call_counts.get("SetDoubleChannelValue", 0)
+        assert 20 == batcher.write_count
+        assert 18 == batcher.folded_write_count
+        assert 1 == batcher.flush_count
+        assert 20 == batcher.last_flush_write_count
+        assert 2 == batcher.last_flush_channel_count
+        assert batcher.last_flush_duration > 0
+
+    @pytest.mark.unit  # type: ignore
+    def test__flush_interval__batcher_running__values_flushed_in_background(self) -> None:
+        with FakeFlexLoggerServer(_CHANNELS) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                channel_specification = project.open_channel_specification_document()
+                with WriteBatcher(channel_specification, flush_interval=0.02) as batcher:
+                    batcher.write("Output 0", 1.0)
+                    time.sleep(0.2)
+                    flushed_value = server.get_channel_value("Output 0")
+                    batcher.write("Output 1", 2.0)
+                final_value = server.get_channel_value("Output 1")
+
+        assert 1.0 == flushed_value
+        assert 2.0 == final_value
+        assert not batcher.is_running
+        assert 2 == batcher.flush_count
+
+    @pytest.mark.unit  # type: ignore
+    def test__flush_fails__values_kept_for_next_flush(self) -> None:
+        with FakeFlexLoggerServer(_CHANNELS) as server:
+            with Application(server_port=server.port) as app:
+                project = app.open_project("Test.flxproj")
+                batcher = WriteBatcher(project.open_channel_specification_document())
+                batcher.write("Output 0", 1.0)
+                batcher.write("Output 1", 2.0)
+                server.fail_next_calls("SetDoubleChannelValues", 1, grpc.StatusCode.INTERNAL)
+
+                with pytest.raises(FlexLoggerError):
+                    batcher.flush()
+                batcher.write("Output 1", 3.0)
+                batcher.flush()
+
+                values = [server.get_channel_value(channel.name) for channel in _CHANNELS]
+
+        assert [1.0, 3.0] == values
+
+    @pytest.mark.unit  # type: ignore
+    def test__invalid_arguments__exception_raised(self) -> None:
+        with pytest.raises(ValueError):
+            WriteBatcher(None, flush_interval=0)  # type: ignore
+        batcher = WriteBatcher(None)  # type: ignore
+        with pytest.raises(ValueError):
+            batcher.write("", 1.0)
+        with pytest.raises(ValueError):
+            batcher.write("Output 0", "1.0")  # type: ignore
+        assert 0 == batcher.pending_channel_count